@@ -0,0 +1,144 @@
+#!/bin/env python
+
+# file bench_dispatch.py
+
+import ctypes
+import sys
+import timeit
+
+import openvr
+
+"""
+Measures the per-call Python overhead of the OpenVR interface wrappers.
+
+The IVRSystem function table is filled with stub functions implemented in
+Python, so this runs without a headset or SteamVR. Each line reports the time
+per call through the wrapper method, through an equivalent of the previous
+wrapper implementation (uncached function table field, fresh out-parameters),
+and of calling the stub function pointer directly, which is the floor all
+variants share. The difference to the stub column is the wrapper overhead.
+"""
+
+
+def _stub_system_function_table():
+    "IVRSystem_FnTable whose hot entries are implemented in Python"
+    table = openvr.IVRSystem_FnTable()
+    fn_types = dict(openvr.IVRSystem_FnTable._fields_)
+
+    def getTrackedDeviceClass(unDeviceIndex):
+        if unDeviceIndex == openvr.k_unTrackedDeviceIndex_Hmd:
+            return openvr.TrackedDeviceClass_HMD
+        return openvr.TrackedDeviceClass_Controller
+
+    def isTrackedDeviceConnected(unDeviceIndex):
+        return unDeviceIndex < 3
+
+    def getControllerState(unControllerDeviceIndex, pControllerState, unControllerStateSize):
+        pControllerState[0].unPacketNum += 1
+        return 1
+
+    def getTimeSinceLastVsync(pfSecondsSinceLastVsync, pulFrameCounter):
+        pfSecondsSinceLastVsync[0] = 0.005
+        pulFrameCounter[0] = 1000
+        return 1
+
+    # Keep references to the callbacks, so they outlive this function
+    table._callbacks = []
+    for fn in (getTrackedDeviceClass, isTrackedDeviceConnected, getControllerState, getTimeSinceLastVsync):
+        callback = fn_types[fn.__name__](fn)
+        table._callbacks.append(callback)
+        setattr(table, fn.__name__, callback)
+    return table
+
+
+class _StubLibrary(object):
+    "Stands in for the OpenVR shared library, handing out stub function tables"
+
+    def __init__(self, tables):
+        self.tables = tables
+
+    def VR_IsInterfaceVersionValid(self, interfaceVersion):
+        return b"FnTable:" + interfaceVersion in self.tables
+
+    def VR_GetGenericInterface(self, interfaceVersion, error):
+        return ctypes.addressof(self.tables[interfaceVersion])
+
+
+# Wrappers as they were before function pointers and out-parameters were cached
+
+def _previous_getTrackedDeviceClass(system, unDeviceIndex):
+    fn = system.function_table.getTrackedDeviceClass
+    result = fn(unDeviceIndex)
+    return result
+
+
+def _previous_isTrackedDeviceConnected(system, unDeviceIndex):
+    fn = system.function_table.isTrackedDeviceConnected
+    result = fn(unDeviceIndex)
+    return result
+
+
+def _previous_getControllerState(system, unControllerDeviceIndex, unControllerStateSize=ctypes.sizeof(openvr.VRControllerState_t)):
+    fn = system.function_table.getControllerState
+    pControllerState = openvr.VRControllerState_t()
+    result = fn(unControllerDeviceIndex, ctypes.byref(pControllerState), unControllerStateSize)
+    return result, pControllerState
+
+
+def _previous_getTimeSinceLastVsync(system):
+    fn = system.function_table.getTimeSinceLastVsync
+    pfSecondsSinceLastVsync = ctypes.c_float()
+    pulFrameCounter = ctypes.c_uint64()
+    result = fn(ctypes.byref(pfSecondsSinceLastVsync), ctypes.byref(pulFrameCounter))
+    return result, pfSecondsSinceLastVsync.value, pulFrameCounter.value
+
+
+def _ns_per_call(fn, number):
+    best = min(timeit.repeat(fn, number=number, repeat=7))
+    return 1e9 * best / number
+
+
+def main(number=100000):
+    table = _stub_system_function_table()
+    openvr.setBackend(_StubLibrary({b"FnTable:" + openvr.IVRSystem_Version: table}))
+    system = openvr.IVRSystem()
+    state = openvr.VRControllerState_t()
+    state_size = ctypes.sizeof(openvr.VRControllerState_t)
+    fns = system._fns
+    # name, wrapper call, previous wrapper call, direct stub call
+    cases = [
+        ("getTrackedDeviceClass",
+            lambda: system.getTrackedDeviceClass(1),
+            lambda: _previous_getTrackedDeviceClass(system, 1),
+            lambda: fns.getTrackedDeviceClass(1)),
+        ("isTrackedDeviceConnected",
+            lambda: system.isTrackedDeviceConnected(1),
+            lambda: _previous_isTrackedDeviceConnected(system, 1),
+            lambda: fns.isTrackedDeviceConnected(1)),
+        ("getControllerState",
+            lambda: system.getControllerState(1),
+            lambda: _previous_getControllerState(system, 1),
+            lambda: fns.getControllerState(1, ctypes.byref(state), state_size)),
+        ("getControllerState(pControllerState=)",
+            lambda: system.getControllerState(1, pControllerState=state),
+            None,
+            lambda: fns.getControllerState(1, ctypes.byref(state), state_size)),
+        ("getTimeSinceLastVsync",
+            lambda: system.getTimeSinceLastVsync(),
+            lambda: _previous_getTimeSinceLastVsync(system),
+            lambda: fns.getTimeSinceLastVsync(ctypes.byref(ctypes.c_float()), ctypes.byref(ctypes.c_uint64()))),
+    ]
+    print("%-40s %10s %10s %10s" % ("ns/call", "wrapper", "previous", "stub"))
+    for name, wrapped, previous, direct in cases:
+        line = "%-40s %10.0f" % (name, _ns_per_call(wrapped, number))
+        for fn in (previous, direct):
+            if fn is None:
+                line += " %10s" % "-"
+            else:
+                line += " %10.0f" % _ns_per_call(fn, number)
+        print(line)
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/bin/env python
+
+# file bench_frame_loop.py
+
+import argparse
+from ctypes import sizeof
+import sys
+import time
+
+import openvr
+from openvr.frame_timing import FrameTimingCollector
+from openvr.pose_buffer import PoseBuffer
+from openvr.replay import ReplayRuntime
+from openvr.simulator import SimulatedRuntime
+
+"""
+Load test of the per-frame OpenVR work of a scene application, run against
+the simulated runtime, so it needs neither a headset nor SteamVR.
+
+Each frame waits for poses, polls events and controller state, and computes
+the view matrices, as OpenVrGlRenderer and TrackedDevicesActor do, but
+without drawing. The report shows the CPU time spent per frame and how many
+frames the simulated compositor counted as dropped. With --replay, the
+devices move as in a session recorded with pose_recorder.PoseRecorder, and
+unpaced runs see the same poses and events every time.
+"""
+
+
+def run(frames, refresh_rate, paced, replay=None, speed=1.0):
+    if replay is None:
+        runtime = SimulatedRuntime(refresh_rate=refresh_rate, paced=paced)
+    else:
+        runtime = ReplayRuntime(replay, speed=speed, refresh_rate=refresh_rate, paced=paced, loop=True)
+    openvr.setBackend(runtime)
+    vr_system = openvr.init(openvr.VRApplication_Scene)
+    compositor = openvr.VRCompositor()
+    poses = PoseBuffer()
+    event = openvr.VREvent_t()
+    state = openvr.VRControllerState_t()
+    controllers = [i for i in range(len(runtime.devices))
+                   if vr_system.getTrackedDeviceClass(i) == openvr.TrackedDeviceClass_Controller]
+    collector = FrameTimingCollector(capacity=frames)
+    work_times = []
+    start = time.time()
+    for frame in range(frames):
+        compositor.waitGetPoses(poses, len(poses), None, 0)
+        work_start = time.time()
+        while vr_system.pollNextEvent(event):
+            pass
+        for i in controllers:
+            vr_system.getControllerState(i, pControllerState=state)
+        poses.inverse_device_matrices()
+        poses.device_matrices()
+        work_times.append(time.time() - work_start)
+        if frame % 64 == 0:
+            collector.collect()
+    elapsed = time.time() - start
+    collector.collect()
+    timing = collector.stats()
+    stats = compositor.getCumulativeStats(sizeof(openvr.Compositor_CumulativeStats))
+    openvr.shutdown()
+    openvr.setBackend(None)
+    work_times.sort()
+    print("%d frames in %.2f s: %.1f frames per second" % (frames, elapsed, frames / elapsed))
+    print("per-frame work: median %.3f ms, max %.3f ms" % (
+        1000.0 * work_times[len(work_times) // 2], 1000.0 * work_times[-1]))
+    print("dropped frames: %d" % stats.m_nNumDroppedFrames)
+    print("compositor frame interval: p50 %.3f ms, p90 %.3f ms, p99 %.3f ms" % tuple(timing.cpu_ms))
+    sys.stdout.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test of per-frame OpenVR work against the simulated runtime")
+    parser.add_argument('--frames', type=int, default=900)
+    parser.add_argument('--refresh-rate', type=float, default=90.0)
+    parser.add_argument('--unpaced', action='store_true', help="don't wait for simulated vsync")
+    parser.add_argument('--replay', metavar='POSELOG', help="replay a recorded pose log")
+    parser.add_argument('--speed', type=float, default=1.0, help="replay speed factor")
+    args = parser.parse_args()
+    run(args.frames, args.refresh_rate, not args.unpaced, args.replay, args.speed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/bin/env python
+
+# file bench_import.py
+
+import os
+import subprocess
+import sys
+
+"""
+Measures the cold start cost of the openvr module, each sample in a fresh
+Python process, for the typical amounts of the module a program uses.
+"""
+
+_cases = [
+    ("import openvr", "pass"),
+    ("enum constant", "openvr.TrackedDeviceClass_Controller"),
+    ("isRuntimeInstalled()", "openvr.isRuntimeInstalled()"),
+    ("IVRSystem class", "openvr.IVRSystem"),
+    ("all interface classes", "[getattr(openvr, name) for name in openvr._interface_modules]"),
+]
+
+_script = """
+import time
+start = time.time()
+import openvr
+%s
+print(time.time() - start)
+"""
+
+
+def _seconds(statement):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([os.path.join(os.path.dirname(__file__), '..'), env.get('PYTHONPATH', '')])
+    # Measure with cached bytecode, as an installed package would run
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    with open(os.devnull, 'w') as devnull:
+        output = subprocess.check_output([sys.executable, '-c', _script % statement], env=env, stderr=devnull)
+    return float(output.decode().split()[-1])
+
+
+def main(repeat=15):
+    # Warm up the file system cache and write the bytecode files
+    _seconds("pass")
+    print("%-30s %10s %10s" % ("ms", "min", "median"))
+    for name, statement in _cases:
+        samples = sorted(_seconds(statement) for _ in range(repeat))
+        print("%-30s %10.2f %10.2f" % (name, 1000.0 * samples[0], 1000.0 * samples[len(samples) // 2]))
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
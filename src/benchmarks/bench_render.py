@@ -0,0 +1,72 @@
+#!/bin/env python
+
+# file bench_render.py
+
+import argparse
+import sys
+import time
+
+# Selects PyOpenGL's EGL platform, so it comes before the other modules using OpenGL
+from openvr.glframework.egl_app import EglApp
+import openvr
+from openvr.color_cube_actor import ColorCubeActor
+from openvr.gl_renderer import OpenVrGlRenderer
+from openvr.simulator import SimulatedRuntime
+from openvr.tracked_devices_actor import TrackedDevicesActor
+
+"""
+Throughput test of OpenVrGlRenderer with a color cube and the tracked device
+models, run headless with EglApp against the simulated runtime, so it needs
+neither a headset, SteamVR, a display server nor, with Mesa's llvmpipe, a GPU.
+
+Frames are not paced by vsync: the report shows how many frames per second
+the renderer and its actors sustain, and the wall clock time per frame,
+which includes the GPU work only with --finish.
+"""
+
+
+def run(frames, warmup, width, height, stereo, multisample, mirror, finish):
+    runtime = SimulatedRuntime(paced=False)
+    runtime.render_target_size = (width, height)
+    openvr.setBackend(runtime)
+    renderer = OpenVrGlRenderer(multisample=multisample, single_pass_stereo=stereo)
+    renderer.do_mirror = mirror
+    renderer.append(ColorCubeActor())
+    renderer.append(TrackedDevicesActor(renderer.poses))
+    frame_times = []
+    with EglApp(renderer, finish=finish) as app:
+        app.run_loop(warmup)
+        start = time.time()
+        for frame in range(frames):
+            frame_start = time.time()
+            app.render_scene()
+            frame_times.append(time.time() - frame_start)
+        elapsed = time.time() - start
+    openvr.setBackend(None)
+    frame_times.sort()
+    print("%d frames of %dx%d per eye in %.2f s: %.1f frames per second" % (
+        frames, width, height, elapsed, frames / elapsed))
+    print("per-frame time: median %.3f ms, p90 %.3f ms, max %.3f ms" % (
+        1000.0 * frame_times[len(frame_times) // 2],
+        1000.0 * frame_times[int(0.9 * (len(frame_times) - 1))],
+        1000.0 * frame_times[-1]))
+    sys.stdout.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless throughput test of the OpenGL renderer")
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--warmup', type=int, default=10, help="frames rendered before measuring")
+    parser.add_argument('--size', type=int, nargs=2, default=(540, 600), metavar=('WIDTH', 'HEIGHT'),
+                        help="render target size of each eye")
+    parser.add_argument('--stereo', action='store_true', help="single pass stereo rendering")
+    parser.add_argument('--multisample', type=int, default=0)
+    parser.add_argument('--mirror', action='store_true', help="also draw the desktop mirror")
+    parser.add_argument('--finish', action='store_true', help="wait for the GPU after each frame")
+    args = parser.parse_args()
+    run(args.frames, args.warmup, args.size[0], args.size[1], args.stereo, args.multisample,
+        args.mirror, args.finish)
+
+
+if __name__ == "__main__":
+    main()
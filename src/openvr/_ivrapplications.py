@@ -0,0 +1,327 @@
+#!/bin/env python
+
+# IVRApplications interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.IVRApplications, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+class IVRApplications_FnTable(Structure):
+    _fields_ = [
+        ("addApplicationManifest", OPENVR_FNTABLE_CALLTYPE(EVRApplicationError, c_char_p, openvr_bool)),
+        ("removeApplicationManifest", OPENVR_FNTABLE_CALLTYPE(EVRApplicationError, c_char_p)),
+        ("isApplicationInstalled", OPENVR_FNTABLE_CALLTYPE(openvr_bool, c_char_p)),
+        ("getApplicationCount", OPENVR_FNTABLE_CALLTYPE(c_uint32)),
+        ("getApplicationKeyByIndex", OPENVR_FNTABLE_CALLTYPE(EVRApplicationError, c_uint32, c_char_p, c_uint32)),
+        ("getApplicationKeyByProcessId", OPENVR_FNTABLE_CALLTYPE(EVRApplicationError, c_uint32, c_char_p, c_uint32)),
+        ("launchApplication", OPENVR_FNTABLE_CALLTYPE(EVRApplicationError, c_char_p)),
+        ("launchTemplateApplication", OPENVR_FNTABLE_CALLTYPE(EVRApplicationError, c_char_p, c_char_p, POINTER(AppOverrideKeys_t), c_uint32)),
+        ("launchApplicationFromMimeType", OPENVR_FNTABLE_CALLTYPE(EVRApplicationError, c_char_p, c_char_p)),
+        ("launchDashboardOverlay", OPENVR_FNTABLE_CALLTYPE(EVRApplicationError, c_char_p)),
+        ("cancelApplicationLaunch", OPENVR_FNTABLE_CALLTYPE(openvr_bool, c_char_p)),
+        ("identifyApplication", OPENVR_FNTABLE_CALLTYPE(EVRApplicationError, c_uint32, c_char_p)),
+        ("getApplicationProcessId", OPENVR_FNTABLE_CALLTYPE(c_uint32, c_char_p)),
+        ("getApplicationsErrorNameFromEnum", OPENVR_FNTABLE_CALLTYPE(c_char_p, EVRApplicationError)),
+        ("getApplicationPropertyString", OPENVR_FNTABLE_CALLTYPE(c_uint32, c_char_p, EVRApplicationProperty, c_char_p, c_uint32, POINTER(EVRApplicationError))),
+        ("getApplicationPropertyBool", OPENVR_FNTABLE_CALLTYPE(openvr_bool, c_char_p, EVRApplicationProperty, POINTER(EVRApplicationError))),
+        ("getApplicationPropertyUint64", OPENVR_FNTABLE_CALLTYPE(c_uint64, c_char_p, EVRApplicationProperty, POINTER(EVRApplicationError))),
+        ("setApplicationAutoLaunch", OPENVR_FNTABLE_CALLTYPE(EVRApplicationError, c_char_p, openvr_bool)),
+        ("getApplicationAutoLaunch", OPENVR_FNTABLE_CALLTYPE(openvr_bool, c_char_p)),
+        ("setDefaultApplicationForMimeType", OPENVR_FNTABLE_CALLTYPE(EVRApplicationError, c_char_p, c_char_p)),
+        ("getDefaultApplicationForMimeType", OPENVR_FNTABLE_CALLTYPE(openvr_bool, c_char_p, c_char_p, c_uint32)),
+        ("getApplicationSupportedMimeTypes", OPENVR_FNTABLE_CALLTYPE(openvr_bool, c_char_p, c_char_p, c_uint32)),
+        ("getApplicationsThatSupportMimeType", OPENVR_FNTABLE_CALLTYPE(c_uint32, c_char_p, c_char_p, c_uint32)),
+        ("getApplicationLaunchArguments", OPENVR_FNTABLE_CALLTYPE(c_uint32, c_uint32, c_char_p, c_uint32)),
+        ("getStartingApplication", OPENVR_FNTABLE_CALLTYPE(EVRApplicationError, c_char_p, c_uint32)),
+        ("getTransitionState", OPENVR_FNTABLE_CALLTYPE(EVRApplicationTransitionState)),
+        ("performApplicationPrelaunchCheck", OPENVR_FNTABLE_CALLTYPE(EVRApplicationError, c_char_p)),
+        ("getApplicationsTransitionStateNameFromEnum", OPENVR_FNTABLE_CALLTYPE(c_char_p, EVRApplicationTransitionState)),
+        ("isQuitUserPromptRequested", OPENVR_FNTABLE_CALLTYPE(openvr_bool)),
+        ("launchInternalProcess", OPENVR_FNTABLE_CALLTYPE(EVRApplicationError, c_char_p, c_char_p, c_char_p)),
+        ("getCurrentSceneProcessId", OPENVR_FNTABLE_CALLTYPE(c_uint32)),
+    ]
+
+
+class IVRApplications(object):
+    def __init__(self):
+        version_key = IVRApplications_Version
+        if not isInterfaceVersionValid(version_key):
+            _checkInitError(VRInitError_Init_InterfaceNotFound)
+        # Thank you lukexi https://github.com/lukexi/openvr-hs/blob/master/cbits/openvr_capi_helper.c#L9
+        fn_key = b"FnTable:" + version_key
+        fn_type = IVRApplications_FnTable
+        fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
+        if fn_table_ptr is None:
+            raise OpenVRError("Error retrieving VR API for IVRApplications")
+        self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
+
+    def addApplicationManifest(self, pchApplicationManifestFullPath, bTemporary):
+        """
+        Adds an application manifest to the list to load when building the list of installed applications. 
+        Temporary manifests are not automatically loaded
+        """
+
+        fn = self._fns.addApplicationManifest
+        result = fn(pchApplicationManifestFullPath, bTemporary)
+        return result
+
+    def removeApplicationManifest(self, pchApplicationManifestFullPath):
+        "Removes an application manifest from the list to load when building the list of installed applications."
+
+        fn = self._fns.removeApplicationManifest
+        result = fn(pchApplicationManifestFullPath)
+        return result
+
+    def isApplicationInstalled(self, pchAppKey):
+        "Returns true if an application is installed"
+
+        fn = self._fns.isApplicationInstalled
+        result = fn(pchAppKey)
+        return result
+
+    def getApplicationCount(self):
+        "Returns the number of applications available in the list"
+
+        fn = self._fns.getApplicationCount
+        result = fn()
+        return result
+
+    def getApplicationKeyByIndex(self, unApplicationIndex, pchAppKeyBuffer, unAppKeyBufferLen):
+        """
+        Returns the key of the specified application. The index is at least 0 and is less than the return 
+        value of GetApplicationCount(). The buffer should be at least k_unMaxApplicationKeyLength in order to 
+        fit the key.
+        """
+
+        fn = self._fns.getApplicationKeyByIndex
+        result = fn(unApplicationIndex, pchAppKeyBuffer, unAppKeyBufferLen)
+        return result
+
+    def getApplicationKeyByProcessId(self, unProcessId, pchAppKeyBuffer, unAppKeyBufferLen):
+        """
+        Returns the key of the application for the specified Process Id. The buffer should be at least 
+        k_unMaxApplicationKeyLength in order to fit the key.
+        """
+
+        fn = self._fns.getApplicationKeyByProcessId
+        result = fn(unProcessId, pchAppKeyBuffer, unAppKeyBufferLen)
+        return result
+
+    def launchApplication(self, pchAppKey):
+        """
+        Launches the application. The existing scene application will exit and then the new application will start.
+        This call is not valid for dashboard overlay applications.
+        """
+
+        fn = self._fns.launchApplication
+        result = fn(pchAppKey)
+        return result
+
+    def launchTemplateApplication(self, pchTemplateAppKey, pchNewAppKey, unKeys):
+        """
+        Launches an instance of an application of type template, with its app key being pchNewAppKey (which must be unique) and optionally override sections
+        from the manifest file via AppOverrideKeys_t
+        """
+
+        fn = self._fns.launchTemplateApplication
+        pKeys = AppOverrideKeys_t()
+        result = fn(pchTemplateAppKey, pchNewAppKey, byref(pKeys), unKeys)
+        return result, pKeys
+
+    def launchApplicationFromMimeType(self, pchMimeType, pchArgs):
+        "launches the application currently associated with this mime type and passes it the option args, typically the filename or object name of the item being launched"
+
+        fn = self._fns.launchApplicationFromMimeType
+        result = fn(pchMimeType, pchArgs)
+        return result
+
+    def launchDashboardOverlay(self, pchAppKey):
+        """
+        Launches the dashboard overlay application if it is not already running. This call is only valid for 
+        dashboard overlay applications.
+        """
+
+        fn = self._fns.launchDashboardOverlay
+        result = fn(pchAppKey)
+        return result
+
+    def cancelApplicationLaunch(self, pchAppKey):
+        "Cancel a pending launch for an application"
+
+        fn = self._fns.cancelApplicationLaunch
+        result = fn(pchAppKey)
+        return result
+
+    def identifyApplication(self, unProcessId, pchAppKey):
+        """
+        Identifies a running application. OpenVR can't always tell which process started in response
+        to a URL. This function allows a URL handler (or the process itself) to identify the app key 
+        for the now running application. Passing a process ID of 0 identifies the calling process. 
+        The application must be one that's known to the system via a call to AddApplicationManifest.
+        """
+
+        fn = self._fns.identifyApplication
+        result = fn(unProcessId, pchAppKey)
+        return result
+
+    def getApplicationProcessId(self, pchAppKey):
+        "Returns the process ID for an application. Return 0 if the application was not found or is not running."
+
+        fn = self._fns.getApplicationProcessId
+        result = fn(pchAppKey)
+        return result
+
+    def getApplicationsErrorNameFromEnum(self, error):
+        "Returns a string for an applications error"
+
+        fn = self._fns.getApplicationsErrorNameFromEnum
+        result = fn(error)
+        return result
+
+    def getApplicationPropertyString(self, pchAppKey, eProperty, pchPropertyValueBuffer, unPropertyValueBufferLen):
+        "Returns a value for an application property. The required buffer size to fit this value will be returned."
+
+        fn = self._fns.getApplicationPropertyString
+        peError = EVRApplicationError()
+        result = fn(pchAppKey, eProperty, pchPropertyValueBuffer, unPropertyValueBufferLen, byref(peError))
+        return result, peError
+
+    def getApplicationPropertyBool(self, pchAppKey, eProperty):
+        "Returns a bool value for an application property. Returns false in all error cases."
+
+        fn = self._fns.getApplicationPropertyBool
+        peError = EVRApplicationError()
+        result = fn(pchAppKey, eProperty, byref(peError))
+        return result, peError
+
+    def getApplicationPropertyUint64(self, pchAppKey, eProperty):
+        "Returns a uint64 value for an application property. Returns 0 in all error cases."
+
+        fn = self._fns.getApplicationPropertyUint64
+        peError = EVRApplicationError()
+        result = fn(pchAppKey, eProperty, byref(peError))
+        return result, peError
+
+    def setApplicationAutoLaunch(self, pchAppKey, bAutoLaunch):
+        "Sets the application auto-launch flag. This is only valid for applications which return true for VRApplicationProperty_IsDashboardOverlay_Bool."
+
+        fn = self._fns.setApplicationAutoLaunch
+        result = fn(pchAppKey, bAutoLaunch)
+        return result
+
+    def getApplicationAutoLaunch(self, pchAppKey):
+        "Gets the application auto-launch flag. This is only valid for applications which return true for VRApplicationProperty_IsDashboardOverlay_Bool."
+
+        fn = self._fns.getApplicationAutoLaunch
+        result = fn(pchAppKey)
+        return result
+
+    def setDefaultApplicationForMimeType(self, pchAppKey, pchMimeType):
+        "Adds this mime-type to the list of supported mime types for this application"
+
+        fn = self._fns.setDefaultApplicationForMimeType
+        result = fn(pchAppKey, pchMimeType)
+        return result
+
+    def getDefaultApplicationForMimeType(self, pchMimeType, pchAppKeyBuffer, unAppKeyBufferLen):
+        "return the app key that will open this mime type"
+
+        fn = self._fns.getDefaultApplicationForMimeType
+        result = fn(pchMimeType, pchAppKeyBuffer, unAppKeyBufferLen)
+        return result
+
+    def getApplicationSupportedMimeTypes(self, pchAppKey, pchMimeTypesBuffer, unMimeTypesBuffer):
+        "Get the list of supported mime types for this application, comma-delimited"
+
+        fn = self._fns.getApplicationSupportedMimeTypes
+        result = fn(pchAppKey, pchMimeTypesBuffer, unMimeTypesBuffer)
+        return result
+
+    def getApplicationsThatSupportMimeType(self, pchMimeType, pchAppKeysThatSupportBuffer, unAppKeysThatSupportBuffer):
+        "Get the list of app-keys that support this mime type, comma-delimited, the return value is number of bytes you need to return the full string"
+
+        fn = self._fns.getApplicationsThatSupportMimeType
+        result = fn(pchMimeType, pchAppKeysThatSupportBuffer, unAppKeysThatSupportBuffer)
+        return result
+
+    def getApplicationLaunchArguments(self, unHandle, pchArgs, unArgs):
+        "Get the args list from an app launch that had the process already running, you call this when you get a VREvent_ApplicationMimeTypeLoad"
+
+        fn = self._fns.getApplicationLaunchArguments
+        result = fn(unHandle, pchArgs, unArgs)
+        return result
+
+    def getStartingApplication(self, pchAppKeyBuffer, unAppKeyBufferLen):
+        "Returns the app key for the application that is starting up"
+
+        fn = self._fns.getStartingApplication
+        result = fn(pchAppKeyBuffer, unAppKeyBufferLen)
+        return result
+
+    def getTransitionState(self):
+        "Returns the application transition state"
+
+        fn = self._fns.getTransitionState
+        result = fn()
+        return result
+
+    def performApplicationPrelaunchCheck(self, pchAppKey):
+        """
+        Returns errors that would prevent the specified application from launching immediately. Calling this function will
+        cause the current scene application to quit, so only call it when you are actually about to launch something else.
+        What the caller should do about these failures depends on the failure:
+          VRApplicationError_OldApplicationQuitting - An existing application has been told to quit. Wait for a VREvent_ProcessQuit
+                                                      and try again.
+          VRApplicationError_ApplicationAlreadyStarting - This application is already starting. This is a permanent failure.
+          VRApplicationError_LaunchInProgress	      - A different application is already starting. This is a permanent failure.
+          VRApplicationError_None                   - Go ahead and launch. Everything is clear.
+        """
+
+        fn = self._fns.performApplicationPrelaunchCheck
+        result = fn(pchAppKey)
+        return result
+
+    def getApplicationsTransitionStateNameFromEnum(self, state):
+        "Returns a string for an application transition state"
+
+        fn = self._fns.getApplicationsTransitionStateNameFromEnum
+        result = fn(state)
+        return result
+
+    def isQuitUserPromptRequested(self):
+        "Returns true if the outgoing scene app has requested a save prompt before exiting"
+
+        fn = self._fns.isQuitUserPromptRequested
+        result = fn()
+        return result
+
+    def launchInternalProcess(self, pchBinaryPath, pchArguments, pchWorkingDirectory):
+        """
+        Starts a subprocess within the calling application. This
+        suppresses all application transition UI and automatically identifies the new executable 
+        as part of the same application. On success the calling process should exit immediately. 
+        If working directory is NULL or "" the directory portion of the binary path will be 
+        the working directory.
+        """
+
+        fn = self._fns.launchInternalProcess
+        result = fn(pchBinaryPath, pchArguments, pchWorkingDirectory)
+        return result
+
+    def getCurrentSceneProcessId(self):
+        """
+        Returns the current scene process ID according to the application system. A scene process will get scene
+        focus once it starts rendering, but it will appear here once it calls VR_Init with the Scene application
+        type.
+        """
+
+        fn = self._fns.getCurrentSceneProcessId
+        result = fn()
+        return result
@@ -0,0 +1,115 @@
+#!/bin/env python
+
+# IVRChaperone interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.IVRChaperone, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+class IVRChaperone_FnTable(Structure):
+    _fields_ = [
+        ("getCalibrationState", OPENVR_FNTABLE_CALLTYPE(ChaperoneCalibrationState)),
+        ("getPlayAreaSize", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(c_float), POINTER(c_float))),
+        ("getPlayAreaRect", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(HmdQuad_t))),
+        ("reloadInfo", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("setSceneColor", OPENVR_FNTABLE_CALLTYPE(None, HmdColor_t)),
+        ("getBoundsColor", OPENVR_FNTABLE_CALLTYPE(None, POINTER(HmdColor_t), c_int, c_float, POINTER(HmdColor_t))),
+        ("areBoundsVisible", OPENVR_FNTABLE_CALLTYPE(openvr_bool)),
+        ("forceBoundsVisible", OPENVR_FNTABLE_CALLTYPE(None, openvr_bool)),
+    ]
+
+
+class IVRChaperone(object):
+    """
+    HIGH LEVEL TRACKING SPACE ASSUMPTIONS:
+    0,0,0 is the preferred standing area center.
+    0Y is the floor height.
+    -Z is the preferred forward facing direction.
+    """
+
+    def __init__(self):
+        version_key = IVRChaperone_Version
+        if not isInterfaceVersionValid(version_key):
+            _checkInitError(VRInitError_Init_InterfaceNotFound)
+        # Thank you lukexi https://github.com/lukexi/openvr-hs/blob/master/cbits/openvr_capi_helper.c#L9
+        fn_key = b"FnTable:" + version_key
+        fn_type = IVRChaperone_FnTable
+        fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
+        if fn_table_ptr is None:
+            raise OpenVRError("Error retrieving VR API for IVRChaperone")
+        self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
+
+    def getCalibrationState(self):
+        "Get the current state of Chaperone calibration. This state can change at any time during a session due to physical base station changes."
+
+        fn = self._fns.getCalibrationState
+        result = fn()
+        return result
+
+    def getPlayAreaSize(self):
+        """
+        Returns the width and depth of the Play Area (formerly named Soft Bounds) in X and Z. 
+        Tracking space center (0,0,0) is the center of the Play Area.
+        """
+
+        fn = self._fns.getPlayAreaSize
+        pSizeX = c_float()
+        pSizeZ = c_float()
+        result = fn(byref(pSizeX), byref(pSizeZ))
+        return result, pSizeX.value, pSizeZ.value
+
+    def getPlayAreaRect(self):
+        """
+        Returns the 4 corner positions of the Play Area (formerly named Soft Bounds).
+        Corners are in counter-clockwise order.
+        Standing center (0,0,0) is the center of the Play Area.
+        It's a rectangle.
+        2 sides are parallel to the X axis and 2 sides are parallel to the Z axis.
+        Height of every corner is 0Y (on the floor).
+        """
+
+        fn = self._fns.getPlayAreaRect
+        rect = HmdQuad_t()
+        result = fn(byref(rect))
+        return result, rect
+
+    def reloadInfo(self):
+        "Reload Chaperone data from the .vrchap file on disk."
+
+        fn = self._fns.reloadInfo
+        fn()
+
+    def setSceneColor(self, color):
+        "Optionally give the chaperone system a hit about the color and brightness in the scene"
+
+        fn = self._fns.setSceneColor
+        fn(color)
+
+    def getBoundsColor(self, nNumOutputColors, flCollisionBoundsFadeDistance):
+        "Get the current chaperone bounds draw color and brightness"
+
+        fn = self._fns.getBoundsColor
+        pOutputColorArray = HmdColor_t()
+        pOutputCameraColor = HmdColor_t()
+        fn(byref(pOutputColorArray), nNumOutputColors, flCollisionBoundsFadeDistance, byref(pOutputCameraColor))
+        return pOutputColorArray, pOutputCameraColor
+
+    def areBoundsVisible(self):
+        "Determine whether the bounds are showing right now"
+
+        fn = self._fns.areBoundsVisible
+        result = fn()
+        return result
+
+    def forceBoundsVisible(self, bForce):
+        "Force the bounds to show, mostly for utilities"
+
+        fn = self._fns.forceBoundsVisible
+        fn(bForce)
@@ -0,0 +1,224 @@
+#!/bin/env python
+
+# IVRChaperoneSetup interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.IVRChaperoneSetup, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+class IVRChaperoneSetup_FnTable(Structure):
+    _fields_ = [
+        ("commitWorkingCopy", OPENVR_FNTABLE_CALLTYPE(openvr_bool, EChaperoneConfigFile)),
+        ("revertWorkingCopy", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("getWorkingPlayAreaSize", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(c_float), POINTER(c_float))),
+        ("getWorkingPlayAreaRect", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(HmdQuad_t))),
+        ("getWorkingCollisionBoundsInfo", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(HmdQuad_t), POINTER(c_uint32))),
+        ("getLiveCollisionBoundsInfo", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(HmdQuad_t), POINTER(c_uint32))),
+        ("getWorkingSeatedZeroPoseToRawTrackingPose", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(HmdMatrix34_t))),
+        ("getWorkingStandingZeroPoseToRawTrackingPose", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(HmdMatrix34_t))),
+        ("setWorkingPlayAreaSize", OPENVR_FNTABLE_CALLTYPE(None, c_float, c_float)),
+        ("setWorkingCollisionBoundsInfo", OPENVR_FNTABLE_CALLTYPE(None, POINTER(HmdQuad_t), c_uint32)),
+        ("setWorkingSeatedZeroPoseToRawTrackingPose", OPENVR_FNTABLE_CALLTYPE(None, POINTER(HmdMatrix34_t))),
+        ("setWorkingStandingZeroPoseToRawTrackingPose", OPENVR_FNTABLE_CALLTYPE(None, POINTER(HmdMatrix34_t))),
+        ("reloadFromDisk", OPENVR_FNTABLE_CALLTYPE(None, EChaperoneConfigFile)),
+        ("getLiveSeatedZeroPoseToRawTrackingPose", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(HmdMatrix34_t))),
+        ("setWorkingCollisionBoundsTagsInfo", OPENVR_FNTABLE_CALLTYPE(None, POINTER(c_uint8), c_uint32)),
+        ("getLiveCollisionBoundsTagsInfo", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(c_uint8), POINTER(c_uint32))),
+        ("setWorkingPhysicalBoundsInfo", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(HmdQuad_t), c_uint32)),
+        ("getLivePhysicalBoundsInfo", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(HmdQuad_t), POINTER(c_uint32))),
+        ("exportLiveToBuffer", OPENVR_FNTABLE_CALLTYPE(openvr_bool, c_char_p, POINTER(c_uint32))),
+        ("importFromBufferToWorking", OPENVR_FNTABLE_CALLTYPE(openvr_bool, c_char_p, c_uint32)),
+    ]
+
+
+class IVRChaperoneSetup(object):
+    """
+    Manages the working copy of the chaperone info. By default this will be the same as the 
+    live copy. Any changes made with this interface will stay in the working copy until 
+    CommitWorkingCopy() is called, at which point the working copy and the live copy will be 
+    the same again.
+    """
+
+    def __init__(self):
+        version_key = IVRChaperoneSetup_Version
+        if not isInterfaceVersionValid(version_key):
+            _checkInitError(VRInitError_Init_InterfaceNotFound)
+        # Thank you lukexi https://github.com/lukexi/openvr-hs/blob/master/cbits/openvr_capi_helper.c#L9
+        fn_key = b"FnTable:" + version_key
+        fn_type = IVRChaperoneSetup_FnTable
+        fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
+        if fn_table_ptr is None:
+            raise OpenVRError("Error retrieving VR API for IVRChaperoneSetup")
+        self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
+
+    def commitWorkingCopy(self, configFile):
+        "Saves the current working copy to disk"
+
+        fn = self._fns.commitWorkingCopy
+        result = fn(configFile)
+        return result
+
+    def revertWorkingCopy(self):
+        """
+        Reverts the working copy to match the live chaperone calibration.
+        To modify existing data this MUST be do WHILE getting a non-error ChaperoneCalibrationStatus.
+        Only after this should you do gets and sets on the existing data.
+        """
+
+        fn = self._fns.revertWorkingCopy
+        fn()
+
+    def getWorkingPlayAreaSize(self):
+        """
+        Returns the width and depth of the Play Area (formerly named Soft Bounds) in X and Z from the working copy.
+        Tracking space center (0,0,0) is the center of the Play Area.
+        """
+
+        fn = self._fns.getWorkingPlayAreaSize
+        pSizeX = c_float()
+        pSizeZ = c_float()
+        result = fn(byref(pSizeX), byref(pSizeZ))
+        return result, pSizeX.value, pSizeZ.value
+
+    def getWorkingPlayAreaRect(self):
+        """
+        Returns the 4 corner positions of the Play Area (formerly named Soft Bounds) from the working copy.
+        Corners are in clockwise order.
+        Tracking space center (0,0,0) is the center of the Play Area.
+        It's a rectangle.
+        2 sides are parallel to the X axis and 2 sides are parallel to the Z axis.
+        Height of every corner is 0Y (on the floor).
+        """
+
+        fn = self._fns.getWorkingPlayAreaRect
+        rect = HmdQuad_t()
+        result = fn(byref(rect))
+        return result, rect
+
+    def getWorkingCollisionBoundsInfo(self):
+        """
+        Returns the number of Quads if the buffer points to null. Otherwise it returns Quads 
+        into the buffer up to the max specified from the working copy.
+        """
+
+        fn = self._fns.getWorkingCollisionBoundsInfo
+        pQuadsBuffer = HmdQuad_t()
+        punQuadsCount = c_uint32()
+        result = fn(byref(pQuadsBuffer), byref(punQuadsCount))
+        return result, pQuadsBuffer, punQuadsCount.value
+
+    def getLiveCollisionBoundsInfo(self):
+        """
+        Returns the number of Quads if the buffer points to null. Otherwise it returns Quads 
+        into the buffer up to the max specified.
+        """
+
+        fn = self._fns.getLiveCollisionBoundsInfo
+        pQuadsBuffer = HmdQuad_t()
+        punQuadsCount = c_uint32()
+        result = fn(byref(pQuadsBuffer), byref(punQuadsCount))
+        return result, pQuadsBuffer, punQuadsCount.value
+
+    def getWorkingSeatedZeroPoseToRawTrackingPose(self):
+        "Returns the preferred seated position from the working copy."
+
+        fn = self._fns.getWorkingSeatedZeroPoseToRawTrackingPose
+        pmatSeatedZeroPoseToRawTrackingPose = HmdMatrix34_t()
+        result = fn(byref(pmatSeatedZeroPoseToRawTrackingPose))
+        return result, pmatSeatedZeroPoseToRawTrackingPose
+
+    def getWorkingStandingZeroPoseToRawTrackingPose(self):
+        "Returns the standing origin from the working copy."
+
+        fn = self._fns.getWorkingStandingZeroPoseToRawTrackingPose
+        pmatStandingZeroPoseToRawTrackingPose = HmdMatrix34_t()
+        result = fn(byref(pmatStandingZeroPoseToRawTrackingPose))
+        return result, pmatStandingZeroPoseToRawTrackingPose
+
+    def setWorkingPlayAreaSize(self, sizeX, sizeZ):
+        "Sets the Play Area in the working copy."
+
+        fn = self._fns.setWorkingPlayAreaSize
+        fn(sizeX, sizeZ)
+
+    def setWorkingCollisionBoundsInfo(self, unQuadsCount):
+        "Sets the Collision Bounds in the working copy."
+
+        fn = self._fns.setWorkingCollisionBoundsInfo
+        pQuadsBuffer = HmdQuad_t()
+        fn(byref(pQuadsBuffer), unQuadsCount)
+        return pQuadsBuffer
+
+    def setWorkingSeatedZeroPoseToRawTrackingPose(self):
+        "Sets the preferred seated position in the working copy."
+
+        fn = self._fns.setWorkingSeatedZeroPoseToRawTrackingPose
+        pMatSeatedZeroPoseToRawTrackingPose = HmdMatrix34_t()
+        fn(byref(pMatSeatedZeroPoseToRawTrackingPose))
+        return pMatSeatedZeroPoseToRawTrackingPose
+
+    def setWorkingStandingZeroPoseToRawTrackingPose(self):
+        "Sets the preferred standing position in the working copy."
+
+        fn = self._fns.setWorkingStandingZeroPoseToRawTrackingPose
+        pMatStandingZeroPoseToRawTrackingPose = HmdMatrix34_t()
+        fn(byref(pMatStandingZeroPoseToRawTrackingPose))
+        return pMatStandingZeroPoseToRawTrackingPose
+
+    def reloadFromDisk(self, configFile):
+        "Tear everything down and reload it from the file on disk"
+
+        fn = self._fns.reloadFromDisk
+        fn(configFile)
+
+    def getLiveSeatedZeroPoseToRawTrackingPose(self):
+        "Returns the preferred seated position."
+
+        fn = self._fns.getLiveSeatedZeroPoseToRawTrackingPose
+        pmatSeatedZeroPoseToRawTrackingPose = HmdMatrix34_t()
+        result = fn(byref(pmatSeatedZeroPoseToRawTrackingPose))
+        return result, pmatSeatedZeroPoseToRawTrackingPose
+
+    def setWorkingCollisionBoundsTagsInfo(self, unTagCount):
+        fn = self._fns.setWorkingCollisionBoundsTagsInfo
+        pTagsBuffer = c_uint8()
+        fn(byref(pTagsBuffer), unTagCount)
+        return pTagsBuffer.value
+
+    def getLiveCollisionBoundsTagsInfo(self):
+        fn = self._fns.getLiveCollisionBoundsTagsInfo
+        pTagsBuffer = c_uint8()
+        punTagCount = c_uint32()
+        result = fn(byref(pTagsBuffer), byref(punTagCount))
+        return result, pTagsBuffer.value, punTagCount.value
+
+    def setWorkingPhysicalBoundsInfo(self, unQuadsCount):
+        fn = self._fns.setWorkingPhysicalBoundsInfo
+        pQuadsBuffer = HmdQuad_t()
+        result = fn(byref(pQuadsBuffer), unQuadsCount)
+        return result, pQuadsBuffer
+
+    def getLivePhysicalBoundsInfo(self):
+        fn = self._fns.getLivePhysicalBoundsInfo
+        pQuadsBuffer = HmdQuad_t()
+        punQuadsCount = c_uint32()
+        result = fn(byref(pQuadsBuffer), byref(punQuadsCount))
+        return result, pQuadsBuffer, punQuadsCount.value
+
+    def exportLiveToBuffer(self, pBuffer):
+        fn = self._fns.exportLiveToBuffer
+        pnBufferLength = c_uint32()
+        result = fn(pBuffer, byref(pnBufferLength))
+        return result, pnBufferLength.value
+
+    def importFromBufferToWorking(self, pBuffer, nImportFlags):
+        fn = self._fns.importFromBufferToWorking
+        result = fn(pBuffer, nImportFlags)
+        return result
@@ -0,0 +1,438 @@
+#!/bin/env python
+
+# IVRCompositor interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.IVRCompositor, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+class IVRCompositor_FnTable(Structure):
+    _fields_ = [
+        ("setTrackingSpace", OPENVR_FNTABLE_CALLTYPE(None, ETrackingUniverseOrigin)),
+        ("getTrackingSpace", OPENVR_FNTABLE_CALLTYPE(ETrackingUniverseOrigin)),
+        ("waitGetPoses", OPENVR_FNTABLE_CALLTYPE(EVRCompositorError, POINTER(TrackedDevicePose_t), c_uint32, POINTER(TrackedDevicePose_t), c_uint32)),
+        ("getLastPoses", OPENVR_FNTABLE_CALLTYPE(EVRCompositorError, POINTER(TrackedDevicePose_t), c_uint32, POINTER(TrackedDevicePose_t), c_uint32)),
+        ("getLastPoseForTrackedDeviceIndex", OPENVR_FNTABLE_CALLTYPE(EVRCompositorError, TrackedDeviceIndex_t, POINTER(TrackedDevicePose_t), POINTER(TrackedDevicePose_t))),
+        ("submit", OPENVR_FNTABLE_CALLTYPE(EVRCompositorError, EVREye, POINTER(Texture_t), POINTER(VRTextureBounds_t), EVRSubmitFlags)),
+        ("clearLastSubmittedFrame", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("postPresentHandoff", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("getFrameTiming", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(Compositor_FrameTiming), c_uint32)),
+        ("getFrameTimings", OPENVR_FNTABLE_CALLTYPE(c_uint32, POINTER(Compositor_FrameTiming), c_uint32)),
+        ("getFrameTimeRemaining", OPENVR_FNTABLE_CALLTYPE(c_float)),
+        ("getCumulativeStats", OPENVR_FNTABLE_CALLTYPE(None, POINTER(Compositor_CumulativeStats), c_uint32)),
+        ("fadeToColor", OPENVR_FNTABLE_CALLTYPE(None, c_float, c_float, c_float, c_float, c_float, openvr_bool)),
+        ("getCurrentFadeColor", OPENVR_FNTABLE_CALLTYPE(HmdColor_t, openvr_bool)),
+        ("fadeGrid", OPENVR_FNTABLE_CALLTYPE(None, c_float, openvr_bool)),
+        ("getCurrentGridAlpha", OPENVR_FNTABLE_CALLTYPE(c_float)),
+        ("setSkyboxOverride", OPENVR_FNTABLE_CALLTYPE(EVRCompositorError, POINTER(Texture_t), c_uint32)),
+        ("clearSkyboxOverride", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("compositorBringToFront", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("compositorGoToBack", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("compositorQuit", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("isFullscreen", OPENVR_FNTABLE_CALLTYPE(openvr_bool)),
+        ("getCurrentSceneFocusProcess", OPENVR_FNTABLE_CALLTYPE(c_uint32)),
+        ("getLastFrameRenderer", OPENVR_FNTABLE_CALLTYPE(c_uint32)),
+        ("canRenderScene", OPENVR_FNTABLE_CALLTYPE(openvr_bool)),
+        ("showMirrorWindow", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("hideMirrorWindow", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("isMirrorWindowVisible", OPENVR_FNTABLE_CALLTYPE(openvr_bool)),
+        ("compositorDumpImages", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("shouldAppRenderWithLowResources", OPENVR_FNTABLE_CALLTYPE(openvr_bool)),
+        ("forceInterleavedReprojectionOn", OPENVR_FNTABLE_CALLTYPE(None, openvr_bool)),
+        ("forceReconnectProcess", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("suspendRendering", OPENVR_FNTABLE_CALLTYPE(None, openvr_bool)),
+        ("getMirrorTextureD3D11", OPENVR_FNTABLE_CALLTYPE(EVRCompositorError, EVREye, c_void_p, POINTER(c_void_p))),
+        ("releaseMirrorTextureD3D11", OPENVR_FNTABLE_CALLTYPE(None, c_void_p)),
+        ("getMirrorTextureGL", OPENVR_FNTABLE_CALLTYPE(EVRCompositorError, EVREye, POINTER(glUInt_t), POINTER(glSharedTextureHandle_t))),
+        ("releaseSharedGLTexture", OPENVR_FNTABLE_CALLTYPE(openvr_bool, glUInt_t, glSharedTextureHandle_t)),
+        ("lockGLSharedTextureForAccess", OPENVR_FNTABLE_CALLTYPE(None, glSharedTextureHandle_t)),
+        ("unlockGLSharedTextureForAccess", OPENVR_FNTABLE_CALLTYPE(None, glSharedTextureHandle_t)),
+        ("getVulkanInstanceExtensionsRequired", OPENVR_FNTABLE_CALLTYPE(c_uint32, c_char_p, c_uint32)),
+        ("getVulkanDeviceExtensionsRequired", OPENVR_FNTABLE_CALLTYPE(c_uint32, POINTER(VkPhysicalDevice_T), c_char_p, c_uint32)),
+    ]
+
+
+class IVRCompositor(object):
+    "Allows the application to interact with the compositor"
+
+    def __init__(self):
+        version_key = IVRCompositor_Version
+        if not isInterfaceVersionValid(version_key):
+            _checkInitError(VRInitError_Init_InterfaceNotFound)
+        # Thank you lukexi https://github.com/lukexi/openvr-hs/blob/master/cbits/openvr_capi_helper.c#L9
+        fn_key = b"FnTable:" + version_key
+        fn_type = IVRCompositor_FnTable
+        fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
+        if fn_table_ptr is None:
+            raise OpenVRError("Error retrieving VR API for IVRCompositor")
+        self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
+
+    def setTrackingSpace(self, eOrigin):
+        "Sets tracking space returned by WaitGetPoses"
+
+        fn = self._fns.setTrackingSpace
+        fn(eOrigin)
+
+    def getTrackingSpace(self):
+        "Gets current tracking space returned by WaitGetPoses"
+
+        fn = self._fns.getTrackingSpace
+        result = fn()
+        return result
+
+    def waitGetPoses(self, pRenderPoseArray, unRenderPoseArrayCount, pGamePoseArray, unGamePoseArrayCount):
+        """
+        Scene applications should call this function to get poses to render with (and optionally poses predicted an additional frame out to use for gameplay).
+        This function will block until "running start" milliseconds before the start of the frame, and should be called at the last moment before needing to
+        start rendering.
+        * Return codes:
+        - IsNotSceneApplication (make sure to call VR_Init with VRApplicaiton_Scene)
+        - DoNotHaveFocus (some other app has taken focus - this will throttle the call to 10hz to reduce the impact on that app)
+        """
+
+        fn = self._fns.waitGetPoses
+        # TODO: Automate this manual translation
+        # Convert non-pointer python arguments to pointers
+        if pRenderPoseArray is not None:
+            pRenderPoseArray = byref(pRenderPoseArray[0])
+        if pGamePoseArray is not None:
+            pGamePoseArray = byref(pGamePoseArray[0])
+        result = fn(pRenderPoseArray, unRenderPoseArrayCount, pGamePoseArray, unGamePoseArrayCount)
+        return result
+
+    def getLastPoses(self, unRenderPoseArrayCount, unGamePoseArrayCount):
+        "Get the last set of poses returned by WaitGetPoses."
+
+        fn = self._fns.getLastPoses
+        pRenderPoseArray = TrackedDevicePose_t()
+        pGamePoseArray = TrackedDevicePose_t()
+        result = fn(byref(pRenderPoseArray), unRenderPoseArrayCount, byref(pGamePoseArray), unGamePoseArrayCount)
+        return result, pRenderPoseArray, pGamePoseArray
+
+    def getLastPoseForTrackedDeviceIndex(self, unDeviceIndex):
+        """
+        Interface for accessing last set of poses returned by WaitGetPoses one at a time.
+        Returns VRCompositorError_IndexOutOfRange if unDeviceIndex not less than k_unMaxTrackedDeviceCount otherwise VRCompositorError_None.
+        It is okay to pass NULL for either pose if you only want one of the values.
+        """
+
+        fn = self._fns.getLastPoseForTrackedDeviceIndex
+        pOutputPose = TrackedDevicePose_t()
+        pOutputGamePose = TrackedDevicePose_t()
+        result = fn(unDeviceIndex, byref(pOutputPose), byref(pOutputGamePose))
+        return result, pOutputPose, pOutputGamePose
+
+    def submit(self, eEye, pTexture, pBounds=None, nSubmitFlags=Submit_Default):
+        """
+        Updated scene texture to display. If pBounds is NULL the entire texture will be used.  If called from an OpenGL app, consider adding a glFlush after
+        Submitting both frames to signal the driver to start processing, otherwise it may wait until the command buffer fills up, causing the app to miss frames.
+        * OpenGL dirty state:
+        glBindTexture
+        * Return codes:
+        - IsNotSceneApplication (make sure to call VR_Init with VRApplicaiton_Scene)
+        - DoNotHaveFocus (some other app has taken focus)
+        - TextureIsOnWrongDevice (application did not use proper AdapterIndex - see IVRSystem.GetDXGIOutputInfo)
+        - SharedTexturesNotSupported (application needs to call CreateDXGIFactory1 or later before creating DX device)
+        - TextureUsesUnsupportedFormat (scene textures must be compatible with DXGI sharing rules - e.g. uncompressed, no mips, etc.)
+        - InvalidTexture (usually means bad arguments passed in)
+        - AlreadySubmitted (app has submitted two left textures or two right textures in a single frame - i.e. before calling WaitGetPoses again)
+        """
+
+        fn = self._fns.submit
+        # TODO: Automate this manual translation
+        eError = fn(eEye, byref(pTexture), pBounds, nSubmitFlags)
+        return eError
+
+    def clearLastSubmittedFrame(self):
+        """
+        Clears the frame that was sent with the last call to Submit. This will cause the 
+        compositor to show the grid until Submit is called again.
+        """
+
+        fn = self._fns.clearLastSubmittedFrame
+        fn()
+
+    def postPresentHandoff(self):
+        """
+        Call immediately after presenting your app's window (i.e. companion window) to unblock the compositor.
+        This is an optional call, which only needs to be used if you can't instead call WaitGetPoses immediately after Present.
+        For example, if your engine's render and game loop are not on separate threads, or blocking the render thread until 3ms before the next vsync would
+        introduce a deadlock of some sort.  This function tells the compositor that you have finished all rendering after having Submitted buffers for both
+        eyes, and it is free to start its rendering work.  This should only be called from the same thread you are rendering on.
+        """
+
+        fn = self._fns.postPresentHandoff
+        fn()
+
+    def getFrameTiming(self, unFramesAgo=0, pTiming=None):
+        """
+        Returns true if timing data is filled it.  Sets oldest timing info if nFramesAgo is larger than the stored history.
+        Be sure to set timing.size = sizeof(Compositor_FrameTiming) on struct passed in before calling this function.
+        """
+
+        fn = self._fns.getFrameTiming
+        # TODO: Automate this manual translation
+        # Pass in a preallocated pTiming to avoid allocating a new one on every call
+        if pTiming is None:
+            pTiming = Compositor_FrameTiming()
+        pTiming.m_nSize = sizeof(Compositor_FrameTiming)
+        result = fn(byref(pTiming), unFramesAgo)
+        return result, pTiming
+
+    def getFrameTimings(self, nFrames, pTiming=None):
+        """
+        Interface for copying a range of timing data.  Frames are returned in ascending order (oldest to newest) with the last being the most recent frame.
+        Only the first entry's m_nSize needs to be set, as the rest will be inferred from that.  Returns total number of entries filled out.
+        """
+
+        fn = self._fns.getFrameTimings
+        # TODO: Automate this manual translation
+        # pTiming is an array of at least nFrames Compositor_FrameTiming, allocated if not given
+        if nFrames < 1:
+            raise ValueError("nFrames must be at least 1, not %d" % nFrames)
+        if pTiming is None:
+            pTiming = (Compositor_FrameTiming * nFrames)()
+        elif len(pTiming) < nFrames:
+            # The runtime writes nFrames entries
+            raise ValueError("pTiming has room for %d frame timings, fewer than nFrames %d" % (len(pTiming), nFrames))
+        pTiming[0].m_nSize = sizeof(Compositor_FrameTiming)
+        result = fn(byref(pTiming[0]), nFrames)
+        return result, pTiming
+
+    def getFrameTimeRemaining(self):
+        """
+        Returns the time in seconds left in the current (as identified by FrameTiming's frameIndex) frame.
+        Due to "running start", this value may roll over to the next frame before ever reaching 0.0.
+        """
+
+        fn = self._fns.getFrameTimeRemaining
+        result = fn()
+        return result
+
+    def getCumulativeStats(self, nStatsSizeInBytes):
+        "Fills out stats accumulated for the last connected application.  Pass in sizeof( Compositor_CumulativeStats ) as second parameter."
+
+        fn = self._fns.getCumulativeStats
+        pStats = Compositor_CumulativeStats()
+        fn(byref(pStats), nStatsSizeInBytes)
+        return pStats
+
+    def fadeToColor(self, fSeconds, fRed, fGreen, fBlue, fAlpha, bBackground):
+        """
+        Fades the view on the HMD to the specified color. The fade will take fSeconds, and the color values are between
+        0.0 and 1.0. This color is faded on top of the scene based on the alpha parameter. Removing the fade color instantly 
+        would be FadeToColor( 0.0, 0.0, 0.0, 0.0, 0.0 ).  Values are in un-premultiplied alpha space.
+        """
+
+        fn = self._fns.fadeToColor
+        fn(fSeconds, fRed, fGreen, fBlue, fAlpha, bBackground)
+
+    def getCurrentFadeColor(self, bBackground):
+        "Get current fade color value."
+
+        fn = self._fns.getCurrentFadeColor
+        result = fn(bBackground)
+        return result
+
+    def fadeGrid(self, fSeconds, bFadeIn):
+        "Fading the Grid in or out in fSeconds"
+
+        fn = self._fns.fadeGrid
+        fn(fSeconds, bFadeIn)
+
+    def getCurrentGridAlpha(self):
+        "Get current alpha value of grid."
+
+        fn = self._fns.getCurrentGridAlpha
+        result = fn()
+        return result
+
+    def setSkyboxOverride(self, unTextureCount):
+        """
+        Override the skybox used in the compositor (e.g. for during level loads when the app can't feed scene images fast enough)
+        Order is Front, Back, Left, Right, Top, Bottom.  If only a single texture is passed, it is assumed in lat-long format.
+        If two are passed, it is assumed a lat-long stereo pair.
+        """
+
+        fn = self._fns.setSkyboxOverride
+        pTextures = Texture_t()
+        result = fn(byref(pTextures), unTextureCount)
+        return result, pTextures
+
+    def clearSkyboxOverride(self):
+        "Resets compositor skybox back to defaults."
+
+        fn = self._fns.clearSkyboxOverride
+        fn()
+
+    def compositorBringToFront(self):
+        """
+        Brings the compositor window to the front. This is useful for covering any other window that may be on the HMD
+        and is obscuring the compositor window.
+        """
+
+        fn = self._fns.compositorBringToFront
+        fn()
+
+    def compositorGoToBack(self):
+        "Pushes the compositor window to the back. This is useful for allowing other applications to draw directly to the HMD."
+
+        fn = self._fns.compositorGoToBack
+        fn()
+
+    def compositorQuit(self):
+        """
+        Tells the compositor process to clean up and exit. You do not need to call this function at shutdown. Under normal 
+        circumstances the compositor will manage its own life cycle based on what applications are running.
+        """
+
+        fn = self._fns.compositorQuit
+        fn()
+
+    def isFullscreen(self):
+        "Return whether the compositor is fullscreen"
+
+        fn = self._fns.isFullscreen
+        result = fn()
+        return result
+
+    def getCurrentSceneFocusProcess(self):
+        "Returns the process ID of the process that is currently rendering the scene"
+
+        fn = self._fns.getCurrentSceneFocusProcess
+        result = fn()
+        return result
+
+    def getLastFrameRenderer(self):
+        """
+        Returns the process ID of the process that rendered the last frame (or 0 if the compositor itself rendered the frame.)
+        Returns 0 when fading out from an app and the app's process Id when fading into an app.
+        """
+
+        fn = self._fns.getLastFrameRenderer
+        result = fn()
+        return result
+
+    def canRenderScene(self):
+        "Returns true if the current process has the scene focus"
+
+        fn = self._fns.canRenderScene
+        result = fn()
+        return result
+
+    def showMirrorWindow(self):
+        "Creates a window on the primary monitor to display what is being shown in the headset."
+
+        fn = self._fns.showMirrorWindow
+        fn()
+
+    def hideMirrorWindow(self):
+        "Closes the mirror window."
+
+        fn = self._fns.hideMirrorWindow
+        fn()
+
+    def isMirrorWindowVisible(self):
+        "Returns true if the mirror window is shown."
+
+        fn = self._fns.isMirrorWindowVisible
+        result = fn()
+        return result
+
+    def compositorDumpImages(self):
+        "Writes all images that the compositor knows about (including overlays) to a 'screenshots' folder in the SteamVR runtime root."
+
+        fn = self._fns.compositorDumpImages
+        fn()
+
+    def shouldAppRenderWithLowResources(self):
+        "Let an app know it should be rendering with low resources."
+
+        fn = self._fns.shouldAppRenderWithLowResources
+        result = fn()
+        return result
+
+    def forceInterleavedReprojectionOn(self, bOverride):
+        "Override interleaved reprojection logic to force on."
+
+        fn = self._fns.forceInterleavedReprojectionOn
+        fn(bOverride)
+
+    def forceReconnectProcess(self):
+        "Force reconnecting to the compositor process."
+
+        fn = self._fns.forceReconnectProcess
+        fn()
+
+    def suspendRendering(self, bSuspend):
+        "Temporarily suspends rendering (useful for finer control over scene transitions)."
+
+        fn = self._fns.suspendRendering
+        fn(bSuspend)
+
+    def getMirrorTextureD3D11(self, eEye, pD3D11DeviceOrResource):
+        """
+        Opens a shared D3D11 texture with the undistorted composited image for each eye.  Use ReleaseMirrorTextureD3D11 when finished
+        instead of calling Release on the resource itself.
+        """
+
+        fn = self._fns.getMirrorTextureD3D11
+        ppD3D11ShaderResourceView = c_void_p()
+        result = fn(eEye, pD3D11DeviceOrResource, byref(ppD3D11ShaderResourceView))
+        return result, ppD3D11ShaderResourceView.value
+
+    def releaseMirrorTextureD3D11(self, pD3D11ShaderResourceView):
+        fn = self._fns.releaseMirrorTextureD3D11
+        fn(pD3D11ShaderResourceView)
+
+    def getMirrorTextureGL(self, eEye):
+        "Access to mirror textures from OpenGL."
+
+        fn = self._fns.getMirrorTextureGL
+        pglTextureId = glUInt_t()
+        pglSharedTextureHandle = glSharedTextureHandle_t()
+        result = fn(eEye, byref(pglTextureId), byref(pglSharedTextureHandle))
+        return result, pglTextureId, pglSharedTextureHandle
+
+    def releaseSharedGLTexture(self, glTextureId, glSharedTextureHandle):
+        fn = self._fns.releaseSharedGLTexture
+        result = fn(glTextureId, glSharedTextureHandle)
+        return result
+
+    def lockGLSharedTextureForAccess(self, glSharedTextureHandle):
+        fn = self._fns.lockGLSharedTextureForAccess
+        fn(glSharedTextureHandle)
+
+    def unlockGLSharedTextureForAccess(self, glSharedTextureHandle):
+        fn = self._fns.unlockGLSharedTextureForAccess
+        fn(glSharedTextureHandle)
+
+    def getVulkanInstanceExtensionsRequired(self, pchValue, unBufferSize):
+        """
+        [Vulkan Only]
+        return 0. Otherwise it returns the length of the number of bytes necessary to hold this string including the trailing
+        null.  The string will be a space separated list of-required instance extensions to enable in VkCreateInstance
+        """
+
+        fn = self._fns.getVulkanInstanceExtensionsRequired
+        result = fn(pchValue, unBufferSize)
+        return result
+
+    def getVulkanDeviceExtensionsRequired(self, pchValue, unBufferSize):
+        """
+        [Vulkan only]
+        return 0. Otherwise it returns the length of the number of bytes necessary to hold this string including the trailing
+        null.  The string will be a space separated list of required device extensions to enable in VkCreateDevice
+        """
+
+        fn = self._fns.getVulkanDeviceExtensionsRequired
+        pPhysicalDevice = VkPhysicalDevice_T()
+        result = fn(byref(pPhysicalDevice), pchValue, unBufferSize)
+        return result, pPhysicalDevice
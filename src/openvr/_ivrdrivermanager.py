@@ -0,0 +1,46 @@
+#!/bin/env python
+
+# IVRDriverManager interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.IVRDriverManager, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+class IVRDriverManager_FnTable(Structure):
+    _fields_ = [
+        ("getDriverCount", OPENVR_FNTABLE_CALLTYPE(c_uint32)),
+        ("getDriverName", OPENVR_FNTABLE_CALLTYPE(c_uint32, DriverId_t, c_char_p, c_uint32)),
+    ]
+
+
+class IVRDriverManager(object):
+    def __init__(self):
+        version_key = IVRDriverManager_Version
+        if not isInterfaceVersionValid(version_key):
+            _checkInitError(VRInitError_Init_InterfaceNotFound)
+        # Thank you lukexi https://github.com/lukexi/openvr-hs/blob/master/cbits/openvr_capi_helper.c#L9
+        fn_key = b"FnTable:" + version_key
+        fn_type = IVRDriverManager_FnTable
+        fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
+        if fn_table_ptr is None:
+            raise OpenVRError("Error retrieving VR API for IVRDriverManager")
+        self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
+
+    def getDriverCount(self):
+        fn = self._fns.getDriverCount
+        result = fn()
+        return result
+
+    def getDriverName(self, nDriver, pchValue, unBufferSize):
+        "Returns the length of the number of bytes necessary to hold this string including the trailing null."
+
+        fn = self._fns.getDriverName
+        result = fn(nDriver, pchValue, unBufferSize)
+        return result
@@ -0,0 +1,75 @@
+#!/bin/env python
+
+# IVRExtendedDisplay interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.IVRExtendedDisplay, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+class IVRExtendedDisplay_FnTable(Structure):
+    _fields_ = [
+        ("getWindowBounds", OPENVR_FNTABLE_CALLTYPE(None, POINTER(c_int32), POINTER(c_int32), POINTER(c_uint32), POINTER(c_uint32))),
+        ("getEyeOutputViewport", OPENVR_FNTABLE_CALLTYPE(None, EVREye, POINTER(c_uint32), POINTER(c_uint32), POINTER(c_uint32), POINTER(c_uint32))),
+        ("getDXGIOutputInfo", OPENVR_FNTABLE_CALLTYPE(None, POINTER(c_int32), POINTER(c_int32))),
+    ]
+
+
+class IVRExtendedDisplay(object):
+    """
+    NOTE: Use of this interface is not recommended in production applications. It will not work for displays which use
+    direct-to-display mode. Creating our own window is also incompatible with the VR compositor and is not available when the compositor is running.
+    """
+
+    def __init__(self):
+        version_key = IVRExtendedDisplay_Version
+        if not isInterfaceVersionValid(version_key):
+            _checkInitError(VRInitError_Init_InterfaceNotFound)
+        # Thank you lukexi https://github.com/lukexi/openvr-hs/blob/master/cbits/openvr_capi_helper.c#L9
+        fn_key = b"FnTable:" + version_key
+        fn_type = IVRExtendedDisplay_FnTable
+        fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
+        if fn_table_ptr is None:
+            raise OpenVRError("Error retrieving VR API for IVRExtendedDisplay")
+        self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
+
+    def getWindowBounds(self):
+        "Size and position that the window needs to be on the VR display."
+
+        fn = self._fns.getWindowBounds
+        pnX = c_int32()
+        pnY = c_int32()
+        pnWidth = c_uint32()
+        pnHeight = c_uint32()
+        fn(byref(pnX), byref(pnY), byref(pnWidth), byref(pnHeight))
+        return pnX.value, pnY.value, pnWidth.value, pnHeight.value
+
+    def getEyeOutputViewport(self, eEye):
+        "Gets the viewport in the frame buffer to draw the output of the distortion into"
+
+        fn = self._fns.getEyeOutputViewport
+        pnX = c_uint32()
+        pnY = c_uint32()
+        pnWidth = c_uint32()
+        pnHeight = c_uint32()
+        fn(eEye, byref(pnX), byref(pnY), byref(pnWidth), byref(pnHeight))
+        return pnX.value, pnY.value, pnWidth.value, pnHeight.value
+
+    def getDXGIOutputInfo(self):
+        """
+        [D3D10/11 Only]
+        Returns the adapter index and output index that the user should pass into EnumAdapters and EnumOutputs
+        to create the device and swap chain in DX10 and DX11. If an error occurs both indices will be set to -1.
+        """
+
+        fn = self._fns.getDXGIOutputInfo
+        pnAdapterIndex = c_int32()
+        pnAdapterOutputIndex = c_int32()
+        fn(byref(pnAdapterIndex), byref(pnAdapterOutputIndex))
+        return pnAdapterIndex.value, pnAdapterOutputIndex.value
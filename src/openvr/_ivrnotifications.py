@@ -0,0 +1,60 @@
+#!/bin/env python
+
+# IVRNotifications interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.IVRNotifications, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+class IVRNotifications_FnTable(Structure):
+    _fields_ = [
+        ("createNotification", OPENVR_FNTABLE_CALLTYPE(EVRNotificationError, VROverlayHandle_t, c_uint64, EVRNotificationType, c_char_p, EVRNotificationStyle, POINTER(NotificationBitmap_t), POINTER(VRNotificationId))),
+        ("removeNotification", OPENVR_FNTABLE_CALLTYPE(EVRNotificationError, VRNotificationId)),
+    ]
+
+
+class IVRNotifications(object):
+    """
+    Allows notification sources to interact with the VR system
+    This current interface is not yet implemented. Do not use yet.
+    """
+
+    def __init__(self):
+        version_key = IVRNotifications_Version
+        if not isInterfaceVersionValid(version_key):
+            _checkInitError(VRInitError_Init_InterfaceNotFound)
+        # Thank you lukexi https://github.com/lukexi/openvr-hs/blob/master/cbits/openvr_capi_helper.c#L9
+        fn_key = b"FnTable:" + version_key
+        fn_type = IVRNotifications_FnTable
+        fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
+        if fn_table_ptr is None:
+            raise OpenVRError("Error retrieving VR API for IVRNotifications")
+        self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
+
+    def createNotification(self, ulOverlayHandle, ulUserValue, type_, pchText, style):
+        """
+        Create a notification and enqueue it to be shown to the user.
+        An overlay handle is required to create a notification, as otherwise it would be impossible for a user to act on it.
+        To create a two-line notification, use a line break ('\n') to split the text into two lines.
+        The pImage argument may be NULL, in which case the specified overlay's icon will be used instead.
+        """
+
+        fn = self._fns.createNotification
+        pImage = NotificationBitmap_t()
+        pNotificationId = VRNotificationId()
+        result = fn(ulOverlayHandle, ulUserValue, type_, pchText, style, byref(pImage), byref(pNotificationId))
+        return result, pImage, pNotificationId
+
+    def removeNotification(self, notificationId):
+        "Destroy a notification, hiding it first if it currently shown to the user."
+
+        fn = self._fns.removeNotification
+        result = fn(notificationId)
+        return result
@@ -0,0 +1,823 @@
+#!/bin/env python
+
+# IVROverlay interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.IVROverlay, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+class IVROverlay_FnTable(Structure):
+    _fields_ = [
+        ("findOverlay", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, c_char_p, POINTER(VROverlayHandle_t))),
+        ("createOverlay", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, c_char_p, c_char_p, POINTER(VROverlayHandle_t))),
+        ("destroyOverlay", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t)),
+        ("setHighQualityOverlay", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t)),
+        ("getHighQualityOverlay", OPENVR_FNTABLE_CALLTYPE(VROverlayHandle_t)),
+        ("getOverlayKey", OPENVR_FNTABLE_CALLTYPE(c_uint32, VROverlayHandle_t, c_char_p, c_uint32, POINTER(EVROverlayError))),
+        ("getOverlayName", OPENVR_FNTABLE_CALLTYPE(c_uint32, VROverlayHandle_t, c_char_p, c_uint32, POINTER(EVROverlayError))),
+        ("setOverlayName", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, c_char_p)),
+        ("getOverlayImageData", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, c_void_p, c_uint32, POINTER(c_uint32), POINTER(c_uint32))),
+        ("getOverlayErrorNameFromEnum", OPENVR_FNTABLE_CALLTYPE(c_char_p, EVROverlayError)),
+        ("setOverlayRenderingPid", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, c_uint32)),
+        ("getOverlayRenderingPid", OPENVR_FNTABLE_CALLTYPE(c_uint32, VROverlayHandle_t)),
+        ("setOverlayFlag", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, VROverlayFlags, openvr_bool)),
+        ("getOverlayFlag", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, VROverlayFlags, POINTER(openvr_bool))),
+        ("setOverlayColor", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, c_float, c_float, c_float)),
+        ("getOverlayColor", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(c_float), POINTER(c_float), POINTER(c_float))),
+        ("setOverlayAlpha", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, c_float)),
+        ("getOverlayAlpha", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(c_float))),
+        ("setOverlayTexelAspect", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, c_float)),
+        ("getOverlayTexelAspect", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(c_float))),
+        ("setOverlaySortOrder", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, c_uint32)),
+        ("getOverlaySortOrder", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(c_uint32))),
+        ("setOverlayWidthInMeters", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, c_float)),
+        ("getOverlayWidthInMeters", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(c_float))),
+        ("setOverlayAutoCurveDistanceRangeInMeters", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, c_float, c_float)),
+        ("getOverlayAutoCurveDistanceRangeInMeters", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(c_float), POINTER(c_float))),
+        ("setOverlayTextureColorSpace", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, EColorSpace)),
+        ("getOverlayTextureColorSpace", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(EColorSpace))),
+        ("setOverlayTextureBounds", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(VRTextureBounds_t))),
+        ("getOverlayTextureBounds", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(VRTextureBounds_t))),
+        ("getOverlayRenderModel", OPENVR_FNTABLE_CALLTYPE(c_uint32, VROverlayHandle_t, c_char_p, c_uint32, POINTER(HmdColor_t), POINTER(EVROverlayError))),
+        ("setOverlayRenderModel", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, c_char_p, POINTER(HmdColor_t))),
+        ("getOverlayTransformType", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(VROverlayTransformType))),
+        ("setOverlayTransformAbsolute", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, ETrackingUniverseOrigin, POINTER(HmdMatrix34_t))),
+        ("getOverlayTransformAbsolute", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(ETrackingUniverseOrigin), POINTER(HmdMatrix34_t))),
+        ("setOverlayTransformTrackedDeviceRelative", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, TrackedDeviceIndex_t, POINTER(HmdMatrix34_t))),
+        ("getOverlayTransformTrackedDeviceRelative", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(TrackedDeviceIndex_t), POINTER(HmdMatrix34_t))),
+        ("setOverlayTransformTrackedDeviceComponent", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, TrackedDeviceIndex_t, c_char_p)),
+        ("getOverlayTransformTrackedDeviceComponent", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(TrackedDeviceIndex_t), c_char_p, c_uint32)),
+        ("getOverlayTransformOverlayRelative", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(VROverlayHandle_t), POINTER(HmdMatrix34_t))),
+        ("setOverlayTransformOverlayRelative", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, VROverlayHandle_t, POINTER(HmdMatrix34_t))),
+        ("showOverlay", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t)),
+        ("hideOverlay", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t)),
+        ("isOverlayVisible", OPENVR_FNTABLE_CALLTYPE(openvr_bool, VROverlayHandle_t)),
+        ("getTransformForOverlayCoordinates", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, ETrackingUniverseOrigin, HmdVector2_t, POINTER(HmdMatrix34_t))),
+        ("pollNextOverlayEvent", OPENVR_FNTABLE_CALLTYPE(openvr_bool, VROverlayHandle_t, POINTER(VREvent_t), c_uint32)),
+        ("getOverlayInputMethod", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(VROverlayInputMethod))),
+        ("setOverlayInputMethod", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, VROverlayInputMethod)),
+        ("getOverlayMouseScale", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(HmdVector2_t))),
+        ("setOverlayMouseScale", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(HmdVector2_t))),
+        ("computeOverlayIntersection", OPENVR_FNTABLE_CALLTYPE(openvr_bool, VROverlayHandle_t, POINTER(VROverlayIntersectionParams_t), POINTER(VROverlayIntersectionResults_t))),
+        ("handleControllerOverlayInteractionAsMouse", OPENVR_FNTABLE_CALLTYPE(openvr_bool, VROverlayHandle_t, TrackedDeviceIndex_t)),
+        ("isHoverTargetOverlay", OPENVR_FNTABLE_CALLTYPE(openvr_bool, VROverlayHandle_t)),
+        ("getGamepadFocusOverlay", OPENVR_FNTABLE_CALLTYPE(VROverlayHandle_t)),
+        ("setGamepadFocusOverlay", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t)),
+        ("setOverlayNeighbor", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, EOverlayDirection, VROverlayHandle_t, VROverlayHandle_t)),
+        ("moveGamepadFocusToNeighbor", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, EOverlayDirection, VROverlayHandle_t)),
+        ("setOverlayTexture", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(Texture_t))),
+        ("clearOverlayTexture", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t)),
+        ("setOverlayRaw", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, c_void_p, c_uint32, c_uint32, c_uint32)),
+        ("setOverlayFromFile", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, c_char_p)),
+        ("getOverlayTexture", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(c_void_p), c_void_p, POINTER(c_uint32), POINTER(c_uint32), POINTER(c_uint32), POINTER(ETextureType), POINTER(EColorSpace), POINTER(VRTextureBounds_t))),
+        ("releaseNativeOverlayHandle", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, c_void_p)),
+        ("getOverlayTextureSize", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(c_uint32), POINTER(c_uint32))),
+        ("createDashboardOverlay", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, c_char_p, c_char_p, POINTER(VROverlayHandle_t), POINTER(VROverlayHandle_t))),
+        ("isDashboardVisible", OPENVR_FNTABLE_CALLTYPE(openvr_bool)),
+        ("isActiveDashboardOverlay", OPENVR_FNTABLE_CALLTYPE(openvr_bool, VROverlayHandle_t)),
+        ("setDashboardOverlaySceneProcess", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, c_uint32)),
+        ("getDashboardOverlaySceneProcess", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(c_uint32))),
+        ("showDashboard", OPENVR_FNTABLE_CALLTYPE(None, c_char_p)),
+        ("getPrimaryDashboardDevice", OPENVR_FNTABLE_CALLTYPE(TrackedDeviceIndex_t)),
+        ("showKeyboard", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, EGamepadTextInputMode, EGamepadTextInputLineMode, c_char_p, c_uint32, c_char_p, openvr_bool, c_uint64)),
+        ("showKeyboardForOverlay", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, EGamepadTextInputMode, EGamepadTextInputLineMode, c_char_p, c_uint32, c_char_p, openvr_bool, c_uint64)),
+        ("getKeyboardText", OPENVR_FNTABLE_CALLTYPE(c_uint32, c_char_p, c_uint32)),
+        ("hideKeyboard", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("setKeyboardTransformAbsolute", OPENVR_FNTABLE_CALLTYPE(None, ETrackingUniverseOrigin, POINTER(HmdMatrix34_t))),
+        ("setKeyboardPositionForOverlay", OPENVR_FNTABLE_CALLTYPE(None, VROverlayHandle_t, HmdRect2_t)),
+        ("setOverlayIntersectionMask", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(VROverlayIntersectionMaskPrimitive_t), c_uint32, c_uint32)),
+        ("getOverlayFlags", OPENVR_FNTABLE_CALLTYPE(EVROverlayError, VROverlayHandle_t, POINTER(c_uint32))),
+        ("showMessageOverlay", OPENVR_FNTABLE_CALLTYPE(VRMessageOverlayResponse, c_char_p, c_char_p, c_char_p, c_char_p, c_char_p, c_char_p)),
+    ]
+
+
+class IVROverlay(object):
+    def __init__(self):
+        version_key = IVROverlay_Version
+        if not isInterfaceVersionValid(version_key):
+            _checkInitError(VRInitError_Init_InterfaceNotFound)
+        # Thank you lukexi https://github.com/lukexi/openvr-hs/blob/master/cbits/openvr_capi_helper.c#L9
+        fn_key = b"FnTable:" + version_key
+        fn_type = IVROverlay_FnTable
+        fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
+        if fn_table_ptr is None:
+            raise OpenVRError("Error retrieving VR API for IVROverlay")
+        self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
+
+    def findOverlay(self, pchOverlayKey):
+        "Finds an existing overlay with the specified key."
+
+        fn = self._fns.findOverlay
+        pOverlayHandle = VROverlayHandle_t()
+        result = fn(pchOverlayKey, byref(pOverlayHandle))
+        return result, pOverlayHandle
+
+    def createOverlay(self, pchOverlayKey, pchOverlayName):
+        "Creates a new named overlay. All overlays start hidden and with default settings."
+
+        fn = self._fns.createOverlay
+        pOverlayHandle = VROverlayHandle_t()
+        result = fn(pchOverlayKey, pchOverlayName, byref(pOverlayHandle))
+        return result, pOverlayHandle
+
+    def destroyOverlay(self, ulOverlayHandle):
+        """
+        Destroys the specified overlay. When an application calls VR_Shutdown all overlays created by that app are
+        automatically destroyed.
+        """
+
+        fn = self._fns.destroyOverlay
+        result = fn(ulOverlayHandle)
+        return result
+
+    def setHighQualityOverlay(self, ulOverlayHandle):
+        """
+        Specify which overlay to use the high quality render path.  This overlay will be composited in during the distortion pass which
+        results in it drawing on top of everything else, but also at a higher quality as it samples the source texture directly rather than
+        rasterizing into each eye's render texture first.  Because if this, only one of these is supported at any given time.  It is most useful
+        for overlays that are expected to take up most of the user's view (e.g. streaming video).
+        This mode does not support mouse input to your overlay.
+        """
+
+        fn = self._fns.setHighQualityOverlay
+        result = fn(ulOverlayHandle)
+        return result
+
+    def getHighQualityOverlay(self):
+        """
+        Returns the overlay handle of the current overlay being rendered using the single high quality overlay render path.
+        Otherwise it will return k_ulOverlayHandleInvalid.
+        """
+
+        fn = self._fns.getHighQualityOverlay
+        result = fn()
+        return result
+
+    def getOverlayKey(self, ulOverlayHandle, pchValue, unBufferSize):
+        """
+        Fills the provided buffer with the string key of the overlay. Returns the size of buffer required to store the key, including
+        the terminating null character. k_unVROverlayMaxKeyLength will be enough bytes to fit the string.
+        """
+
+        fn = self._fns.getOverlayKey
+        pError = EVROverlayError()
+        result = fn(ulOverlayHandle, pchValue, unBufferSize, byref(pError))
+        return result, pError
+
+    def getOverlayName(self, ulOverlayHandle, pchValue, unBufferSize):
+        """
+        Fills the provided buffer with the friendly name of the overlay. Returns the size of buffer required to store the key, including
+        the terminating null character. k_unVROverlayMaxNameLength will be enough bytes to fit the string.
+        """
+
+        fn = self._fns.getOverlayName
+        pError = EVROverlayError()
+        result = fn(ulOverlayHandle, pchValue, unBufferSize, byref(pError))
+        return result, pError
+
+    def setOverlayName(self, ulOverlayHandle, pchName):
+        "set the name to use for this overlay"
+
+        fn = self._fns.setOverlayName
+        result = fn(ulOverlayHandle, pchName)
+        return result
+
+    def getOverlayImageData(self, ulOverlayHandle, pvBuffer, unBufferSize):
+        """
+        Gets the raw image data from an overlay. Overlay image data is always returned as RGBA data, 4 bytes per pixel. If the buffer is not large enough, width and height 
+        will be set and VROverlayError_ArrayTooSmall is returned.
+        """
+
+        fn = self._fns.getOverlayImageData
+        punWidth = c_uint32()
+        punHeight = c_uint32()
+        result = fn(ulOverlayHandle, pvBuffer, unBufferSize, byref(punWidth), byref(punHeight))
+        return result, punWidth.value, punHeight.value
+
+    def getOverlayErrorNameFromEnum(self, error):
+        """
+        returns a string that corresponds with the specified overlay error. The string will be the name 
+        of the error enum value for all valid error codes
+        """
+
+        fn = self._fns.getOverlayErrorNameFromEnum
+        result = fn(error)
+        return result
+
+    def setOverlayRenderingPid(self, ulOverlayHandle, unPID):
+        """
+        Sets the pid that is allowed to render to this overlay (the creator pid is always allow to render),
+        by default this is the pid of the process that made the overlay
+        """
+
+        fn = self._fns.setOverlayRenderingPid
+        result = fn(ulOverlayHandle, unPID)
+        return result
+
+    def getOverlayRenderingPid(self, ulOverlayHandle):
+        "Gets the pid that is allowed to render to this overlay"
+
+        fn = self._fns.getOverlayRenderingPid
+        result = fn(ulOverlayHandle)
+        return result
+
+    def setOverlayFlag(self, ulOverlayHandle, eOverlayFlag, bEnabled):
+        "Specify flag setting for a given overlay"
+
+        fn = self._fns.setOverlayFlag
+        result = fn(ulOverlayHandle, eOverlayFlag, bEnabled)
+        return result
+
+    def getOverlayFlag(self, ulOverlayHandle, eOverlayFlag):
+        "Sets flag setting for a given overlay"
+
+        fn = self._fns.getOverlayFlag
+        pbEnabled = openvr_bool()
+        result = fn(ulOverlayHandle, eOverlayFlag, byref(pbEnabled))
+        return result, pbEnabled
+
+    def setOverlayColor(self, ulOverlayHandle, fRed, fGreen, fBlue):
+        "Sets the color tint of the overlay quad. Use 0.0 to 1.0 per channel."
+
+        fn = self._fns.setOverlayColor
+        result = fn(ulOverlayHandle, fRed, fGreen, fBlue)
+        return result
+
+    def getOverlayColor(self, ulOverlayHandle):
+        "Gets the color tint of the overlay quad."
+
+        fn = self._fns.getOverlayColor
+        pfRed = c_float()
+        pfGreen = c_float()
+        pfBlue = c_float()
+        result = fn(ulOverlayHandle, byref(pfRed), byref(pfGreen), byref(pfBlue))
+        return result, pfRed.value, pfGreen.value, pfBlue.value
+
+    def setOverlayAlpha(self, ulOverlayHandle, fAlpha):
+        "Sets the alpha of the overlay quad. Use 1.0 for 100 percent opacity to 0.0 for 0 percent opacity."
+
+        fn = self._fns.setOverlayAlpha
+        result = fn(ulOverlayHandle, fAlpha)
+        return result
+
+    def getOverlayAlpha(self, ulOverlayHandle):
+        "Gets the alpha of the overlay quad. By default overlays are rendering at 100 percent alpha (1.0)."
+
+        fn = self._fns.getOverlayAlpha
+        pfAlpha = c_float()
+        result = fn(ulOverlayHandle, byref(pfAlpha))
+        return result, pfAlpha.value
+
+    def setOverlayTexelAspect(self, ulOverlayHandle, fTexelAspect):
+        """
+        Sets the aspect ratio of the texels in the overlay. 1.0 means the texels are square. 2.0 means the texels
+        are twice as wide as they are tall. Defaults to 1.0.
+        """
+
+        fn = self._fns.setOverlayTexelAspect
+        result = fn(ulOverlayHandle, fTexelAspect)
+        return result
+
+    def getOverlayTexelAspect(self, ulOverlayHandle):
+        "Gets the aspect ratio of the texels in the overlay. Defaults to 1.0"
+
+        fn = self._fns.getOverlayTexelAspect
+        pfTexelAspect = c_float()
+        result = fn(ulOverlayHandle, byref(pfTexelAspect))
+        return result, pfTexelAspect.value
+
+    def setOverlaySortOrder(self, ulOverlayHandle, unSortOrder):
+        """
+        Sets the rendering sort order for the overlay. Overlays are rendered this order:
+             Overlays owned by the scene application
+             Overlays owned by some other application
+        *	Within a category overlays are rendered lowest sort order to highest sort order. Overlays with the same 
+        sort order are rendered back to front base on distance from the HMD.
+        *	Sort order defaults to 0.
+        """
+
+        fn = self._fns.setOverlaySortOrder
+        result = fn(ulOverlayHandle, unSortOrder)
+        return result
+
+    def getOverlaySortOrder(self, ulOverlayHandle):
+        "Gets the sort order of the overlay. See SetOverlaySortOrder for how this works."
+
+        fn = self._fns.getOverlaySortOrder
+        punSortOrder = c_uint32()
+        result = fn(ulOverlayHandle, byref(punSortOrder))
+        return result, punSortOrder.value
+
+    def setOverlayWidthInMeters(self, ulOverlayHandle, fWidthInMeters):
+        "Sets the width of the overlay quad in meters. By default overlays are rendered on a quad that is 1 meter across"
+
+        fn = self._fns.setOverlayWidthInMeters
+        result = fn(ulOverlayHandle, fWidthInMeters)
+        return result
+
+    def getOverlayWidthInMeters(self, ulOverlayHandle):
+        "Returns the width of the overlay quad in meters. By default overlays are rendered on a quad that is 1 meter across"
+
+        fn = self._fns.getOverlayWidthInMeters
+        pfWidthInMeters = c_float()
+        result = fn(ulOverlayHandle, byref(pfWidthInMeters))
+        return result, pfWidthInMeters.value
+
+    def setOverlayAutoCurveDistanceRangeInMeters(self, ulOverlayHandle, fMinDistanceInMeters, fMaxDistanceInMeters):
+        """
+        For high-quality curved overlays only, sets the distance range in meters from the overlay used to automatically curve
+        the surface around the viewer.  Min is distance is when the surface will be most curved.  Max is when least curved.
+        """
+
+        fn = self._fns.setOverlayAutoCurveDistanceRangeInMeters
+        result = fn(ulOverlayHandle, fMinDistanceInMeters, fMaxDistanceInMeters)
+        return result
+
+    def getOverlayAutoCurveDistanceRangeInMeters(self, ulOverlayHandle):
+        """
+        For high-quality curved overlays only, gets the distance range in meters from the overlay used to automatically curve
+        the surface around the viewer.  Min is distance is when the surface will be most curved.  Max is when least curved.
+        """
+
+        fn = self._fns.getOverlayAutoCurveDistanceRangeInMeters
+        pfMinDistanceInMeters = c_float()
+        pfMaxDistanceInMeters = c_float()
+        result = fn(ulOverlayHandle, byref(pfMinDistanceInMeters), byref(pfMaxDistanceInMeters))
+        return result, pfMinDistanceInMeters.value, pfMaxDistanceInMeters.value
+
+    def setOverlayTextureColorSpace(self, ulOverlayHandle, eTextureColorSpace):
+        """
+        Sets the colorspace the overlay texture's data is in.  Defaults to 'auto'.
+        If the texture needs to be resolved, you should call SetOverlayTexture with the appropriate colorspace instead.
+        """
+
+        fn = self._fns.setOverlayTextureColorSpace
+        result = fn(ulOverlayHandle, eTextureColorSpace)
+        return result
+
+    def getOverlayTextureColorSpace(self, ulOverlayHandle):
+        "Gets the overlay's current colorspace setting."
+
+        fn = self._fns.getOverlayTextureColorSpace
+        peTextureColorSpace = EColorSpace()
+        result = fn(ulOverlayHandle, byref(peTextureColorSpace))
+        return result, peTextureColorSpace
+
+    def setOverlayTextureBounds(self, ulOverlayHandle):
+        "Sets the part of the texture to use for the overlay. UV Min is the upper left corner and UV Max is the lower right corner."
+
+        fn = self._fns.setOverlayTextureBounds
+        pOverlayTextureBounds = VRTextureBounds_t()
+        result = fn(ulOverlayHandle, byref(pOverlayTextureBounds))
+        return result, pOverlayTextureBounds
+
+    def getOverlayTextureBounds(self, ulOverlayHandle):
+        "Gets the part of the texture to use for the overlay. UV Min is the upper left corner and UV Max is the lower right corner."
+
+        fn = self._fns.getOverlayTextureBounds
+        pOverlayTextureBounds = VRTextureBounds_t()
+        result = fn(ulOverlayHandle, byref(pOverlayTextureBounds))
+        return result, pOverlayTextureBounds
+
+    def getOverlayRenderModel(self, ulOverlayHandle, pchValue, unBufferSize):
+        "Gets render model to draw behind this overlay"
+
+        fn = self._fns.getOverlayRenderModel
+        pColor = HmdColor_t()
+        pError = EVROverlayError()
+        result = fn(ulOverlayHandle, pchValue, unBufferSize, byref(pColor), byref(pError))
+        return result, pColor, pError
+
+    def setOverlayRenderModel(self, ulOverlayHandle, pchRenderModel):
+        """
+        Sets render model to draw behind this overlay and the vertex color to use, pass null for pColor to match the overlays vertex color. 
+        The model is scaled by the same amount as the overlay, with a default of 1m.
+        """
+
+        fn = self._fns.setOverlayRenderModel
+        pColor = HmdColor_t()
+        result = fn(ulOverlayHandle, pchRenderModel, byref(pColor))
+        return result, pColor
+
+    def getOverlayTransformType(self, ulOverlayHandle):
+        "Returns the transform type of this overlay."
+
+        fn = self._fns.getOverlayTransformType
+        peTransformType = VROverlayTransformType()
+        result = fn(ulOverlayHandle, byref(peTransformType))
+        return result, peTransformType
+
+    def setOverlayTransformAbsolute(self, ulOverlayHandle, eTrackingOrigin):
+        "Sets the transform to absolute tracking origin."
+
+        fn = self._fns.setOverlayTransformAbsolute
+        pmatTrackingOriginToOverlayTransform = HmdMatrix34_t()
+        result = fn(ulOverlayHandle, eTrackingOrigin, byref(pmatTrackingOriginToOverlayTransform))
+        return result, pmatTrackingOriginToOverlayTransform
+
+    def getOverlayTransformAbsolute(self, ulOverlayHandle):
+        "Gets the transform if it is absolute. Returns an error if the transform is some other type."
+
+        fn = self._fns.getOverlayTransformAbsolute
+        peTrackingOrigin = ETrackingUniverseOrigin()
+        pmatTrackingOriginToOverlayTransform = HmdMatrix34_t()
+        result = fn(ulOverlayHandle, byref(peTrackingOrigin), byref(pmatTrackingOriginToOverlayTransform))
+        return result, peTrackingOrigin, pmatTrackingOriginToOverlayTransform
+
+    def setOverlayTransformTrackedDeviceRelative(self, ulOverlayHandle, unTrackedDevice):
+        "Sets the transform to relative to the transform of the specified tracked device."
+
+        fn = self._fns.setOverlayTransformTrackedDeviceRelative
+        pmatTrackedDeviceToOverlayTransform = HmdMatrix34_t()
+        result = fn(ulOverlayHandle, unTrackedDevice, byref(pmatTrackedDeviceToOverlayTransform))
+        return result, pmatTrackedDeviceToOverlayTransform
+
+    def getOverlayTransformTrackedDeviceRelative(self, ulOverlayHandle):
+        "Gets the transform if it is relative to a tracked device. Returns an error if the transform is some other type."
+
+        fn = self._fns.getOverlayTransformTrackedDeviceRelative
+        punTrackedDevice = TrackedDeviceIndex_t()
+        pmatTrackedDeviceToOverlayTransform = HmdMatrix34_t()
+        result = fn(ulOverlayHandle, byref(punTrackedDevice), byref(pmatTrackedDeviceToOverlayTransform))
+        return result, punTrackedDevice, pmatTrackedDeviceToOverlayTransform
+
+    def setOverlayTransformTrackedDeviceComponent(self, ulOverlayHandle, unDeviceIndex, pchComponentName):
+        """
+        Sets the transform to draw the overlay on a rendermodel component mesh instead of a quad. This will only draw when the system is
+        drawing the device. Overlays with this transform type cannot receive mouse events.
+        """
+
+        fn = self._fns.setOverlayTransformTrackedDeviceComponent
+        result = fn(ulOverlayHandle, unDeviceIndex, pchComponentName)
+        return result
+
+    def getOverlayTransformTrackedDeviceComponent(self, ulOverlayHandle, pchComponentName, unComponentNameSize):
+        "Gets the transform information when the overlay is rendering on a component."
+
+        fn = self._fns.getOverlayTransformTrackedDeviceComponent
+        punDeviceIndex = TrackedDeviceIndex_t()
+        result = fn(ulOverlayHandle, byref(punDeviceIndex), pchComponentName, unComponentNameSize)
+        return result, punDeviceIndex
+
+    def getOverlayTransformOverlayRelative(self, ulOverlayHandle):
+        "Gets the transform if it is relative to another overlay. Returns an error if the transform is some other type."
+
+        fn = self._fns.getOverlayTransformOverlayRelative
+        ulOverlayHandleParent = VROverlayHandle_t()
+        pmatParentOverlayToOverlayTransform = HmdMatrix34_t()
+        result = fn(ulOverlayHandle, byref(ulOverlayHandleParent), byref(pmatParentOverlayToOverlayTransform))
+        return result, ulOverlayHandleParent, pmatParentOverlayToOverlayTransform
+
+    def setOverlayTransformOverlayRelative(self, ulOverlayHandle, ulOverlayHandleParent):
+        "Sets the transform to relative to the transform of the specified overlay. This overlays visibility will also track the parents visibility"
+
+        fn = self._fns.setOverlayTransformOverlayRelative
+        pmatParentOverlayToOverlayTransform = HmdMatrix34_t()
+        result = fn(ulOverlayHandle, ulOverlayHandleParent, byref(pmatParentOverlayToOverlayTransform))
+        return result, pmatParentOverlayToOverlayTransform
+
+    def showOverlay(self, ulOverlayHandle):
+        "Shows the VR overlay.  For dashboard overlays, only the Dashboard Manager is allowed to call this."
+
+        fn = self._fns.showOverlay
+        result = fn(ulOverlayHandle)
+        return result
+
+    def hideOverlay(self, ulOverlayHandle):
+        "Hides the VR overlay.  For dashboard overlays, only the Dashboard Manager is allowed to call this."
+
+        fn = self._fns.hideOverlay
+        result = fn(ulOverlayHandle)
+        return result
+
+    def isOverlayVisible(self, ulOverlayHandle):
+        "Returns true if the overlay is visible."
+
+        fn = self._fns.isOverlayVisible
+        result = fn(ulOverlayHandle)
+        return result
+
+    def getTransformForOverlayCoordinates(self, ulOverlayHandle, eTrackingOrigin, coordinatesInOverlay):
+        "Get the transform in 3d space associated with a specific 2d point in the overlay's coordinate space (where 0,0 is the lower left). -Z points out of the overlay"
+
+        fn = self._fns.getTransformForOverlayCoordinates
+        pmatTransform = HmdMatrix34_t()
+        result = fn(ulOverlayHandle, eTrackingOrigin, coordinatesInOverlay, byref(pmatTransform))
+        return result, pmatTransform
+
+    def pollNextOverlayEvent(self, ulOverlayHandle, uncbVREvent):
+        """
+        Returns true and fills the event with the next event on the overlay's event queue, if there is one. 
+        If there are no events this method returns false. uncbVREvent should be the size in bytes of the VREvent_t struct
+        """
+
+        fn = self._fns.pollNextOverlayEvent
+        pEvent = VREvent_t()
+        result = fn(ulOverlayHandle, byref(pEvent), uncbVREvent)
+        return result, pEvent
+
+    def getOverlayInputMethod(self, ulOverlayHandle):
+        "Returns the current input settings for the specified overlay."
+
+        fn = self._fns.getOverlayInputMethod
+        peInputMethod = VROverlayInputMethod()
+        result = fn(ulOverlayHandle, byref(peInputMethod))
+        return result, peInputMethod
+
+    def setOverlayInputMethod(self, ulOverlayHandle, eInputMethod):
+        "Sets the input settings for the specified overlay."
+
+        fn = self._fns.setOverlayInputMethod
+        result = fn(ulOverlayHandle, eInputMethod)
+        return result
+
+    def getOverlayMouseScale(self, ulOverlayHandle):
+        """
+        Gets the mouse scaling factor that is used for mouse events. The actual texture may be a different size, but this is
+        typically the size of the underlying UI in pixels.
+        """
+
+        fn = self._fns.getOverlayMouseScale
+        pvecMouseScale = HmdVector2_t()
+        result = fn(ulOverlayHandle, byref(pvecMouseScale))
+        return result, pvecMouseScale
+
+    def setOverlayMouseScale(self, ulOverlayHandle):
+        """
+        Sets the mouse scaling factor that is used for mouse events. The actual texture may be a different size, but this is
+        typically the size of the underlying UI in pixels (not in world space).
+        """
+
+        fn = self._fns.setOverlayMouseScale
+        pvecMouseScale = HmdVector2_t()
+        result = fn(ulOverlayHandle, byref(pvecMouseScale))
+        return result, pvecMouseScale
+
+    def computeOverlayIntersection(self, ulOverlayHandle):
+        """
+        Computes the overlay-space pixel coordinates of where the ray intersects the overlay with the
+        specified settings. Returns false if there is no intersection.
+        """
+
+        fn = self._fns.computeOverlayIntersection
+        pParams = VROverlayIntersectionParams_t()
+        pResults = VROverlayIntersectionResults_t()
+        result = fn(ulOverlayHandle, byref(pParams), byref(pResults))
+        return result, pParams, pResults
+
+    def handleControllerOverlayInteractionAsMouse(self, ulOverlayHandle, unControllerDeviceIndex):
+        """
+        Processes mouse input from the specified controller as though it were a mouse pointed at a compositor overlay with the
+        specified settings. The controller is treated like a laser pointer on the -z axis. The point where the laser pointer would
+        intersect with the overlay is the mouse position, the trigger is left mouse, and the track pad is right mouse. 
+        * Return true if the controller is pointed at the overlay and an event was generated.
+        """
+
+        fn = self._fns.handleControllerOverlayInteractionAsMouse
+        result = fn(ulOverlayHandle, unControllerDeviceIndex)
+        return result
+
+    def isHoverTargetOverlay(self, ulOverlayHandle):
+        """
+        Returns true if the specified overlay is the hover target. An overlay is the hover target when it is the last overlay "moused over" 
+        by the virtual mouse pointer
+        """
+
+        fn = self._fns.isHoverTargetOverlay
+        result = fn(ulOverlayHandle)
+        return result
+
+    def getGamepadFocusOverlay(self):
+        "Returns the current Gamepad focus overlay"
+
+        fn = self._fns.getGamepadFocusOverlay
+        result = fn()
+        return result
+
+    def setGamepadFocusOverlay(self, ulNewFocusOverlay):
+        "Sets the current Gamepad focus overlay"
+
+        fn = self._fns.setGamepadFocusOverlay
+        result = fn(ulNewFocusOverlay)
+        return result
+
+    def setOverlayNeighbor(self, eDirection, ulFrom, ulTo):
+        """
+        Sets an overlay's neighbor. This will also set the neighbor of the "to" overlay
+        to point back to the "from" overlay. If an overlay's neighbor is set to invalid both
+        ends will be cleared
+        """
+
+        fn = self._fns.setOverlayNeighbor
+        result = fn(eDirection, ulFrom, ulTo)
+        return result
+
+    def moveGamepadFocusToNeighbor(self, eDirection, ulFrom):
+        """
+        Changes the Gamepad focus from one overlay to one of its neighbors. Returns VROverlayError_NoNeighbor if there is no
+        neighbor in that direction
+        """
+
+        fn = self._fns.moveGamepadFocusToNeighbor
+        result = fn(eDirection, ulFrom)
+        return result
+
+    def setOverlayTexture(self, ulOverlayHandle):
+        """
+        Texture to draw for the overlay. This function can only be called by the overlay's creator or renderer process (see SetOverlayRenderingPid) .
+        * OpenGL dirty state:
+        glBindTexture
+        """
+
+        fn = self._fns.setOverlayTexture
+        pTexture = Texture_t()
+        result = fn(ulOverlayHandle, byref(pTexture))
+        return result, pTexture
+
+    def clearOverlayTexture(self, ulOverlayHandle):
+        "Use this to tell the overlay system to release the texture set for this overlay."
+
+        fn = self._fns.clearOverlayTexture
+        result = fn(ulOverlayHandle)
+        return result
+
+    def setOverlayRaw(self, ulOverlayHandle, pvBuffer, unWidth, unHeight, unDepth):
+        """
+        Separate interface for providing the data as a stream of bytes, but there is an upper bound on data 
+        that can be sent. This function can only be called by the overlay's renderer process.
+        """
+
+        fn = self._fns.setOverlayRaw
+        result = fn(ulOverlayHandle, pvBuffer, unWidth, unHeight, unDepth)
+        return result
+
+    def setOverlayFromFile(self, ulOverlayHandle, pchFilePath):
+        """
+        Separate interface for providing the image through a filename: can be png or jpg, and should not be bigger than 1920x1080.
+        This function can only be called by the overlay's renderer process
+        """
+
+        fn = self._fns.setOverlayFromFile
+        result = fn(ulOverlayHandle, pchFilePath)
+        return result
+
+    def getOverlayTexture(self, ulOverlayHandle, pNativeTextureRef):
+        """
+        Get the native texture handle/device for an overlay you have created.
+        On windows this handle will be a ID3D11ShaderResourceView with a ID3D11Texture2D bound.
+        * The texture will always be sized to match the backing texture you supplied in SetOverlayTexture above.
+        * You MUST call ReleaseNativeOverlayHandle() with pNativeTextureHandle once you are done with this texture.
+        * pNativeTextureHandle is an OUTPUT, it will be a pointer to a ID3D11ShaderResourceView *.
+        pNativeTextureRef is an INPUT and should be a ID3D11Resource *. The device used by pNativeTextureRef will be used to bind pNativeTextureHandle.
+        """
+
+        fn = self._fns.getOverlayTexture
+        pNativeTextureHandle = c_void_p()
+        pWidth = c_uint32()
+        pHeight = c_uint32()
+        pNativeFormat = c_uint32()
+        pAPIType = ETextureType()
+        pColorSpace = EColorSpace()
+        pTextureBounds = VRTextureBounds_t()
+        result = fn(ulOverlayHandle, byref(pNativeTextureHandle), pNativeTextureRef, byref(pWidth), byref(pHeight), byref(pNativeFormat), byref(pAPIType), byref(pColorSpace), byref(pTextureBounds))
+        return result, pNativeTextureHandle.value, pWidth.value, pHeight.value, pNativeFormat.value, pAPIType, pColorSpace, pTextureBounds
+
+    def releaseNativeOverlayHandle(self, ulOverlayHandle, pNativeTextureHandle):
+        """
+        Release the pNativeTextureHandle provided from the GetOverlayTexture call, this allows the system to free the underlying GPU resources for this object,
+        so only do it once you stop rendering this texture.
+        """
+
+        fn = self._fns.releaseNativeOverlayHandle
+        result = fn(ulOverlayHandle, pNativeTextureHandle)
+        return result
+
+    def getOverlayTextureSize(self, ulOverlayHandle):
+        "Get the size of the overlay texture"
+
+        fn = self._fns.getOverlayTextureSize
+        pWidth = c_uint32()
+        pHeight = c_uint32()
+        result = fn(ulOverlayHandle, byref(pWidth), byref(pHeight))
+        return result, pWidth.value, pHeight.value
+
+    def createDashboardOverlay(self, pchOverlayKey, pchOverlayFriendlyName):
+        "Creates a dashboard overlay and returns its handle"
+
+        fn = self._fns.createDashboardOverlay
+        pMainHandle = VROverlayHandle_t()
+        pThumbnailHandle = VROverlayHandle_t()
+        result = fn(pchOverlayKey, pchOverlayFriendlyName, byref(pMainHandle), byref(pThumbnailHandle))
+        return result, pMainHandle, pThumbnailHandle
+
+    def isDashboardVisible(self):
+        "Returns true if the dashboard is visible"
+
+        fn = self._fns.isDashboardVisible
+        result = fn()
+        return result
+
+    def isActiveDashboardOverlay(self, ulOverlayHandle):
+        "returns true if the dashboard is visible and the specified overlay is the active system Overlay"
+
+        fn = self._fns.isActiveDashboardOverlay
+        result = fn(ulOverlayHandle)
+        return result
+
+    def setDashboardOverlaySceneProcess(self, ulOverlayHandle, unProcessId):
+        "Sets the dashboard overlay to only appear when the specified process ID has scene focus"
+
+        fn = self._fns.setDashboardOverlaySceneProcess
+        result = fn(ulOverlayHandle, unProcessId)
+        return result
+
+    def getDashboardOverlaySceneProcess(self, ulOverlayHandle):
+        "Gets the process ID that this dashboard overlay requires to have scene focus"
+
+        fn = self._fns.getDashboardOverlaySceneProcess
+        punProcessId = c_uint32()
+        result = fn(ulOverlayHandle, byref(punProcessId))
+        return result, punProcessId.value
+
+    def showDashboard(self, pchOverlayToShow):
+        "Shows the dashboard."
+
+        fn = self._fns.showDashboard
+        fn(pchOverlayToShow)
+
+    def getPrimaryDashboardDevice(self):
+        "Returns the tracked device that has the laser pointer in the dashboard"
+
+        fn = self._fns.getPrimaryDashboardDevice
+        result = fn()
+        return result
+
+    def showKeyboard(self, eInputMode, eLineInputMode, pchDescription, unCharMax, pchExistingText, bUseMinimalMode, uUserValue):
+        "Show the virtual keyboard to accept input"
+
+        fn = self._fns.showKeyboard
+        result = fn(eInputMode, eLineInputMode, pchDescription, unCharMax, pchExistingText, bUseMinimalMode, uUserValue)
+        return result
+
+    def showKeyboardForOverlay(self, ulOverlayHandle, eInputMode, eLineInputMode, pchDescription, unCharMax, pchExistingText, bUseMinimalMode, uUserValue):
+        fn = self._fns.showKeyboardForOverlay
+        result = fn(ulOverlayHandle, eInputMode, eLineInputMode, pchDescription, unCharMax, pchExistingText, bUseMinimalMode, uUserValue)
+        return result
+
+    def getKeyboardText(self, pchText, cchText):
+        "Get the text that was entered into the text input"
+
+        fn = self._fns.getKeyboardText
+        result = fn(pchText, cchText)
+        return result
+
+    def hideKeyboard(self):
+        "Hide the virtual keyboard"
+
+        fn = self._fns.hideKeyboard
+        fn()
+
+    def setKeyboardTransformAbsolute(self, eTrackingOrigin):
+        "Set the position of the keyboard in world space"
+
+        fn = self._fns.setKeyboardTransformAbsolute
+        pmatTrackingOriginToKeyboardTransform = HmdMatrix34_t()
+        fn(eTrackingOrigin, byref(pmatTrackingOriginToKeyboardTransform))
+        return pmatTrackingOriginToKeyboardTransform
+
+    def setKeyboardPositionForOverlay(self, ulOverlayHandle, avoidRect):
+        "Set the position of the keyboard in overlay space by telling it to avoid a rectangle in the overlay. Rectangle coords have (0,0) in the bottom left"
+
+        fn = self._fns.setKeyboardPositionForOverlay
+        fn(ulOverlayHandle, avoidRect)
+
+    def setOverlayIntersectionMask(self, ulOverlayHandle, unNumMaskPrimitives, unPrimitiveSize):
+        """
+        Sets a list of primitives to be used for controller ray intersection
+        typically the size of the underlying UI in pixels (not in world space).
+        """
+
+        fn = self._fns.setOverlayIntersectionMask
+        pMaskPrimitives = VROverlayIntersectionMaskPrimitive_t()
+        result = fn(ulOverlayHandle, byref(pMaskPrimitives), unNumMaskPrimitives, unPrimitiveSize)
+        return result, pMaskPrimitives
+
+    def getOverlayFlags(self, ulOverlayHandle):
+        fn = self._fns.getOverlayFlags
+        pFlags = c_uint32()
+        result = fn(ulOverlayHandle, byref(pFlags))
+        return result, pFlags.value
+
+    def showMessageOverlay(self, pchText, pchCaption, pchButton0Text, pchButton1Text, pchButton2Text, pchButton3Text):
+        "Show the message overlay. This will block and return you a result."
+
+        fn = self._fns.showMessageOverlay
+        result = fn(pchText, pchCaption, pchButton0Text, pchButton1Text, pchButton2Text, pchButton3Text)
+        return result
@@ -0,0 +1,244 @@
+#!/bin/env python
+
+# IVRRenderModels interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.IVRRenderModels, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+class IVRRenderModels_FnTable(Structure):
+    _fields_ = [
+        ("loadRenderModel_Async", OPENVR_FNTABLE_CALLTYPE(EVRRenderModelError, c_char_p, POINTER(POINTER(RenderModel_t)))),
+        ("freeRenderModel", OPENVR_FNTABLE_CALLTYPE(None, POINTER(RenderModel_t))),
+        ("loadTexture_Async", OPENVR_FNTABLE_CALLTYPE(EVRRenderModelError, TextureID_t, POINTER(POINTER(RenderModel_TextureMap_t)))),
+        ("freeTexture", OPENVR_FNTABLE_CALLTYPE(None, POINTER(RenderModel_TextureMap_t))),
+        ("loadTextureD3D11_Async", OPENVR_FNTABLE_CALLTYPE(EVRRenderModelError, TextureID_t, c_void_p, POINTER(c_void_p))),
+        ("loadIntoTextureD3D11_Async", OPENVR_FNTABLE_CALLTYPE(EVRRenderModelError, TextureID_t, c_void_p)),
+        ("freeTextureD3D11", OPENVR_FNTABLE_CALLTYPE(None, c_void_p)),
+        ("getRenderModelName", OPENVR_FNTABLE_CALLTYPE(c_uint32, c_uint32, c_char_p, c_uint32)),
+        ("getRenderModelCount", OPENVR_FNTABLE_CALLTYPE(c_uint32)),
+        ("getComponentCount", OPENVR_FNTABLE_CALLTYPE(c_uint32, c_char_p)),
+        ("getComponentName", OPENVR_FNTABLE_CALLTYPE(c_uint32, c_char_p, c_uint32, c_char_p, c_uint32)),
+        ("getComponentButtonMask", OPENVR_FNTABLE_CALLTYPE(c_uint64, c_char_p, c_char_p)),
+        ("getComponentRenderModelName", OPENVR_FNTABLE_CALLTYPE(c_uint32, c_char_p, c_char_p, c_char_p, c_uint32)),
+        ("getComponentState", OPENVR_FNTABLE_CALLTYPE(openvr_bool, c_char_p, c_char_p, POINTER(VRControllerState_t), POINTER(RenderModel_ControllerMode_State_t), POINTER(RenderModel_ComponentState_t))),
+        ("renderModelHasComponent", OPENVR_FNTABLE_CALLTYPE(openvr_bool, c_char_p, c_char_p)),
+        ("getRenderModelThumbnailURL", OPENVR_FNTABLE_CALLTYPE(c_uint32, c_char_p, c_char_p, c_uint32, POINTER(EVRRenderModelError))),
+        ("getRenderModelOriginalPath", OPENVR_FNTABLE_CALLTYPE(c_uint32, c_char_p, c_char_p, c_uint32, POINTER(EVRRenderModelError))),
+        ("getRenderModelErrorNameFromEnum", OPENVR_FNTABLE_CALLTYPE(c_char_p, EVRRenderModelError)),
+    ]
+
+
+class IVRRenderModels(object):
+    def __init__(self):
+        version_key = IVRRenderModels_Version
+        if not isInterfaceVersionValid(version_key):
+            _checkInitError(VRInitError_Init_InterfaceNotFound)
+        # Thank you lukexi https://github.com/lukexi/openvr-hs/blob/master/cbits/openvr_capi_helper.c#L9
+        fn_key = b"FnTable:" + version_key
+        fn_type = IVRRenderModels_FnTable
+        fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
+        if fn_table_ptr is None:
+            raise OpenVRError("Error retrieving VR API for IVRRenderModels")
+        self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
+
+    def loadRenderModel_Async(self, pchRenderModelName):
+        """
+        Loads and returns a render model for use in the application. pchRenderModelName should be a render model name
+        from the Prop_RenderModelName_String property or an absolute path name to a render model on disk. 
+        * The resulting render model is valid until VR_Shutdown() is called or until FreeRenderModel() is called. When the 
+        application is finished with the render model it should call FreeRenderModel() to free the memory associated
+        with the model.
+        * The method returns VRRenderModelError_Loading while the render model is still being loaded.
+        The method returns VRRenderModelError_None once loaded successfully, otherwise will return an error.
+        """
+
+        fn = self._fns.loadRenderModel_Async
+        ppRenderModel = POINTER(RenderModel_t)()
+        result = fn(pchRenderModelName, byref(ppRenderModel))
+        # TODO: Automate this manual translation
+        if ppRenderModel:
+            model = ppRenderModel.contents
+        else:
+            model = None
+        return result, model
+
+    def freeRenderModel(self, pRenderModel):
+        """
+        Frees a previously returned render model
+          It is safe to call this on a null ptr.
+        """
+
+        fn = self._fns.freeRenderModel
+        # TODO: Automate this manual translation
+        # loadRenderModel_Async() returns the RenderModel_t itself, which must be passed back by reference
+        if isinstance(pRenderModel, RenderModel_t):
+            pRenderModel = byref(pRenderModel)
+        fn(pRenderModel)
+
+    def loadTexture_Async(self, textureId):
+        "Loads and returns a texture for use in the application."
+
+        fn = self._fns.loadTexture_Async
+        ppTexture = POINTER(RenderModel_TextureMap_t)()
+        result = fn(textureId, byref(ppTexture))
+        return result, ppTexture
+
+    def freeTexture(self, pTexture):
+        """
+        Frees a previously returned texture
+          It is safe to call this on a null ptr.
+        """
+
+        fn = self._fns.freeTexture
+        # TODO: Automate this manual translation
+        # Accepts the pointer returned by loadTexture_Async(), or its contents
+        if isinstance(pTexture, RenderModel_TextureMap_t):
+            pTexture = byref(pTexture)
+        fn(pTexture)
+
+    def loadTextureD3D11_Async(self, textureId, pD3D11Device):
+        "Creates a D3D11 texture and loads data into it."
+
+        fn = self._fns.loadTextureD3D11_Async
+        ppD3D11Texture2D = c_void_p()
+        result = fn(textureId, pD3D11Device, byref(ppD3D11Texture2D))
+        return result, ppD3D11Texture2D.value
+
+    def loadIntoTextureD3D11_Async(self, textureId, pDstTexture):
+        "Helper function to copy the bits into an existing texture."
+
+        fn = self._fns.loadIntoTextureD3D11_Async
+        result = fn(textureId, pDstTexture)
+        return result
+
+    def freeTextureD3D11(self, pD3D11Texture2D):
+        "Use this to free textures created with LoadTextureD3D11_Async instead of calling Release on them."
+
+        fn = self._fns.freeTextureD3D11
+        fn(pD3D11Texture2D)
+
+    def getRenderModelName(self, unRenderModelIndex, pchRenderModelName, unRenderModelNameLen):
+        """
+        Use this to get the names of available render models.  Index does not correlate to a tracked device index, but
+        is only used for iterating over all available render models.  If the index is out of range, this function will return 0.
+        Otherwise, it will return the size of the buffer required for the name.
+        """
+
+        fn = self._fns.getRenderModelName
+        result = fn(unRenderModelIndex, pchRenderModelName, unRenderModelNameLen)
+        return result
+
+    def getRenderModelCount(self):
+        "Returns the number of available render models."
+
+        fn = self._fns.getRenderModelCount
+        result = fn()
+        return result
+
+    def getComponentCount(self, pchRenderModelName):
+        """
+        Returns the number of components of the specified render model.
+         Components are useful when client application wish to draw, label, or otherwise interact with components of tracked objects.
+         Examples controller components:
+          renderable things such as triggers, buttons
+          non-renderable things which include coordinate systems such as 'tip', 'base', a neutral controller agnostic hand-pose
+          If all controller components are enumerated and rendered, it will be equivalent to drawing the traditional render model
+          Returns 0 if components not supported, >0 otherwise
+        """
+
+        fn = self._fns.getComponentCount
+        result = fn(pchRenderModelName)
+        return result
+
+    def getComponentName(self, pchRenderModelName, unComponentIndex, pchComponentName, unComponentNameLen):
+        """
+        Use this to get the names of available components.  Index does not correlate to a tracked device index, but
+        is only used for iterating over all available components.  If the index is out of range, this function will return 0.
+        Otherwise, it will return the size of the buffer required for the name.
+        """
+
+        fn = self._fns.getComponentName
+        result = fn(pchRenderModelName, unComponentIndex, pchComponentName, unComponentNameLen)
+        return result
+
+    def getComponentButtonMask(self, pchRenderModelName, pchComponentName):
+        """
+        Get the button mask for all buttons associated with this component
+          If no buttons (or axes) are associated with this component, return 0
+          Note: multiple components may be associated with the same button. Ex: two grip buttons on a single controller.
+          Note: A single component may be associated with multiple buttons. Ex: A trackpad which also provides "D-pad" functionality
+        """
+
+        fn = self._fns.getComponentButtonMask
+        result = fn(pchRenderModelName, pchComponentName)
+        return result
+
+    def getComponentRenderModelName(self, pchRenderModelName, pchComponentName, pchComponentRenderModelName, unComponentRenderModelNameLen):
+        """
+        Use this to get the render model name for the specified rendermode/component combination, to be passed to LoadRenderModel.
+        If the component name is out of range, this function will return 0.
+        Otherwise, it will return the size of the buffer required for the name.
+        """
+
+        fn = self._fns.getComponentRenderModelName
+        result = fn(pchRenderModelName, pchComponentName, pchComponentRenderModelName, unComponentRenderModelNameLen)
+        return result
+
+    def getComponentState(self, pchRenderModelName, pchComponentName):
+        """
+        Use this to query information about the component, as a function of the controller state.
+        * For dynamic controller components (ex: trigger) values will reflect component motions
+        For static components this will return a consistent value independent of the VRControllerState_t
+        * If the pchRenderModelName or pchComponentName is invalid, this will return false (and transforms will be set to identity).
+        Otherwise, return true
+        Note: For dynamic objects, visibility may be dynamic. (I.e., true/false will be returned based on controller state and controller mode state )
+        """
+
+        fn = self._fns.getComponentState
+        pControllerState = VRControllerState_t()
+        pState = RenderModel_ControllerMode_State_t()
+        pComponentState = RenderModel_ComponentState_t()
+        result = fn(pchRenderModelName, pchComponentName, byref(pControllerState), byref(pState), byref(pComponentState))
+        return result, pControllerState, pState, pComponentState
+
+    def renderModelHasComponent(self, pchRenderModelName, pchComponentName):
+        "Returns true if the render model has a component with the specified name"
+
+        fn = self._fns.renderModelHasComponent
+        result = fn(pchRenderModelName, pchComponentName)
+        return result
+
+    def getRenderModelThumbnailURL(self, pchRenderModelName, pchThumbnailURL, unThumbnailURLLen):
+        "Returns the URL of the thumbnail image for this rendermodel"
+
+        fn = self._fns.getRenderModelThumbnailURL
+        peError = EVRRenderModelError()
+        result = fn(pchRenderModelName, pchThumbnailURL, unThumbnailURLLen, byref(peError))
+        return result, peError
+
+    def getRenderModelOriginalPath(self, pchRenderModelName, pchOriginalPath, unOriginalPathLen):
+        """
+        Provides a render model path that will load the unskinned model if the model name provided has been replace by the user. If the model
+        hasn't been replaced the path value will still be a valid path to load the model. Pass this to LoadRenderModel_Async, etc. to load the
+        model.
+        """
+
+        fn = self._fns.getRenderModelOriginalPath
+        peError = EVRRenderModelError()
+        result = fn(pchRenderModelName, pchOriginalPath, unOriginalPathLen, byref(peError))
+        return result, peError
+
+    def getRenderModelErrorNameFromEnum(self, error):
+        "Returns a string for a render model error"
+
+        fn = self._fns.getRenderModelErrorNameFromEnum
+        result = fn(error)
+        return result
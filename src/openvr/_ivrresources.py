@@ -0,0 +1,55 @@
+#!/bin/env python
+
+# IVRResources interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.IVRResources, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+class IVRResources_FnTable(Structure):
+    _fields_ = [
+        ("loadSharedResource", OPENVR_FNTABLE_CALLTYPE(c_uint32, c_char_p, c_char_p, c_uint32)),
+        ("getResourceFullPath", OPENVR_FNTABLE_CALLTYPE(c_uint32, c_char_p, c_char_p, c_char_p, c_uint32)),
+    ]
+
+
+class IVRResources(object):
+    def __init__(self):
+        version_key = IVRResources_Version
+        if not isInterfaceVersionValid(version_key):
+            _checkInitError(VRInitError_Init_InterfaceNotFound)
+        # Thank you lukexi https://github.com/lukexi/openvr-hs/blob/master/cbits/openvr_capi_helper.c#L9
+        fn_key = b"FnTable:" + version_key
+        fn_type = IVRResources_FnTable
+        fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
+        if fn_table_ptr is None:
+            raise OpenVRError("Error retrieving VR API for IVRResources")
+        self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
+
+    def loadSharedResource(self, pchResourceName, pchBuffer, unBufferLen):
+        """
+        Loads the specified resource into the provided buffer if large enough.
+        Returns the size in bytes of the buffer required to hold the specified resource.
+        """
+
+        fn = self._fns.loadSharedResource
+        result = fn(pchResourceName, pchBuffer, unBufferLen)
+        return result
+
+    def getResourceFullPath(self, pchResourceName, pchResourceTypeDirectory, pchPathBuffer, unBufferLen):
+        """
+        Provides the full path to the specified resource. Resource names can include named directories for
+        drivers and other things, and this resolves all of those and returns the actual physical path. 
+        pchResourceTypeDirectory is the subdirectory of resources to look in.
+        """
+
+        fn = self._fns.getResourceFullPath
+        result = fn(pchResourceName, pchResourceTypeDirectory, pchPathBuffer, unBufferLen)
+        return result
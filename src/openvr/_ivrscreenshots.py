@@ -0,0 +1,169 @@
+#!/bin/env python
+
+# IVRScreenshots interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.IVRScreenshots, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+class IVRScreenshots_FnTable(Structure):
+    _fields_ = [
+        ("requestScreenshot", OPENVR_FNTABLE_CALLTYPE(EVRScreenshotError, POINTER(ScreenshotHandle_t), EVRScreenshotType, c_char_p, c_char_p)),
+        ("hookScreenshot", OPENVR_FNTABLE_CALLTYPE(EVRScreenshotError, POINTER(EVRScreenshotType), c_int)),
+        ("getScreenshotPropertyType", OPENVR_FNTABLE_CALLTYPE(EVRScreenshotType, ScreenshotHandle_t, POINTER(EVRScreenshotError))),
+        ("getScreenshotPropertyFilename", OPENVR_FNTABLE_CALLTYPE(c_uint32, ScreenshotHandle_t, EVRScreenshotPropertyFilenames, c_char_p, c_uint32, POINTER(EVRScreenshotError))),
+        ("updateScreenshotProgress", OPENVR_FNTABLE_CALLTYPE(EVRScreenshotError, ScreenshotHandle_t, c_float)),
+        ("takeStereoScreenshot", OPENVR_FNTABLE_CALLTYPE(EVRScreenshotError, POINTER(ScreenshotHandle_t), c_char_p, c_char_p)),
+        ("submitScreenshot", OPENVR_FNTABLE_CALLTYPE(EVRScreenshotError, ScreenshotHandle_t, EVRScreenshotType, c_char_p, c_char_p)),
+    ]
+
+
+class IVRScreenshots(object):
+    "Allows the application to generate screenshots"
+
+    def __init__(self):
+        version_key = IVRScreenshots_Version
+        if not isInterfaceVersionValid(version_key):
+            _checkInitError(VRInitError_Init_InterfaceNotFound)
+        # Thank you lukexi https://github.com/lukexi/openvr-hs/blob/master/cbits/openvr_capi_helper.c#L9
+        fn_key = b"FnTable:" + version_key
+        fn_type = IVRScreenshots_FnTable
+        fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
+        if fn_table_ptr is None:
+            raise OpenVRError("Error retrieving VR API for IVRScreenshots")
+        self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
+
+    def requestScreenshot(self, type_, pchPreviewFilename, pchVRFilename):
+        """
+        Request a screenshot of the requested type.
+         A request of the VRScreenshotType_Stereo type will always
+         work. Other types will depend on the underlying application
+         support.
+         The first file name is for the preview image and should be a
+         regular screenshot (ideally from the left eye). The second
+         is the VR screenshot in the correct format. They should be
+         in the same aspect ratio.  Formats per type:
+         VRScreenshotType_Mono: the VR filename is ignored (can be
+         nullptr), this is a normal flat single shot.
+         VRScreenshotType_Stereo:  The VR image should be a
+         side-by-side with the left eye image on the left.
+         VRScreenshotType_Cubemap: The VR image should be six square
+         images composited horizontally.
+         VRScreenshotType_StereoPanorama: above/below with left eye
+         panorama being the above image.  Image is typically square
+         with the panorama being 2x horizontal.
+         
+         Note that the VR dashboard will call this function when
+         the user presses the screenshot binding (currently System
+         Button + Trigger).  If Steam is running, the destination
+         file names will be in %TEMP% and will be copied into
+         Steam's screenshot library for the running application
+         once SubmitScreenshot() is called.
+         If Steam is not running, the paths will be in the user's
+         documents folder under Documents\SteamVR\Screenshots.
+         Other VR applications can call this to initiate a
+         screenshot outside of user control.
+         The destination file names do not need an extension,
+         will be replaced with the correct one for the format
+         which is currently .png.
+        """
+
+        fn = self._fns.requestScreenshot
+        pOutScreenshotHandle = ScreenshotHandle_t()
+        result = fn(byref(pOutScreenshotHandle), type_, pchPreviewFilename, pchVRFilename)
+        return result, pOutScreenshotHandle
+
+    def hookScreenshot(self, numTypes):
+        """
+        Called by the running VR application to indicate that it
+         wishes to be in charge of screenshots.  If the
+         application does not call this, the Compositor will only
+         support VRScreenshotType_Stereo screenshots that will be
+         captured without notification to the running app.
+         Once hooked your application will receive a
+         VREvent_RequestScreenshot event when the user presses the
+         buttons to take a screenshot.
+        """
+
+        fn = self._fns.hookScreenshot
+        pSupportedTypes = EVRScreenshotType()
+        result = fn(byref(pSupportedTypes), numTypes)
+        return result, pSupportedTypes
+
+    def getScreenshotPropertyType(self, screenshotHandle):
+        """
+        When your application receives a
+         VREvent_RequestScreenshot event, call these functions to get
+         the details of the screenshot request.
+        """
+
+        fn = self._fns.getScreenshotPropertyType
+        pError = EVRScreenshotError()
+        result = fn(screenshotHandle, byref(pError))
+        return result, pError
+
+    def getScreenshotPropertyFilename(self, screenshotHandle, filenameType, pchFilename, cchFilename):
+        """
+        Get the filename for the preview or vr image (see
+         vr::EScreenshotPropertyFilenames).  The return value is
+         the size of the string.
+        """
+
+        fn = self._fns.getScreenshotPropertyFilename
+        pError = EVRScreenshotError()
+        result = fn(screenshotHandle, filenameType, pchFilename, cchFilename, byref(pError))
+        return result, pError
+
+    def updateScreenshotProgress(self, screenshotHandle, flProgress):
+        """
+        Call this if the application is taking the screen shot
+         will take more than a few ms processing. This will result
+         in an overlay being presented that shows a completion
+         bar.
+        """
+
+        fn = self._fns.updateScreenshotProgress
+        result = fn(screenshotHandle, flProgress)
+        return result
+
+    def takeStereoScreenshot(self, pchPreviewFilename, pchVRFilename):
+        """
+        Tells the compositor to take an internal screenshot of
+         type VRScreenshotType_Stereo. It will take the current
+         submitted scene textures of the running application and
+         write them into the preview image and a side-by-side file
+         for the VR image.
+         This is similar to request screenshot, but doesn't ever
+         talk to the application, just takes the shot and submits.
+        """
+
+        fn = self._fns.takeStereoScreenshot
+        pOutScreenshotHandle = ScreenshotHandle_t()
+        result = fn(byref(pOutScreenshotHandle), pchPreviewFilename, pchVRFilename)
+        return result, pOutScreenshotHandle
+
+    def submitScreenshot(self, screenshotHandle, type_, pchSourcePreviewFilename, pchSourceVRFilename):
+        """
+        Submit the completed screenshot.  If Steam is running
+         this will call into the Steam client and upload the
+         screenshot to the screenshots section of the library for
+         the running application.  If Steam is not running, this
+         function will display a notification to the user that the
+         screenshot was taken. The paths should be full paths with
+         extensions.
+         File paths should be absolute including extensions.
+         screenshotHandle can be k_unScreenshotHandleInvalid if this
+         was a new shot taking by the app to be saved and not
+         initiated by a user (achievement earned or something)
+        """
+
+        fn = self._fns.submitScreenshot
+        result = fn(screenshotHandle, type_, pchSourcePreviewFilename, pchSourceVRFilename)
+        return result
@@ -0,0 +1,122 @@
+#!/bin/env python
+
+# IVRSettings interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.IVRSettings, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+class IVRSettings_FnTable(Structure):
+    _fields_ = [
+        ("getSettingsErrorNameFromEnum", OPENVR_FNTABLE_CALLTYPE(c_char_p, EVRSettingsError)),
+        ("sync", OPENVR_FNTABLE_CALLTYPE(openvr_bool, openvr_bool, POINTER(EVRSettingsError))),
+        ("setBool", OPENVR_FNTABLE_CALLTYPE(None, c_char_p, c_char_p, openvr_bool, POINTER(EVRSettingsError))),
+        ("setInt32", OPENVR_FNTABLE_CALLTYPE(None, c_char_p, c_char_p, c_int32, POINTER(EVRSettingsError))),
+        ("setFloat", OPENVR_FNTABLE_CALLTYPE(None, c_char_p, c_char_p, c_float, POINTER(EVRSettingsError))),
+        ("setString", OPENVR_FNTABLE_CALLTYPE(None, c_char_p, c_char_p, c_char_p, POINTER(EVRSettingsError))),
+        ("getBool", OPENVR_FNTABLE_CALLTYPE(openvr_bool, c_char_p, c_char_p, POINTER(EVRSettingsError))),
+        ("getInt32", OPENVR_FNTABLE_CALLTYPE(c_int32, c_char_p, c_char_p, POINTER(EVRSettingsError))),
+        ("getFloat", OPENVR_FNTABLE_CALLTYPE(c_float, c_char_p, c_char_p, POINTER(EVRSettingsError))),
+        ("getString", OPENVR_FNTABLE_CALLTYPE(None, c_char_p, c_char_p, c_char_p, c_uint32, POINTER(EVRSettingsError))),
+        ("removeSection", OPENVR_FNTABLE_CALLTYPE(None, c_char_p, POINTER(EVRSettingsError))),
+        ("removeKeyInSection", OPENVR_FNTABLE_CALLTYPE(None, c_char_p, c_char_p, POINTER(EVRSettingsError))),
+    ]
+
+
+class IVRSettings(object):
+    def __init__(self):
+        version_key = IVRSettings_Version
+        if not isInterfaceVersionValid(version_key):
+            _checkInitError(VRInitError_Init_InterfaceNotFound)
+        # Thank you lukexi https://github.com/lukexi/openvr-hs/blob/master/cbits/openvr_capi_helper.c#L9
+        fn_key = b"FnTable:" + version_key
+        fn_type = IVRSettings_FnTable
+        fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
+        if fn_table_ptr is None:
+            raise OpenVRError("Error retrieving VR API for IVRSettings")
+        self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
+
+    def getSettingsErrorNameFromEnum(self, eError):
+        fn = self._fns.getSettingsErrorNameFromEnum
+        result = fn(eError)
+        return result
+
+    def sync(self, bForce):
+        "Returns true if file sync occurred (force or settings dirty)"
+
+        fn = self._fns.sync
+        peError = EVRSettingsError()
+        result = fn(bForce, byref(peError))
+        return result, peError
+
+    def setBool(self, pchSection, pchSettingsKey, bValue):
+        fn = self._fns.setBool
+        peError = EVRSettingsError()
+        fn(pchSection, pchSettingsKey, bValue, byref(peError))
+        return peError
+
+    def setInt32(self, pchSection, pchSettingsKey, nValue):
+        fn = self._fns.setInt32
+        peError = EVRSettingsError()
+        fn(pchSection, pchSettingsKey, nValue, byref(peError))
+        return peError
+
+    def setFloat(self, pchSection, pchSettingsKey, flValue):
+        fn = self._fns.setFloat
+        peError = EVRSettingsError()
+        fn(pchSection, pchSettingsKey, flValue, byref(peError))
+        return peError
+
+    def setString(self, pchSection, pchSettingsKey, pchValue):
+        fn = self._fns.setString
+        peError = EVRSettingsError()
+        fn(pchSection, pchSettingsKey, pchValue, byref(peError))
+        return peError
+
+    def getBool(self, pchSection, pchSettingsKey):
+        """
+        Users of the system need to provide a proper default in default.vrsettings in the resources/settings/ directory
+        of either the runtime or the driver_xxx directory. Otherwise the default will be false, 0, 0.0 or ""
+        """
+
+        fn = self._fns.getBool
+        peError = EVRSettingsError()
+        result = fn(pchSection, pchSettingsKey, byref(peError))
+        return result, peError
+
+    def getInt32(self, pchSection, pchSettingsKey):
+        fn = self._fns.getInt32
+        peError = EVRSettingsError()
+        result = fn(pchSection, pchSettingsKey, byref(peError))
+        return result, peError
+
+    def getFloat(self, pchSection, pchSettingsKey):
+        fn = self._fns.getFloat
+        peError = EVRSettingsError()
+        result = fn(pchSection, pchSettingsKey, byref(peError))
+        return result, peError
+
+    def getString(self, pchSection, pchSettingsKey, pchValue, unValueLen):
+        fn = self._fns.getString
+        peError = EVRSettingsError()
+        fn(pchSection, pchSettingsKey, pchValue, unValueLen, byref(peError))
+        return peError
+
+    def removeSection(self, pchSection):
+        fn = self._fns.removeSection
+        peError = EVRSettingsError()
+        fn(pchSection, byref(peError))
+        return peError
+
+    def removeKeyInSection(self, pchSection, pchSettingsKey):
+        fn = self._fns.removeKeyInSection
+        peError = EVRSettingsError()
+        fn(pchSection, pchSettingsKey, byref(peError))
+        return peError
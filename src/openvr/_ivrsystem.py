@@ -0,0 +1,571 @@
+#!/bin/env python
+
+# IVRSystem interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.IVRSystem, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+class IVRSystem_FnTable(Structure):
+    _fields_ = [
+        ("getRecommendedRenderTargetSize", OPENVR_FNTABLE_CALLTYPE(None, POINTER(c_uint32), POINTER(c_uint32))),
+        ("getProjectionMatrix", OPENVR_FNTABLE_CALLTYPE(HmdMatrix44_t, EVREye, c_float, c_float)),
+        ("getProjectionRaw", OPENVR_FNTABLE_CALLTYPE(None, EVREye, POINTER(c_float), POINTER(c_float), POINTER(c_float), POINTER(c_float))),
+        ("computeDistortion", OPENVR_FNTABLE_CALLTYPE(openvr_bool, EVREye, c_float, c_float, POINTER(DistortionCoordinates_t))),
+        ("getEyeToHeadTransform", OPENVR_FNTABLE_CALLTYPE(HmdMatrix34_t, EVREye)),
+        ("getTimeSinceLastVsync", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(c_float), POINTER(c_uint64))),
+        ("getD3D9AdapterIndex", OPENVR_FNTABLE_CALLTYPE(c_int32)),
+        ("getDXGIOutputInfo", OPENVR_FNTABLE_CALLTYPE(None, POINTER(c_int32))),
+        ("getOutputDevice", OPENVR_FNTABLE_CALLTYPE(None, POINTER(c_uint64), ETextureType)),
+        ("isDisplayOnDesktop", OPENVR_FNTABLE_CALLTYPE(openvr_bool)),
+        ("setDisplayVisibility", OPENVR_FNTABLE_CALLTYPE(openvr_bool, openvr_bool)),
+        ("getDeviceToAbsoluteTrackingPose", OPENVR_FNTABLE_CALLTYPE(None, ETrackingUniverseOrigin, c_float, POINTER(TrackedDevicePose_t), c_uint32)),
+        ("resetSeatedZeroPose", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("getSeatedZeroPoseToStandingAbsoluteTrackingPose", OPENVR_FNTABLE_CALLTYPE(HmdMatrix34_t)),
+        ("getRawZeroPoseToStandingAbsoluteTrackingPose", OPENVR_FNTABLE_CALLTYPE(HmdMatrix34_t)),
+        ("getSortedTrackedDeviceIndicesOfClass", OPENVR_FNTABLE_CALLTYPE(c_uint32, ETrackedDeviceClass, POINTER(TrackedDeviceIndex_t), c_uint32, TrackedDeviceIndex_t)),
+        ("getTrackedDeviceActivityLevel", OPENVR_FNTABLE_CALLTYPE(EDeviceActivityLevel, TrackedDeviceIndex_t)),
+        ("applyTransform", OPENVR_FNTABLE_CALLTYPE(None, POINTER(TrackedDevicePose_t), POINTER(TrackedDevicePose_t), POINTER(HmdMatrix34_t))),
+        ("getTrackedDeviceIndexForControllerRole", OPENVR_FNTABLE_CALLTYPE(TrackedDeviceIndex_t, ETrackedControllerRole)),
+        ("getControllerRoleForTrackedDeviceIndex", OPENVR_FNTABLE_CALLTYPE(ETrackedControllerRole, TrackedDeviceIndex_t)),
+        ("getTrackedDeviceClass", OPENVR_FNTABLE_CALLTYPE(ETrackedDeviceClass, TrackedDeviceIndex_t)),
+        ("isTrackedDeviceConnected", OPENVR_FNTABLE_CALLTYPE(openvr_bool, TrackedDeviceIndex_t)),
+        ("getBoolTrackedDeviceProperty", OPENVR_FNTABLE_CALLTYPE(openvr_bool, TrackedDeviceIndex_t, ETrackedDeviceProperty, POINTER(ETrackedPropertyError))),
+        ("getFloatTrackedDeviceProperty", OPENVR_FNTABLE_CALLTYPE(c_float, TrackedDeviceIndex_t, ETrackedDeviceProperty, POINTER(ETrackedPropertyError))),
+        ("getInt32TrackedDeviceProperty", OPENVR_FNTABLE_CALLTYPE(c_int32, TrackedDeviceIndex_t, ETrackedDeviceProperty, POINTER(ETrackedPropertyError))),
+        ("getUint64TrackedDeviceProperty", OPENVR_FNTABLE_CALLTYPE(c_uint64, TrackedDeviceIndex_t, ETrackedDeviceProperty, POINTER(ETrackedPropertyError))),
+        ("getMatrix34TrackedDeviceProperty", OPENVR_FNTABLE_CALLTYPE(HmdMatrix34_t, TrackedDeviceIndex_t, ETrackedDeviceProperty, POINTER(ETrackedPropertyError))),
+        ("getStringTrackedDeviceProperty", OPENVR_FNTABLE_CALLTYPE(c_uint32, TrackedDeviceIndex_t, ETrackedDeviceProperty, c_char_p, c_uint32, POINTER(ETrackedPropertyError))),
+        ("getPropErrorNameFromEnum", OPENVR_FNTABLE_CALLTYPE(c_char_p, ETrackedPropertyError)),
+        ("pollNextEvent", OPENVR_FNTABLE_CALLTYPE(openvr_bool, POINTER(VREvent_t), c_uint32)),
+        ("pollNextEventWithPose", OPENVR_FNTABLE_CALLTYPE(openvr_bool, ETrackingUniverseOrigin, POINTER(VREvent_t), c_uint32, POINTER(TrackedDevicePose_t))),
+        ("getEventTypeNameFromEnum", OPENVR_FNTABLE_CALLTYPE(c_char_p, EVREventType)),
+        ("getHiddenAreaMesh", OPENVR_FNTABLE_CALLTYPE(HiddenAreaMesh_t, EVREye, EHiddenAreaMeshType)),
+        ("getControllerState", OPENVR_FNTABLE_CALLTYPE(openvr_bool, TrackedDeviceIndex_t, POINTER(VRControllerState_t), c_uint32)),
+        ("getControllerStateWithPose", OPENVR_FNTABLE_CALLTYPE(openvr_bool, ETrackingUniverseOrigin, TrackedDeviceIndex_t, POINTER(VRControllerState_t), c_uint32, POINTER(TrackedDevicePose_t))),
+        ("triggerHapticPulse", OPENVR_FNTABLE_CALLTYPE(None, TrackedDeviceIndex_t, c_uint32, c_ushort)),
+        ("getButtonIdNameFromEnum", OPENVR_FNTABLE_CALLTYPE(c_char_p, EVRButtonId)),
+        ("getControllerAxisTypeNameFromEnum", OPENVR_FNTABLE_CALLTYPE(c_char_p, EVRControllerAxisType)),
+        ("captureInputFocus", OPENVR_FNTABLE_CALLTYPE(openvr_bool)),
+        ("releaseInputFocus", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("isInputFocusCapturedByAnotherProcess", OPENVR_FNTABLE_CALLTYPE(openvr_bool)),
+        ("driverDebugRequest", OPENVR_FNTABLE_CALLTYPE(c_uint32, TrackedDeviceIndex_t, c_char_p, c_char_p, c_uint32)),
+        ("performFirmwareUpdate", OPENVR_FNTABLE_CALLTYPE(EVRFirmwareError, TrackedDeviceIndex_t)),
+        ("acknowledgeQuit_Exiting", OPENVR_FNTABLE_CALLTYPE(None)),
+        ("acknowledgeQuit_UserPrompt", OPENVR_FNTABLE_CALLTYPE(None)),
+    ]
+
+
+class IVRSystem(object):
+    def __init__(self):
+        version_key = IVRSystem_Version
+        if not isInterfaceVersionValid(version_key):
+            _checkInitError(VRInitError_Init_InterfaceNotFound)
+        # Thank you lukexi https://github.com/lukexi/openvr-hs/blob/master/cbits/openvr_capi_helper.c#L9
+        fn_key = b"FnTable:" + version_key
+        fn_type = IVRSystem_FnTable
+        fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
+        if fn_table_ptr is None:
+            raise OpenVRError("Error retrieving VR API for IVRSystem")
+        self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
+        # TODO: Automate this manual translation
+
+    def getRecommendedRenderTargetSize(self):
+        "Suggested size for the intermediate render target that the distortion pulls from."
+
+        fn = self._fns.getRecommendedRenderTargetSize
+        pnWidth = c_uint32()
+        pnHeight = c_uint32()
+        fn(byref(pnWidth), byref(pnHeight))
+        return pnWidth.value, pnHeight.value
+
+    def getProjectionMatrix(self, eEye, fNearZ, fFarZ):
+        "The projection matrix for the specified eye"
+
+        fn = self._fns.getProjectionMatrix
+        result = fn(eEye, fNearZ, fFarZ)
+        return result
+
+    def getProjectionRaw(self, eEye):
+        """
+        The components necessary to build your own projection matrix in case your
+        application is doing something fancy like infinite Z
+        """
+
+        fn = self._fns.getProjectionRaw
+        pfLeft = c_float()
+        pfRight = c_float()
+        pfTop = c_float()
+        pfBottom = c_float()
+        fn(eEye, byref(pfLeft), byref(pfRight), byref(pfTop), byref(pfBottom))
+        return pfLeft.value, pfRight.value, pfTop.value, pfBottom.value
+
+    def computeDistortion(self, eEye, fU, fV):
+        """
+        Gets the result of the distortion function for the specified eye and input UVs. UVs go from 0,0 in 
+        the upper left of that eye's viewport and 1,1 in the lower right of that eye's viewport.
+        Returns true for success. Otherwise, returns false, and distortion coordinates are not suitable.
+        """
+
+        fn = self._fns.computeDistortion
+        pDistortionCoordinates = DistortionCoordinates_t()
+        result = fn(eEye, fU, fV, byref(pDistortionCoordinates))
+        return result, pDistortionCoordinates
+
+    def getEyeToHeadTransform(self, eEye):
+        """
+        Returns the transform from eye space to the head space. Eye space is the per-eye flavor of head
+        space that provides stereo disparity. Instead of Model * View * Projection the sequence is Model * View * Eye^-1 * Projection. 
+        Normally View and Eye^-1 will be multiplied together and treated as View in your application.
+        """
+
+        fn = self._fns.getEyeToHeadTransform
+        result = fn(eEye)
+        return result
+
+    def getTimeSinceLastVsync(self):
+        """
+        Returns the number of elapsed seconds since the last recorded vsync event. This 
+        will come from a vsync timer event in the timer if possible or from the application-reported
+          time if that is not available. If no vsync times are available the function will 
+          return zero for vsync time and frame counter and return false from the method.
+        """
+
+        fn = self._fns.getTimeSinceLastVsync
+        pfSecondsSinceLastVsync = c_float()
+        pulFrameCounter = c_uint64()
+        result = fn(byref(pfSecondsSinceLastVsync), byref(pulFrameCounter))
+        return result, pfSecondsSinceLastVsync.value, pulFrameCounter.value
+
+    def getD3D9AdapterIndex(self):
+        """
+        [D3D9 Only]
+        Returns the adapter index that the user should pass into CreateDevice to set up D3D9 in such
+        a way that it can go full screen exclusive on the HMD. Returns -1 if there was an error.
+        """
+
+        fn = self._fns.getD3D9AdapterIndex
+        result = fn()
+        return result
+
+    def getDXGIOutputInfo(self):
+        """
+        [D3D10/11 Only]
+        Returns the adapter index and output index that the user should pass into EnumAdapters and EnumOutputs
+        to create the device and swap chain in DX10 and DX11. If an error occurs both indices will be set to -1.
+        """
+
+        fn = self._fns.getDXGIOutputInfo
+        pnAdapterIndex = c_int32()
+        fn(byref(pnAdapterIndex))
+        return pnAdapterIndex.value
+
+    def getOutputDevice(self, textureType):
+        """
+        * Returns platform- and texture-type specific adapter identification so that applications and the
+        compositor are creating textures and swap chains on the same GPU. If an error occurs the device
+        will be set to 0.
+        [D3D10/11/12 Only (D3D9 Not Supported)]
+         Returns the adapter LUID that identifies the GPU attached to the HMD. The user should
+         enumerate all adapters using IDXGIFactory::EnumAdapters and IDXGIAdapter::GetDesc to find
+         the adapter with the matching LUID, or use IDXGIFactory4::EnumAdapterByLuid.
+         The discovered IDXGIAdapter should be used to create the device and swap chain.
+        [Vulkan Only]
+         Returns the vk::PhysicalDevice that should be used by the application.
+        [macOS Only]
+         Returns an id<MTLDevice> that should be used by the application.
+        """
+
+        fn = self._fns.getOutputDevice
+        pnDevice = c_uint64()
+        fn(byref(pnDevice), textureType)
+        return pnDevice.value
+
+    def isDisplayOnDesktop(self):
+        "Use to determine if the headset display is part of the desktop (i.e. extended) or hidden (i.e. direct mode)."
+
+        fn = self._fns.isDisplayOnDesktop
+        result = fn()
+        return result
+
+    def setDisplayVisibility(self, bIsVisibleOnDesktop):
+        "Set the display visibility (true = extended, false = direct mode).  Return value of true indicates that the change was successful."
+
+        fn = self._fns.setDisplayVisibility
+        result = fn(bIsVisibleOnDesktop)
+        return result
+
+    def getDeviceToAbsoluteTrackingPose(self, eOrigin, fPredictedSecondsToPhotonsFromNow, unTrackedDevicePoseArrayCount, pTrackedDevicePoseArray=None):
+        """
+        The pose that the tracker thinks that the HMD will be in at the specified number of seconds into the 
+        future. Pass 0 to get the state at the instant the method is called. Most of the time the application should
+        calculate the time until the photons will be emitted from the display and pass that time into the method.
+        * This is roughly analogous to the inverse of the view matrix in most applications, though 
+        many games will need to do some additional rotation or translation on top of the rotation
+        and translation provided by the head pose.
+        * For devices where bPoseIsValid is true the application can use the pose to position the device
+        in question. The provided array can be any size up to k_unMaxTrackedDeviceCount. 
+        * Seated experiences should call this method with TrackingUniverseSeated and receive poses relative
+        to the seated zero pose. Standing experiences should call this method with TrackingUniverseStanding 
+        and receive poses relative to the Chaperone Play Area. TrackingUniverseRawAndUncalibrated should 
+        probably not be used unless the application is the Chaperone calibration tool itself, but will provide
+        poses relative to the hardware-specific coordinate system in the driver.
+        """
+
+        fn = self._fns.getDeviceToAbsoluteTrackingPose
+        if pTrackedDevicePoseArray is None:
+            pTrackedDevicePoseArray = (TrackedDevicePose_t * unTrackedDevicePoseArrayCount)()
+        pTrackedDevicePoseArray = cast(pTrackedDevicePoseArray, POINTER(TrackedDevicePose_t))
+        fn(eOrigin, fPredictedSecondsToPhotonsFromNow, pTrackedDevicePoseArray, unTrackedDevicePoseArrayCount)
+        return pTrackedDevicePoseArray
+
+    def resetSeatedZeroPose(self):
+        """
+        Sets the zero pose for the seated tracker coordinate system to the current position and yaw of the HMD. After 
+        ResetSeatedZeroPose all GetDeviceToAbsoluteTrackingPose calls that pass TrackingUniverseSeated as the origin 
+        will be relative to this new zero pose. The new zero coordinate system will not change the fact that the Y axis 
+        is up in the real world, so the next pose returned from GetDeviceToAbsoluteTrackingPose after a call to 
+        ResetSeatedZeroPose may not be exactly an identity matrix.
+        * NOTE: This function overrides the user's previously saved seated zero pose and should only be called as the result of a user action. 
+        Users are also able to set their seated zero pose via the OpenVR Dashboard.
+        """
+
+        fn = self._fns.resetSeatedZeroPose
+        fn()
+
+    def getSeatedZeroPoseToStandingAbsoluteTrackingPose(self):
+        """
+        Returns the transform from the seated zero pose to the standing absolute tracking system. This allows 
+        applications to represent the seated origin to used or transform object positions from one coordinate
+        system to the other. 
+        * The seated origin may or may not be inside the Play Area or Collision Bounds returned by IVRChaperone. Its position 
+        depends on what the user has set from the Dashboard settings and previous calls to ResetSeatedZeroPose.
+        """
+
+        fn = self._fns.getSeatedZeroPoseToStandingAbsoluteTrackingPose
+        result = fn()
+        return result
+
+    def getRawZeroPoseToStandingAbsoluteTrackingPose(self):
+        """
+        Returns the transform from the tracking origin to the standing absolute tracking system. This allows
+        applications to convert from raw tracking space to the calibrated standing coordinate system.
+        """
+
+        fn = self._fns.getRawZeroPoseToStandingAbsoluteTrackingPose
+        result = fn()
+        return result
+
+    def getSortedTrackedDeviceIndicesOfClass(self, eTrackedDeviceClass, unTrackedDeviceIndexArrayCount, unRelativeToTrackedDeviceIndex):
+        """
+        Get a sorted array of device indices of a given class of tracked devices (e.g. controllers).  Devices are sorted right to left
+        relative to the specified tracked device (default: hmd -- pass in -1 for absolute tracking space).  Returns the number of devices
+        in the list, or the size of the array needed if not large enough.
+        """
+
+        fn = self._fns.getSortedTrackedDeviceIndicesOfClass
+        punTrackedDeviceIndexArray = TrackedDeviceIndex_t()
+        result = fn(eTrackedDeviceClass, byref(punTrackedDeviceIndexArray), unTrackedDeviceIndexArrayCount, unRelativeToTrackedDeviceIndex)
+        return result, punTrackedDeviceIndexArray
+
+    def getTrackedDeviceActivityLevel(self, unDeviceId):
+        "Returns the level of activity on the device."
+
+        fn = self._fns.getTrackedDeviceActivityLevel
+        result = fn(unDeviceId)
+        return result
+
+    def applyTransform(self):
+        """
+        Convenience utility to apply the specified transform to the specified pose.
+          This properly transforms all pose components, including velocity and angular velocity
+        """
+
+        fn = self._fns.applyTransform
+        pOutputPose = TrackedDevicePose_t()
+        pTrackedDevicePose = TrackedDevicePose_t()
+        pTransform = HmdMatrix34_t()
+        fn(byref(pOutputPose), byref(pTrackedDevicePose), byref(pTransform))
+        return pOutputPose, pTrackedDevicePose, pTransform
+
+    def getTrackedDeviceIndexForControllerRole(self, unDeviceType):
+        "Returns the device index associated with a specific role, for example the left hand or the right hand."
+
+        fn = self._fns.getTrackedDeviceIndexForControllerRole
+        result = fn(unDeviceType)
+        return result
+
+    def getControllerRoleForTrackedDeviceIndex(self, unDeviceIndex):
+        "Returns the controller type associated with a device index."
+
+        fn = self._fns.getControllerRoleForTrackedDeviceIndex
+        result = fn(unDeviceIndex)
+        return result
+
+    def getTrackedDeviceClass(self, unDeviceIndex):
+        """
+        Returns the device class of a tracked device. If there has not been a device connected in this slot
+        since the application started this function will return TrackedDevice_Invalid. For previous detected
+        devices the function will return the previously observed device class. 
+        * To determine which devices exist on the system, just loop from 0 to k_unMaxTrackedDeviceCount and check
+        the device class. Every device with something other than TrackedDevice_Invalid is associated with an 
+        actual tracked device.
+        """
+
+        fn = self._fns.getTrackedDeviceClass
+        result = fn(unDeviceIndex)
+        return result
+
+    def isTrackedDeviceConnected(self, unDeviceIndex):
+        "Returns true if there is a device connected in this slot."
+
+        fn = self._fns.isTrackedDeviceConnected
+        result = fn(unDeviceIndex)
+        return result
+
+    def getBoolTrackedDeviceProperty(self, unDeviceIndex, prop):
+        "Returns a bool property. If the device index is not valid or the property is not a bool type this function will return false."
+
+        fn = self._fns.getBoolTrackedDeviceProperty
+        pError = ETrackedPropertyError()
+        result = fn(unDeviceIndex, prop, byref(pError))
+        return result, pError
+
+    def getFloatTrackedDeviceProperty(self, unDeviceIndex, prop):
+        "Returns a float property. If the device index is not valid or the property is not a float type this function will return 0."
+
+        fn = self._fns.getFloatTrackedDeviceProperty
+        pError = ETrackedPropertyError()
+        result = fn(unDeviceIndex, prop, byref(pError))
+        return result, pError
+
+    def getInt32TrackedDeviceProperty(self, unDeviceIndex, prop):
+        "Returns an int property. If the device index is not valid or the property is not a int type this function will return 0."
+
+        fn = self._fns.getInt32TrackedDeviceProperty
+        pError = ETrackedPropertyError()
+        result = fn(unDeviceIndex, prop, byref(pError))
+        return result, pError
+
+    def getUint64TrackedDeviceProperty(self, unDeviceIndex, prop):
+        "Returns a uint64 property. If the device index is not valid or the property is not a uint64 type this function will return 0."
+
+        fn = self._fns.getUint64TrackedDeviceProperty
+        pError = ETrackedPropertyError()
+        result = fn(unDeviceIndex, prop, byref(pError))
+        return result, pError
+
+    def getMatrix34TrackedDeviceProperty(self, unDeviceIndex, prop):
+        "Returns a matrix property. If the device index is not valid or the property is not a matrix type, this function will return identity."
+
+        fn = self._fns.getMatrix34TrackedDeviceProperty
+        pError = ETrackedPropertyError()
+        result = fn(unDeviceIndex, prop, byref(pError))
+        return result, pError
+
+    def getStringTrackedDeviceProperty(self, unDeviceIndex, prop):
+        """
+        Returns a string property. If the device index is not valid or the property is not a string type this function will 
+        return 0. Otherwise it returns the length of the number of bytes necessary to hold this string including the trailing
+        null. Strings will always fit in buffers of k_unMaxPropertyStringSize characters.
+        """
+
+        fn = self._fns.getStringTrackedDeviceProperty
+        pError = ETrackedPropertyError()
+        # TODO: automate this string argument manipulation ****
+        unRequiredBufferLen = fn( unDeviceIndex, prop, None, 0, byref(pError) )
+        if unRequiredBufferLen == 0:
+            return b""
+        pchBuffer = ctypes.create_string_buffer(unRequiredBufferLen)
+        fn( unDeviceIndex, prop, pchBuffer, unRequiredBufferLen, byref(pError) )
+        if pError.value != TrackedProp_Success:
+            raise OpenVRError(str(pError))
+        sResult = bytes(pchBuffer.value)
+        return sResult
+
+    def getPropErrorNameFromEnum(self, error):
+        """
+        returns a string that corresponds with the specified property error. The string will be the name 
+        of the error enum value for all valid error codes
+        """
+
+        fn = self._fns.getPropErrorNameFromEnum
+        result = fn(error)
+        return result
+
+    def pollNextEvent(self, pEvent):
+        """
+        Returns true and fills the event with the next event on the queue if there is one. If there are no events
+        this method returns false. uncbVREvent should be the size in bytes of the VREvent_t struct
+        """
+
+        fn = self._fns.pollNextEvent
+        # TODO: Automate this manually converted method
+        result = fn(byref(pEvent), sizeof(VREvent_t))
+        return result != 0
+
+    def pollNextEventWithPose(self, eOrigin, uncbVREvent):
+        """
+        Returns true and fills the event with the next event on the queue if there is one. If there are no events
+        this method returns false. Fills in the pose of the associated tracked device in the provided pose struct. 
+        This pose will always be older than the call to this function and should not be used to render the device. 
+        uncbVREvent should be the size in bytes of the VREvent_t struct
+        """
+
+        fn = self._fns.pollNextEventWithPose
+        pEvent = VREvent_t()
+        pTrackedDevicePose = TrackedDevicePose_t()
+        result = fn(eOrigin, byref(pEvent), uncbVREvent, byref(pTrackedDevicePose))
+        return result, pEvent, pTrackedDevicePose
+
+    def getEventTypeNameFromEnum(self, eType):
+        "returns the name of an EVREvent enum value"
+
+        fn = self._fns.getEventTypeNameFromEnum
+        result = fn(eType)
+        return result
+
+    def getHiddenAreaMesh(self, eEye, type_):
+        """
+        Returns the hidden area mesh for the current HMD. The pixels covered by this mesh will never be seen by the user after the lens distortion is
+        applied based on visibility to the panels. If this HMD does not have a hidden area mesh, the vertex data and count will be NULL and 0 respectively.
+        This mesh is meant to be rendered into the stencil buffer (or into the depth buffer setting nearz) before rendering each eye's view. 
+        This will improve performance by letting the GPU early-reject pixels the user will never see before running the pixel shader.
+        NOTE: Render this mesh with backface culling disabled since the winding order of the vertices can be different per-HMD or per-eye.
+        Setting the bInverse argument to true will produce the visible area mesh that is commonly used in place of full-screen quads. The visible area mesh covers all of the pixels the hidden area mesh does not cover.
+        Setting the bLineLoop argument will return a line loop of vertices in HiddenAreaMesh_t->pVertexData with HiddenAreaMesh_t->unTriangleCount set to the number of vertices.
+        """
+
+        fn = self._fns.getHiddenAreaMesh
+        result = fn(eEye, type_)
+        return result
+
+    def getControllerState(self, unControllerDeviceIndex, unControllerStateSize=sizeof(VRControllerState_t), pControllerState=None):
+        """
+        Fills the supplied struct with the current state of the controller. Returns false if the controller index
+        is invalid.
+        """
+
+        fn = self._fns.getControllerState
+        # TODO: Automate this manual translation
+        # Pass in a preallocated pControllerState to avoid allocating a new one on every call
+        if pControllerState is None:
+            pControllerState = VRControllerState_t()
+        result = fn(unControllerDeviceIndex, byref(pControllerState), unControllerStateSize)
+        return result, pControllerState
+
+    def getControllerStateWithPose(self, eOrigin, unControllerDeviceIndex, unControllerStateSize=sizeof(VRControllerState_t), pControllerState=None, pTrackedDevicePose=None):
+        """
+        fills the supplied struct with the current state of the controller and the provided pose with the pose of 
+        the controller when the controller state was updated most recently. Use this form if you need a precise controller
+        pose as input to your application when the user presses or releases a button.
+        """
+
+        fn = self._fns.getControllerStateWithPose
+        # TODO: Automate this manual translation
+        if pControllerState is None:
+            pControllerState = VRControllerState_t()
+        if pTrackedDevicePose is None:
+            pTrackedDevicePose = TrackedDevicePose_t()
+        result = fn(eOrigin, unControllerDeviceIndex, byref(pControllerState), unControllerStateSize, byref(pTrackedDevicePose))
+        return result, pControllerState, pTrackedDevicePose
+
+    def triggerHapticPulse(self, unControllerDeviceIndex, unAxisId, usDurationMicroSec):
+        """
+        Trigger a single haptic pulse on a controller. After this call the application may not trigger another haptic pulse on this controller
+        and axis combination for 5ms.
+        """
+
+        fn = self._fns.triggerHapticPulse
+        fn(unControllerDeviceIndex, unAxisId, usDurationMicroSec)
+
+    def getButtonIdNameFromEnum(self, eButtonId):
+        "returns the name of an EVRButtonId enum value"
+
+        fn = self._fns.getButtonIdNameFromEnum
+        result = fn(eButtonId)
+        return result
+
+    def getControllerAxisTypeNameFromEnum(self, eAxisType):
+        "returns the name of an EVRControllerAxisType enum value"
+
+        fn = self._fns.getControllerAxisTypeNameFromEnum
+        result = fn(eAxisType)
+        return result
+
+    def captureInputFocus(self):
+        """
+        Tells OpenVR that this process wants exclusive access to controller button states and button events. Other apps will be notified that 
+        they have lost input focus with a VREvent_InputFocusCaptured event. Returns false if input focus could not be captured for
+        some reason.
+        """
+
+        fn = self._fns.captureInputFocus
+        result = fn()
+        return result
+
+    def releaseInputFocus(self):
+        """
+        Tells OpenVR that this process no longer wants exclusive access to button states and button events. Other apps will be notified 
+        that input focus has been released with a VREvent_InputFocusReleased event.
+        """
+
+        fn = self._fns.releaseInputFocus
+        fn()
+
+    def isInputFocusCapturedByAnotherProcess(self):
+        "Returns true if input focus is captured by another process."
+
+        fn = self._fns.isInputFocusCapturedByAnotherProcess
+        result = fn()
+        return result
+
+    def driverDebugRequest(self, unDeviceIndex, pchRequest, pchResponseBuffer, unResponseBufferSize):
+        """
+        Sends a request to the driver for the specified device and returns the response. The maximum response size is 32k,
+        but this method can be called with a smaller buffer. If the response exceeds the size of the buffer, it is truncated. 
+        The size of the response including its terminating null is returned.
+        """
+
+        fn = self._fns.driverDebugRequest
+        result = fn(unDeviceIndex, pchRequest, pchResponseBuffer, unResponseBufferSize)
+        return result
+
+    def performFirmwareUpdate(self, unDeviceIndex):
+        """
+        Performs the actual firmware update if applicable. 
+        The following events will be sent, if VRFirmwareError_None was returned: VREvent_FirmwareUpdateStarted, VREvent_FirmwareUpdateFinished 
+        Use the properties Prop_Firmware_UpdateAvailable_Bool, Prop_Firmware_ManualUpdate_Bool, and Prop_Firmware_ManualUpdateURL_String
+        to figure our whether a firmware update is available, and to figure out whether its a manual update 
+        Prop_Firmware_ManualUpdateURL_String should point to an URL describing the manual update process
+        """
+
+        fn = self._fns.performFirmwareUpdate
+        result = fn(unDeviceIndex)
+        return result
+
+    def acknowledgeQuit_Exiting(self):
+        """
+        Call this to acknowledge to the system that VREvent_Quit has been received and that the process is exiting.
+        This extends the timeout until the process is killed.
+        """
+
+        fn = self._fns.acknowledgeQuit_Exiting
+        fn()
+
+    def acknowledgeQuit_UserPrompt(self):
+        """
+        Call this to tell the system that the user is being prompted to save data. This
+        halts the timeout and dismisses the dashboard (if it was up). Applications should be sure to actually 
+        prompt the user to save and then exit afterward, otherwise the user will be left in a confusing state.
+        """
+
+        fn = self._fns.acknowledgeQuit_UserPrompt
+        fn()
@@ -0,0 +1,154 @@
+#!/bin/env python
+
+# IVRTrackedCamera interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.IVRTrackedCamera, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+class IVRTrackedCamera_FnTable(Structure):
+    _fields_ = [
+        ("getCameraErrorNameFromEnum", OPENVR_FNTABLE_CALLTYPE(c_char_p, EVRTrackedCameraError)),
+        ("hasCamera", OPENVR_FNTABLE_CALLTYPE(EVRTrackedCameraError, TrackedDeviceIndex_t, POINTER(openvr_bool))),
+        ("getCameraFrameSize", OPENVR_FNTABLE_CALLTYPE(EVRTrackedCameraError, TrackedDeviceIndex_t, EVRTrackedCameraFrameType, POINTER(c_uint32), POINTER(c_uint32), POINTER(c_uint32))),
+        ("getCameraIntrinsics", OPENVR_FNTABLE_CALLTYPE(EVRTrackedCameraError, TrackedDeviceIndex_t, EVRTrackedCameraFrameType, POINTER(HmdVector2_t), POINTER(HmdVector2_t))),
+        ("getCameraProjection", OPENVR_FNTABLE_CALLTYPE(EVRTrackedCameraError, TrackedDeviceIndex_t, EVRTrackedCameraFrameType, c_float, c_float, POINTER(HmdMatrix44_t))),
+        ("acquireVideoStreamingService", OPENVR_FNTABLE_CALLTYPE(EVRTrackedCameraError, TrackedDeviceIndex_t, POINTER(TrackedCameraHandle_t))),
+        ("releaseVideoStreamingService", OPENVR_FNTABLE_CALLTYPE(EVRTrackedCameraError, TrackedCameraHandle_t)),
+        ("getVideoStreamFrameBuffer", OPENVR_FNTABLE_CALLTYPE(EVRTrackedCameraError, TrackedCameraHandle_t, EVRTrackedCameraFrameType, c_void_p, c_uint32, POINTER(CameraVideoStreamFrameHeader_t), c_uint32)),
+        ("getVideoStreamTextureSize", OPENVR_FNTABLE_CALLTYPE(EVRTrackedCameraError, TrackedDeviceIndex_t, EVRTrackedCameraFrameType, POINTER(VRTextureBounds_t), POINTER(c_uint32), POINTER(c_uint32))),
+        ("getVideoStreamTextureD3D11", OPENVR_FNTABLE_CALLTYPE(EVRTrackedCameraError, TrackedCameraHandle_t, EVRTrackedCameraFrameType, c_void_p, POINTER(c_void_p), POINTER(CameraVideoStreamFrameHeader_t), c_uint32)),
+        ("getVideoStreamTextureGL", OPENVR_FNTABLE_CALLTYPE(EVRTrackedCameraError, TrackedCameraHandle_t, EVRTrackedCameraFrameType, POINTER(glUInt_t), POINTER(CameraVideoStreamFrameHeader_t), c_uint32)),
+        ("releaseVideoStreamTextureGL", OPENVR_FNTABLE_CALLTYPE(EVRTrackedCameraError, TrackedCameraHandle_t, glUInt_t)),
+    ]
+
+
+class IVRTrackedCamera(object):
+    def __init__(self):
+        version_key = IVRTrackedCamera_Version
+        if not isInterfaceVersionValid(version_key):
+            _checkInitError(VRInitError_Init_InterfaceNotFound)
+        # Thank you lukexi https://github.com/lukexi/openvr-hs/blob/master/cbits/openvr_capi_helper.c#L9
+        fn_key = b"FnTable:" + version_key
+        fn_type = IVRTrackedCamera_FnTable
+        fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
+        if fn_table_ptr is None:
+            raise OpenVRError("Error retrieving VR API for IVRTrackedCamera")
+        self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
+
+    def getCameraErrorNameFromEnum(self, eCameraError):
+        "Returns a string for an error"
+
+        fn = self._fns.getCameraErrorNameFromEnum
+        result = fn(eCameraError)
+        return result
+
+    def hasCamera(self, nDeviceIndex):
+        "For convenience, same as tracked property request Prop_HasCamera_Bool"
+
+        fn = self._fns.hasCamera
+        pHasCamera = openvr_bool()
+        result = fn(nDeviceIndex, byref(pHasCamera))
+        return result, pHasCamera
+
+    def getCameraFrameSize(self, nDeviceIndex, eFrameType):
+        "Gets size of the image frame."
+
+        fn = self._fns.getCameraFrameSize
+        pnWidth = c_uint32()
+        pnHeight = c_uint32()
+        pnFrameBufferSize = c_uint32()
+        result = fn(nDeviceIndex, eFrameType, byref(pnWidth), byref(pnHeight), byref(pnFrameBufferSize))
+        return result, pnWidth.value, pnHeight.value, pnFrameBufferSize.value
+
+    def getCameraIntrinsics(self, nDeviceIndex, eFrameType):
+        fn = self._fns.getCameraIntrinsics
+        pFocalLength = HmdVector2_t()
+        pCenter = HmdVector2_t()
+        result = fn(nDeviceIndex, eFrameType, byref(pFocalLength), byref(pCenter))
+        return result, pFocalLength, pCenter
+
+    def getCameraProjection(self, nDeviceIndex, eFrameType, flZNear, flZFar):
+        fn = self._fns.getCameraProjection
+        pProjection = HmdMatrix44_t()
+        result = fn(nDeviceIndex, eFrameType, flZNear, flZFar, byref(pProjection))
+        return result, pProjection
+
+    def acquireVideoStreamingService(self, nDeviceIndex):
+        """
+        Acquiring streaming service permits video streaming for the caller. Releasing hints the system that video services do not need to be maintained for this client.
+        If the camera has not already been activated, a one time spin up may incur some auto exposure as well as initial streaming frame delays.
+        The camera should be considered a global resource accessible for shared consumption but not exclusive to any caller.
+        The camera may go inactive due to lack of active consumers or headset idleness.
+        """
+
+        fn = self._fns.acquireVideoStreamingService
+        pHandle = TrackedCameraHandle_t()
+        result = fn(nDeviceIndex, byref(pHandle))
+        return result, pHandle
+
+    def releaseVideoStreamingService(self, hTrackedCamera):
+        fn = self._fns.releaseVideoStreamingService
+        result = fn(hTrackedCamera)
+        return result
+
+    def getVideoStreamFrameBuffer(self, hTrackedCamera, eFrameType, pFrameBuffer, nFrameBufferSize, nFrameHeaderSize):
+        """
+        Copies the image frame into a caller's provided buffer. The image data is currently provided as RGBA data, 4 bytes per pixel.
+        A caller can provide null for the framebuffer or frameheader if not desired. Requesting the frame header first, followed by the frame buffer allows
+        the caller to determine if the frame as advanced per the frame header sequence. 
+        If there is no frame available yet, due to initial camera spinup or re-activation, the error will be VRTrackedCameraError_NoFrameAvailable.
+        Ideally a caller should be polling at ~16ms intervals
+        """
+
+        fn = self._fns.getVideoStreamFrameBuffer
+        pFrameHeader = CameraVideoStreamFrameHeader_t()
+        result = fn(hTrackedCamera, eFrameType, pFrameBuffer, nFrameBufferSize, byref(pFrameHeader), nFrameHeaderSize)
+        return result, pFrameHeader
+
+    def getVideoStreamTextureSize(self, nDeviceIndex, eFrameType):
+        "Gets size of the image frame."
+
+        fn = self._fns.getVideoStreamTextureSize
+        pTextureBounds = VRTextureBounds_t()
+        pnWidth = c_uint32()
+        pnHeight = c_uint32()
+        result = fn(nDeviceIndex, eFrameType, byref(pTextureBounds), byref(pnWidth), byref(pnHeight))
+        return result, pTextureBounds, pnWidth.value, pnHeight.value
+
+    def getVideoStreamTextureD3D11(self, hTrackedCamera, eFrameType, pD3D11DeviceOrResource, nFrameHeaderSize):
+        """
+        Access a shared D3D11 texture for the specified tracked camera stream.
+        The camera frame type VRTrackedCameraFrameType_Undistorted is not supported directly as a shared texture. It is an interior subregion of the shared texture VRTrackedCameraFrameType_MaximumUndistorted.
+        Instead, use GetVideoStreamTextureSize() with VRTrackedCameraFrameType_Undistorted to determine the proper interior subregion bounds along with GetVideoStreamTextureD3D11() with
+        VRTrackedCameraFrameType_MaximumUndistorted to provide the texture. The VRTrackedCameraFrameType_MaximumUndistorted will yield an image where the invalid regions are decoded
+        by the alpha channel having a zero component. The valid regions all have a non-zero alpha component. The subregion as described by VRTrackedCameraFrameType_Undistorted 
+        guarantees a rectangle where all pixels are valid.
+        """
+
+        fn = self._fns.getVideoStreamTextureD3D11
+        ppD3D11ShaderResourceView = c_void_p()
+        pFrameHeader = CameraVideoStreamFrameHeader_t()
+        result = fn(hTrackedCamera, eFrameType, pD3D11DeviceOrResource, byref(ppD3D11ShaderResourceView), byref(pFrameHeader), nFrameHeaderSize)
+        return result, ppD3D11ShaderResourceView.value, pFrameHeader
+
+    def getVideoStreamTextureGL(self, hTrackedCamera, eFrameType, nFrameHeaderSize):
+        "Access a shared GL texture for the specified tracked camera stream"
+
+        fn = self._fns.getVideoStreamTextureGL
+        pglTextureId = glUInt_t()
+        pFrameHeader = CameraVideoStreamFrameHeader_t()
+        result = fn(hTrackedCamera, eFrameType, byref(pglTextureId), byref(pFrameHeader), nFrameHeaderSize)
+        return result, pglTextureId, pFrameHeader
+
+    def releaseVideoStreamTextureGL(self, hTrackedCamera, glTextureId):
+        fn = self._fns.releaseVideoStreamTextureGL
+        result = fn(hTrackedCamera, glTextureId)
+        return result
@@ -0,0 +1,123 @@
+#!/bin/env python
+
+# file adaptive_resolution.py
+
+import collections
+import math
+
+import numpy
+
+import openvr
+
+"""
+Dynamic render resolution, lowered when the GPU gets close to missing frames, see ResolutionController
+"""
+
+
+# Frame timings lag the frames being rendered, so the first few after a change
+# of scale may still be of frames at the old scale
+_SETTLE_FRAMES = 2
+
+
+class ResolutionController(object):
+    """
+    Picks the resolution scale of each frame from the GPU time of the frames
+    before it. Pass one to OpenVrGlRenderer(resolution_controller=...), which
+    allocates its eye framebuffers once, at max_scale times the recommended
+    render target size, renders into the scale times smaller lower left
+    region of them, and submits only that region with VRTextureBounds_t.
+
+    The GPU time target is frame_budget_ms less a headroom fraction of it.
+    As soon as a frame exceeds the whole budget, and otherwise once
+    sample_frames frames at the current scale have been measured, the scale
+    is lowered if their 90th percentile GPU time exceeds the target, in
+    proportion to the pixel count. It is raised by at most step, again
+    in proportion to the pixel count, only when the GPU time is below
+    the target by more than a hysteresis fraction of it, so the scale does
+    not oscillate around the target. frame_budget_ms None means the refresh
+    interval of the HMD, see init().
+    """
+
+    def __init__(self, min_scale=0.5, max_scale=1.0, headroom=0.1, hysteresis=0.15, step=0.05,
+                 sample_frames=10, frame_budget_ms=None):
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.headroom = headroom
+        self.hysteresis = hysteresis
+        self.step = step
+        self.sample_frames = sample_frames
+        self.frame_budget_ms = frame_budget_ms
+        self.scale = max_scale
+        # Number of times the scale went down and up
+        self.decreases = 0
+        self.increases = 0
+        self._gpu_ms = collections.deque(maxlen=sample_frames)
+        self._timing = openvr.Compositor_FrameTiming()
+        self._last_frame_index = None
+
+    def init(self, vr_system):
+        "Sets frame_budget_ms, unless given, from the display frequency of the HMD, or 90 Hz if unknown"
+        if self.frame_budget_ms is not None:
+            return
+        frequency, error = vr_system.getFloatTrackedDeviceProperty(
+            openvr.k_unTrackedDeviceIndex_Hmd, openvr.Prop_DisplayFrequency_Float)
+        if error.value != openvr.TrackedProp_Success or frequency <= 0:
+            frequency = 90.0
+        self.frame_budget_ms = 1000.0 / frequency
+
+    @property
+    def target_ms(self):
+        return self.frame_budget_ms * (1.0 - self.headroom)
+
+    def update(self, gpu_ms):
+        "Accounts for the GPU time of one more frame rendered at the current scale. Returns the new scale."
+        self._gpu_ms.append(gpu_ms)
+        if gpu_ms > self.frame_budget_ms and len(self._gpu_ms) > _SETTLE_FRAMES:
+            measured = gpu_ms
+        elif len(self._gpu_ms) == self.sample_frames:
+            measured = numpy.percentile(self._gpu_ms, 90)
+        else:
+            return self.scale
+        target = self.target_ms
+        if measured <= 0:
+            return self.scale
+        # The GPU time of a frame is roughly proportional to its pixel count, the square of the scale
+        ideal = self.scale * math.sqrt(target / measured)
+        if measured > target:
+            scale = max(ideal, self.min_scale)
+        elif measured < target * (1.0 - self.hysteresis):
+            scale = min(ideal, self.scale + self.step, self.max_scale)
+        else:
+            scale = self.scale
+        if scale != self.scale:
+            if scale < self.scale:
+                self.decreases += 1
+            else:
+                self.increases += 1
+            self.scale = scale
+            # Frames at the old scale say little about the new one
+            self._gpu_ms.clear()
+        return self.scale
+
+    def update_from_compositor(self, compositor=None):
+        """
+        Calls update() with the m_flTotalRenderGpuMs of the last completed
+        frame, if the compositor reported a new one. compositor defaults to
+        openvr.VRCompositor(). Returns the scale.
+        """
+        if compositor is None:
+            compositor = openvr.VRCompositor()
+        # The newest frame timing is the frame in progress; the one before is complete
+        if not compositor.getFrameTiming(1, self._timing)[0]:
+            return self.scale
+        frame_index = self._timing.m_nFrameIndex
+        # Right after startup, the only timing is the frame in progress, without a GPU time yet
+        if frame_index == self._last_frame_index or self._timing.m_flTotalRenderGpuMs <= 0:
+            return self.scale
+        self._last_frame_index = frame_index
+        return self.update(self._timing.m_flTotalRenderGpuMs)
+
+    def viewport_size(self, width, height):
+        "Size of the region to render at the current scale, for a render target size of width by height at scale 1"
+        return (max(int(round(width * self.scale)), 1),
+                max(int(round(height * self.scale)), 1))
@@ -0,0 +1,180 @@
+#!/bin/env python
+
+# file aio.py
+
+import asyncio
+import collections
+import threading
+import time
+
+import openvr
+from openvr.event_buffer import EventBuffer
+from openvr.pose_buffer import PoseBuffer
+
+"""
+Asyncio streams of tracked device poses and OpenVR events, for monitoring
+tools that must not block their event loop.
+
+    async def monitor():
+        async with stream_poses(rate_hz=20) as poses:
+            async for batch in poses:
+                print(batch.poses['mDeviceToAbsoluteTracking'][openvr.k_unTrackedDeviceIndex_Hmd])
+
+Each stream samples the runtime on a dedicated thread, which starts on the
+first iteration. Samples wait in a bounded queue; when the consumer falls
+behind, the oldest samples are dropped and counted in the stream's dropped
+attribute. Streams run until close(), which leaving an "async with" block does.
+"""
+
+
+# One sample of all tracked device poses. time is the time.time() of the
+# sample, poses a copy of PoseBuffer.array, with pose_buffer.pose_dtype fields.
+PoseBatch = collections.namedtuple('PoseBatch', ['time', 'poses'])
+
+
+class _SamplingStream(object):
+    "Async iterator over items produced at a fixed rate by a worker thread"
+
+    def __init__(self, rate_hz, maxsize):
+        self.rate_hz = rate_hz
+        self.items = collections.deque(maxlen=maxsize)
+        self.dropped = 0
+        self.error = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._loop = None
+        self._ready = None
+
+    def _sample(self):
+        "Returns a list of new items. Called on the worker thread."
+        raise NotImplementedError()
+
+    def _start(self):
+        # Called from __anext__(), so on the loop that consumes the items
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self._thread = threading.Thread(target=self._run, name=type(self).__name__)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        interval = 1.0 / self.rate_hz
+        next_time = time.time()
+        try:
+            while not self._stop.is_set():
+                items = self._sample()
+                for item in items:
+                    # A full deque drops its oldest item on append
+                    if len(self.items) == self.items.maxlen:
+                        self.dropped += 1
+                    self.items.append(item)
+                if items:
+                    self._wake()
+                next_time += interval
+                delay = next_time - time.time()
+                if delay < 0:
+                    # Fell behind; resume the schedule from now instead of catching up
+                    next_time = time.time()
+                else:
+                    self._stop.wait(delay)
+        except Exception as exc:
+            self.error = exc
+            self._wake()
+
+    def _wake(self):
+        try:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        except RuntimeError:
+            # The event loop was closed under us, so nobody is waiting
+            if not self._loop.is_closed():
+                raise
+
+    def close(self):
+        "Stops the worker thread. Items already queued can still be consumed."
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            if not self._loop.is_closed():
+                self._wake()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._thread is None and not self._stop.is_set():
+            self._start()
+        while not self.items:
+            if self.error is not None:
+                raise self.error
+            if self._stop.is_set():
+                raise StopAsyncIteration()
+            self._ready.clear()
+            await self._ready.wait()
+        return self.items.popleft()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class PoseStream(_SamplingStream):
+    "Async iterator of PoseBatch, see stream_poses()"
+
+    def __init__(self, rate_hz, maxsize, origin, vr_system):
+        super(PoseStream, self).__init__(rate_hz, maxsize)
+        self.origin = origin
+        self.vr_system = vr_system
+        self.buffer = PoseBuffer()
+
+    def _start(self):
+        if self.vr_system is None:
+            self.vr_system = openvr.VRSystem()
+        super(PoseStream, self)._start()
+
+    def _sample(self):
+        self.vr_system.getDeviceToAbsoluteTrackingPose(self.origin, 0, len(self.buffer), self.buffer)
+        return [PoseBatch(time.time(), self.buffer.array.copy())]
+
+
+class EventStream(_SamplingStream):
+    "Async iterator of events as event_buffer.event_dtype records, see stream_events()"
+
+    def __init__(self, rate_hz, maxsize, types, vr_system):
+        super(EventStream, self).__init__(rate_hz, maxsize)
+        self.types = types
+        self.buffer = EventBuffer(vr_system=vr_system)
+
+    def _start(self):
+        if self.buffer.vr_system is None:
+            self.buffer.vr_system = openvr.VRSystem()
+        super(EventStream, self)._start()
+
+    def _sample(self):
+        result = []
+        while True:
+            # Copy, because the buffer is overwritten by the next drain
+            events = self.buffer.drain_events(types=self.types).copy()
+            result.extend(events)
+            if self.buffer.count < len(self.buffer):
+                return result
+
+
+def stream_poses(rate_hz=60.0, maxsize=4, origin=openvr.TrackingUniverseStanding, vr_system=None):
+    """
+    Async iterator of PoseBatch, sampled with IVRSystem.getDeviceToAbsoluteTrackingPose()
+    rate_hz times per second. At most maxsize batches are queued.
+    """
+    return PoseStream(rate_hz, maxsize, origin, vr_system)
+
+
+def stream_events(types=None, maxsize=256, rate_hz=90.0, vr_system=None):
+    """
+    Async iterator of OpenVR events, as event_buffer.event_dtype records,
+    drained rate_hz times per second. If types is given, only events of those
+    EVREventType values are delivered. At most maxsize events are queued.
+    The OpenVR event queue is shared by the whole application, so events
+    delivered to one stream are not seen by another stream or by pollNextEvent().
+    """
+    return EventStream(rate_hz, maxsize, types, vr_system)
@@ -7,6 +7,7 @@ from textwrap import dedent
 from OpenGL.GL import *  # @UnusedWildImport # this comment squelches an IDE warning
 from OpenGL.GL.shaders import compileShader, compileProgram
 
+from openvr.gl_renderer import FallbackFrameUniforms, frame_uniforms_glsl, stereo_vertex_glsl
 from openvr.glframework import shader_string
 
 """
@@ -25,21 +26,30 @@ class ColorCubeActor(object):
       | /0    | /1
       |/______|/
       4       5
+
+    Inside OpenVrGlRenderer, the cube is drawn with the eye matrices of the
+    renderer's frame uniform buffer, and the matrices passed to display_gl()
+    and display_gl_stereo() are not uploaded again. Drawn without the
+    renderer, it uploads those matrices itself, with a FallbackFrameUniforms.
     """
     
     def __init__(self):
         self.shader = 0
         self.vao = None
+        self.frame_uniforms = FallbackFrameUniforms()
     
     def init_gl(self):
         vertex_shader = compileShader(
             shader_string("""
             // Adapted from @jherico's RiftDemo.py in pyovr
             
-            layout(location = 0) uniform mat4 Projection = mat4(1);
-            layout(location = 4) uniform mat4 ModelView = mat4(1);
             layout(location = 8) uniform float Size = 0.3;
             
+            mat4 frame_projection(int eye);
+            mat4 frame_view(int eye);
+            int frame_eye_count();
+            vec4 stereo_position(vec4 position, int eye);
+            
             // Minimum Y value is zero, so cube sits on the floor in room scale
             const vec3 UNIT_CUBE[8] = vec3[8](
               vec3(-1.0, -0.0, -1.0), // 0: lower left rear
@@ -82,9 +92,13 @@ class ColorCubeActor(object):
                   _color = vec3(1.0) + _color;
               }
             
-              gl_Position = Projection * ModelView * vec4(UNIT_CUBE[vertexIndex] * Size, 1.0);
+              int eye = gl_InstanceID % frame_eye_count();
+              gl_Position = frame_projection(eye) * frame_view(eye) * vec4(UNIT_CUBE[vertexIndex] * Size, 1.0);
+              if (frame_eye_count() == 2) {
+                  gl_Position = stereo_position(gl_Position, eye);
+              }
             }
-            """), 
+            """) + frame_uniforms_glsl + stereo_vertex_glsl, 
             GL_VERTEX_SHADER)
         fragment_shader = compileShader(
             shader_string("""
@@ -103,15 +117,23 @@ class ColorCubeActor(object):
         glEnable(GL_DEPTH_TEST)
         
     def display_gl(self, modelview, projection):
+        "Draws the cube with the matrices of the renderer's frame uniform buffer, or else modelview and projection"
+        self.frame_uniforms.bind(modelview, projection)
         glUseProgram(self.shader)
-        glUniformMatrix4fv(0, 1, False, projection)
-        glUniformMatrix4fv(4, 1, False, modelview)
         glBindVertexArray(self.vao)
         glDrawArrays(GL_TRIANGLES, 0, 36)
     
+    def display_gl_stereo(self, modelviews, projections):
+        "Draws the cube for both eyes of single-pass stereo, as two instances"
+        self.frame_uniforms.bind(modelviews, projections)
+        glUseProgram(self.shader)
+        glBindVertexArray(self.vao)
+        glDrawArraysInstanced(GL_TRIANGLES, 0, 36, 2)
+    
     def dispose_gl(self):
         glDeleteProgram(self.shader)
         self.shader = 0
         if self.vao:
             glDeleteVertexArrays(1, (self.vao,))
         self.vao = 0
+        self.frame_uniforms.dispose_gl()
@@ -0,0 +1,132 @@
+#!/bin/env python
+
+# file device_properties.py
+
+import openvr
+
+"""
+Per-device cache of tracked device properties that only change when a device
+is (re)connected or updated
+"""
+
+
+# Events after which the cached properties of a device may be out of date
+invalidating_event_types = frozenset((
+    openvr.VREvent_TrackedDeviceActivated,
+    openvr.VREvent_TrackedDeviceDeactivated,
+    openvr.VREvent_TrackedDeviceUpdated,
+    openvr.VREvent_PropertyChanged,
+    openvr.VREvent_TrackedDeviceRoleChanged,
+))
+
+# Cache keys for values that are not properties in their own right
+_DEVICE_CLASS = 'device_class'
+_CONTROLLER_ROLE = 'controller_role'
+
+
+class DevicePropertyCache(object):
+    """
+    Memoizes tracked device properties, such as device class, controller role,
+    serial number and render model name, by device index. Querying a property
+    through IVRSystem costs one or two calls into the runtime and a string
+    buffer allocation; a cached lookup is a dictionary access.
+
+    The cache does not poll events itself. Pass each VREvent_t the application
+    polls to handle_event(), or call invalidate() when a device's connected
+    state changes, so that swapped or updated devices are queried again.
+    """
+
+    def __init__(self, vr_system=None):
+        "vr_system defaults to openvr.VRSystem() at the time of each query"
+        self.vr_system = vr_system
+        self._devices = dict()
+
+    def _system(self):
+        if self.vr_system is not None:
+            return self.vr_system
+        return openvr.VRSystem()
+
+    def _properties(self, index):
+        try:
+            return self._devices[index]
+        except KeyError:
+            return self._devices.setdefault(index, dict())
+
+    def device_class(self, index):
+        "ETrackedDeviceClass of a device, like IVRSystem.getTrackedDeviceClass()"
+        properties = self._properties(index)
+        try:
+            return properties[_DEVICE_CLASS]
+        except KeyError:
+            pass
+        result = self._system().getTrackedDeviceClass(index)
+        # No device yet at this index, so ask again next time
+        if result != openvr.TrackedDeviceClass_Invalid:
+            properties[_DEVICE_CLASS] = result
+        return result
+
+    def controller_role(self, index):
+        "ETrackedControllerRole of a device, like IVRSystem.getControllerRoleForTrackedDeviceIndex()"
+        properties = self._properties(index)
+        try:
+            return properties[_CONTROLLER_ROLE]
+        except KeyError:
+            pass
+        result = self._system().getControllerRoleForTrackedDeviceIndex(index)
+        properties[_CONTROLLER_ROLE] = result
+        return result
+
+    def string_property(self, index, prop):
+        "Value of a string property, like IVRSystem.getStringTrackedDeviceProperty()"
+        properties = self._properties(index)
+        try:
+            return properties[prop]
+        except KeyError:
+            pass
+        result = self._system().getStringTrackedDeviceProperty(index, prop)
+        properties[prop] = result
+        return result
+
+    def model_number(self, index):
+        return self.string_property(index, openvr.Prop_ModelNumber_String)
+
+    def serial_number(self, index):
+        return self.string_property(index, openvr.Prop_SerialNumber_String)
+
+    def render_model_name(self, index):
+        return self.string_property(index, openvr.Prop_RenderModelName_String)
+
+    def invalidate(self, index=None):
+        "Forgets the cached properties of one device, or of all devices if index is None"
+        if index is None:
+            self._devices.clear()
+        else:
+            self._devices.pop(index, None)
+
+    def handle_event(self, event):
+        """
+        Invalidates the properties of the device an event is about, if the event
+        type is in invalidating_event_types. Returns whether anything was invalidated.
+        """
+        if event.eventType not in invalidating_event_types:
+            return False
+        self._invalidate_event_device(event.trackedDeviceIndex)
+        return True
+
+    def handle_events(self, events):
+        """
+        Like handle_event(), for a NumPy array of events as returned by
+        openvr.event_buffer.EventBuffer.drain_events()
+        """
+        result = False
+        for event_type, index in zip(events['eventType'].tolist(), events['trackedDeviceIndex'].tolist()):
+            if event_type in invalidating_event_types:
+                self._invalidate_event_device(index)
+                result = True
+        return result
+
+    def _invalidate_event_device(self, index):
+        if index >= openvr.k_unMaxTrackedDeviceCount:
+            self.invalidate()
+        else:
+            self.invalidate(index)
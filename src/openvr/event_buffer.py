@@ -0,0 +1,93 @@
+#!/bin/env python
+
+# file event_buffer.py
+
+from ctypes import byref, sizeof
+
+import numpy
+
+import openvr
+
+"""
+Bulk polling of OpenVR events into a preallocated VREvent_t array with a NumPy view
+"""
+
+
+def _event_dtype():
+    """
+    NumPy structured dtype with the same memory layout as VREvent_t.
+    data holds the raw bytes of the VREvent_Data_t union; controller_button
+    overlaps its first member, VREvent_Controller_t.button, which is what most
+    controller events carry.
+    """
+    event_t = openvr.VREvent_t
+    data_size = sizeof(openvr.VREvent_Data_t)
+    return numpy.dtype({
+        'names': ['eventType', 'trackedDeviceIndex', 'eventAgeSeconds', 'data', 'controller_button'],
+        'formats': [numpy.uint32, numpy.uint32, numpy.float32, (numpy.uint8, (data_size,)), numpy.uint32],
+        'offsets': [event_t.eventType.offset,
+                    event_t.trackedDeviceIndex.offset,
+                    event_t.eventAgeSeconds.offset,
+                    event_t.data.offset,
+                    event_t.data.offset + openvr.VREvent_Data_t.controller.offset],
+        'itemsize': sizeof(event_t),
+    })
+
+
+event_dtype = _event_dtype()
+
+
+class EventBuffer(object):
+    """
+    Preallocated array of VREvent_t, filled by draining the OpenVR event queue
+    in one loop, with a NumPy structured view (see event_dtype) of the same memory.
+
+        buffer = EventBuffer()
+        events = buffer.drain_events()
+        presses = events[events['eventType'] == openvr.VREvent_ButtonPress]
+
+    Indexing the buffer returns the individual ctypes VREvent_t.
+    """
+
+    def __init__(self, capacity=64, vr_system=None):
+        "vr_system defaults to openvr.VRSystem() at the time of each drain"
+        self.events = (openvr.VREvent_t * capacity)()
+        self.array = numpy.frombuffer(self.events, dtype=event_dtype)
+        self.vr_system = vr_system
+        # Reused arguments of every pollNextEvent call
+        self._refs = [byref(event) for event in self.events]
+        self._event_size = sizeof(openvr.VREvent_t)
+        # Number of events polled by the last drain, before filtering by type
+        self.count = 0
+        self._as_parameter_ = self.events
+
+    def __getitem__(self, key):
+        return self.events[key]
+
+    def __len__(self):
+        return len(self.events)
+
+    def drain_events(self, max_events=None, types=None):
+        """
+        Polls up to max_events events, by default the buffer capacity, and
+        returns them as a view of the structured array. The view is only valid
+        until the next drain. If types is given, only events of those
+        EVREventType values are returned, as a copy; the others are still
+        removed from the queue.
+        """
+        if max_events is None or max_events > len(self.events):
+            max_events = len(self.events)
+        vr_system = self.vr_system
+        if vr_system is None:
+            vr_system = openvr.VRSystem()
+        poll = vr_system._fns.pollNextEvent
+        refs = self._refs
+        event_size = self._event_size
+        count = 0
+        while count < max_events and poll(refs[count], event_size):
+            count += 1
+        self.count = count
+        result = self.array[:count]
+        if types is not None:
+            result = result[numpy.isin(result['eventType'], list(types))]
+        return result
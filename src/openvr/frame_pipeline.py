@@ -0,0 +1,291 @@
+#!/bin/env python
+
+# file frame_pipeline.py
+
+import collections
+import threading
+
+import numpy
+
+import openvr
+from openvr.frame_timing import RingBuffer
+from openvr.pose_buffer import PoseBuffer
+
+"""
+Pipelined frames: late latching of the poses each frame is drawn with, see
+PoseLatch, and simulation of the next frame on a worker thread, see FramePipeline
+"""
+
+try:
+    from time import perf_counter as _clock
+except ImportError:  # Python 2
+    from time import time as _clock
+
+
+# One frame drawn with poses from a PoseLatch. frame_index is the compositor's
+# m_nFrameIndex of the frame, or -1 if unknown. wait_to_latch_ms is the time
+# from the return of waitGetPoses() to the latch, and latency_ms the time from
+# the moment the poses were read to the predicted photons of the frame, which
+# is the motion-to-photon latency if the frame is displayed on time.
+# late_frames is the number of vsyncs the frame was displayed late by, and
+# measured_ms the resulting motion-to-photon latency; they are -1 and NaN
+# until the compositor reports the timing of the frame.
+motion_to_photon_dtype = numpy.dtype([
+    ('frame_index', numpy.int64),
+    ('wait_to_latch_ms', numpy.float32),
+    ('latency_ms', numpy.float32),
+    ('late_frames', numpy.int32),
+    ('measured_ms', numpy.float32),
+])
+
+# Summary of a range of latched frames. latency_ms, measured_ms and
+# wait_to_latch_ms are arrays with one value per requested percentile;
+# measured_ms covers only the frames whose timing the compositor has reported.
+# late_frames is the number of frames displayed late.
+MotionToPhotonStats = collections.namedtuple('MotionToPhotonStats', [
+    'frames', 'latency_ms', 'measured_ms', 'wait_to_latch_ms', 'late_frames'])
+
+
+class PoseLatch(object):
+    """
+    Reads the tracked device poses of a frame again right before drawing it,
+    predicted for when the frame's photons leave the display, and measures
+    the motion-to-photon latency of each frame. Pass one to
+    OpenVrGlRenderer(pose_latch=...), or call it around waitGetPoses():
+
+        compositor.waitGetPoses(poses, len(poses), None, 0)
+        latch.update_from_compositor(compositor)
+        latch.begin_frame(frame_index)
+        ...  # simulation, culling and other work that does not need the head pose
+        latch.latch(poses)
+        ...  # draw and submit
+
+    begin_frame() fixes the time of the frame's photons, from
+    IVRSystem.getTimeSinceLastVsync(), the display frequency and
+    Prop_SecondsFromVsyncToPhotons_Float of the HMD; a frame that starts
+    less than running_start_ms before a vsync, as with the compositor's
+    running start, is displayed one vsync later. latch() then passes the
+    remaining time as fPredictedSecondsToPhotonsFromNow to
+    IVRSystem.getDeviceToAbsoluteTrackingPose(), so every latch of a frame
+    predicts the same moment, from tracking data as recent as possible.
+
+    This version of the OpenVR API has no way to submit the pose a frame was
+    rendered with, so the compositor reprojects from the pose it returned from
+    waitGetPoses(); late latching helps most where the compositor reprojects
+    rotation only. With enabled False, latch() keeps the poses of waitGetPoses(),
+    and only the latency is measured, for comparison.
+
+    origin is the ETrackingUniverseOrigin of the poses; None means the
+    compositor's tracking space, see init().
+    """
+
+    def __init__(self, enabled=True, origin=None, running_start_ms=3.0, capacity=4096):
+        self.enabled = enabled
+        self.origin = origin
+        self.running_start_ms = running_start_ms
+        self.frames = RingBuffer(capacity, motion_to_photon_dtype)
+        self.frame_duration = 1.0 / 90.0
+        self.seconds_from_vsync_to_photons = 0.0
+        self.vr_system = None
+        self._frame_index = -1
+        self._wait_time = None
+        self._photon_time = None
+        self._timing = openvr.Compositor_FrameTiming()
+
+    def init(self, vr_system, compositor=None):
+        """
+        Reads the display timing of the HMD, and the tracking space if origin
+        is None. compositor defaults to openvr.VRCompositor().
+        """
+        self.vr_system = vr_system
+        hmd = openvr.k_unTrackedDeviceIndex_Hmd
+        frequency, error = vr_system.getFloatTrackedDeviceProperty(hmd, openvr.Prop_DisplayFrequency_Float)
+        if error.value == openvr.TrackedProp_Success and frequency > 0:
+            self.frame_duration = 1.0 / frequency
+        photons, error = vr_system.getFloatTrackedDeviceProperty(hmd, openvr.Prop_SecondsFromVsyncToPhotons_Float)
+        if error.value == openvr.TrackedProp_Success:
+            self.seconds_from_vsync_to_photons = photons
+        if self.origin is None:
+            if compositor is None:
+                compositor = openvr.VRCompositor()
+            self.origin = compositor.getTrackingSpace()
+
+    def begin_frame(self, frame_index=-1):
+        "Fixes the time of the photons of the frame that waitGetPoses() just started"
+        self._frame_index = frame_index
+        self._wait_time = _clock()
+        valid, since_vsync, _ = self.vr_system.getTimeSinceLastVsync()
+        to_vsync = self.frame_duration - since_vsync if valid else self.frame_duration
+        if to_vsync < 1e-3 * self.running_start_ms:
+            to_vsync += self.frame_duration
+        self._photon_time = self._wait_time + to_vsync + self.seconds_from_vsync_to_photons
+
+    def seconds_to_photons(self):
+        "Seconds from now until the photons of the current frame, never negative"
+        return max(self._photon_time - _clock(), 0.0)
+
+    def latch(self, poses):
+        """
+        Overwrites poses, a PoseBuffer or ctypes TrackedDevicePose_t array, with
+        the poses predicted for the photons of the current frame, if enabled,
+        and records the frame. Returns poses.
+        """
+        now = _clock()
+        seconds = max(self._photon_time - now, 0.0)
+        if self.enabled:
+            self.vr_system.getDeviceToAbsoluteTrackingPose(self.origin, seconds, len(poses), poses)
+            pose_time = now
+        else:
+            pose_time = self._wait_time
+        self.frames.append((self._frame_index, 1e3 * (now - self._wait_time),
+                            1e3 * (self._photon_time - pose_time), -1, numpy.nan))
+        return poses
+
+    def update_from_compositor(self, compositor=None):
+        """
+        Records how late the last completed frame was displayed, if it was
+        latched and the compositor reported it. compositor defaults to
+        openvr.VRCompositor(). Call it once per frame, after waitGetPoses().
+        """
+        if compositor is None:
+            compositor = openvr.VRCompositor()
+        # The newest frame timing is the frame in progress; the one before is complete
+        if not compositor.getFrameTiming(1, self._timing)[0]:
+            return
+        frame_index = self._timing.m_nFrameIndex
+        # Frames with late_frames -1 are waiting for their timing; only the last few can be
+        frames = self.frames
+        for k in range(1, min(len(frames), 4) + 1):
+            entry = frames.array[(frames.total - k) % frames.capacity]
+            if entry['frame_index'] == frame_index and entry['late_frames'] < 0:
+                late_frames = self._timing.m_nNumDroppedFrames
+                entry['late_frames'] = late_frames
+                entry['measured_ms'] = entry['latency_ms'] + 1e3 * late_frames * self.frame_duration
+                return
+
+    def stats(self, percentiles=(50, 90, 99), frames=None):
+        "MotionToPhotonStats of the last frames latched frames, by default all that are kept"
+        latched = self.frames.last(frames)
+        measured = latched['measured_ms'][latched['late_frames'] >= 0]
+        nan = numpy.full(len(percentiles), numpy.nan)
+
+        def percentile(values):
+            if len(values) == 0:
+                return nan.copy()
+            return numpy.percentile(values, percentiles)
+        return MotionToPhotonStats(
+            frames=len(latched),
+            latency_ms=percentile(latched['latency_ms']),
+            measured_ms=percentile(measured),
+            wait_to_latch_ms=percentile(latched['wait_to_latch_ms']),
+            late_frames=int(numpy.count_nonzero(latched['late_frames'] > 0)),
+        )
+
+
+class FramePipeline(object):
+    """
+    Runs the application's simulation of the next frame on a worker thread,
+    while the render thread draws the current one. Pass one to
+    OpenVrGlRenderer(frame_pipeline=...), or call begin_frame() after each
+    waitGetPoses() that fills game_poses.
+
+    update(poses) is called on the worker thread with a PoseBuffer copy of the
+    game poses of waitGetPoses(), which are predicted for the display of the
+    next frame, and returns the state to draw the next frame with. After
+    begin_frame(), state is the result of the update started by the previous
+    begin_frame(). update() must not modify objects that actors are drawing;
+    it should return new ones instead.
+
+    Python threads take turns holding the global interpreter lock, so update()
+    runs alongside the render thread while that thread waits in the OpenGL
+    driver or the compositor, e.g. in waitGetPoses(). stalls counts the
+    frames in which the render thread had to wait for update() to finish,
+    and stall_seconds the total time it waited.
+    """
+
+    def __init__(self, update, count=openvr.k_unMaxTrackedDeviceCount):
+        self.update = update
+        self.game_poses = PoseBuffer(count)
+        self.state = None
+        self.stalls = 0
+        self.stall_seconds = 0.0
+        self._poses = PoseBuffer(count)
+        self._condition = threading.Condition()
+        self._pending = False
+        self._stopping = False
+        self._result = None
+        self._error = None
+        self._thread = None
+
+    def start(self):
+        "Starts the worker thread; begin_frame() does it if needed"
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name='FramePipeline')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        condition = self._condition
+        while True:
+            with condition:
+                while not self._pending and not self._stopping:
+                    condition.wait()
+                if self._stopping:
+                    return
+            result = error = None
+            try:
+                result = self.update(self._poses)
+            except Exception as exc:
+                error = exc
+            with condition:
+                self._result = result
+                self._error = error
+                self._pending = False
+                condition.notify_all()
+
+    def begin_frame(self):
+        """
+        Waits for the update started by the previous call, makes its result
+        the current state, and starts the update of the next frame with a copy
+        of game_poses. The first call has no update to take over: it runs
+        update() on the calling thread to set state, and the second call
+        starts the first update on the worker thread, so the simulation steps
+        once per frame from the start. Exceptions raised by update() are
+        raised here. Returns state.
+        """
+        if self._thread is None:
+            self.state = self._result = self.update(self._copy_game_poses())
+            self.start()
+            return self.state
+        condition = self._condition
+        with condition:
+            if self._pending:
+                start = _clock()
+                while self._pending:
+                    condition.wait()
+                self.stalls += 1
+                self.stall_seconds += _clock() - start
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            self.state = self._result
+            self._copy_game_poses()
+            self._pending = True
+            condition.notify_all()
+        return self.state
+
+    def _copy_game_poses(self):
+        self._poses.array[:] = self.game_poses.array
+        return self._poses
+
+    def stop(self):
+        "Waits for the update in progress, if any, and stops the worker thread"
+        if self._thread is None:
+            return
+        with self._condition:
+            while self._pending:
+                self._condition.wait()
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join()
+        self._thread = None
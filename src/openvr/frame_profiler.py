@@ -0,0 +1,170 @@
+#!/bin/env python
+
+# file frame_profiler.py
+
+import collections
+
+import numpy
+
+from openvr.frame_timing import RingBuffer
+
+"""
+Opt-in CPU profiling of the phases of each rendered frame, see FrameProfiler
+"""
+
+try:
+    from time import perf_counter_ns as _clock_ns
+except ImportError:  # Python < 3.7
+    from time import perf_counter as _perf_counter
+
+    def _clock_ns():
+        return int(_perf_counter() * 1e9)
+
+
+# Phases of OpenVrGlRenderer.render_scene(), in order. simulation is the wait
+# for a frame_pipeline.FramePipeline's update() to finish; upload is the
+# reallocation of the eye framebuffers for a new resolution and the actors'
+# update_gl(), such as render model uploads.
+phase_names = ('wait_poses', 'simulation', 'upload', 'matrices', 'display', 'resolve', 'submit')
+PHASE_WAIT_POSES, PHASE_SIMULATION, PHASE_UPLOAD, PHASE_MATRICES, PHASE_DISPLAY, PHASE_RESOLVE, \
+    PHASE_SUBMIT = range(len(phase_names))
+
+
+def frame_profile_dtype(max_actors):
+    """
+    NumPy structured dtype of one profiled frame. frame_index is the compositor's
+    m_nFrameIndex of the frame, or -1 if unknown. All times are in nanoseconds;
+    phase_ns is indexed by the PHASE_ constants, actor_ns by actor index.
+    """
+    return numpy.dtype([
+        ('frame_index', numpy.int64),
+        ('start_ns', numpy.int64),
+        ('total_ns', numpy.int64),
+        ('phase_ns', numpy.int64, (len(phase_names),)),
+        ('actor_ns', numpy.int64, (max_actors,)),
+    ])
+
+
+# Summary of a range of profiled frames. total_ms and work_ms are arrays with one
+# value per requested percentile; work_ms excludes the time spent waiting for
+# poses. phase_ms maps each phase name to such an array, and actor_ms is an
+# array of shape (max_actors, len(percentiles)).
+FrameProfileStats = collections.namedtuple('FrameProfileStats', [
+    'frames', 'total_ms', 'work_ms', 'phase_ms', 'actor_ms'])
+
+
+class FrameProfiler(object):
+    """
+    Records how long each phase of each frame, and each actor's display_gl(),
+    takes on the CPU, with time.perf_counter_ns(). Pass one to
+    OpenVrGlRenderer(profiler=...) to profile render_scene().
+
+    Within a frame, times accumulate in preallocated lists; end_frame() copies
+    them into a RingBuffer of frame_profile_dtype(max_actors) in one assignment.
+    A phase is timed by handing the clock value from the previous call on:
+
+        t = profiler.begin_frame()
+        ...
+        t = profiler.lap(PHASE_MATRICES, t)
+        ...
+        profiler.end_frame()
+
+    Times measure the CPU cost of issuing work; OpenGL executes it later, on
+    the GPU. correlate() and missed_frame_causes() match profiled frames with
+    the compositor's own frame timings, from a frame_timing.FrameTimingCollector.
+    """
+
+    def __init__(self, capacity=4096, max_actors=32):
+        self.frames = RingBuffer(capacity, frame_profile_dtype(max_actors))
+        self.max_actors = max_actors
+        self.clock = _clock_ns
+        self._phase_ns = [0] * len(phase_names)
+        self._actor_ns = [0] * max_actors
+        self._frame_index = -1
+        self._start_ns = 0
+
+    def begin_frame(self):
+        "Starts profiling a frame, and returns the clock value to pass to the first lap()"
+        self._phase_ns[:] = [0] * len(self._phase_ns)
+        self._actor_ns[:] = [0] * len(self._actor_ns)
+        self._frame_index = -1
+        self._start_ns = _clock_ns()
+        return self._start_ns
+
+    def lap(self, phase, start_ns):
+        "Adds the time since start_ns to a phase, and returns the current clock value"
+        now = _clock_ns()
+        self._phase_ns[phase] += now - start_ns
+        return now
+
+    def lap_actor(self, index, start_ns):
+        "Adds the time since start_ns to an actor, and returns the current clock value"
+        now = _clock_ns()
+        if index < self.max_actors:
+            self._actor_ns[index] += now - start_ns
+        return now
+
+    def set_frame_index(self, frame_index):
+        "Sets the compositor's m_nFrameIndex of the frame being profiled"
+        self._frame_index = frame_index
+
+    def end_frame(self):
+        self.frames.append((self._frame_index, self._start_ns, _clock_ns() - self._start_ns,
+                            self._phase_ns, self._actor_ns))
+
+    def stats(self, percentiles=(50, 90, 99), frames=None):
+        "FrameProfileStats of the last frames frames, by default all that are kept"
+        profile = self.frames.last(frames)
+        if len(profile) == 0:
+            nan = numpy.full(len(percentiles), numpy.nan)
+            return FrameProfileStats(0, nan, nan.copy(), dict((name, nan.copy()) for name in phase_names),
+                                     numpy.full((self.max_actors, len(percentiles)), numpy.nan))
+        phase_ms = 1e-6 * profile['phase_ns']
+        total_ms = 1e-6 * profile['total_ns']
+        return FrameProfileStats(
+            frames=len(profile),
+            total_ms=numpy.percentile(total_ms, percentiles),
+            work_ms=numpy.percentile(total_ms - phase_ms[:, PHASE_WAIT_POSES], percentiles),
+            phase_ms=dict((name, numpy.percentile(phase_ms[:, phase], percentiles))
+                          for phase, name in enumerate(phase_names)),
+            actor_ms=numpy.percentile(1e-6 * profile['actor_ns'], percentiles, axis=0).T,
+        )
+
+    def correlate(self, collector, frames=None):
+        """
+        Pairs the last frames profiled frames, by default all that are kept,
+        with the compositor timings of the same frames in collector.frames.
+        Returns the profiled frames and their compositor timings as two arrays
+        of equal length, ordered by frame index.
+        """
+        profile = self.frames.last(frames)
+        timings = collector.frames.last()
+        _, profile_indices, timing_indices = numpy.intersect1d(
+            profile['frame_index'], timings['m_nFrameIndex'].astype(numpy.int64), return_indices=True)
+        return profile[profile_indices], timings[timing_indices]
+
+    def missed_frame_causes(self, collector, frame_budget_ms=1000.0 / 90.0, frames=None):
+        """
+        For each correlated frame that the compositor dropped or mispresented,
+        a (frame_index, cause) tuple. cause is 'simulation' if the CPU work
+        of the frame, excluding the wait for poses, exceeded frame_budget_ms
+        only because of the wait for the simulation thread; 'application' if
+        it exceeded it anyway; 'gpu' if the frame's m_flTotalRenderGpuMs did;
+        otherwise 'compositor'.
+        """
+        profile, timings = self.correlate(collector, frames)
+        missed = (timings['m_nNumDroppedFrames'] > 0) | (timings['m_nNumMisPresented'] > 0)
+        work_ms = 1e-6 * (profile['total_ns'] - profile['phase_ns'][:, PHASE_WAIT_POSES])
+        simulation_ms = 1e-6 * profile['phase_ns'][:, PHASE_SIMULATION]
+        result = []
+        for k in numpy.flatnonzero(missed).tolist():
+            if work_ms[k] - simulation_ms[k] > frame_budget_ms:
+                cause = 'application'
+            elif work_ms[k] > frame_budget_ms:
+                cause = 'simulation'
+            elif timings['m_flTotalRenderGpuMs'][k] > frame_budget_ms:
+                cause = 'gpu'
+            else:
+                cause = 'compositor'
+            result.append((int(profile['frame_index'][k]), cause))
+        return result
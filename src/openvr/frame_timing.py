@@ -0,0 +1,165 @@
+#!/bin/env python
+
+# file frame_timing.py
+
+import collections
+from ctypes import c_double, c_float, c_uint32, sizeof
+
+import numpy
+
+import openvr
+from openvr.pose_buffer import pose_dtype
+
+"""
+Compositor frame timing history in NumPy ring buffers, with rolling statistics
+"""
+
+
+def _frame_timing_dtype():
+    "NumPy structured dtype with the same memory layout as Compositor_FrameTiming"
+    timing_t = openvr.Compositor_FrameTiming
+    formats = {c_uint32: numpy.uint32, c_float: numpy.float32, c_double: numpy.float64,
+               openvr.TrackedDevicePose_t: pose_dtype}
+    names = [name for name, _ in timing_t._fields_]
+    return numpy.dtype({
+        'names': names,
+        'formats': [formats[ctype] for _, ctype in timing_t._fields_],
+        'offsets': [getattr(timing_t, name).offset for name in names],
+        'itemsize': sizeof(timing_t),
+    })
+
+
+frame_timing_dtype = _frame_timing_dtype()
+
+# Summary of a range of frames. gpu_ms and cpu_ms are arrays with one value per
+# requested percentile; the frame counts are totals over the range.
+FrameTimingStats = collections.namedtuple('FrameTimingStats', [
+    'frames', 'gpu_ms', 'cpu_ms', 'dropped_frames', 'mispresented_frames', 'reprojected_frames'])
+
+
+class RingBuffer(object):
+    """
+    Fixed capacity NumPy array that keeps the most recent entries appended to it.
+    Appending is a vectorized copy, so whole batches of entries cost the same
+    few Python operations as a single one.
+    """
+
+    def __init__(self, capacity, dtype):
+        self.array = numpy.zeros(capacity, dtype=dtype)
+        self.capacity = capacity
+        # Total number of entries ever appended
+        self.total = 0
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def append(self, entry):
+        "Appends one entry, which can be a tuple for structured dtypes"
+        self.array[self.total % self.capacity] = entry
+        self.total += 1
+
+    def extend(self, entries):
+        "Appends an array of entries, of which at most the last capacity are kept"
+        appended = len(entries)
+        entries = entries[-self.capacity:]
+        count = len(entries)
+        # The entries that are not kept still take their place in the ring
+        start = (self.total + appended - count) % self.capacity
+        head = min(count, self.capacity - start)
+        self.array[start:start + head] = entries[:head]
+        self.array[:count - head] = entries[head:]
+        self.total += appended
+
+    def last(self, count=None):
+        "Copy of the last count entries, by default all that are kept, oldest first"
+        size = len(self)
+        if count is None or count > size:
+            count = size
+        end = self.total % self.capacity
+        if count <= end:
+            return self.array[end - count:end].copy()
+        return numpy.concatenate((self.array[end - count:], self.array[:end]))
+
+    def clear(self):
+        self.total = 0
+
+
+class FrameTimingCollector(object):
+    """
+    Accumulates IVRCompositor frame timings in a RingBuffer of frame_timing_dtype.
+
+        collector = FrameTimingCollector()
+        while running:
+            ...
+            if frame % 90 == 0:
+                collector.collect()
+                print(collector.stats().gpu_ms)
+
+    Each collect() copies the compositor's whole history, up to
+    compositor_history frames, with one getFrameTimings() call into a
+    preallocated array, and appends only the completed frames not seen before,
+    by m_nFrameIndex. Calling it at least once every compositor_history - 1
+    frames loses no frames; missed_frames counts the frames that were skipped otherwise.
+    """
+
+    def __init__(self, capacity=4096, compositor_history=128, compositor=None):
+        "compositor defaults to openvr.VRCompositor() at the time of each collect()"
+        self.frames = RingBuffer(capacity, frame_timing_dtype)
+        self.compositor = compositor
+        self.missed_frames = 0
+        self.last_frame_index = None
+        self._timings = (openvr.Compositor_FrameTiming * compositor_history)()
+        self._timings_array = numpy.frombuffer(self._timings, dtype=frame_timing_dtype)
+
+    def collect(self):
+        "Fetches the compositor's frame timing history. Returns the number of new frames."
+        compositor = self.compositor
+        if compositor is None:
+            compositor = openvr.VRCompositor()
+        count = compositor.getFrameTimings(len(self._timings), self._timings)[0]
+        # The newest entry is the frame still in progress; it is complete by the next collect()
+        history = self._timings_array[:max(count - 1, 0)]
+        if len(history) == 0:
+            return 0
+        # The frame index starts over when the application reconnects to the runtime;
+        # only the frames since the last restart belong together
+        restarts = numpy.flatnonzero(numpy.diff(history['m_nFrameIndex'].astype(numpy.int64)) < 0)
+        if len(restarts):
+            history = history[restarts[-1] + 1:]
+        indices = history['m_nFrameIndex']
+        last = self.last_frame_index
+        if last is not None and (len(restarts) or indices[-1] < last):
+            last = None
+        if last is not None:
+            history = history[indices > last]
+            if len(history) and history['m_nFrameIndex'][0] > last + 1:
+                self.missed_frames += int(history['m_nFrameIndex'][0]) - last - 1
+        if len(history):
+            self.frames.extend(history)
+            self.last_frame_index = int(history['m_nFrameIndex'][-1])
+        return len(history)
+
+    def percentiles(self, field, percentiles=(50, 90, 99), frames=None):
+        "Percentiles of one frame_timing_dtype field over the last frames frames, by default all that are kept"
+        values = self.frames.last(frames)[field]
+        if len(values) == 0:
+            return numpy.full(len(percentiles), numpy.nan)
+        return numpy.percentile(values, percentiles)
+
+    def stats(self, percentiles=(50, 90, 99), frames=None):
+        """
+        FrameTimingStats of the last frames frames, by default all that are kept.
+        GPU time is m_flTotalRenderGpuMs, CPU time is m_flClientFrameIntervalMs.
+        """
+        timings = self.frames.last(frames)
+        if len(timings) == 0:
+            nan = numpy.full(len(percentiles), numpy.nan)
+            return FrameTimingStats(0, nan, nan.copy(), 0, 0, 0)
+        return FrameTimingStats(
+            frames=len(timings),
+            gpu_ms=numpy.percentile(timings['m_flTotalRenderGpuMs'], percentiles),
+            cpu_ms=numpy.percentile(timings['m_flClientFrameIntervalMs'], percentiles),
+            dropped_frames=int(timings['m_nNumDroppedFrames'].sum()),
+            mispresented_frames=int(timings['m_nNumMisPresented'].sum()),
+            reprojected_frames=int(numpy.count_nonzero(timings['m_nReprojectionFlags'])),
+        )
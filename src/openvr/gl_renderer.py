@@ -2,41 +2,111 @@
 
 # file openvr_gl_renderer.py
 
+import collections
+from ctypes import c_ubyte
+import math
+
 from OpenGL.GL import *  # @UnusedWildImport # this comment squelches an IDE warning
+from OpenGL.GL.shaders import compileShader, compileProgram
+from OpenGL.arrays import vbo
 import numpy
 
 import openvr
+from openvr.frame_profiler import PHASE_DISPLAY, PHASE_MATRICES, PHASE_RESOLVE, PHASE_SIMULATION, PHASE_SUBMIT, \
+    PHASE_UPLOAD, PHASE_WAIT_POSES
+from openvr.glframework import shader_string, shader_substring
+from openvr.gpu_timer import PASS_LEFT, PASS_MIRROR, PASS_RIGHT, PASS_STEREO, pass_names
+from openvr.hidden_area import clip_space_vertices, get_hidden_area_vertices
+from openvr.pose_buffer import PoseBuffer, inverse_matrices_for_openvr_poses, matrices_for_openvr_poses
 
 """
 Renders OpenGL scenes to virtual reality headsets using OpenVR API
 """
 
 
+# GLSL vertex shader function for single-pass stereo, see OpenVrGlRenderer.display_gl_stereo().
+# Append it to the source of a vertex shader that declares
+#     vec4 stereo_position(vec4 position, int eye);
+# draws two instances per object, and passes it the clip space position of eye gl_InstanceID % 2.
+stereo_vertex_glsl = shader_substring("""
+    // Moves a clip space position of one eye, 0 for left and 1 for right, into
+    // that eye's half of the double-wide framebuffer, and clips it to that half
+    vec4 stereo_position(vec4 position, int eye) {
+      position.x = 0.5 * position.x + (float(eye) - 0.5) * position.w;
+      gl_ClipDistance[0] = eye == 0 ? -position.x : position.x;
+      return position;
+    }
+    """)
+
+
+# Uniform buffer binding point of the FrameUniforms block
+FRAME_UNIFORMS_BINDING = 0
+
+# GLSL uniform block of the eye matrices that OpenVrGlRenderer publishes for
+# each render pass, see FrameUniformBuffer. Append it to the source of a shader that declares
+#     mat4 frame_projection(int eye);
+#     mat4 frame_view(int eye);
+#     int frame_eye_count();
+# and draws frame_eye_count() instances per object, for eye gl_InstanceID % frame_eye_count().
+frame_uniforms_glsl = shader_substring("""
+    // Projection and room to eye matrices of the eyes drawn by the current render pass;
+    // only the first of each is used unless EyeCount is 2
+    layout(std140, binding = %d) uniform FrameUniforms {
+      mat4 Projection[2];
+      mat4 View[2];
+      int EyeCount;
+    };
+    
+    mat4 frame_projection(int eye) { return Projection[eye]; }
+    mat4 frame_view(int eye) { return View[eye]; }
+    int frame_eye_count() { return EyeCount; }
+    """ % FRAME_UNIFORMS_BINDING)
+
+# Size in bytes of the FrameUniforms block in std140 layout
+_FRAME_UNIFORMS_SIZE = 272
+
+# Eye drawn by each of the one-eye render passes, which come before PASS_STEREO
+_pass_eyes = numpy.array([1 if render_pass == PASS_RIGHT else 0 for render_pass in range(PASS_STEREO)])
+
+# FrameUniformBuffer whose block is bound to FRAME_UNIFORMS_BINDING, from its bind() to its unbind()
+_bound_frame_uniforms = None
+
+
+def frame_uniforms_dtype(stride=_FRAME_UNIFORMS_SIZE):
+    "NumPy structured dtype of one FrameUniforms block in std140 layout, padded to stride bytes"
+    return numpy.dtype({
+        'names': ['projection', 'view', 'eye_count'],
+        'formats': [(numpy.float32, (2, 4, 4)), (numpy.float32, (2, 4, 4)), numpy.int32],
+        'offsets': [0, 128, 256],
+        'itemsize': stride,
+    })
+
+
 # TODO: matrixForOpenVrMatrix() is not general, it is specific the perspective and 
 # modelview matrices used in this example
 def matrixForOpenVrMatrix(mat):
-    if len(mat.m) == 4: # HmdMatrix44_t?
-        result = numpy.matrix(
-                ((mat.m[0][0], mat.m[1][0], mat.m[2][0], mat.m[3][0]),
-                 (mat.m[0][1], mat.m[1][1], mat.m[2][1], mat.m[3][1]), 
-                 (mat.m[0][2], mat.m[1][2], mat.m[2][2], mat.m[3][2]), 
-                 (mat.m[0][3], mat.m[1][3], mat.m[2][3], mat.m[3][3]),)
-            , numpy.float32)
-        return result
-    elif len(mat.m) == 3: # HmdMatrix34_t?
-        result = numpy.matrix(
-                ((mat.m[0][0], mat.m[1][0], mat.m[2][0], 0.0),
-                 (mat.m[0][1], mat.m[1][1], mat.m[2][1], 0.0), 
-                 (mat.m[0][2], mat.m[1][2], mat.m[2][2], 0.0), 
-                 (mat.m[0][3], mat.m[1][3], mat.m[2][3], 1.0),)
-            , numpy.float32)  
-        return result
+    """
+    Converts one HmdMatrix44_t or HmdMatrix34_t into a transposed numpy.matrix.
+    Kept for compatibility; numpy.matrix is deprecated, so new code should use
+    matrices_for_openvr_poses(), or PoseBuffer.device_matrices() to convert all
+    tracked device poses at once.
+    """
+    m = numpy.ctypeslib.as_array(mat.m)  # view, no per-element ctypes reads
+    if len(m) == 4: # HmdMatrix44_t?
+        return numpy.matrix(m.T, numpy.float32)
+    elif len(m) == 3: # HmdMatrix34_t?
+        return numpy.matrix(matrices_for_openvr_poses(m[numpy.newaxis])[0])
+
+
+# Bytes per pixel of color formats, for estimating framebuffer memory
+_format_bytes = {GL_RGBA8: 4, GL_SRGB8_ALPHA8: 4, GL_RGB10_A2: 4, GL_R11F_G11F_B10F: 4,
+                 GL_RGBA16F: 8, GL_RGBA32F: 16}
 
 
 class OpenVrFramebuffer(object):
     "Framebuffer for rendering one eye"
     
-    def __init__(self, width, height, multisample = 0):
+    def __init__(self, width, height, multisample = 0, internal_format=GL_RGBA8):
         self.fb = 0
         self.depth_buffer = 0
         self.texture_id = 0
@@ -44,6 +114,23 @@ class OpenVrFramebuffer(object):
         self.height = height
         self.compositor = None
         self.multisample = multisample
+        self.internal_format = internal_format
+
+    @property
+    def key(self):
+        "The properties that make framebuffers interchangeable, see FramebufferPool"
+        return self.width, self.height, self.internal_format, self.multisample
+
+    @property
+    def memory_size(self):
+        "Estimated size in bytes of the color, depth-stencil and resolve buffers"
+        pixels = self.width * self.height
+        color = _format_bytes.get(self.internal_format, 4)
+        # GL_DEPTH24_STENCIL8 is 4 bytes per sample
+        result = pixels * max(self.multisample, 1) * (color + 4)
+        if self.multisample > 0:
+            result += pixels * color
+        return result
         
     def init_gl(self):
         # Set up framebuffer and render textures
@@ -59,11 +146,11 @@ class OpenVrFramebuffer(object):
         self.texture_id = int(glGenTextures(1))
         if self.multisample > 0:
             glBindTexture(GL_TEXTURE_2D_MULTISAMPLE, self.texture_id)
-            glTexImage2DMultisample(GL_TEXTURE_2D_MULTISAMPLE, self.multisample, GL_RGBA8, self.width, self.height, True)
+            glTexImage2DMultisample(GL_TEXTURE_2D_MULTISAMPLE, self.multisample, self.internal_format, self.width, self.height, True)
             glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D_MULTISAMPLE, self.texture_id, 0)
         else:
             glBindTexture(GL_TEXTURE_2D, self.texture_id)
-            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, self.width, self.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+            glTexImage2D(GL_TEXTURE_2D, 0, self.internal_format, self.width, self.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
@@ -85,7 +172,7 @@ class OpenVrFramebuffer(object):
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAX_LEVEL, 0)
-            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, self.width, self.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+            glTexImage2D(GL_TEXTURE_2D, 0, self.internal_format, self.width, self.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
             glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, self.resolve_texture_id, 0)
             status = glCheckFramebufferStatus(GL_FRAMEBUFFER)
             if status != GL_FRAMEBUFFER_COMPLETE:
@@ -101,15 +188,24 @@ class OpenVrFramebuffer(object):
         self.texture.eType = openvr.TextureType_OpenGL
         self.texture.eColorSpace = openvr.ColorSpace_Gamma
         
-    def submit(self, eye):
+    def resolve(self, width=None, height=None):
+        """
+        Copies the multisample color buffer, if any, into the texture that is submitted.
+        width and height limit the copy to the lower left region that was rendered.
+        """
         if self.multisample > 0:
+            if width is None:
+                width, height = self.width, self.height
             glBindFramebuffer(GL_READ_FRAMEBUFFER, self.fb)
             glBindFramebuffer(GL_DRAW_FRAMEBUFFER, self.resolve_fb)
-            glBlitFramebuffer(0, 0, self.width, self.height, 
-                              0, 0, self.width, self.height,
+            glBlitFramebuffer(0, 0, width, height, 
+                              0, 0, width, height,
                               GL_COLOR_BUFFER_BIT, GL_LINEAR)
             glBindFramebuffer(GL_READ_FRAMEBUFFER, 0)
             glBindFramebuffer(GL_DRAW_FRAMEBUFFER, 0)
+
+    def submit(self, eye):
+        self.resolve()
         openvr.VRCompositor().submit(eye, self.texture)
         
     def dispose_gl(self):
@@ -122,16 +218,417 @@ class OpenVrFramebuffer(object):
             glDeleteFramebuffers(1, [self.resolve_fb])
 
 
+class FramebufferPool(object):
+    """
+    Recycles OpenVrFramebuffers, with their depth-stencil buffers and resolve
+    targets, so that changing the size or multisampling of a render target
+    back and forth does not reallocate GPU memory every time.
+
+        fb = pool.acquire(width, height, multisample=4)
+        ...
+        pool.release(fb)
+
+    acquire() hands out a released framebuffer of the same size, color format
+    and sample count when there is one, and otherwise creates a new one.
+    Released framebuffers are kept for reuse until the estimated memory of
+    all framebuffers exceeds budget_bytes; then the least recently released
+    ones are deleted. Framebuffers in use are never deleted, so they may
+    exceed the budget on their own. OpenVrGlRenderer takes its eye
+    framebuffers from its framebuffer_pool, which actors can share for
+    offscreen passes. All methods need the OpenGL context.
+    """
+
+    def __init__(self, budget_bytes=512 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        # Estimated memory of all framebuffers of the pool, in use or not
+        self.allocated_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Released framebuffers by id, least recently released first
+        self._free = collections.OrderedDict()
+        self._in_use = dict()
+
+    def __len__(self):
+        return len(self._free) + len(self._in_use)
+
+    @property
+    def in_use(self):
+        return len(self._in_use)
+
+    def acquire(self, width, height, multisample=0, internal_format=GL_RGBA8):
+        "An initialized OpenVrFramebuffer, reused if possible"
+        key = (width, height, internal_format, multisample)
+        # The most recently released match is the likeliest to still be resident
+        for fb_id in reversed(self._free):
+            if self._free[fb_id].key == key:
+                fb = self._free.pop(fb_id)
+                self.hits += 1
+                break
+        else:
+            fb = self._create_framebuffer(width, height, multisample, internal_format)
+            self.allocated_bytes += fb.memory_size
+            self.misses += 1
+        self._in_use[id(fb)] = fb
+        self._evict()
+        return fb
+
+    def _create_framebuffer(self, width, height, multisample, internal_format):
+        fb = OpenVrFramebuffer(width, height, multisample=multisample, internal_format=internal_format)
+        fb.init_gl()
+        return fb
+
+    def release(self, fb):
+        "Returns a framebuffer from acquire() to the pool, for reuse"
+        del self._in_use[id(fb)]
+        self._free[id(fb)] = fb
+        self._evict()
+
+    def preallocate(self, width, height, multisample=0, internal_format=GL_RGBA8, count=1):
+        "Creates framebuffers ahead of time, so that acquiring them later does not stall"
+        framebuffers = [self.acquire(width, height, multisample, internal_format) for _ in range(count)]
+        for fb in framebuffers:
+            self.release(fb)
+
+    def _evict(self):
+        while self.allocated_bytes > self.budget_bytes and self._free:
+            _, fb = self._free.popitem(last=False)
+            self._delete(fb)
+            self.evictions += 1
+
+    def _delete(self, fb):
+        fb.dispose_gl()
+        self.allocated_bytes -= fb.memory_size
+
+    def trim(self):
+        "Deletes all framebuffers that are not in use"
+        while self._free:
+            self._delete(self._free.popitem(last=False)[1])
+
+    def dispose_gl(self):
+        "Deletes all framebuffers, including those in use"
+        self.trim()
+        for fb in self._in_use.values():
+            self._delete(fb)
+        self._in_use.clear()
+
+
+class HiddenAreaMask(object):
+    """
+    Marks the pixels of each eye that the user never sees, behind the lenses,
+    in the stencil buffer, so that actors drawn afterwards skip shading them.
+    The hidden area meshes of both eyes are fetched once, and uploaded into
+    one vertex buffer, laid out for separate eye framebuffers and for the two
+    halves of a single-pass stereo framebuffer.
+    """
+
+    def __init__(self):
+        self.shader = 0
+        self.vao = None
+        self.vertices = None
+        # First vertex and vertex count of the mesh for each render pass
+        self.ranges = dict()
+
+    def init_gl(self, vr_system):
+        left, right = [clip_space_vertices(get_hidden_area_vertices(eye, vr_system=vr_system))
+                       for eye in (openvr.Eye_Left, openvr.Eye_Right)]
+        # The same meshes squeezed into the left and right halves of a double-wide framebuffer
+        stereo = numpy.concatenate((left, right))
+        stereo[:len(left), 0] = 0.5 * left[:, 0] - 0.5
+        stereo[len(left):, 0] = 0.5 * right[:, 0] + 0.5
+        self.ranges = {
+            PASS_LEFT: (0, len(left)),
+            PASS_RIGHT: (len(left), len(right)),
+            PASS_STEREO: (len(left) + len(right), len(stereo)),
+        }
+        if len(stereo) == 0:
+            return  # This HMD has no hidden area mesh
+        vertex_shader = compileShader(
+            shader_string("""
+            layout(location = 0) in vec2 in_Position;
+            
+            void main() {
+              gl_Position = vec4(in_Position, -1.0, 1.0);
+            }
+            """), 
+            GL_VERTEX_SHADER)
+        fragment_shader = compileShader(
+            shader_string("""
+            out vec4 fragColor;
+            
+            void main() {
+              fragColor = vec4(0.0);
+            }
+            """), 
+            GL_FRAGMENT_SHADER)
+        self.shader = compileProgram(vertex_shader, fragment_shader)
+        self.vertices = vbo.VBO(numpy.concatenate((left, right, stereo)))
+        self.vao = glGenVertexArrays(1)
+        glBindVertexArray(self.vao)
+        self.vertices.bind()
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 2, GL_FLOAT, False, 0, None)
+        glBindVertexArray(0)
+
+    def display_gl(self, render_pass):
+        """
+        Sets the stencil of the hidden pixels of a render pass, one of the gpu_timer.PASS_
+        constants, to 1, and leaves the stencil test enabled so that only pixels
+        with stencil 0 are drawn. Returns False, without changing any state, if
+        the pass has no hidden area. The stencil buffer must have been cleared to 0.
+        """
+        first, count = self.ranges.get(render_pass, (0, 0))
+        if count == 0:
+            return False
+        glEnable(GL_STENCIL_TEST)
+        glStencilFunc(GL_ALWAYS, 1, 0xFF)
+        glStencilOp(GL_KEEP, GL_KEEP, GL_REPLACE)
+        glColorMask(False, False, False, False)
+        glDepthMask(False)
+        # The winding order of the meshes differs between HMDs and eyes
+        cull_face = glIsEnabled(GL_CULL_FACE)
+        glDisable(GL_CULL_FACE)
+        glUseProgram(self.shader)
+        glBindVertexArray(self.vao)
+        glDrawArrays(GL_TRIANGLES, first, count)
+        glBindVertexArray(0)
+        if cull_face:
+            glEnable(GL_CULL_FACE)
+        glColorMask(True, True, True, True)
+        glDepthMask(True)
+        glStencilFunc(GL_EQUAL, 0, 0xFF)
+        glStencilOp(GL_KEEP, GL_KEEP, GL_KEEP)
+        return True
+
+    def dispose_gl(self):
+        if self.shader:
+            glDeleteProgram(self.shader)
+            self.shader = 0
+        if self.vao:
+            glDeleteVertexArrays(1, (self.vao,))
+            self.vao = None
+        if self.vertices is not None:
+            self.vertices.delete()
+            self.vertices = None
+
+
+class FrameUniformBuffer(object):
+    """
+    Uniform buffer of the eye matrices of every render pass, which actors read
+    through frame_uniforms_glsl instead of uploading them with glUniformMatrix4fv
+    for each draw.
+
+    The buffer is allocated with glBufferStorage and mapped once, persistently
+    and coherently. It holds frames_in_flight frames of one block per render
+    pass, each aligned to GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT. update() writes
+    all blocks of a frame in one NumPy assignment, into the frame of the
+    buffer that the GPU finished reading frames_in_flight frames ago, waiting
+    on its fence if it did not; fence_waits counts those waits. bind() binds
+    one render pass's block to FRAME_UNIFORMS_BINDING, and unbind() unbinds
+    it, so that actors drawn outside of the renderer's frame use their
+    FallbackFrameUniforms.
+    """
+
+    def __init__(self, frames_in_flight=3):
+        self.frames_in_flight = frames_in_flight
+        self.buffer = 0
+        self.stride = 0
+        # (frames_in_flight, len(pass_names)) view of the mapped buffer
+        self.blocks = None
+        # Frame of the buffer written by the last update()
+        self.frame = 0
+        self.fence_waits = 0
+        self._fences = [None] * frames_in_flight
+        self._staging = None
+        self._written = False
+
+    def init_gl(self):
+        alignment = int(glGetIntegerv(GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT))
+        self.stride = -(-_FRAME_UNIFORMS_SIZE // alignment) * alignment
+        dtype = frame_uniforms_dtype(self.stride)
+        size = self.stride * len(pass_names) * self.frames_in_flight
+        flags = GL_MAP_WRITE_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT
+        self.buffer = glGenBuffers(1)
+        glBindBuffer(GL_UNIFORM_BUFFER, self.buffer)
+        glBufferStorage(GL_UNIFORM_BUFFER, size, None, flags)
+        address = glMapBufferRange(GL_UNIFORM_BUFFER, 0, size, flags)
+        glBindBuffer(GL_UNIFORM_BUFFER, 0)
+        mapped = (c_ubyte * size).from_address(address)
+        self.blocks = numpy.frombuffer(mapped, dtype=dtype).reshape(self.frames_in_flight, len(pass_names))
+        self._staging = numpy.zeros(len(pass_names), dtype=dtype)
+        self._staging['eye_count'] = 1
+        self._staging['eye_count'][PASS_STEREO] = 2
+
+    def update(self, views, projections):
+        """
+        Publishes the matrices of a new frame. views and projections are float32 arrays
+        of shape (2, 4, 4), left eye first, in the layout of matrixForOpenVrMatrix().
+        """
+        frame = (self.frame + 1) % self.frames_in_flight
+        fence = self._fences[frame]
+        if fence is not None:
+            if glClientWaitSync(fence, 0, 0) == GL_TIMEOUT_EXPIRED:
+                self.fence_waits += 1
+                glClientWaitSync(fence, GL_SYNC_FLUSH_COMMANDS_BIT, 1000000000)
+            glDeleteSync(fence)
+            self._fences[frame] = None
+        staging = self._staging
+        # The left, right and mirror passes draw one eye each, the stereo pass both
+        staging['projection'][:PASS_STEREO, 0] = projections[_pass_eyes]
+        staging['view'][:PASS_STEREO, 0] = views[_pass_eyes]
+        staging['projection'][PASS_STEREO] = projections
+        staging['view'][PASS_STEREO] = views
+        self.blocks[frame] = staging
+        self.frame = frame
+        self._written = True
+
+    def bind(self, render_pass):
+        "Binds the block of one of the PASS_ render passes of the current frame"
+        global _bound_frame_uniforms
+        offset = (self.frame * len(pass_names) + render_pass) * self.stride
+        glBindBufferRange(GL_UNIFORM_BUFFER, FRAME_UNIFORMS_BINDING, self.buffer, offset, _FRAME_UNIFORMS_SIZE)
+        _bound_frame_uniforms = self
+
+    def unbind(self):
+        global _bound_frame_uniforms
+        if _bound_frame_uniforms is self:
+            glBindBufferBase(GL_UNIFORM_BUFFER, FRAME_UNIFORMS_BINDING, 0)
+            _bound_frame_uniforms = None
+
+    def end_frame(self):
+        "Fences the frame written by the last update(), after the commands that read it"
+        if self._written:
+            self._fences[self.frame] = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+            self._written = False
+
+    def dispose_gl(self):
+        self.unbind()
+        for fence in self._fences:
+            if fence is not None:
+                glDeleteSync(fence)
+        self._fences = [None] * self.frames_in_flight
+        # The mapping ends with the buffer
+        self.blocks = None
+        if self.buffer:
+            glDeleteBuffers(1, [self.buffer])
+            self.buffer = 0
+
+
+class FallbackFrameUniforms(object):
+    """
+    FrameUniforms block of one actor, for drawing it outside of
+    OpenVrGlRenderer with the matrices passed to its display_gl() or
+    display_gl_stereo(). While a renderer's FrameUniformBuffer is bound,
+    bind() does nothing, so actors drawn by the renderer read its matrices
+    without any upload of their own.
+    """
+
+    def __init__(self):
+        self.buffer = 0
+        self._block = numpy.zeros(1, dtype=frame_uniforms_dtype())
+
+    def bind(self, views, projections):
+        """
+        Uploads and binds the matrices of one eye, each a 4x4 matrix, or of both eyes
+        of single-pass stereo, each of shape (2, 4, 4), unless a FrameUniformBuffer is bound.
+        """
+        if _bound_frame_uniforms is not None:
+            return
+        views = numpy.reshape(views, (-1, 4, 4))
+        block = self._block
+        block['view'][0, :len(views)] = views
+        block['projection'][0, :len(views)] = numpy.reshape(projections, (-1, 4, 4))
+        block['eye_count'] = len(views)
+        if not self.buffer:
+            self.buffer = glGenBuffers(1)
+            glBindBuffer(GL_UNIFORM_BUFFER, self.buffer)
+            glBufferData(GL_UNIFORM_BUFFER, block.nbytes, block, GL_DYNAMIC_DRAW)
+        else:
+            glBindBuffer(GL_UNIFORM_BUFFER, self.buffer)
+            glBufferSubData(GL_UNIFORM_BUFFER, 0, block.nbytes, block)
+        glBindBuffer(GL_UNIFORM_BUFFER, 0)
+        glBindBufferBase(GL_UNIFORM_BUFFER, FRAME_UNIFORMS_BINDING, self.buffer)
+
+    def dispose_gl(self):
+        if self.buffer:
+            glDeleteBuffers(1, [self.buffer])
+            self.buffer = 0
+
+
 class OpenVrGlRenderer(list):
-    "Renders to virtual reality headset using OpenVR and OpenGL APIs"
+    """
+    Renders to virtual reality headset using OpenVR and OpenGL APIs
+
+    profiler, if given, is a frame_profiler.FrameProfiler that records the CPU
+    time of each phase of render_scene() and of each actor's display_gl().
+    gpu_timer, if given, is a gpu_timer.GpuTimer that records the GPU time of
+    the clear, each actor and the resolve of each render pass.
+
+    With single_pass_stereo True, both eyes are rendered side by side into one
+    double-wide framebuffer, in a single pass over the actors, and each half is
+    submitted with its VRTextureBounds_t. See display_gl_stereo().
+
+    With hidden_area_mask True, the HMD's hidden area mesh is drawn into the
+    stencil buffer of each eye before the actors, which are then not shaded
+    where the user cannot see them. See HiddenAreaMask.
+
+    resolution_controller, if given, is an adaptive_resolution.ResolutionController
+    that lowers the rendered resolution when the GPU cannot keep up. Eye
+    framebuffers are then allocated at its max_scale, and each frame renders
+    into their lower left region, at the controller's current scale.
+
+    Eye framebuffers come from framebuffer_pool, a FramebufferPool that is
+    created if not given. After changing multisample, single_pass_stereo or
+    the max_scale of the resolution controller, call reallocate_framebuffers();
+    the framebuffers of the old configuration stay in the pool, so changing
+    back does not allocate again.
+
+    pose_latch, if given, is a frame_pipeline.PoseLatch that reads the poses
+    again right before the eye matrices are computed, predicted for the
+    frame's photons, and measures the motion-to-photon latency of each frame.
+    frame_pipeline, if given, is a frame_pipeline.FramePipeline whose update()
+    simulates the next frame on a worker thread while this one is rendered;
+    actors draw its state.
+
+    The eye matrices of each render pass are published once per frame in
+    frame_uniforms, a FrameUniformBuffer, and bound to FRAME_UNIFORMS_BINDING
+    while actors draw; actor shaders read them through frame_uniforms_glsl,
+    and actors ignore the matrices passed to display_gl(). Actors that can
+    also be drawn without the renderer upload those matrices with a
+    FallbackFrameUniforms.
+
+    Actors with an update_gl() method have it called once per frame, before
+    any render pass, e.g. to upload resources that finished loading.
+    """
 
-    def __init__(self, actor=None, window_size=(800,600), multisample=0):
+    def __init__(self, actor=None, window_size=(800,600), multisample=0, profiler=None, gpu_timer=None,
+                 single_pass_stereo=False, hidden_area_mask=True, resolution_controller=None,
+                 framebuffer_pool=None, pose_latch=None, frame_pipeline=None):
         self.vr_system = None
         self.left_fb = None
         self.right_fb = None
+        self.stereo_fb = None
+        self.single_pass_stereo = single_pass_stereo
+        self.hidden_area_mask = HiddenAreaMask() if hidden_area_mask else None
+        self.resolution_controller = resolution_controller
+        # A pool created here is deleted with the renderer; a shared one is left to its owner
+        self._owns_framebuffer_pool = framebuffer_pool is None
+        if framebuffer_pool is None:
+            framebuffer_pool = FramebufferPool()
+        self.framebuffer_pool = framebuffer_pool
+        self.pose_latch = pose_latch
+        self.frame_pipeline = frame_pipeline
+        self.frame_uniforms = FrameUniformBuffer()
+        # Regions of the framebuffer textures that the compositor shows to each eye
+        self.eye_bounds = (openvr.VRTextureBounds_t(0.0, 0.0, 1.0, 1.0),
+                           openvr.VRTextureBounds_t(0.0, 0.0, 1.0, 1.0))
+        # Recommended render target size, size of the region rendered this frame,
+        # and size of the framebuffer region, of one eye
+        self.render_target_size = None
+        self.viewport_size = None
+        self.max_viewport_size = None
         self.window_size = window_size
-        poses_t = openvr.TrackedDevicePose_t * openvr.k_unMaxTrackedDeviceCount
-        self.poses = poses_t()
+        self.poses = PoseBuffer(openvr.k_unMaxTrackedDeviceCount)
         if actor is not None:
             try:
                 len(actor)
@@ -140,82 +637,324 @@ class OpenVrGlRenderer(list):
                 self.append(actor)
         self.do_mirror = False
         self.multisample = multisample      
+        self.profiler = profiler
+        self.gpu_timer = gpu_timer
+        # Reused by the profiler and GPU timer to learn the compositor's index of each frame
+        self._frame_timing = openvr.Compositor_FrameTiming()
+        # Render pass that display_gl() draws, for the hidden area mask and GPU timer
+        self._pass = PASS_LEFT
 
     def init_gl(self):
         "allocate OpenGL resources"
         self.vr_system = openvr.init(openvr.VRApplication_Scene)
-        w, h = self.vr_system.getRecommendedRenderTargetSize()
-        self.left_fb = OpenVrFramebuffer(w, h, multisample=self.multisample)
-        self.right_fb = OpenVrFramebuffer(w, h, multisample=self.multisample)
+        self.render_target_size = self.vr_system.getRecommendedRenderTargetSize()
         self.compositor = openvr.VRCompositor()
         if self.compositor is None:
             raise Exception("Unable to create compositor") 
-        self.left_fb.init_gl()
-        self.right_fb.init_gl()
+        if self.resolution_controller is not None:
+            self.resolution_controller.init(self.vr_system)
+        if self.pose_latch is not None:
+            self.pose_latch.init(self.vr_system, self.compositor)
+        self._acquire_framebuffers()
+        self.frame_uniforms.init_gl()
+        if self.gpu_timer is not None:
+            self.gpu_timer.init_gl()
+        if self.hidden_area_mask is not None:
+            self.hidden_area_mask.init_gl(self.vr_system)
         # Compute projection matrix
         zNear = 0.2
         zFar = 500.0
-        self.projection_left = numpy.asarray(matrixForOpenVrMatrix(self.vr_system.getProjectionMatrix(
-                openvr.Eye_Left, 
-                zNear, zFar)))
-        self.projection_right = numpy.asarray(matrixForOpenVrMatrix(self.vr_system.getProjectionMatrix(
-                openvr.Eye_Right, 
-                zNear, zFar)))
-        self.view_left = matrixForOpenVrMatrix(
-            self.vr_system.getEyeToHeadTransform(openvr.Eye_Left)).I  # head_X_eye in Kane notation
-        self.view_right = matrixForOpenVrMatrix(
-            self.vr_system.getEyeToHeadTransform(openvr.Eye_Right)).I  # head_X_eye in Kane notation
+        eyes = (openvr.Eye_Left, openvr.Eye_Right)
+        # In the transposed layout of matrices_for_openvr_poses()
+        self.projections = numpy.array([numpy.ctypeslib.as_array(self.vr_system.getProjectionMatrix(
+                eye, zNear, zFar).m).T for eye in eyes], dtype=numpy.float32)
+        # head_X_eye in Kane notation
+        self.views = inverse_matrices_for_openvr_poses([numpy.ctypeslib.as_array(
+                self.vr_system.getEyeToHeadTransform(eye).m) for eye in eyes])
+        self.projection_left, self.projection_right = self.projections
+        self.view_left, self.view_right = self.views
         for actor in self:
             actor.init_gl()
 
+    def _acquire_framebuffers(self):
+        w, h = self.render_target_size
+        if self.resolution_controller is not None:
+            scale = self.resolution_controller.max_scale
+            w, h = int(math.ceil(w * scale)), int(math.ceil(h * scale))
+        pool = self.framebuffer_pool
+        if self.single_pass_stereo:
+            self.stereo_fb = pool.acquire(2 * w, h, multisample=self.multisample)
+        else:
+            self.left_fb = pool.acquire(w, h, multisample=self.multisample)
+            self.right_fb = pool.acquire(w, h, multisample=self.multisample)
+        self.max_viewport_size = (w, h)
+        self._set_viewport_size((w, h))
+
+    def _release_framebuffers(self):
+        for fb in (self.left_fb, self.right_fb, self.stereo_fb):
+            if fb is not None:
+                self.framebuffer_pool.release(fb)
+        self.left_fb = self.right_fb = self.stereo_fb = None
+
+    def reallocate_framebuffers(self):
+        "Replaces the eye framebuffers with ones that match the current configuration"
+        self._release_framebuffers()
+        self._acquire_framebuffers()
+
+    def _set_viewport_size(self, size):
+        "Sets the size of the region of each eye to render, and the texture bounds to submit"
+        self.viewport_size = size
+        width, height = size
+        fb_width, fb_height = self.max_viewport_size
+        u = float(width) / fb_width
+        # Texture v runs down from the top, the last row of an OpenGL texture
+        v = 1.0 - float(height) / fb_height
+        left, right = self.eye_bounds
+        if self.single_pass_stereo:
+            u *= 0.5
+            left.uMin, left.uMax, right.uMin, right.uMax = 0.0, u, u, 2 * u
+        else:
+            left.uMin, left.uMax, right.uMin, right.uMax = 0.0, u, 0.0, u
+        left.vMin = right.vMin = v
+        left.vMax = right.vMax = 1.0
+
     def render_scene(self):
         if self.compositor is None:
             return
-        self.compositor.waitGetPoses(self.poses, openvr.k_unMaxTrackedDeviceCount, None, 0)
-        hmd_pose0 = self.poses[openvr.k_unTrackedDeviceIndex_Hmd]
-        if not hmd_pose0.bPoseIsValid:
+        profiler = self.profiler
+        gpu_timer = self.gpu_timer
+        latch = self.pose_latch
+        pipeline = self.frame_pipeline
+        t = None
+        if profiler is not None:
+            t = profiler.begin_frame()
+        if pipeline is None:
+            self.compositor.waitGetPoses(self.poses, openvr.k_unMaxTrackedDeviceCount, None, 0)
+        else:
+            # Game poses are predicted one frame further ahead, for simulating the next frame
+            self.compositor.waitGetPoses(self.poses, openvr.k_unMaxTrackedDeviceCount,
+                                         pipeline.game_poses, len(pipeline.game_poses))
+        if profiler is not None:
+            t = profiler.lap(PHASE_WAIT_POSES, t)
+        if profiler is not None or gpu_timer is not None or latch is not None:
+            # The newest frame timing is the one of the frame that just started
+            frame_index = -1
+            if self.compositor.getFrameTiming(0, self._frame_timing)[0]:
+                frame_index = self._frame_timing.m_nFrameIndex
+            if profiler is not None:
+                profiler.set_frame_index(frame_index)
+            if gpu_timer is not None:
+                gpu_timer.begin_frame(frame_index)
+            if latch is not None:
+                latch.update_from_compositor(self.compositor)
+                latch.begin_frame(frame_index)
+        if profiler is not None:
+            t = profiler.lap(PHASE_MATRICES, t)
+        if pipeline is not None:
+            pipeline.begin_frame()
+            # A stall on the simulation thread, not work of the render thread
+            if profiler is not None:
+                t = profiler.lap(PHASE_SIMULATION, t)
+        controller = self.resolution_controller
+        if controller is not None:
+            controller.update_from_compositor(self.compositor)
+            width, height = controller.viewport_size(*self.render_target_size)
+            size = (min(width, self.max_viewport_size[0]), min(height, self.max_viewport_size[1]))
+            if size != self.viewport_size:
+                self._set_viewport_size(size)
+        # Per-frame work of actors, such as uploads, once per frame rather than once per render pass
+        for actor in self:
+            update = getattr(actor, 'update_gl', None)
+            if update is not None:
+                update()
+        if profiler is not None:
+            t = profiler.lap(PHASE_UPLOAD, t)
+        # Everything above is independent of the head pose, so the latch is as late as it can be
+        if latch is not None:
+            latch.latch(self.poses)
+        hmd_index = openvr.k_unTrackedDeviceIndex_Hmd
+        if not self.poses.valid[hmd_index]:
+            self._end_frame()
             return
-        hmd_pose1 = hmd_pose0.mDeviceToAbsoluteTracking # head_X_room in Kane notation
-        hmd_pose = matrixForOpenVrMatrix(hmd_pose1).I # room_X_head in Kane notation
+        # room_X_head in Kane notation, inverting only the HMD's pose
+        modelview = inverse_matrices_for_openvr_poses(self.poses.matrices[hmd_index:hmd_index + 1])[0]
         # Use the pose to compute things
-        modelview = hmd_pose
-        mvl = modelview * self.view_left # room_X_eye(left) in Kane notation
-        mvr = modelview * self.view_right # room_X_eye(right) in Kane notation
-        # Repack the resulting matrices to have default stride, to avoid
-        # problems with weird strides and OpenGL
-        mvl = numpy.asarray(numpy.matrix(mvl, dtype=numpy.float32))
-        mvr = numpy.asarray(numpy.matrix(mvr, dtype=numpy.float32))
+        # room_X_eye in Kane notation, for both eyes at once
+        modelviews = numpy.matmul(modelview, self.views)
+        mvl, mvr = modelviews
+        self.frame_uniforms.update(modelviews, self.projections)
+        if profiler is not None:
+            t = profiler.lap(PHASE_MATRICES, t)
         # 1) On-screen render:
         if self.do_mirror:
             glViewport(0, 0, self.window_size[0], self.window_size[1])
             # Display left eye view to screen
+            self._pass = PASS_MIRROR
             self.display_gl(mvl, self.projection_left)
         # 2) VR render
+        if self.single_pass_stereo:
+            self._render_stereo(modelviews, t)
+            return
+        width, height = self.viewport_size
         # Left eye view
         glBindFramebuffer(GL_FRAMEBUFFER, self.left_fb.fb)
-        glViewport(0, 0, self.left_fb.width, self.left_fb.height)
+        scissor = self._set_eye_viewport(width, height)
+        self._pass = PASS_LEFT
         self.display_gl(mvl, self.projection_left)
-        self.left_fb.submit(openvr.Eye_Left)
-        # self.compositor.submit(openvr.Eye_Left, self.left_fb.texture)
+        t = self._submit(self.left_fb, ((openvr.Eye_Left, self.eye_bounds[0]),), width, height, t)
         # Right eye view
         glBindFramebuffer(GL_FRAMEBUFFER, self.right_fb.fb)
+        self._pass = PASS_RIGHT
         self.display_gl(mvr, self.projection_right)
-        self.right_fb.submit(openvr.Eye_Right)
-        # self.compositor.submit(openvr.Eye_Right, self.right_fb.texture)
+        t = self._submit(self.right_fb, ((openvr.Eye_Right, self.eye_bounds[1]),), width, height, t)
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        if scissor:
+            glDisable(GL_SCISSOR_TEST)
+        self._end_frame()
+
+    def _set_eye_viewport(self, width, height):
+        "Sets the viewport to the region rendered this frame. Returns whether the scissor test was enabled."
+        glViewport(0, 0, width, height)
+        if self.viewport_size == self.max_viewport_size:
+            return False
+        # So that clears skip the rest of the framebuffer, too
+        glEnable(GL_SCISSOR_TEST)
+        glScissor(0, 0, width, height)
+        return True
+
+    def _render_stereo(self, modelviews, t):
+        width, height = self.viewport_size
+        glBindFramebuffer(GL_FRAMEBUFFER, self.stereo_fb.fb)
+        scissor = self._set_eye_viewport(2 * width, height)
+        self._pass = PASS_STEREO
+        self.display_gl_stereo(modelviews, self.projections)
+        # One resolve for both eyes, then each eye gets its half of the texture
+        submissions = ((openvr.Eye_Left, self.eye_bounds[0]), (openvr.Eye_Right, self.eye_bounds[1]))
+        self._submit(self.stereo_fb, submissions, 2 * width, height, t)
         glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        if scissor:
+            glDisable(GL_SCISSOR_TEST)
+        self._end_frame()
+
+    def _submit(self, fb, submissions, width, height, t):
+        "Resolves the rendered region of fb, and submits it to the compositor as each (eye, bounds) of submissions"
+        profiler = self.profiler
+        gpu_timer = self.gpu_timer
+        # Everything since the last lap was spent in display_gl()
+        if profiler is not None:
+            t = profiler.lap(PHASE_DISPLAY, t)
+        if gpu_timer is not None:
+            gpu_timer.begin(self._pass, gpu_timer.section_resolve)
+        fb.resolve(width, height)
+        if gpu_timer is not None:
+            gpu_timer.end()
+        if profiler is not None:
+            t = profiler.lap(PHASE_RESOLVE, t)
+        for eye, bounds in submissions:
+            self.compositor.submit(eye, fb.texture, bounds)
+        if profiler is not None:
+            t = profiler.lap(PHASE_SUBMIT, t)
+        return t
+
+    def _end_frame(self):
+        self.frame_uniforms.end_frame()
+        self.frame_uniforms.unbind()
+        if self.profiler is not None:
+            self.profiler.end_frame()
+        if self.gpu_timer is not None:
+            self.gpu_timer.end_frame()
         
-    def display_gl(self, modelview, projection):
+    def _clear(self):
+        "Clears the framebuffer and masks its hidden area. Returns whether the stencil test is now on."
+        gpu_timer = self.gpu_timer
+        if gpu_timer is not None:
+            gpu_timer.begin(self._pass, gpu_timer.section_clear)
         glClearColor(0.5, 0.5, 0.5, 0.0) # gray background
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        for actor in self:
-            actor.display_gl(modelview, projection)
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT | GL_STENCIL_BUFFER_BIT)
+        masked = self.hidden_area_mask is not None and self.hidden_area_mask.display_gl(self._pass)
+        if gpu_timer is not None:
+            gpu_timer.end()
+        return masked
+
+    def _display_instrumented(self, display):
+        "Calls display(actor) for each actor, timing each call with the profiler and GPU timer"
+        profiler = self.profiler
+        gpu_timer = self.gpu_timer
+        if profiler is not None:
+            t = profiler.clock()
+        for index, actor in enumerate(self):
+            if gpu_timer is not None:
+                gpu_timer.begin(self._pass, gpu_timer.actor_section(index))
+            display(actor)
+            if gpu_timer is not None:
+                gpu_timer.end()
+            if profiler is not None:
+                t = profiler.lap_actor(index, t)
+
+    def display_gl(self, modelview, projection):
+        self.frame_uniforms.bind(self._pass)
+        masked = self._clear()
+        if self.profiler is None and self.gpu_timer is None:
+            for actor in self:
+                actor.display_gl(modelview, projection)
+        else:
+            self._display_instrumented(lambda actor: actor.display_gl(modelview, projection))
+        if masked:
+            glDisable(GL_STENCIL_TEST)
+
+    def display_gl_stereo(self, modelviews, projections):
+        """
+        Draws both eyes side by side into the lower left region of stereo_fb, which must be bound,
+        each eye viewport_size in size.
+        modelviews and projections are float32 arrays of shape (2, 4, 4), left eye first.
+
+        Actors with a display_gl_stereo(modelviews, projections) method draw
+        both eyes at once, usually as two instances of each draw call whose
+        vertex shader calls stereo_position() from stereo_vertex_glsl; the
+        renderer enables GL_CLIP_DISTANCE0 around such calls. Other actors
+        are drawn with display_gl() once per eye, each with a half-width viewport.
+        """
+        self.frame_uniforms.bind(PASS_STEREO)
+        masked = self._clear()
+        if self.profiler is None and self.gpu_timer is None:
+            for actor in self:
+                self._display_actor_stereo(actor, modelviews, projections)
+        else:
+            self._display_instrumented(lambda actor: self._display_actor_stereo(actor, modelviews, projections))
+        glDisable(GL_CLIP_DISTANCE0)
+        if masked:
+            glDisable(GL_STENCIL_TEST)
+
+    def _display_actor_stereo(self, actor, modelviews, projections):
+        display_stereo = getattr(actor, 'display_gl_stereo', None)
+        if display_stereo is not None:
+            glEnable(GL_CLIP_DISTANCE0)
+            display_stereo(modelviews, projections)
+            return
+        glDisable(GL_CLIP_DISTANCE0)
+        width, height = self.viewport_size
+        glViewport(0, 0, width, height)
+        self.frame_uniforms.bind(PASS_LEFT)
+        actor.display_gl(modelviews[0], projections[0])
+        glViewport(width, 0, width, height)
+        self.frame_uniforms.bind(PASS_RIGHT)
+        actor.display_gl(modelviews[1], projections[1])
+        glViewport(0, 0, 2 * width, height)
+        self.frame_uniforms.bind(PASS_STEREO)
 
     def dispose_gl(self):
+        if self.frame_pipeline is not None:
+            self.frame_pipeline.stop()
         for actor in self:
             actor.dispose_gl()
+        if self.gpu_timer is not None:
+            self.gpu_timer.dispose_gl()
+        if self.hidden_area_mask is not None:
+            self.hidden_area_mask.dispose_gl()
+        self.frame_uniforms.dispose_gl()
         if self.vr_system is not None:
             openvr.shutdown()
             self.vr_system = None
-        if self.left_fb is not None:
-            self.left_fb.dispose_gl()
-            self.right_fb.dispose_gl()
+        self._release_framebuffers()
+        if self._owns_framebuffer_pool:
+            self.framebuffer_pool.dispose_gl()
@@ -1,4 +1,5 @@
 import inspect
+import sys
 import textwrap
 
 
@@ -33,8 +34,10 @@ def shader_substring(body, stack_frame=1):
     The unindenting allows you to type the shader code at a pleasing indent level
     in your python method, while still creating an unindented GLSL string at the end.
     """
-    line_count = len(body.splitlines(True))
-    line_number = inspect.stack()[stack_frame][2] + 1 - line_count
+    line_number = inspect.stack()[stack_frame][2]
+    if sys.version_info < (3, 8):
+        # Older Pythons report the last line of a multi-line string argument, not the first
+        line_number += 1 - len(body.splitlines(True))
     return """\
 #line %d
 %s
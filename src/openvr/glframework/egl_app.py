@@ -0,0 +1,162 @@
+#!/bin/env python
+
+# file egl_app.py
+
+import ctypes
+import os
+import sys
+
+# PyOpenGL binds to the windowing system it finds when it is first imported
+if 'OpenGL' not in sys.modules:
+    os.environ.setdefault('PYOPENGL_PLATFORM', 'egl')
+
+import numpy
+from OpenGL import EGL, platform
+from OpenGL.GL import glBindFramebuffer, glFinish, glFlush, glReadPixels, \
+    GL_READ_FRAMEBUFFER, GL_RGBA, GL_UNSIGNED_BYTE
+
+
+"""
+Headless EGL application, for rendering offscreen without a window or a
+display server, e.g. in continuous integration or on a server without a GPU
+"""
+
+
+# From the EGL_MESA_platform_surfaceless extension
+_EGL_PLATFORM_SURFACELESS_MESA = 0x31DD
+
+
+class EglApp(object):
+    """
+    EglApp creates an OpenGL 4.5 core context and an offscreen pbuffer of the
+    renderer's window_size with EGL, and drives the renderer like the other
+    apps of glframework. No window, X server or Wayland compositor is needed;
+    where Mesa has no GPU to use, it renders with its llvmpipe software
+    rasterizer. The pbuffer is the default framebuffer, in place of a window,
+    so the desktop mirror of OpenVrGlRenderer has somewhere to go; read_pixels()
+    returns its contents.
+
+    Frames are not paced by a display: run_loop() renders as fast as it can,
+    so together with openvr.simulator.SimulatedRuntime(paced=False) it runs
+    a renderer and its actors without a headset at whatever rate they
+    sustain, for tests and benchmarks. With finish True, each frame waits for
+    the GPU, so wall clock time per frame includes the GPU work.
+
+    PyOpenGL must use its EGL platform. Importing this module selects it
+    unless OpenGL was imported first; otherwise set the PYOPENGL_PLATFORM
+    environment variable to "egl".
+    """
+
+    def __init__(self, renderer, title="EglApp", finish=False):
+        "Creates an OpenGL context and an offscreen surface, and acquires OpenGL resources"
+        self.renderer = renderer
+        self.title = title
+        self.finish = finish
+        self.frame_count = 0
+        self._should_close = False
+        self._is_initialized = False # keep track of whether self.init_gl() has been called
+        if type(platform.PLATFORM).__name__ != 'EGLPlatform':
+            raise Exception("PyOpenGL does not use EGL; set PYOPENGL_PLATFORM=egl before importing OpenGL")
+        self.display = self._get_display()
+        major, minor = EGL.EGLint(), EGL.EGLint()
+        if not EGL.eglInitialize(self.display, ctypes.pointer(major), ctypes.pointer(minor)):
+            raise Exception("EGL initialization error")
+        config_attributes = (EGL.EGLint * 15)(
+            EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+            EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+            EGL.EGL_RED_SIZE, 8, EGL.EGL_GREEN_SIZE, 8, EGL.EGL_BLUE_SIZE, 8,
+            EGL.EGL_DEPTH_SIZE, 24, EGL.EGL_STENCIL_SIZE, 8,
+            EGL.EGL_NONE)
+        config = EGL.EGLConfig()
+        config_count = EGL.EGLint()
+        if not EGL.eglChooseConfig(self.display, config_attributes, ctypes.pointer(config), 1,
+                                   ctypes.pointer(config_count)) or config_count.value < 1:
+            EGL.eglTerminate(self.display)
+            raise Exception("No EGL configuration for offscreen OpenGL rendering")
+        width, height = self.renderer.window_size
+        surface_attributes = (EGL.EGLint * 5)(EGL.EGL_WIDTH, width, EGL.EGL_HEIGHT, height, EGL.EGL_NONE)
+        self.surface = EGL.eglCreatePbufferSurface(self.display, config, surface_attributes)
+        # Use modern OpenGL version 4.5 core
+        EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+        context_attributes = (EGL.EGLint * 7)(
+            EGL.EGL_CONTEXT_MAJOR_VERSION, 4,
+            EGL.EGL_CONTEXT_MINOR_VERSION, 5,
+            EGL.EGL_CONTEXT_OPENGL_PROFILE_MASK, EGL.EGL_CONTEXT_OPENGL_CORE_PROFILE_BIT,
+            EGL.EGL_NONE)
+        self.context = EGL.eglCreateContext(self.display, config, EGL.EGL_NO_CONTEXT, context_attributes)
+        if not self.surface or not self.context:
+            EGL.eglTerminate(self.display)
+            raise Exception("EGL context creation error")
+        self._make_current()
+
+    @staticmethod
+    def _get_display():
+        # Surfaceless Mesa needs neither a display server nor access to a GPU device
+        extensions = EGL.eglQueryString(EGL.EGL_NO_DISPLAY, EGL.EGL_EXTENSIONS) or b''
+        if b'EGL_MESA_platform_surfaceless' in extensions.split() and bool(EGL.eglGetPlatformDisplay):
+            display = EGL.eglGetPlatformDisplay(_EGL_PLATFORM_SURFACELESS_MESA, EGL.EGL_DEFAULT_DISPLAY, None)
+        else:
+            display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+        if not display:
+            raise Exception("No EGL display")
+        return display
+
+    def _make_current(self):
+        EGL.eglMakeCurrent(self.display, self.surface, self.surface, self.context)
+
+    def __enter__(self):
+        "setup for RAII using 'with' keyword"
+        return self
+
+    def __exit__(self, type_arg, value, traceback):
+        "cleanup for RAII using 'with' keyword"
+        self.dispose_gl()
+
+    def init_gl(self):
+        if self._is_initialized:
+            return # only initialize once
+        self._make_current()
+        if self.renderer is not None:
+            self.renderer.init_gl()
+        self._is_initialized = True
+
+    def render_scene(self):
+        "render scene one time"
+        self.init_gl() # should be a no-op after the first frame is rendered
+        self.renderer.render_scene()
+        if self.finish:
+            glFinish()
+        else:
+            glFlush()
+        self.frame_count += 1
+
+    def read_pixels(self):
+        "Contents of the offscreen surface, as a height x width x RGBA uint8 array, bottom row first"
+        width, height = self.renderer.window_size
+        glBindFramebuffer(GL_READ_FRAMEBUFFER, 0)
+        pixels = glReadPixels(0, 0, width, height, GL_RGBA, GL_UNSIGNED_BYTE)
+        return numpy.frombuffer(pixels, numpy.uint8).reshape(height, width, 4)
+
+    def dispose_gl(self):
+        if self.context:
+            self._make_current()
+            if self.renderer is not None:
+                self.renderer.dispose_gl()
+            EGL.eglMakeCurrent(self.display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, EGL.EGL_NO_CONTEXT)
+            EGL.eglDestroySurface(self.display, self.surface)
+            EGL.eglDestroyContext(self.display, self.context)
+            EGL.eglTerminate(self.display)
+            self.context = None
+            self.surface = None
+        self._is_initialized = False
+
+    def close(self):
+        "makes run_loop() return after the frame in progress"
+        self._should_close = True
+
+    def run_loop(self, frame_count=None):
+        "keep rendering, as fast as possible, until close() is called or frame_count more frames are rendered"
+        self._should_close = False
+        end = None if frame_count is None else self.frame_count + frame_count
+        while not self._should_close and (end is None or self.frame_count < end):
+            self.render_scene()
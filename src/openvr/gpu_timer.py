@@ -0,0 +1,189 @@
+#!/bin/env python
+
+# file gpu_timer.py
+
+import collections
+import ctypes
+
+from OpenGL.GL import *  # @UnusedWildImport # this comment squelches an IDE warning
+# PyOpenGL's wrapper of glGetQueryObjectui64v cannot write into uint64 arrays
+from OpenGL.raw.GL.VERSION.GL_3_3 import glGetQueryObjectui64v as _glGetQueryObjectui64v
+import numpy
+
+from openvr.frame_timing import RingBuffer
+
+"""
+GPU time of each render pass and actor, measured with GL_TIME_ELAPSED queries
+"""
+
+try:
+    from time import perf_counter as _clock
+except ImportError:  # Python 2
+    from time import time as _clock
+
+
+# Render passes of OpenVrGlRenderer.render_scene(); single-pass stereo draws both eyes in the stereo pass
+pass_names = ('left', 'right', 'mirror', 'stereo')
+PASS_LEFT, PASS_RIGHT, PASS_MIRROR, PASS_STEREO = range(len(pass_names))
+
+
+def gpu_frame_dtype(max_actors):
+    """
+    NumPy structured dtype of the GPU times of one frame, in nanoseconds.
+    frame_index is the compositor's m_nFrameIndex of the frame, or -1 if unknown.
+    pass_ns is indexed by the PASS_ constants; actor_ns by actor index, summed over all passes.
+    """
+    return numpy.dtype([
+        ('frame_index', numpy.int64),
+        ('total_ns', numpy.int64),
+        ('pass_ns', numpy.int64, (len(pass_names),)),
+        ('actor_ns', numpy.int64, (max_actors,)),
+        ('clear_ns', numpy.int64),
+        ('resolve_ns', numpy.int64),
+    ])
+
+
+# Summary of a range of frames. total_ms, clear_ms and resolve_ms are arrays with
+# one value per requested percentile, pass_ms maps each pass name to such an
+# array, and actor_ms is an array of shape (max_actors, len(percentiles)).
+GpuTimerStats = collections.namedtuple('GpuTimerStats', [
+    'frames', 'total_ms', 'pass_ms', 'actor_ms', 'clear_ms', 'resolve_ms'])
+
+
+class GpuTimer(object):
+    """
+    Measures the GPU time of sections of each frame, such as one actor's
+    display_gl() in one render pass, with GL_TIME_ELAPSED queries. Pass one to
+    OpenVrGlRenderer(gpu_timer=...) to time the clear, including the hidden
+    area mask, each actor and the MSAA resolve of every pass.
+
+    Query results become available some frames after the GPU work was issued,
+    so the queries of latency_frames frames are kept in flight. begin_frame()
+    reads the results of the oldest frame if they are available, and never
+    waits for them; a frame whose results are still pending when its queries
+    are needed again is counted in lost_frames instead. Completed frames are
+    appended to a RingBuffer of gpu_frame_dtype(max_actors).
+
+    A frame's GPU work runs between its begin_frame() and the collection of
+    its results. Frames with a section that took longer than that are
+    counted in invalid_frames and dropped; some drivers, e.g. Mesa's
+    llvmpipe, report a bogus time for the first query of a context.
+
+    GL_TIME_ELAPSED queries cannot nest, so sections must not overlap.
+    """
+
+    def __init__(self, latency_frames=3, capacity=4096, max_actors=32):
+        self.frames = RingBuffer(capacity, gpu_frame_dtype(max_actors))
+        self.latency_frames = latency_frames
+        self.max_actors = max_actors
+        self.lost_frames = 0
+        self.invalid_frames = 0
+        # Sections of each pass: the actors, then the clear, then the resolve
+        self.section_clear = max_actors
+        self.section_resolve = max_actors + 1
+        self._shape = (latency_frames, len(pass_names), max_actors + 2)
+        self._queries = None
+        self._issued = numpy.zeros(self._shape, dtype=numpy.bool_)
+        self._last_query = [None] * latency_frames
+        self._frame_indices = [-1] * latency_frames
+        self._begin_times = [0.0] * latency_frames
+        self._frame_count = 0
+        self._slot = 0
+        self._active = False
+        self._result = numpy.zeros(1, dtype=numpy.uint64)
+        self._result_pointer = self._result.ctypes.data_as(ctypes.POINTER(ctypes.c_uint64))
+        self._elapsed = numpy.zeros(self._shape[1:], dtype=numpy.int64)
+
+    def init_gl(self):
+        count = int(numpy.prod(self._shape))
+        self._queries = numpy.asarray(glGenQueries(count), dtype=numpy.uint32).reshape(self._shape)
+
+    def dispose_gl(self):
+        if self._queries is not None:
+            glDeleteQueries(self._queries.size, self._queries.ravel())
+            self._queries = None
+
+    def begin_frame(self, frame_index=-1):
+        "Starts a frame, first collecting the results of the frame whose queries it reuses"
+        self._slot = self._frame_count % self.latency_frames
+        self._collect(self._slot)
+        self._frame_indices[self._slot] = frame_index
+        self._begin_times[self._slot] = _clock()
+
+    def begin(self, pass_index, section):
+        """
+        Starts timing a section, an actor index or section_clear or section_resolve, of a pass.
+        Sections of actors from index max_actors on are not timed.
+        """
+        if section is None:
+            return
+        query = int(self._queries[self._slot, pass_index, section])
+        self._issued[self._slot, pass_index, section] = True
+        self._last_query[self._slot] = query
+        self._active = True
+        glBeginQuery(GL_TIME_ELAPSED, query)
+
+    def end(self):
+        if self._active:
+            glEndQuery(GL_TIME_ELAPSED)
+            self._active = False
+
+    def actor_section(self, index):
+        "Section of the actor at index, or None if it is not timed"
+        if index < self.max_actors:
+            return index
+        return None
+
+    def end_frame(self):
+        self._frame_count += 1
+
+    def _collect(self, slot):
+        issued = self._issued[slot]
+        last_query = self._last_query[slot]
+        if last_query is None:
+            return
+        self._last_query[slot] = None
+        # Queries complete in order, so the last one tells for the whole frame
+        if not glGetQueryObjectuiv(last_query, GL_QUERY_RESULT_AVAILABLE):
+            self.lost_frames += 1
+            issued[:] = False
+            return
+        max_ns = 1e9 * (_clock() - self._begin_times[slot])
+        elapsed = self._elapsed
+        elapsed[:] = 0
+        for pass_index, section in zip(*numpy.nonzero(issued)):
+            _glGetQueryObjectui64v(int(self._queries[slot, pass_index, section]), GL_QUERY_RESULT,
+                                   self._result_pointer)
+            elapsed[pass_index, section] = self._result[0]
+        issued[:] = False
+        if elapsed.max() > max_ns:
+            self.invalid_frames += 1
+            return
+        self.frames.append((self._frame_indices[slot], elapsed.sum(), elapsed.sum(axis=1),
+                            elapsed[:, :self.max_actors].sum(axis=0),
+                            elapsed[:, self.section_clear].sum(), elapsed[:, self.section_resolve].sum()))
+
+    def percentiles(self, field, percentiles=(50, 90, 99), frames=None):
+        "Percentiles in milliseconds of one scalar _ns field of gpu_frame_dtype over the last frames frames"
+        values = self.frames.last(frames)[field]
+        if len(values) == 0:
+            return numpy.full(len(percentiles), numpy.nan)
+        return numpy.percentile(1e-6 * values, percentiles)
+
+    def stats(self, percentiles=(50, 90, 99), frames=None):
+        "GpuTimerStats of the last frames frames, by default all that are kept"
+        timings = self.frames.last(frames)
+        if len(timings) == 0:
+            nan = numpy.full(len(percentiles), numpy.nan)
+            return GpuTimerStats(0, nan, dict((name, nan.copy()) for name in pass_names),
+                                 numpy.full((self.max_actors, len(percentiles)), numpy.nan), nan.copy(), nan.copy())
+        pass_ms = 1e-6 * timings['pass_ns']
+        return GpuTimerStats(
+            frames=len(timings),
+            total_ms=numpy.percentile(1e-6 * timings['total_ns'], percentiles),
+            pass_ms=dict((name, numpy.percentile(pass_ms[:, index], percentiles))
+                         for index, name in enumerate(pass_names)),
+            actor_ms=numpy.percentile(1e-6 * timings['actor_ns'], percentiles, axis=0).T,
+            clear_ms=numpy.percentile(1e-6 * timings['clear_ns'], percentiles),
+            resolve_ms=numpy.percentile(1e-6 * timings['resolve_ns'], percentiles),
+        )
@@ -0,0 +1,53 @@
+#!/bin/env python
+
+# file hidden_area.py
+
+from ctypes import cast, c_float, POINTER
+
+import numpy
+
+import openvr
+
+"""
+NumPy views of the hidden area meshes returned by IVRSystem.getHiddenAreaMesh()
+"""
+
+
+def hidden_area_vertices(mesh, type_=openvr.k_eHiddenAreaMesh_Standard):
+    """
+    Zero-copy (N, 2) float32 NumPy view of the vertices of a HiddenAreaMesh_t,
+    in texture coordinates of the eye's render target: u to the right and v
+    down, from 0 to 1. type_ is the EHiddenAreaMeshType the mesh was requested
+    with; N is 3 * unTriangleCount for triangle meshes, and unTriangleCount for
+    k_eHiddenAreaMesh_LineLoop. The view is empty if the HMD has no such mesh.
+
+    The vertex data belongs to the runtime; copy the view to keep it past openvr.shutdown().
+    """
+    count = mesh.unTriangleCount
+    if type_ != openvr.k_eHiddenAreaMesh_LineLoop:
+        count *= 3
+    if count == 0 or not mesh.pVertexData:
+        return numpy.zeros((0, 2), dtype=numpy.float32)
+    return numpy.ctypeslib.as_array(cast(mesh.pVertexData, POINTER(c_float)), shape=(count, 2))
+
+
+def get_hidden_area_vertices(eye, type_=openvr.k_eHiddenAreaMesh_Standard, vr_system=None):
+    """
+    Copy of the vertices of the hidden area mesh of one eye, see hidden_area_vertices().
+    vr_system defaults to openvr.VRSystem().
+    """
+    if vr_system is None:
+        vr_system = openvr.VRSystem()
+    return hidden_area_vertices(vr_system.getHiddenAreaMesh(eye, type_), type_).copy()
+
+
+def clip_space_vertices(vertices):
+    """
+    (N, 2) float32 OpenGL normalized device coordinates of hidden area mesh
+    vertices, for drawing into an eye's framebuffer. OpenGL textures are
+    stored bottom row first, so v is flipped.
+    """
+    result = numpy.empty((len(vertices), 2), dtype=numpy.float32)
+    result[:, 0] = 2.0 * vertices[:, 0] - 1.0
+    result[:, 1] = 1.0 - 2.0 * vertices[:, 1]
+    return result
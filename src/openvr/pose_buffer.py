@@ -0,0 +1,147 @@
+#!/bin/env python
+
+# file pose_buffer.py
+
+from ctypes import sizeof
+
+import numpy
+
+import openvr
+
+"""
+Zero-copy NumPy views of OpenVR tracked device pose arrays
+"""
+
+
+def _pose_dtype():
+    "NumPy structured dtype with the same memory layout as TrackedDevicePose_t"
+    pose_t = openvr.TrackedDevicePose_t
+    return numpy.dtype({
+        'names': ['mDeviceToAbsoluteTracking', 'vVelocity', 'vAngularVelocity',
+                  'eTrackingResult', 'bPoseIsValid', 'bDeviceIsConnected'],
+        'formats': [(numpy.float32, (3, 4)), (numpy.float32, (3,)), (numpy.float32, (3,)),
+                    numpy.uint32, numpy.bool_, numpy.bool_],
+        'offsets': [pose_t.mDeviceToAbsoluteTracking.offset,
+                    pose_t.vVelocity.offset,
+                    pose_t.vAngularVelocity.offset,
+                    pose_t.eTrackingResult.offset,
+                    pose_t.bPoseIsValid.offset,
+                    pose_t.bDeviceIsConnected.offset],
+        'itemsize': sizeof(pose_t),
+    })
+
+
+pose_dtype = _pose_dtype()
+
+
+def matrices_for_openvr_poses(matrices, out=None):
+    """
+    Converts an (N, 3, 4) array of OpenVR HmdMatrix34_t values into an (N, 4, 4)
+    float32 array of homogeneous matrices, all in one NumPy operation.
+    Each result uses the same transposed (column-major) layout as
+    gl_renderer.matrixForOpenVrMatrix(), so it can be handed straight to glUniformMatrix4fv.
+    """
+    matrices = numpy.asarray(matrices, dtype=numpy.float32)
+    if out is None:
+        out = numpy.empty((len(matrices), 4, 4), dtype=numpy.float32)
+    out[:, :, :3] = matrices.transpose(0, 2, 1)
+    out[:, :3, 3] = 0.0
+    out[:, 3, 3] = 1.0
+    return out
+
+
+def inverse_matrices_for_openvr_poses(matrices, out=None):
+    """
+    Like matrices_for_openvr_poses(), but returns the inverse of each pose.
+    Poses are rigid transforms [R|t], so the inverse [R^T|-R^T t] is computed
+    directly instead of by general matrix inversion.
+    """
+    matrices = numpy.asarray(matrices, dtype=numpy.float32)
+    if out is None:
+        out = numpy.empty((len(matrices), 4, 4), dtype=numpy.float32)
+    rotation = matrices[:, :, :3]
+    translation = matrices[:, :, 3]
+    # In transposed layout R^T becomes R, and -R^T t becomes the bottom row
+    out[:, :3, :3] = rotation
+    out[:, :3, 3] = 0.0
+    numpy.einsum('ki,kij->kj', translation, rotation, out=out[:, 3, :3])
+    numpy.negative(out[:, 3, :3], out=out[:, 3, :3])
+    out[:, 3, 3] = 1.0
+    return out
+
+
+def rigid_inverse(matrix):
+    "Inverse of one (4, 4) transposed-layout rigid transform, such as a result from matrices_for_openvr_poses()"
+    matrix = numpy.asarray(matrix, dtype=numpy.float32)
+    result = numpy.zeros((4, 4), dtype=numpy.float32)
+    rotation = matrix[:3, :3]
+    result[:3, :3] = rotation.T
+    result[3, :3] = -numpy.dot(rotation, matrix[3, :3])
+    result[3, 3] = 1.0
+    return result
+
+
+class PoseBuffer(object):
+    """
+    Contiguous array of TrackedDevicePose_t, with NumPy views that alias the
+    same memory the OpenVR runtime writes into.
+
+    A PoseBuffer can be passed anywhere a ctypes TrackedDevicePose_t array is
+    expected, e.g. IVRCompositor.waitGetPoses() or
+    IVRSystem.getDeviceToAbsoluteTrackingPose(), and indexing it returns the
+    individual ctypes TrackedDevicePose_t, so existing per-device code keeps working.
+    The view attributes are created once and never copied, so after each
+    call into the runtime they already hold the new poses:
+
+        matrices          (N, 3, 4) float32 device-to-absolute-tracking matrices
+        velocity          (N, 3) float32, meters per second
+        angular_velocity  (N, 3) float32, radians per second
+        tracking_result   (N,) uint32 ETrackingResult values
+        valid             (N,) bool, bPoseIsValid
+        connected         (N,) bool, bDeviceIsConnected
+    """
+
+    def __init__(self, count=openvr.k_unMaxTrackedDeviceCount, poses=None):
+        "Allocates a new pose array, or wraps an existing ctypes array of TrackedDevicePose_t"
+        if poses is None:
+            poses = (openvr.TrackedDevicePose_t * count)()
+        self.poses = poses
+        self.array = numpy.frombuffer(poses, dtype=pose_dtype)
+        self.matrices = self.array['mDeviceToAbsoluteTracking']
+        self.velocity = self.array['vVelocity']
+        self.angular_velocity = self.array['vAngularVelocity']
+        self.tracking_result = self.array['eTrackingResult']
+        self.valid = self.array['bPoseIsValid']
+        self.connected = self.array['bDeviceIsConnected']
+        # Preallocated outputs for the per-frame matrix conversions
+        self._device_matrices = numpy.empty((len(poses), 4, 4), dtype=numpy.float32)
+        self._inverse_device_matrices = numpy.empty((len(poses), 4, 4), dtype=numpy.float32)
+        # Lets ctypes.cast() and foreign function calls accept a PoseBuffer directly
+        self._as_parameter_ = poses
+
+    def __getitem__(self, key):
+        return self.poses[key]
+
+    def __len__(self):
+        return len(self.poses)
+
+    def __iter__(self):
+        return iter(self.poses)
+
+    def valid_indices(self):
+        "Indices of the devices whose pose is currently valid"
+        return numpy.flatnonzero(self.valid)
+
+    def device_matrices(self):
+        """
+        (N, 4, 4) float32 device_X_room matrices for all devices, in the layout of
+        matrixForOpenVrMatrix(). The returned array is reused by the next call.
+        """
+        return matrices_for_openvr_poses(self.matrices, out=self._device_matrices)
+
+    def inverse_device_matrices(self):
+        """
+        (N, 4, 4) float32 room_X_device matrices for all devices, in the layout of
+        matrixForOpenVrMatrix(). The returned array is reused by the next call.
+        """
+        return inverse_matrices_for_openvr_poses(self.matrices, out=self._inverse_device_matrices)
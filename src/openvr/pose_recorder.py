@@ -0,0 +1,314 @@
+#!/bin/env python
+
+# file pose_recorder.py
+
+from ctypes import byref, sizeof
+import json
+import os
+import struct
+import threading
+import time
+
+try:
+    import queue
+except ImportError:  # Python 2
+    import Queue as queue
+
+import numpy
+from numpy.lib import format as npformat
+
+import openvr
+from openvr.pose_buffer import pose_dtype
+
+"""
+Recording of tracking sessions to a compact binary log, and memory-mapped reading of it
+
+A pose log is a header followed by fixed size records, one per sample:
+
+    magic       8 bytes, b'PYOVRLOG'
+    version     uint32, little endian
+    header_size uint32, little endian, size of the whole header in bytes
+    layout      JSON object, padded with spaces to header_size, with keys
+                "dtype" (NumPy descr of one record), "device_count",
+                "record_size", "start_time" and "devices"
+    records     record_dtype(device_count), back to back until the end of file
+
+Each record holds the sample time, the TrackedDevicePose_t of the first
+device_count devices, and their VRControllerState_t. Because every record has
+the same size, the record count follows from the file size, and a log that
+was cut short by a crash is still readable up to the last complete record.
+
+"devices" lists the class, controller role and identifying string properties
+of every device that was connected during the recording, as objects with the
+keys "index", "class", "role", "model_number", "serial_number" and
+"render_model_name". The header is rewritten with this list when recording ends.
+"""
+
+
+_MAGIC = b'PYOVRLOG'
+_VERSION = 1
+_PREAMBLE = struct.Struct('<8sII')
+# Records start at a page boundary, which leaves room for the layout JSON
+_HEADER_SIZE = 8192
+
+
+def _controller_state_dtype():
+    "NumPy structured dtype with the same memory layout as VRControllerState_t"
+    state_t = openvr.VRControllerState_t
+    return numpy.dtype({
+        'names': ['unPacketNum', 'ulButtonPressed', 'ulButtonTouched', 'rAxis'],
+        'formats': [numpy.uint32, numpy.uint64, numpy.uint64, (numpy.float32, (openvr.k_unControllerStateAxisCount, 2))],
+        'offsets': [state_t.unPacketNum.offset,
+                    state_t.ulButtonPressed.offset,
+                    state_t.ulButtonTouched.offset,
+                    state_t.rAxis.offset],
+        'itemsize': sizeof(state_t),
+    })
+
+
+controller_state_dtype = _controller_state_dtype()
+
+
+def record_dtype(device_count):
+    "NumPy structured dtype of one pose log record, for device_count devices"
+    return numpy.dtype([
+        ('time', numpy.float64),
+        ('poses', pose_dtype, (device_count,)),
+        ('controller_states', controller_state_dtype, (device_count,)),
+    ])
+
+
+def _descr_from_json(value):
+    "Restores the tuples of a NumPy descr that went through JSON as lists"
+    if not isinstance(value, list):
+        return str(value)
+    result = []
+    for field in value:
+        if len(field) > 2:
+            result.append((str(field[0]), _descr_from_json(field[1]), tuple(field[2])))
+        else:
+            result.append((str(field[0]), _descr_from_json(field[1])))
+    return result
+
+
+class PoseRecorder(object):
+    """
+    Appends timestamped tracked device poses and controller states to a pose log.
+
+        recorder = PoseRecorder('session.poselog')
+        while running:
+            compositor.waitGetPoses(poses, len(poses), None, 0)
+            recorder.record(poses)
+        recorder.close()
+
+    record() only copies the sample into an in-memory chunk of records; full
+    chunks are written by a background thread in one large write each, so the
+    render loop never waits for the disk. Use a PoseRecorder as a context
+    manager, or call close(), to write the last partial chunk.
+
+    Only the first device_count devices are recorded. Controller states are
+    queried for each connected device when controller_states is True, and
+    are zero for devices that are not controllers. When device_properties is
+    True, the class, role and identifying properties of each device are
+    queried once, when it first shows up as connected, and kept in devices.
+    """
+
+    def __init__(self, path, device_count=16, controller_states=True, device_properties=True,
+                 chunk_records=256, vr_system=None):
+        "vr_system defaults to openvr.VRSystem() at the time of each record"
+        self.path = path
+        self.device_count = device_count
+        self.controller_states = controller_states
+        self.device_properties = device_properties
+        self.vr_system = vr_system
+        self.dtype = record_dtype(device_count)
+        self.record_count = 0
+        self.devices = []
+        self.start_time = time.time()
+        self._seen = numpy.zeros(device_count, dtype=numpy.bool_)
+        self.error = None
+        self._chunk_records = chunk_records
+        self._chunk = numpy.zeros(chunk_records, dtype=self.dtype)
+        self._chunk_index = 0
+        # Chunks go to the writer through _full, and come back through _free for reuse
+        self._full = queue.Queue()
+        self._free = queue.Queue()
+        # Scratch space for getControllerState, with a NumPy view to copy it into the record
+        self._states = (openvr.VRControllerState_t * device_count)()
+        self._states_array = numpy.frombuffer(self._states, dtype=controller_state_dtype)
+        self._state_refs = [byref(state) for state in self._states]
+        self._state_size = sizeof(openvr.VRControllerState_t)
+        self._file = open(path, 'wb')
+        self._file.write(self._header())
+        self._thread = threading.Thread(target=self._run, name='PoseRecorder')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _header(self):
+        layout = json.dumps({
+            'dtype': npformat.dtype_to_descr(self.dtype),
+            'device_count': self.device_count,
+            'record_size': self.dtype.itemsize,
+            'start_time': self.start_time,
+            'devices': self.devices,
+        }).encode('utf-8')
+        result = _PREAMBLE.pack(_MAGIC, _VERSION, _HEADER_SIZE) + layout
+        if len(result) > _HEADER_SIZE:
+            raise ValueError("pose log layout does not fit in the header")
+        return result.ljust(_HEADER_SIZE, b' ')
+
+    def _run(self):
+        while True:
+            chunk, count = self._full.get()
+            if chunk is None:
+                break
+            try:
+                if self.error is None:
+                    self._file.write(chunk[:count].tobytes())
+            except Exception as exc:
+                self.error = exc
+            self._free.put(chunk)
+
+    def _system(self):
+        if self.vr_system is not None:
+            return self.vr_system
+        return openvr.VRSystem()
+
+    def _describe_device(self, index):
+        vr_system = self._system()
+        result = {
+            'index': index,
+            'class': vr_system.getTrackedDeviceClass(index),
+            'role': vr_system.getControllerRoleForTrackedDeviceIndex(index),
+        }
+        for key, prop in (('model_number', openvr.Prop_ModelNumber_String),
+                          ('serial_number', openvr.Prop_SerialNumber_String),
+                          ('render_model_name', openvr.Prop_RenderModelName_String)):
+            result[key] = vr_system.getStringTrackedDeviceProperty(index, prop).decode('utf-8', 'replace')
+        return result
+
+    def _check_error(self):
+        if self.error is not None:
+            raise self.error
+
+    def record(self, poses, seconds=None):
+        """
+        Appends one record. poses is a PoseBuffer, or a ctypes array of
+        TrackedDevicePose_t with at least device_count entries. seconds
+        defaults to time.time().
+        """
+        self._check_error()
+        if seconds is None:
+            seconds = time.time()
+        array = getattr(poses, 'array', None)
+        if array is None:
+            array = numpy.frombuffer(poses, dtype=pose_dtype)
+        array = array[:self.device_count]
+        connected = array['bDeviceIsConnected']
+        if self.device_properties and (connected > self._seen).any():
+            for index in numpy.flatnonzero(connected > self._seen).tolist():
+                self.devices.append(self._describe_device(index))
+            self._seen |= connected
+        record = self._chunk[self._chunk_index]
+        record['time'] = seconds
+        record['poses'] = array
+        if self.controller_states:
+            record['controller_states'] = self._query_controller_states(connected)
+        self._chunk_index += 1
+        self.record_count += 1
+        if self._chunk_index == self._chunk_records:
+            self._queue_chunk()
+
+    def _query_controller_states(self, connected):
+        get_state = self._system()._fns.getControllerState
+        states = self._states_array
+        states.fill(0)
+        for index in numpy.flatnonzero(connected).tolist():
+            if not get_state(index, self._state_refs[index], self._state_size):
+                states[index] = 0
+        return states
+
+    def _queue_chunk(self):
+        if self._chunk_index == 0:
+            return
+        self._full.put((self._chunk, self._chunk_index))
+        try:
+            self._chunk = self._free.get_nowait()
+        except queue.Empty:
+            self._chunk = numpy.zeros(self._chunk_records, dtype=self.dtype)
+        self._chunk_index = 0
+
+    def close(self):
+        "Writes the remaining records and closes the file"
+        if self._thread is None:
+            return
+        self._queue_chunk()
+        self._full.put((None, 0))
+        self._thread.join()
+        self._thread = None
+        if self.devices and self.error is None:
+            # Devices that connected after the start are only known now
+            self._file.seek(0)
+            self._file.write(self._header())
+        self._file.close()
+        self._check_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class PoseLog(object):
+    """
+    Read-only, memory-mapped view of a pose log written by PoseRecorder.
+    Records are only read from disk when accessed, so opening a log of many
+    hours is instant. records is a NumPy structured array of record_dtype();
+    the attributes below are views of its fields:
+
+        time               (N,) float64 sample times, from time.time()
+        poses              (N, D) pose_buffer.pose_dtype records
+        matrices           (N, D, 3, 4) float32 device-to-absolute-tracking matrices
+        controller_states  (N, D) controller_state_dtype records
+
+    devices is the list of device descriptions from the header, see the module documentation.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            preamble = f.read(_PREAMBLE.size)
+            if len(preamble) < _PREAMBLE.size:
+                raise ValueError("%s is not a pose log" % path)
+            magic, version, header_size = _PREAMBLE.unpack(preamble)
+            if magic != _MAGIC:
+                raise ValueError("%s is not a pose log" % path)
+            if version > _VERSION:
+                raise ValueError("%s has unsupported pose log version %d" % (path, version))
+            self.header = json.loads(f.read(header_size - _PREAMBLE.size).decode('utf-8'))
+        self.device_count = self.header['device_count']
+        self.devices = self.header.get('devices', [])
+        self.dtype = numpy.dtype(_descr_from_json(self.header['dtype']))
+        if self.dtype.itemsize != self.header['record_size']:
+            raise ValueError("%s has an inconsistent record layout" % path)
+        # A trailing partial record, from a recording that was cut short, is ignored
+        count = (os.path.getsize(path) - header_size) // self.dtype.itemsize
+        if count > 0:
+            self.records = numpy.memmap(path, dtype=self.dtype, mode='r', offset=header_size, shape=(count,))
+        else:
+            self.records = numpy.zeros(0, dtype=self.dtype)
+        self.time = self.records['time']
+        self.poses = self.records['poses']
+        self.matrices = self.poses['mDeviceToAbsoluteTracking']
+        self.controller_states = self.records['controller_states']
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, key):
+        return self.records[key]
+
+    def index_at(self, seconds):
+        "Index of the last record sampled at or before seconds, or 0 if there is none"
+        return max(int(numpy.searchsorted(self.time, seconds, side='right')) - 1, 0)
@@ -0,0 +1,402 @@
+#!/bin/env python
+
+# file render_models.py
+
+import collections
+from ctypes import cast, sizeof, POINTER
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+
+import numpy
+
+import openvr
+
+"""
+Zero-copy NumPy views of the render models returned by IVRRenderModels.loadRenderModel_Async(),
+loading of render models off the render thread, see RenderModelLoader, and
+an on-disk cache of them, see RenderModelCache
+"""
+
+
+def _render_model_vertex_dtype():
+    "NumPy structured dtype with the same memory layout as RenderModel_Vertex_t"
+    vertex_t = openvr.RenderModel_Vertex_t
+    return numpy.dtype({
+        'names': ['vPosition', 'vNormal', 'rfTextureCoord'],
+        'formats': [(numpy.float32, (3,)), (numpy.float32, (3,)), (numpy.float32, (2,))],
+        'offsets': [vertex_t.vPosition.offset, vertex_t.vNormal.offset, vertex_t.rfTextureCoord.offset],
+        'itemsize': sizeof(vertex_t),
+    })
+
+
+render_model_vertex_dtype = _render_model_vertex_dtype()
+
+
+def render_model_vertices(model):
+    """
+    Zero-copy NumPy view of the unVertexCount vertices of a RenderModel_t,
+    with render_model_vertex_dtype. Its memory is laid out like the
+    interleaved vertex buffer of the model, so the view can be uploaded to
+    OpenGL as is, e.g. with glBufferData(); vertices.view(numpy.float32)
+    gives the 8 floats of each vertex as a flat array.
+
+    The vertex data belongs to the runtime; copy the view to keep it past
+    IVRRenderModels.freeRenderModel() or openvr.shutdown().
+    """
+    if model is None or model.unVertexCount == 0 or not model.rVertexData:
+        return numpy.zeros(0, dtype=render_model_vertex_dtype)
+    return numpy.ctypeslib.as_array(
+        cast(model.rVertexData, POINTER(openvr.RenderModel_Vertex_t * model.unVertexCount)).contents
+    ).view(render_model_vertex_dtype)
+
+
+def render_model_indices(model):
+    """
+    Zero-copy uint16 NumPy view of the 3 * unTriangleCount triangle vertex
+    indices of a RenderModel_t, for GL_UNSIGNED_SHORT element buffers.
+    Like render_model_vertices(), the view is only valid while the model is loaded.
+    """
+    if model is None or model.unTriangleCount == 0 or not model.rIndexData:
+        return numpy.zeros(0, dtype=numpy.uint16)
+    return numpy.ctypeslib.as_array(model.rIndexData, shape=(3 * model.unTriangleCount,))
+
+
+def texture_map_pixels(texture_map):
+    """
+    Zero-copy (unHeight, unWidth, 4) uint8 NumPy view of the RGBA pixels of a
+    RenderModel_TextureMap_t, top row first. Like render_model_vertices(),
+    the view is only valid while the texture is loaded.
+    """
+    if texture_map is None or texture_map.unWidth == 0 or not texture_map.rubTextureMapData:
+        return numpy.zeros((0, 0, 4), dtype=numpy.uint8)
+    return numpy.ctypeslib.as_array(texture_map.rubTextureMapData,
+                                    shape=(texture_map.unHeight, texture_map.unWidth, 4))
+
+
+def mipmap_sizes(width, height):
+    "(width, height) of each mipmap level below a texture of width by height, as OpenGL expects them"
+    sizes = []
+    while width > 1 or height > 1:
+        width, height = max(width // 2, 1), max(height // 2, 1)
+        sizes.append((width, height))
+    return sizes
+
+
+def is_power_of_two(size):
+    return size > 0 and size & (size - 1) == 0
+
+
+def texture_mipmaps(pixels):
+    """
+    List of the mipmap levels below (height, width, 4) uint8 pixels, each the
+    2x2 box filtered level above it, down to 1 by 1, like glGenerateMipmap()
+    for sizes that are powers of two. Of odd sizes, the last row or column
+    is dropped, which drivers do not, see is_power_of_two().
+    """
+    levels = []
+    level = pixels
+    for width, height in mipmap_sizes(pixels.shape[1], pixels.shape[0]):
+        # Sums of up to 4 pixels fit in 16 bits
+        level = level.astype(numpy.uint16)
+        level = level[0:2 * height:2] + level[1:2 * height:2] if level.shape[0] > 1 else 2 * level
+        level = level[:, 0:2 * width:2] + level[:, 1:2 * width:2] if level.shape[1] > 1 else 2 * level
+        level = ((level + 2) // 4).astype(numpy.uint8)
+        levels.append(level)
+    return levels
+
+
+# A render model loaded by RenderModelLoader. error is the EVRRenderModelError
+# of loadRenderModel_Async(); unless it is VRRenderModelError_None, the other
+# fields are None. model and texture are the RenderModel_t and
+# RenderModel_TextureMap_t of the runtime, texture None if the model has no
+# diffuse texture or it failed to load. vertices, indices and pixels are
+# their render_model_vertices(), render_model_indices() and texture_map_pixels()
+# views, pixels None without a texture. mipmaps is a list of the mipmap levels
+# below pixels, or None if they are to be generated on the GPU.
+# Models from a RenderModelCache have model and texture None, and their
+# arrays are mapped from the cache files.
+LoadedRenderModel = collections.namedtuple('LoadedRenderModel', [
+    'name', 'error', 'model', 'texture', 'vertices', 'indices', 'pixels', 'mipmaps'])
+
+
+class RenderModelLoader(object):
+    """
+    Loads render models and their diffuse textures on a worker thread, so the
+    render thread never waits for the runtime to read them. request() queues
+    a render model name; every poll_interval seconds, the worker calls
+    IVRRenderModels.loadRenderModel_Async(), and then loadTexture_Async(),
+    for each model still loading. Finished models wait for the render thread
+    as LoadedRenderModel, in the order they finished, see pop_completed().
+
+    With a RenderModelCache, models found in the cache are mapped from its
+    files without calling the runtime, and models loaded from the runtime are
+    stored in it, mipmaps included, freed, and handed over as mapped from
+    the cache. Otherwise, call free() once a model is uploaded.
+
+    render_models defaults to openvr.VRRenderModels(). The worker thread
+    starts on the first request(); call close() before openvr.shutdown().
+    """
+
+    def __init__(self, poll_interval=0.01, render_models=None, cache=None):
+        self.poll_interval = poll_interval
+        self.render_models = render_models
+        self.cache = cache
+        self.error = None
+        self._requests = collections.deque()
+        self._completed = collections.deque()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def request(self, name):
+        "Queues the render model name for loading. Request each name only once."
+        self._requests.append(name)
+        if self._thread is None:
+            self._start()
+        self._wake.set()
+
+    def pop_completed(self):
+        """
+        Returns the next finished LoadedRenderModel, or None if there is none.
+        An exception raised on the worker thread is raised here.
+        """
+        if self._completed:
+            return self._completed.popleft()
+        if self.error is not None:
+            raise self.error
+        return None
+
+    def _start(self):
+        if self.render_models is None:
+            self.render_models = openvr.VRRenderModels()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='RenderModelLoader')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        # Models still loading, by name; None until the model itself has loaded
+        pending = collections.OrderedDict()
+        try:
+            while not self._stop.is_set():
+                while self._requests:
+                    name = self._requests.popleft()
+                    cached = None if self.cache is None else self.cache.load(name)
+                    if cached is not None:
+                        self._completed.append(cached)
+                    else:
+                        pending.setdefault(name, None)
+                for name in list(pending):
+                    loaded = self._poll(name, pending)
+                    if loaded is not None:
+                        del pending[name]
+                        self._completed.append(loaded)
+                if pending:
+                    self._stop.wait(self.poll_interval)
+                else:
+                    # Requests made after the wake up are drained on the next pass
+                    self._wake.wait()
+                    self._wake.clear()
+            for model in pending.values():
+                if model is not None:
+                    self.render_models.freeRenderModel(model)
+        except Exception as exc:
+            self.error = exc
+
+    def _poll(self, name, pending):
+        "LoadedRenderModel of name, or None while it is still loading"
+        model = pending[name]
+        if model is None:
+            error, model = self.render_models.loadRenderModel_Async(name)
+            if error == openvr.VRRenderModelError_Loading:
+                return None
+            if error != openvr.VRRenderModelError_None:
+                return LoadedRenderModel(name, error, None, None, None, None, None, None)
+            pending[name] = model
+        texture = None
+        if model.diffuseTextureId >= 0:
+            error, texture = self.render_models.loadTexture_Async(model.diffuseTextureId)
+            if error == openvr.VRRenderModelError_Loading:
+                return None
+            texture = texture.contents if error == openvr.VRRenderModelError_None and texture else None
+        loaded = LoadedRenderModel(name, openvr.VRRenderModelError_None, model, texture,
+                                   render_model_vertices(model), render_model_indices(model),
+                                   None if texture is None else texture_map_pixels(texture), None)
+        if self.cache is not None:
+            try:
+                cached = self.cache.store(loaded)
+            except (EnvironmentError, ValueError):
+                # Without a usable cache directory, models still load from the runtime
+                return loaded
+            # The cache files replace the runtime's buffers
+            self.free(loaded)
+            return cached
+        return loaded
+
+    def free(self, loaded):
+        """
+        Frees the runtime's memory of a LoadedRenderModel, with
+        IVRRenderModels.freeRenderModel() and freeTexture(), once its views
+        are no longer used, e.g. after they were uploaded to OpenGL. Returns
+        the LoadedRenderModel without model, texture and views.
+        """
+        if loaded.model is not None:
+            self.render_models.freeRenderModel(loaded.model)
+        if loaded.texture is not None:
+            self.render_models.freeTexture(loaded.texture)
+        return loaded._replace(model=None, texture=None, vertices=None, indices=None, pixels=None, mipmaps=None)
+
+    def close(self):
+        """
+        Stops the worker thread. Models still loading are abandoned, and those
+        not taken by pop_completed() are freed.
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._requests.clear()
+        while self._completed:
+            self.free(self._completed.popleft())
+
+
+def runtime_version():
+    """
+    Fingerprint of the installed OpenVR runtime, which changes when it is
+    updated or reinstalled: openvr.runtimePath(), with the modification times
+    of that directory and of its resources/rendermodels directory. This
+    version of the OpenVR API has no call for the version of the runtime.
+    """
+    path = openvr.runtimePath()
+    if isinstance(path, bytes):
+        path = path.decode('utf-8', 'replace')
+    parts = [path]
+    for directory in (path, os.path.join(path, 'resources', 'rendermodels')):
+        try:
+            parts.append(repr(os.stat(directory).st_mtime))
+        except (EnvironmentError, ValueError):
+            pass
+    return '|'.join(parts)
+
+
+def default_cache_directory():
+    "pyopenvr/rendermodels in the user's cache directory, $XDG_CACHE_HOME or ~/.cache"
+    root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(root, 'pyopenvr', 'rendermodels')
+
+
+class RenderModelCache(object):
+    """
+    On-disk cache of render models, keyed by render model name and
+    runtime_version, so that later runs need not load them from the runtime.
+
+    Each model is a directory of .npy files: the interleaved vertex buffer
+    with render_model_vertex_dtype, the uint16 index buffer, and, if the model
+    has a texture, its pixels and, if its sizes are powers of two, the mipmap
+    levels below them, computed with texture_mipmaps() and stored back to
+    back; the GPU generates the mipmaps of other textures. load() maps the
+    files into memory read-only, so they can be uploaded to OpenGL straight
+    from the page cache.
+    Entries are written to a temporary directory and renamed into place, so
+    processes sharing the cache never see partial entries.
+
+    directory defaults to default_cache_directory(), runtime_version to the
+    runtime_version() of the runtime, at the first load() or store().
+    Textures are stored uncompressed.
+    """
+
+    def __init__(self, directory=None, runtime_version=None):
+        if directory is None:
+            directory = default_cache_directory()
+        self.directory = directory
+        self.runtime_version = runtime_version
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, name):
+        "Directory of the cache entry of render model name"
+        if self.runtime_version is None:
+            self.runtime_version = runtime_version()
+        version = self.runtime_version
+        if not isinstance(version, bytes):
+            version = version.encode('utf-8')
+        key = hashlib.sha1(name + b'\0' + version).hexdigest()[:20]
+        # Names may be paths; the readable part is only for people looking at the cache
+        readable = re.sub(r'[^A-Za-z0-9_.-]+', '_', name.decode('utf-8', 'replace'))[-40:]
+        return os.path.join(self.directory, '%s-%s' % (readable, key))
+
+    def load(self, name):
+        "LoadedRenderModel of render model name from the cache, or None if it is not cached"
+        try:
+            loaded = self._map(name)
+        except (EnvironmentError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return loaded
+
+    def _map(self, name):
+        entry = self._entry(name)
+        vertices = numpy.load(os.path.join(entry, 'vertices.npy'), mmap_mode='r')
+        indices = numpy.load(os.path.join(entry, 'indices.npy'), mmap_mode='r')
+        pixels = mipmaps = None
+        if os.path.exists(os.path.join(entry, 'texture.npy')):
+            pixels = numpy.load(os.path.join(entry, 'texture.npy'), mmap_mode='r')
+            if os.path.exists(os.path.join(entry, 'mipmaps.npy')):
+                mipmaps = self._split_mipmaps(pixels, os.path.join(entry, 'mipmaps.npy'))
+        return LoadedRenderModel(name, openvr.VRRenderModelError_None, None, None,
+                                 vertices, indices, pixels, mipmaps)
+
+    @staticmethod
+    def _split_mipmaps(pixels, path):
+        sizes = mipmap_sizes(pixels.shape[1], pixels.shape[0])
+        if not sizes:
+            return []
+        flat = numpy.load(path, mmap_mode='r')
+        levels = []
+        offset = 0
+        for width, height in sizes:
+            count = 4 * width * height
+            levels.append(flat[offset:offset + count].reshape(height, width, 4))
+            offset += count
+        if offset != len(flat):
+            raise ValueError("mipmaps do not match the texture size")
+        return levels
+
+    def store(self, loaded):
+        """
+        Writes a successfully LoadedRenderModel to the cache, and returns it
+        as load() does. Raises EnvironmentError if the cache cannot be written.
+        """
+        entry = self._entry(loaded.name)
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        temporary = tempfile.mkdtemp(prefix='.partial-', dir=self.directory)
+        try:
+            numpy.save(os.path.join(temporary, 'vertices.npy'), loaded.vertices)
+            numpy.save(os.path.join(temporary, 'indices.npy'), loaded.indices)
+            if loaded.pixels is not None:
+                numpy.save(os.path.join(temporary, 'texture.npy'), loaded.pixels)
+                height, width = loaded.pixels.shape[:2]
+                mipmaps = loaded.mipmaps
+                if mipmaps is None and is_power_of_two(width) and is_power_of_two(height):
+                    mipmaps = texture_mipmaps(loaded.pixels)
+                if mipmaps is not None:
+                    flat = [level.reshape(-1) for level in mipmaps]
+                    numpy.save(os.path.join(temporary, 'mipmaps.npy'),
+                               numpy.concatenate(flat) if flat else numpy.zeros(0, dtype=numpy.uint8))
+            try:
+                os.rename(temporary, entry)
+            except EnvironmentError:
+                # Another process stored it first
+                if not os.path.isdir(entry):
+                    raise
+        finally:
+            if os.path.isdir(temporary):
+                shutil.rmtree(temporary, ignore_errors=True)
+        return self._map(loaded.name)
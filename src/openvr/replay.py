@@ -0,0 +1,165 @@
+#!/bin/env python
+
+# file replay.py
+
+import ctypes
+from ctypes import byref, memmove, sizeof
+
+import numpy
+
+import openvr
+from openvr.pose_recorder import PoseLog
+from openvr.simulator import SimulatedDevice, SimulatedRuntime
+
+"""
+Deterministic playback of a recorded tracking session through the simulated runtime
+
+    runtime = ReplayRuntime('session.poselog', paced=False)
+    openvr.setBackend(runtime)
+    openvr.init(openvr.VRApplication_Scene)
+    while not runtime.finished:
+        compositor.waitGetPoses(poses, len(poses), None, 0)
+        ...
+
+Poses, controller states and the device list come from a log written by
+pose_recorder.PoseRecorder. Button, touch and device (de)activation events are
+regenerated from the changes between consecutive records.
+"""
+
+
+# Records less than this many seconds ahead of the replay time count as reached,
+# so that replaying at the recorded rate is not thrown off by rounding
+_TOLERANCE = 1e-6
+
+
+def _replay_devices(log):
+    "SimulatedDevice list for the devices described in a pose log header, all initially disconnected"
+    described = dict((d['index'], d) for d in log.devices)
+    result = []
+    for index in range(log.device_count):
+        description = described.get(index)
+        if description is None:
+            if index == openvr.k_unTrackedDeviceIndex_Hmd:
+                device_class = openvr.TrackedDeviceClass_HMD
+            else:
+                device_class = openvr.TrackedDeviceClass_GenericTracker
+            device = SimulatedDevice(device_class)
+        else:
+            properties = dict()
+            for key, prop in (('model_number', openvr.Prop_ModelNumber_String),
+                              ('serial_number', openvr.Prop_SerialNumber_String),
+                              ('render_model_name', openvr.Prop_RenderModelName_String)):
+                if description.get(key):
+                    properties[prop] = description[key].encode('utf-8')
+            device = SimulatedDevice(description['class'], properties=properties, role=description['role'])
+        device.connected = False
+        result.append(device)
+    return result
+
+
+class ReplayRuntime(SimulatedRuntime):
+    """
+    SimulatedRuntime that plays back a pose log; install it with openvr.setBackend().
+
+    log is a pose_recorder.PoseLog or the path of one. Playback runs speed
+    times faster than the recording. With paced True, frames follow the
+    simulated vsync, and the replay follows the wall clock. With paced False,
+    the simulation clock advances by exactly one refresh interval per
+    waitGetPoses(), so every run of the same frame loop sees the same poses,
+    controller states and events, whatever the machine's speed.
+    After the last record, the replay holds it, or, if loop is True, restarts
+    from the first record one average record interval later.
+
+    Recorded poses already include the prediction of the recording runtime,
+    so the prediction time asked of getDeviceToAbsoluteTrackingPose() is ignored.
+    """
+
+    def __init__(self, log, speed=1.0, paced=True, loop=False, refresh_rate=90.0, **kwargs):
+        if not isinstance(log, PoseLog):
+            log = PoseLog(log)
+        if len(log) == 0:
+            raise ValueError("pose log %s has no records" % log.path)
+        self.log = log
+        self.speed = speed
+        self.loop = loop
+        super(ReplayRuntime, self).__init__(devices=_replay_devices(log), refresh_rate=refresh_rate,
+                                            paced=paced, **kwargs)
+        self._pose_size = sizeof(openvr.TrackedDevicePose_t)
+        self._state_size = sizeof(openvr.VRControllerState_t)
+        self.record_index = 0
+        self._apply_record(0, queue_events=False)
+        self._load_controller_states(0)
+
+    def seconds(self):
+        if self.paced:
+            return super(ReplayRuntime, self).seconds()
+        return max(self.compositor.frame_index - 1, 0) / float(self.refresh_rate)
+
+    def replay_time(self):
+        "Recording time, in the time.time() of the log, that the replay has reached"
+        log_time = self.log.time
+        elapsed = self.speed * self.seconds() + _TOLERANCE
+        if self.loop and len(log_time) > 1:
+            elapsed %= (log_time[-1] - log_time[0]) * len(log_time) / (len(log_time) - 1)
+        return log_time[0] + elapsed
+
+    @property
+    def finished(self):
+        "Whether the replay has reached the last record, never True when looping"
+        return not self.loop and self.replay_time() >= self.log.time[-1]
+
+    def _advance(self):
+        index = self.log.index_at(self.replay_time())
+        if index == self.record_index:
+            return
+        if index < self.record_index:
+            # Looped or restarted: compare with the current state, not the records in between
+            self._apply_record(index)
+        else:
+            # Every record in between, so that short presses still queue their events
+            for k in range(self.record_index + 1, index + 1):
+                self._apply_record(k)
+        self.record_index = index
+        self._load_controller_states(index)
+
+    def _apply_record(self, index, queue_events=True):
+        "Updates connected states and queues events for what changed since the last applied record"
+        connected = self.log.poses['bDeviceIsConnected'][index]
+        states = self.log.controller_states[index]
+        pressed = states['ulButtonPressed']
+        touched = states['ulButtonTouched']
+        if queue_events:
+            changed = ((connected != self._connected) | (pressed != self._pressed)
+                       | (touched != self._touched))
+            for i in numpy.flatnonzero(changed).tolist():
+                if connected[i] != self.devices[i].connected:
+                    self.connect_device(i, bool(connected[i]))
+                self.set_buttons(i, int(pressed[i]), int(touched[i]))
+        else:
+            for i, device in enumerate(self.devices):
+                device.connected = bool(connected[i])
+        self._connected = numpy.array(connected)
+        self._pressed = numpy.array(pressed)
+        self._touched = numpy.array(touched)
+
+    def _load_controller_states(self, index):
+        "Sets every device's controller state to the recorded one, including its packet number"
+        states = numpy.ascontiguousarray(self.log.controller_states[index])
+        address = states.ctypes.data
+        for device in self.devices:
+            memmove(byref(device.controller_state), address, self._state_size)
+            address += self._state_size
+
+    def begin_frame(self, frame_index):
+        self._advance()
+        super(ReplayRuntime, self).begin_frame(frame_index)
+
+    def fill_poses(self, poses, count, seconds_from_now=0.0):
+        self._advance()
+        source = self.log.poses[self.record_index]
+        recorded = min(count, len(source))
+        memmove(poses, source.ctypes.data, recorded * self._pose_size)
+        if count > recorded:
+            ctypes.memset(ctypes.addressof(poses[recorded]), 0, (count - recorded) * self._pose_size)
+            for index in range(recorded, count):
+                poses[index].eTrackingResult = openvr.TrackingResult_Uninitialized
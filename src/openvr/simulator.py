@@ -0,0 +1,866 @@
+#!/bin/env python
+
+# file simulator.py
+
+import collections
+import ctypes
+from ctypes import byref, cast, memmove, pointer, sizeof, POINTER
+import math
+import time
+
+import openvr
+
+"""
+Simulated OpenVR runtime, for running, load testing and profiling OpenVR
+applications without SteamVR or a headset, e.g. on a continuous integration machine.
+
+    runtime = SimulatedRuntime(refresh_rate=90.0)
+    openvr.setBackend(runtime)
+    vr_system = openvr.init(openvr.VRApplication_Scene)
+    ...
+    openvr.shutdown()
+    openvr.setBackend(None)
+
+The IVRSystem, IVRCompositor and IVRRenderModels function tables are
+implemented in Python. Requesting any other interface fails with
+VRInitError_Init_InterfaceNotFound, and calling a function that is not simulated
+raises NotImplementedError. Device poses, controller state and events are
+scripted through SimulatedDevice and the SimulatedRuntime methods.
+"""
+
+try:
+    from time import perf_counter as _clock
+except ImportError:  # Python 2
+    from time import time as _clock
+
+
+# Type of the object created by ctypes.byref()
+_CArgObject = type(byref(ctypes.c_int()))
+
+
+def _out(arg):
+    "The ctypes object an out-parameter refers to, or None for a null pointer"
+    if arg is None:
+        return None
+    if isinstance(arg, _CArgObject):
+        return arg._obj
+    if not arg:
+        return None
+    return arg.contents
+
+
+def _out_array(arg, ctype):
+    "An out-parameter array of ctype as an indexable ctypes pointer, or None for a null pointer"
+    if arg is None:
+        return None
+    if isinstance(arg, _CArgObject):
+        arg = pointer(arg._obj)
+    result = cast(arg, POINTER(ctype))
+    if not result:
+        return None
+    return result
+
+
+def _enum_name(prefix, value):
+    "Symbol of an OpenVR enum value, such as b'VRInitError_None'"
+    for name, constant in vars(openvr).items():
+        if name.startswith(prefix) and constant == value and isinstance(constant, int):
+            return name.encode('ascii')
+    return b"Unknown"
+
+
+def _matrix34(rows):
+    result = openvr.HmdMatrix34_t()
+    for i in range(3):
+        result.m[i][:] = [float(x) for x in rows[i]]
+    return result
+
+
+def _translation(x, y, z):
+    return ((1, 0, 0, x),
+            (0, 1, 0, y),
+            (0, 0, 1, z),)
+
+
+class SimulatedDevice(object):
+    """
+    One tracked device of a SimulatedRuntime.
+
+    pose is either a fixed 3x4 device-to-absolute-tracking matrix, or a function
+    taking the simulation time in seconds and returning such a matrix.
+    properties maps ETrackedDeviceProperty values to bool, int, float or bytes values.
+    """
+
+    def __init__(self, device_class, pose=None, properties=None, role=openvr.TrackedControllerRole_Invalid):
+        self.device_class = device_class
+        if pose is None:
+            pose = _translation(0, 0, 0)
+        self.pose = pose
+        self.properties = dict()
+        self.properties[openvr.Prop_TrackingSystemName_String] = b"simulated"
+        self.properties[openvr.Prop_ManufacturerName_String] = b"pyopenvr"
+        self.properties[openvr.Prop_DeviceClass_Int32] = device_class
+        if properties is not None:
+            self.properties.update(properties)
+        self.role = role
+        self.connected = True
+        self.controller_state = openvr.VRControllerState_t()
+
+    def pose_at(self, seconds):
+        "The 3x4 device-to-absolute-tracking matrix at the given simulation time"
+        if callable(self.pose):
+            return self.pose(seconds)
+        return self.pose
+
+
+def default_devices():
+    "A standing HMD, left and right hand controllers and two base stations"
+    def device(device_class, model, pose, role=openvr.TrackedControllerRole_Invalid):
+        return SimulatedDevice(device_class, pose, {
+            openvr.Prop_ModelNumber_String: model,
+            openvr.Prop_RenderModelName_String: model,
+        }, role)
+    result = [
+        device(openvr.TrackedDeviceClass_HMD, b"simulated_hmd", _translation(0, 1.7, 0)),
+        device(openvr.TrackedDeviceClass_Controller, b"simulated_controller",
+               _translation(-0.2, 1.1, -0.3), openvr.TrackedControllerRole_LeftHand),
+        device(openvr.TrackedDeviceClass_Controller, b"simulated_controller",
+               _translation(0.2, 1.1, -0.3), openvr.TrackedControllerRole_RightHand),
+        device(openvr.TrackedDeviceClass_TrackingReference, b"simulated_base_station", _translation(-2, 2.4, -2)),
+        device(openvr.TrackedDeviceClass_TrackingReference, b"simulated_base_station", _translation(2, 2.4, 2)),
+    ]
+    for index, d in enumerate(result):
+        d.properties[openvr.Prop_SerialNumber_String] = b"SIM-%d" % index
+    return result
+
+
+class SimulatedRuntime(object):
+    """
+    Python stand-in for the OpenVR shared library; install it with openvr.setBackend().
+
+    devices is a list of SimulatedDevice, indexed by tracked device index;
+    by default see default_devices(). IVRCompositor.waitGetPoses() blocks until
+    the next simulated vsync at refresh_rate Hz, unless paced is False, in
+    which case frames run as fast as the application renders them.
+    script, if given, is called as script(runtime, frame_index) at the start of
+    every frame, to move devices, press buttons or queue events.
+    gpu_frame_ms is reported as m_flTotalRenderGpuMs in the frame timings;
+    None reports the CPU time between waitGetPoses() and the last submit() instead.
+    render_model_load_calls is the number of times loadRenderModel_Async() and
+    loadTexture_Async() report VRRenderModelError_Loading before succeeding.
+    hidden_area_segments is the number of edges, a multiple of 8, of the ellipse
+    that bounds the visible area of each eye in the hidden area meshes;
+    set it to 0 to simulate an HMD without hidden area meshes.
+    """
+
+    def __init__(self, devices=None, refresh_rate=90.0, paced=True, script=None,
+                 gpu_frame_ms=None, render_model_load_calls=0, frame_history=128, hidden_area_segments=32):
+        if devices is None:
+            devices = default_devices()
+        self.devices = list(devices)
+        self.refresh_rate = refresh_rate
+        self.paced = paced
+        self.script = script
+        self.gpu_frame_ms = gpu_frame_ms
+        self.render_model_load_calls = render_model_load_calls
+        self.render_target_size = (1512, 1680)
+        self.ipd = 0.064
+        self.seconds_from_vsync_to_photons = 0.011
+        self.hidden_area_segments = hidden_area_segments
+        # Tangents of the half angles of each eye's frustum: left, right, top, bottom
+        self.projection_raw = {
+            openvr.Eye_Left: (-1.39, 1.24, -1.47, 1.47),
+            openvr.Eye_Right: (-1.24, 1.39, -1.47, 1.47),
+        }
+        self.events = collections.deque()
+        self.frame_timings = collections.deque(maxlen=frame_history)
+        self.submit_count = 0
+        self.haptic_pulses = []
+        self.initialized = False
+        self._init_token = 0
+        self._start_time = _clock()
+        self.system = _SimulatedSystem(self)
+        self.compositor = _SimulatedCompositor(self)
+        self.render_models = _SimulatedRenderModels(self)
+        self._interfaces = {
+            openvr.IVRSystem_Version: (openvr.IVRSystem_FnTable, self.system),
+            openvr.IVRCompositor_Version: (openvr.IVRCompositor_FnTable, self.compositor),
+            openvr.IVRRenderModels_Version: (openvr.IVRRenderModels_FnTable, self.render_models),
+        }
+        # Zero-filled function tables whose addresses are handed out by VR_GetGenericInterface
+        self._function_tables = dict()
+
+    # Scripting
+
+    def seconds(self):
+        "Simulation time in seconds"
+        return _clock() - self._start_time
+
+    def queue_event(self, event_type, tracked_device_index=openvr.k_unTrackedDeviceIndexInvalid, **data):
+        """
+        Queues an event for IVRSystem.pollNextEvent(). Keyword arguments set
+        members of the VREvent_Data_t union, e.g. controller=VREvent_Controller_t(button).
+        """
+        event = openvr.VREvent_t()
+        event.eventType = event_type
+        event.trackedDeviceIndex = tracked_device_index
+        for name, value in data.items():
+            setattr(event.data, name, value)
+        self.events.append((self.seconds(), event))
+
+    def connect_device(self, index, connected=True):
+        self.devices[index].connected = connected
+        if connected:
+            self.queue_event(openvr.VREvent_TrackedDeviceActivated, index)
+        else:
+            self.queue_event(openvr.VREvent_TrackedDeviceDeactivated, index)
+
+    def set_property(self, index, prop, value):
+        self.devices[index].properties[prop] = value
+        self.queue_event(openvr.VREvent_PropertyChanged, index)
+
+    def set_buttons(self, index, pressed=None, touched=None):
+        """
+        Sets the button masks of a controller. Queues the matching button
+        press, unpress, touch and untouch events for every changed button.
+        """
+        state = self.devices[index].controller_state
+        for mask, field, on_event, off_event in (
+                (pressed, 'ulButtonPressed', openvr.VREvent_ButtonPress, openvr.VREvent_ButtonUnpress),
+                (touched, 'ulButtonTouched', openvr.VREvent_ButtonTouch, openvr.VREvent_ButtonUntouch)):
+            if mask is None:
+                continue
+            changed = getattr(state, field) ^ mask
+            setattr(state, field, mask)
+            for button in range(64):
+                if changed & (1 << button):
+                    event_type = on_event if mask & (1 << button) else off_event
+                    self.queue_event(event_type, index, controller=openvr.VREvent_Controller_t(button))
+        state.unPacketNum += 1
+
+    def set_axis(self, index, axis, x, y=0.0):
+        state = self.devices[index].controller_state
+        state.rAxis[axis].x = x
+        state.rAxis[axis].y = y
+        state.unPacketNum += 1
+
+    def begin_frame(self, frame_index):
+        "Called by IVRCompositor.waitGetPoses() before the poses of a new frame are computed"
+        if self.script is not None:
+            self.script(self, frame_index)
+
+    def fill_poses(self, poses, count, seconds_from_now=0.0):
+        "Writes the device poses predicted seconds_from_now into a ctypes pointer to TrackedDevicePose_t"
+        seconds = self.seconds() + seconds_from_now
+        for index in range(count):
+            pose = poses[index]
+            if index < len(self.devices) and self.devices[index].connected:
+                device = self.devices[index]
+                matrix = device.pose_at(seconds)
+                m = pose.mDeviceToAbsoluteTracking.m
+                for i in range(3):
+                    m[i][:] = [float(x) for x in matrix[i]]
+                pose.eTrackingResult = openvr.TrackingResult_Running_OK
+                pose.bPoseIsValid = 1
+                pose.bDeviceIsConnected = 1
+            else:
+                pose.eTrackingResult = openvr.TrackingResult_Uninitialized
+                pose.bPoseIsValid = 0
+                pose.bDeviceIsConnected = 0
+
+    # OpenVR C API entry points, see openvr.setBackend()
+
+    def VR_IsHmdPresent(self):
+        return any(d.device_class == openvr.TrackedDeviceClass_HMD for d in self.devices)
+
+    def VR_IsRuntimeInstalled(self):
+        return True
+
+    def VR_RuntimePath(self):
+        return b"simulated"
+
+    def VR_GetVRInitErrorAsSymbol(self, error):
+        return _enum_name('VRInitError_', error)
+
+    def VR_GetVRInitErrorAsEnglishDescription(self, error):
+        return _enum_name('VRInitError_', error)
+
+    def VR_GetGenericInterface(self, interfaceVersion, error):
+        if interfaceVersion.startswith(b"FnTable:"):
+            interfaceVersion = interfaceVersion[len(b"FnTable:"):]
+        if not self.initialized:
+            _out(error).value = openvr.VRInitError_Init_NotInitialized
+            return None
+        if interfaceVersion not in self._interfaces:
+            _out(error).value = openvr.VRInitError_Init_InterfaceNotFound
+            return None
+        fn_type, _ = self._interfaces[interfaceVersion]
+        table = self._function_tables.setdefault(fn_type, fn_type())
+        _out(error).value = openvr.VRInitError_None
+        return ctypes.addressof(table)
+
+    def VR_IsInterfaceVersionValid(self, interfaceVersion):
+        return interfaceVersion in self._interfaces
+
+    def VR_GetInitToken(self):
+        return self._init_token
+
+    def VR_InitInternal(self, error, eApplicationType):
+        self.initialized = True
+        self._init_token += 1
+        self.compositor.reset()
+        _out(error).value = openvr.VRInitError_None
+        return self._init_token
+
+    def VR_ShutdownInternal(self):
+        self.initialized = False
+        self._init_token += 1
+
+    def functionTableOverrides(self, function_table):
+        "Python implementations for every entry of one of the function tables from VR_GetGenericInterface"
+        for fn_type, implementation in self._interfaces.values():
+            if isinstance(function_table, fn_type):
+                break
+        else:
+            return dict()
+        result = dict()
+        for name, _ in fn_type._fields_:
+            fn = getattr(implementation, name, None)
+            if fn is None:
+                fn = _not_simulated(fn_type.__name__, name)
+            result[name] = fn
+        return result
+
+
+def _not_simulated(table_name, name):
+    def fn(*args):
+        raise NotImplementedError("%s.%s is not simulated" % (table_name, name))
+    return fn
+
+
+def _hidden_area_mesh(segments, type_):
+    """
+    Vertices of a hidden area mesh of the given EHiddenAreaMeshType, as a ctypes
+    array of HmdVector2_t. The visible area is the ellipse inscribed in the
+    texture; the hidden area is the rest, with each edge of the ellipse
+    joined to the edge of the texture by two triangles.
+    """
+    def edge(k):
+        angle = 2 * math.pi * k / segments
+        return math.cos(angle), math.sin(angle)
+
+    def on_border(x, y):
+        # The point of the texture border in the same direction from the center
+        scale = 1.0 / max(abs(x), abs(y))
+        return x * scale, y * scale
+
+    points = []
+    for k in range(segments):
+        (x0, y0), (x1, y1) = edge(k), edge(k + 1)
+        if type_ == openvr.k_eHiddenAreaMesh_LineLoop:
+            points.append((x0, y0))
+        elif type_ == openvr.k_eHiddenAreaMesh_Inverse:
+            points.extend([(0.0, 0.0), (x0, y0), (x1, y1)])
+        else:
+            # Texture corners are at multiples of 45 degrees, so each quad has one straight outer side
+            b0, b1 = on_border(x0, y0), on_border(x1, y1)
+            points.extend([(x0, y0), b0, b1, (x0, y0), b1, (x1, y1)])
+    return (openvr.HmdVector2_t * len(points))(
+        *[openvr.HmdVector2_t(0.5 + 0.5 * x, 0.5 + 0.5 * y) for x, y in points])
+
+
+class _SimulatedSystem(object):
+    "Python implementation of the IVRSystem function table"
+
+    def __init__(self, runtime):
+        self.runtime = runtime
+        self._hidden_area_meshes = dict()
+
+    def _device(self, index):
+        if 0 <= index < len(self.runtime.devices):
+            return self.runtime.devices[index]
+        return None
+
+    def getRecommendedRenderTargetSize(self, pnWidth, pnHeight):
+        _out(pnWidth).value, _out(pnHeight).value = self.runtime.render_target_size
+
+    def getProjectionMatrix(self, eEye, fNearZ, fFarZ):
+        # Same construction as IVRSystem::GetProjectionMatrix() from the raw frustum
+        left, right, top, bottom = self.runtime.projection_raw[eEye]
+        idx = 1.0 / (right - left)
+        idy = 1.0 / (bottom - top)
+        idz = 1.0 / (fFarZ - fNearZ)
+        sx = right + left
+        sy = bottom + top
+        result = openvr.HmdMatrix44_t()
+        result.m[0][:] = [2 * idx, 0, sx * idx, 0]
+        result.m[1][:] = [0, 2 * idy, sy * idy, 0]
+        result.m[2][:] = [0, 0, -fFarZ * idz, -fFarZ * fNearZ * idz]
+        result.m[3][:] = [0, 0, -1, 0]
+        return result
+
+    def getProjectionRaw(self, eEye, pfLeft, pfRight, pfTop, pfBottom):
+        raw = self.runtime.projection_raw[eEye]
+        for arg, value in zip((pfLeft, pfRight, pfTop, pfBottom), raw):
+            _out(arg).value = value
+
+    def getEyeToHeadTransform(self, eEye):
+        offset = 0.5 * self.runtime.ipd
+        if eEye == openvr.Eye_Left:
+            offset = -offset
+        return _matrix34(_translation(offset, 0, 0))
+
+    def getTimeSinceLastVsync(self, pfSecondsSinceLastVsync, pulFrameCounter):
+        frame, since_vsync = self.runtime.compositor.vsync()
+        _out(pfSecondsSinceLastVsync).value = since_vsync
+        _out(pulFrameCounter).value = frame
+        return True
+
+    def isDisplayOnDesktop(self):
+        return False
+
+    def getDeviceToAbsoluteTrackingPose(self, eOrigin, fPredictedSecondsToPhotonsFromNow, pTrackedDevicePoseArray, unTrackedDevicePoseArrayCount):
+        poses = _out_array(pTrackedDevicePoseArray, openvr.TrackedDevicePose_t)
+        self.runtime.fill_poses(poses, unTrackedDevicePoseArrayCount, fPredictedSecondsToPhotonsFromNow)
+
+    def resetSeatedZeroPose(self):
+        pass
+
+    def getSeatedZeroPoseToStandingAbsoluteTrackingPose(self):
+        return _matrix34(_translation(0, 0, 0))
+
+    def getRawZeroPoseToStandingAbsoluteTrackingPose(self):
+        return _matrix34(_translation(0, 0, 0))
+
+    def getSortedTrackedDeviceIndicesOfClass(self, eTrackedDeviceClass, punTrackedDeviceIndexArray, unTrackedDeviceIndexArrayCount, unRelativeToTrackedDeviceIndex):
+        # Sorted by index, not by direction from the relative device
+        indices = [i for i, d in enumerate(self.runtime.devices)
+                   if d.connected and d.device_class == eTrackedDeviceClass]
+        array = _out_array(punTrackedDeviceIndexArray, openvr.TrackedDeviceIndex_t)
+        if array is not None and len(indices) <= unTrackedDeviceIndexArrayCount:
+            for k, index in enumerate(indices):
+                array[k] = index
+        return len(indices)
+
+    def getTrackedDeviceActivityLevel(self, unDeviceId):
+        return openvr.k_EDeviceActivityLevel_UserInteraction
+
+    def getTrackedDeviceIndexForControllerRole(self, unDeviceType):
+        for index, device in enumerate(self.runtime.devices):
+            if device.role == unDeviceType and unDeviceType != openvr.TrackedControllerRole_Invalid:
+                return index
+        return openvr.k_unTrackedDeviceIndexInvalid
+
+    def getControllerRoleForTrackedDeviceIndex(self, unDeviceIndex):
+        device = self._device(unDeviceIndex)
+        if device is None:
+            return openvr.TrackedControllerRole_Invalid
+        return device.role
+
+    def getTrackedDeviceClass(self, unDeviceIndex):
+        device = self._device(unDeviceIndex)
+        if device is None or not device.connected:
+            return openvr.TrackedDeviceClass_Invalid
+        return device.device_class
+
+    def isTrackedDeviceConnected(self, unDeviceIndex):
+        device = self._device(unDeviceIndex)
+        return device is not None and device.connected
+
+    def _property(self, unDeviceIndex, prop, pError, convert, default):
+        device = self._device(unDeviceIndex)
+        error = _out(pError)
+        if device is None:
+            error.value = openvr.TrackedProp_InvalidDevice
+            return default
+        value = device.properties.get(prop)
+        if value is None and device.device_class == openvr.TrackedDeviceClass_HMD:
+            # Display timing follows the runtime, unless set on the device
+            value = {
+                openvr.Prop_DisplayFrequency_Float: self.runtime.refresh_rate,
+                openvr.Prop_SecondsFromVsyncToPhotons_Float: self.runtime.seconds_from_vsync_to_photons,
+            }.get(prop)
+        if value is None:
+            error.value = openvr.TrackedProp_UnknownProperty
+            return default
+        error.value = openvr.TrackedProp_Success
+        return convert(value)
+
+    def getBoolTrackedDeviceProperty(self, unDeviceIndex, prop, pError):
+        return self._property(unDeviceIndex, prop, pError, bool, False)
+
+    def getFloatTrackedDeviceProperty(self, unDeviceIndex, prop, pError):
+        return self._property(unDeviceIndex, prop, pError, float, 0.0)
+
+    def getInt32TrackedDeviceProperty(self, unDeviceIndex, prop, pError):
+        return self._property(unDeviceIndex, prop, pError, int, 0)
+
+    def getUint64TrackedDeviceProperty(self, unDeviceIndex, prop, pError):
+        return self._property(unDeviceIndex, prop, pError, int, 0)
+
+    def getStringTrackedDeviceProperty(self, unDeviceIndex, prop, pchValue, unBufferSize, pError):
+        value = self._property(unDeviceIndex, prop, pError, bytes, None)
+        if value is None:
+            return 0
+        required = len(value) + 1
+        if pchValue is None or unBufferSize < required:
+            _out(pError).value = openvr.TrackedProp_BufferTooSmall
+            return required
+        memmove(pchValue, value + b"\0", required)
+        return required
+
+    def getPropErrorNameFromEnum(self, error):
+        return _enum_name('TrackedProp_', error)
+
+    def pollNextEvent(self, pEvent, uncbVREvent):
+        try:
+            queued_time, event = self.runtime.events.popleft()
+        except IndexError:
+            return False
+        event.eventAgeSeconds = self.runtime.seconds() - queued_time
+        memmove(pointer(_out(pEvent)), byref(event), min(uncbVREvent, sizeof(event)))
+        return True
+
+    def pollNextEventWithPose(self, eOrigin, pEvent, uncbVREvent, pTrackedDevicePose):
+        result = self.pollNextEvent(pEvent, uncbVREvent)
+        if result and pTrackedDevicePose is not None:
+            event = _out(pEvent)
+            poses = (openvr.TrackedDevicePose_t * len(self.runtime.devices))()
+            self.runtime.fill_poses(poses, len(poses))
+            if event.trackedDeviceIndex < len(poses):
+                memmove(pointer(_out(pTrackedDevicePose)), byref(poses[event.trackedDeviceIndex]),
+                        sizeof(openvr.TrackedDevicePose_t))
+        return result
+
+    def getEventTypeNameFromEnum(self, eType):
+        return _enum_name('VREvent_', eType)
+
+    def getHiddenAreaMesh(self, eEye, type_):
+        segments = self.runtime.hidden_area_segments
+        if not segments:
+            # Like an HMD without a hidden area mesh: NULL vertex data and no triangles
+            return openvr.HiddenAreaMesh_t()
+        # Kept alive, like the runtime's own meshes, for as long as the runtime
+        key = (segments, type_)
+        vertices = self._hidden_area_meshes.get(key)
+        if vertices is None:
+            vertices = self._hidden_area_meshes[key] = _hidden_area_mesh(segments, type_)
+        count = len(vertices)
+        if type_ != openvr.k_eHiddenAreaMesh_LineLoop:
+            count //= 3
+        return openvr.HiddenAreaMesh_t(cast(vertices, POINTER(openvr.HmdVector2_t)), count)
+
+    def getControllerState(self, unControllerDeviceIndex, pControllerState, unControllerStateSize):
+        device = self._device(unControllerDeviceIndex)
+        if device is None or not device.connected or device.device_class != openvr.TrackedDeviceClass_Controller:
+            return False
+        memmove(pointer(_out(pControllerState)), byref(device.controller_state),
+                min(unControllerStateSize, sizeof(openvr.VRControllerState_t)))
+        return True
+
+    def getControllerStateWithPose(self, eOrigin, unControllerDeviceIndex, pControllerState, unControllerStateSize, pTrackedDevicePose):
+        result = self.getControllerState(unControllerDeviceIndex, pControllerState, unControllerStateSize)
+        if result and pTrackedDevicePose is not None:
+            poses = (openvr.TrackedDevicePose_t * (unControllerDeviceIndex + 1))()
+            self.runtime.fill_poses(poses, len(poses))
+            memmove(pointer(_out(pTrackedDevicePose)), byref(poses[unControllerDeviceIndex]),
+                    sizeof(openvr.TrackedDevicePose_t))
+        return result
+
+    def triggerHapticPulse(self, unControllerDeviceIndex, unAxisId, usDurationMicroSec):
+        self.runtime.haptic_pulses.append((unControllerDeviceIndex, unAxisId, usDurationMicroSec))
+
+    def getButtonIdNameFromEnum(self, eButtonId):
+        return _enum_name('k_EButton_', eButtonId)
+
+    def getControllerAxisTypeNameFromEnum(self, eAxisType):
+        return _enum_name('k_eControllerAxis_', eAxisType)
+
+    def captureInputFocus(self):
+        return True
+
+    def releaseInputFocus(self):
+        pass
+
+    def isInputFocusCapturedByAnotherProcess(self):
+        return False
+
+    def acknowledgeQuit_Exiting(self):
+        pass
+
+    def acknowledgeQuit_UserPrompt(self):
+        pass
+
+
+class _SimulatedCompositor(object):
+    "Python implementation of the IVRCompositor function table"
+
+    def __init__(self, runtime):
+        self.runtime = runtime
+        self.tracking_space = openvr.TrackingUniverseStanding
+        self.reset()
+
+    def reset(self):
+        self.frame_index = 0
+        self.frame_start = None
+        self.frame_timing = None
+        self.last_submit = None
+        self.dropped_frames = 0
+        self.stats = openvr.Compositor_CumulativeStats()
+        self.last_render_poses = (openvr.TrackedDevicePose_t * openvr.k_unMaxTrackedDeviceCount)()
+        self.last_game_poses = (openvr.TrackedDevicePose_t * openvr.k_unMaxTrackedDeviceCount)()
+
+    def frame_interval(self):
+        return 1.0 / self.runtime.refresh_rate
+
+    def vsync(self):
+        "Index of the most recent simulated vsync, and seconds elapsed since then"
+        seconds = self.runtime.seconds()
+        interval = self.frame_interval()
+        frame = int(seconds / interval)
+        return frame, seconds - frame * interval
+
+    def setTrackingSpace(self, eOrigin):
+        self.tracking_space = eOrigin
+
+    def getTrackingSpace(self):
+        return self.tracking_space
+
+    def _begin_frame_timing(self):
+        # Like SteamVR, the newest entry of the history is the frame in progress
+        timing = openvr.Compositor_FrameTiming()
+        timing.m_nSize = sizeof(openvr.Compositor_FrameTiming)
+        timing.m_nFrameIndex = self.frame_index
+        timing.m_flSystemTimeInSeconds = self.frame_start
+        self.runtime.frame_timings.append(timing)
+        self.frame_timing = timing
+
+    def _end_frame_timing(self, now, dropped):
+        timing = self.frame_timing
+        timing.m_nNumFramePresents = 1 + dropped
+        timing.m_nNumDroppedFrames = dropped
+        timing.m_flClientFrameIntervalMs = 1000.0 * (now - self.frame_start)
+        if self.last_submit is not None:
+            timing.m_flSubmitFrameMs = 1000.0 * (self.last_submit - self.frame_start)
+        if self.runtime.gpu_frame_ms is not None:
+            timing.m_flTotalRenderGpuMs = self.runtime.gpu_frame_ms
+        else:
+            timing.m_flTotalRenderGpuMs = timing.m_flSubmitFrameMs
+        timing.m_flCompositorRenderGpuMs = 0.5
+        timing.m_HmdPose = self.last_render_poses[openvr.k_unTrackedDeviceIndex_Hmd]
+        self.stats.m_nNumFramePresents += timing.m_nNumFramePresents
+        self.stats.m_nNumDroppedFrames += dropped
+        self.stats.m_nNumReprojectedFrames += dropped
+
+    def waitGetPoses(self, pRenderPoseArray, unRenderPoseArrayCount, pGamePoseArray, unGamePoseArrayCount):
+        runtime = self.runtime
+        interval = self.frame_interval()
+        if runtime.paced:
+            # Block until the next vsync, like the compositor does
+            frame, since_vsync = self.vsync()
+            time.sleep(interval - since_vsync)
+            frame += 1
+        else:
+            frame = self.frame_index + 1
+        now = runtime.seconds()
+        dropped = 0
+        if self.frame_timing is not None:
+            dropped = max(0, frame - self.frame_index - 1)
+            self._end_frame_timing(now, dropped)
+        self.frame_index = frame
+        self.frame_start = now
+        self.last_submit = None
+        self._begin_frame_timing()
+        runtime.begin_frame(frame)
+        # Render poses are predicted for when this frame's photons hit the display,
+        # game poses for one frame later
+        photons = interval + runtime.seconds_from_vsync_to_photons
+        runtime.fill_poses(self.last_render_poses, len(self.last_render_poses), photons)
+        runtime.fill_poses(self.last_game_poses, len(self.last_game_poses), photons + interval)
+        self.getLastPoses(pRenderPoseArray, unRenderPoseArrayCount, pGamePoseArray, unGamePoseArrayCount)
+        return openvr.VRCompositorError_None
+
+    def getLastPoses(self, pRenderPoseArray, unRenderPoseArrayCount, pGamePoseArray, unGamePoseArrayCount):
+        for arg, count, source in ((pRenderPoseArray, unRenderPoseArrayCount, self.last_render_poses),
+                                   (pGamePoseArray, unGamePoseArrayCount, self.last_game_poses)):
+            poses = _out_array(arg, openvr.TrackedDevicePose_t)
+            if poses is not None:
+                count = min(count, len(source))
+                memmove(poses, source, count * sizeof(openvr.TrackedDevicePose_t))
+        return openvr.VRCompositorError_None
+
+    def getLastPoseForTrackedDeviceIndex(self, unDeviceIndex, pOutputPose, pOutputGamePose):
+        for arg, source in ((pOutputPose, self.last_render_poses), (pOutputGamePose, self.last_game_poses)):
+            pose = _out(arg)
+            if pose is not None:
+                memmove(pointer(pose), byref(source[unDeviceIndex]), sizeof(openvr.TrackedDevicePose_t))
+        return openvr.VRCompositorError_None
+
+    def submit(self, eEye, pTexture, pBounds, nSubmitFlags):
+        self.runtime.submit_count += 1
+        self.last_submit = self.runtime.seconds()
+        return openvr.VRCompositorError_None
+
+    def clearLastSubmittedFrame(self):
+        pass
+
+    def postPresentHandoff(self):
+        pass
+
+    def getFrameTiming(self, pTiming, unFramesAgo):
+        timing = _out(pTiming)
+        history = self.runtime.frame_timings
+        # The runtime rejects structs whose m_nSize was not set by the caller
+        if timing.m_nSize != sizeof(openvr.Compositor_FrameTiming) or not history:
+            return False
+        source = history[-1 - min(unFramesAgo, len(history) - 1)]
+        memmove(pointer(timing), byref(source), sizeof(source))
+        return True
+
+    def getFrameTimings(self, pTiming, nFrames):
+        timings = _out_array(pTiming, openvr.Compositor_FrameTiming)
+        if timings[0].m_nSize != sizeof(openvr.Compositor_FrameTiming):
+            return 0
+        history = list(self.runtime.frame_timings)[-nFrames:] if nFrames > 0 else []
+        for k, source in enumerate(history):
+            memmove(byref(timings[k]), byref(source), sizeof(source))
+        return len(history)
+
+    def getFrameTimeRemaining(self):
+        _, since_vsync = self.vsync()
+        return self.frame_interval() - since_vsync
+
+    def getCumulativeStats(self, pStats, nStatsSizeInBytes):
+        memmove(pointer(_out(pStats)), byref(self.stats), min(nStatsSizeInBytes, sizeof(self.stats)))
+
+    def compositorBringToFront(self):
+        pass
+
+    def compositorGoToBack(self):
+        pass
+
+    def isFullscreen(self):
+        return True
+
+    def canRenderScene(self):
+        return True
+
+    def showMirrorWindow(self):
+        pass
+
+    def hideMirrorWindow(self):
+        pass
+
+    def isMirrorWindowVisible(self):
+        return False
+
+    def shouldAppRenderWithLowResources(self):
+        return False
+
+    def forceInterleavedReprojectionOn(self, bOverride):
+        pass
+
+    def suspendRendering(self, bSuspend):
+        pass
+
+
+def _cube_render_model():
+    "Vertices and triangle indices of a 10 cm textured cube, with one face per direction"
+    vertices = []
+    indices = []
+    for axis in range(3):
+        for sign in (-1.0, 1.0):
+            u, v = (axis + 1) % 3, (axis + 2) % 3
+            base = len(vertices)
+            for a, b in ((-1, -1), (1, -1), (1, 1), (-1, 1)):
+                vertex = openvr.RenderModel_Vertex_t()
+                vertex.vPosition.v[axis] = 0.05 * sign
+                vertex.vPosition.v[u] = 0.05 * a * sign
+                vertex.vPosition.v[v] = 0.05 * b
+                vertex.vNormal.v[axis] = sign
+                vertex.rfTextureCoord[:] = [0.5 * (a + 1), 0.5 * (b + 1)]
+                vertices.append(vertex)
+            indices.extend([base, base + 1, base + 2, base, base + 2, base + 3])
+    return vertices, indices
+
+
+class _SimulatedRenderModels(object):
+    "Python implementation of the IVRRenderModels function table, handing out a cube for every model name"
+
+    def __init__(self, runtime):
+        self.runtime = runtime
+        self.pending = collections.Counter()
+        # Native memory handed out to the application, by address, until freed
+        self.loaded = dict()
+
+    def _loading(self, key):
+        if self.pending[key] < self.runtime.render_model_load_calls:
+            self.pending[key] += 1
+            return True
+        return False
+
+    def loadRenderModel_Async(self, pchRenderModelName, ppRenderModel):
+        if self._loading(pchRenderModelName):
+            return openvr.VRRenderModelError_Loading
+        vertices, indices = _cube_render_model()
+        model = openvr.RenderModel_t()
+        vertex_data = (openvr.RenderModel_Vertex_t * len(vertices))(*vertices)
+        index_data = (ctypes.c_uint16 * len(indices))(*indices)
+        model.rVertexData = vertex_data
+        model.unVertexCount = len(vertices)
+        model.rIndexData = index_data
+        model.unTriangleCount = len(indices) // 3
+        model.diffuseTextureId = 0
+        self.loaded[ctypes.addressof(model)] = (model, vertex_data, index_data)
+        _out(ppRenderModel).contents = model
+        return openvr.VRRenderModelError_None
+
+    def freeRenderModel(self, pRenderModel):
+        model = _out(pRenderModel)
+        if model is not None:
+            self.loaded.pop(ctypes.addressof(model), None)
+
+    def loadTexture_Async(self, textureId, ppTexture):
+        if self._loading(textureId):
+            return openvr.VRRenderModelError_Loading
+        if textureId != 0:
+            return openvr.VRRenderModelError_InvalidTexture
+        width, height = 2, 2
+        pixels = (ctypes.c_uint8 * (4 * width * height))(*([200, 200, 200, 255] * (width * height)))
+        texture = openvr.RenderModel_TextureMap_t()
+        texture.unWidth = width
+        texture.unHeight = height
+        texture.rubTextureMapData = pixels
+        self.loaded[ctypes.addressof(texture)] = (texture, pixels)
+        _out(ppTexture).contents = texture
+        return openvr.VRRenderModelError_None
+
+    def freeTexture(self, pTexture):
+        self.freeRenderModel(pTexture)
+
+    def getRenderModelCount(self):
+        return len(set(self._model_names()))
+
+    def getRenderModelName(self, unRenderModelIndex, pchRenderModelName, unRenderModelNameLen):
+        names = sorted(set(self._model_names()))
+        if unRenderModelIndex >= len(names):
+            return 0
+        name = names[unRenderModelIndex] + b"\0"
+        if pchRenderModelName is not None and unRenderModelNameLen >= len(name):
+            memmove(pchRenderModelName, name, len(name))
+        return len(name)
+
+    def _model_names(self):
+        for device in self.runtime.devices:
+            name = device.properties.get(openvr.Prop_RenderModelName_String)
+            if name is not None:
+                yield name
+
+    def getComponentCount(self, pchRenderModelName):
+        return 0
+
+    def renderModelHasComponent(self, pchRenderModelName, pchComponentName):
+        return False
+
+    def getRenderModelErrorNameFromEnum(self, error):
+        return _enum_name('VRRenderModelError_', error)
@@ -2,85 +2,137 @@
 
 # file tracked_devices_actor.py
 
-import time
-from ctypes import cast, c_float, c_void_p, sizeof
+import collections
+from ctypes import c_float, c_void_p, sizeof
 
 import numpy
 from OpenGL.GL import *  # @UnusedWildImport # this comment squelches an IDE warning
 from OpenGL.GL.shaders import compileShader, compileProgram
-from OpenGL.arrays import vbo
 from OpenGL.GL.EXT.texture_filter_anisotropic import GL_TEXTURE_MAX_ANISOTROPY_EXT, GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT
 
 import openvr
-from openvr.gl_renderer import matrixForOpenVrMatrix
+from openvr.device_properties import DevicePropertyCache
+from openvr.gl_renderer import FallbackFrameUniforms, frame_uniforms_glsl, stereo_vertex_glsl
 from openvr.glframework import shader_string
+from openvr.pose_buffer import PoseBuffer, matrices_for_openvr_poses
+from openvr.render_models import LoadedRenderModel, RenderModelLoader, render_model_vertex_dtype
 
 """
 Tracked item (controllers, lighthouses, etc) actor for "hello world" openvr apps
 """
 
+try:
+    from time import perf_counter as _clock
+except ImportError:  # Python 2
+    from time import time as _clock
+
+
+# Diffuse texture of models without one, and of the placeholder
+_NO_TEXTURE_PIXELS = numpy.array([[[160, 160, 160, 255]]], dtype=numpy.uint8)
+
+
+def _placeholder_model(size=0.04):
+    "LoadedRenderModel of a gray box, size meters wide, drawn for devices whose render model is not uploaded yet"
+    vertices = numpy.zeros(24, dtype=render_model_vertex_dtype)
+    indices = []
+    for axis in range(3):
+        for side, sign in enumerate((-1.0, 1.0)):
+            u, v = (axis + 1) % 3, (axis + 2) % 3
+            base = 4 * (2 * axis + side)
+            for corner, (a, b) in enumerate(((-1, -1), (1, -1), (1, 1), (-1, 1))):
+                vertex = vertices[base + corner]
+                vertex['vPosition'][axis] = 0.5 * size * sign
+                vertex['vPosition'][u] = 0.5 * size * a * sign
+                vertex['vPosition'][v] = 0.5 * size * b
+                vertex['vNormal'][axis] = sign
+            indices.extend([base, base + 1, base + 2, base, base + 2, base + 3])
+    return LoadedRenderModel(b"placeholder", openvr.VRRenderModelError_None, None, None,
+                             vertices, numpy.array(indices, dtype=numpy.uint16), None, None)
+
 
 class TrackedDeviceMesh(object):
-    def __init__(self, model_name):
-        "This constructor must only be called with a live OpenGL context"
-        self.model_name = model_name
-        # Load controller model
-        error = openvr.EVRRenderModelError()
-        while True:
-            error, model = openvr.VRRenderModels().loadRenderModel_Async(model_name)
-            if error != openvr.VRRenderModelError_Loading:
+    """
+    Vertex array and diffuse texture of a render model. They are uploaded by
+    upload_gl() in steps, so that the upload of a large model can be spread
+    over several frames.
+    """
+
+    def __init__(self, loaded):
+        "loaded is a render_models.LoadedRenderModel"
+        self.model_name = loaded.name
+        self.index_count = len(loaded.indices)
+        self.vao = None
+        self.vertex_buffer = None
+        self.index_buffer = None
+        self.diffuse_texture = None
+        self._loaded = loaded
+        self._upload_steps = collections.deque([self._upload_buffers, self._upload_texture])
+
+    @property
+    def is_ready(self):
+        "Whether the mesh is uploaded and can be drawn"
+        return not self._upload_steps
+
+    def upload_gl(self, deadline=None):
+        """
+        Runs upload steps until the mesh is uploaded or, after at least one
+        step, the perf_counter() time is past deadline. Returns is_ready.
+        """
+        steps = self._upload_steps
+        while steps:
+            steps.popleft()()
+            if deadline is not None and _clock() >= deadline:
                 break
-            time.sleep(1)
-        vertices0 = list()
-        indices0 = list()
-        if model is not None:
-            for v in range (model.unVertexCount):
-                vd = model.rVertexData[v]
-                vertices0.append(float(vd.vPosition.v[0])) # position X
-                vertices0.append(float(vd.vPosition.v[1])) # position Y
-                vertices0.append(float(vd.vPosition.v[2])) # position Z
-                vertices0.append(float(vd.vNormal.v[0])) # normal X
-                vertices0.append(float(vd.vNormal.v[1])) # normal Y
-                vertices0.append(float(vd.vNormal.v[2])) # normal Z
-                vertices0.append(float(vd.rfTextureCoord[0])) # texture coordinate U
-                vertices0.append(float(vd.rfTextureCoord[1])) # texture coordinate V
-            for i in range (model.unTriangleCount * 3):
-                index = model.rIndexData[i]
-                indices0.append(int(index))
-        vertices0 = numpy.array(vertices0, dtype=numpy.float32)
-        indices0 = numpy.array(indices0, dtype=numpy.uint32)
-        #
-        self.vertexPositions = vbo.VBO(vertices0)
-        self.indexPositions = vbo.VBO(indices0, target=GL_ELEMENT_ARRAY_BUFFER)
+        if not steps:
+            # The CPU-side buffers are no longer needed
+            self._loaded = None
+        return not steps
+
+    def _upload_buffers(self):
+        # Uploaded straight from the runtime's memory, or the cache's, in its interleaved layout
+        vertices = self._loaded.vertices
+        indices = self._loaded.indices
         # http://stackoverflow.com/questions/14365484/how-to-draw-with-vertex-array-objects-and-gldrawelements-in-pyopengl
         self.vao = glGenVertexArrays(1)
         glBindVertexArray(self.vao)
-        self.vertexPositions.bind()
-        self.indexPositions.bind()
+        self.vertex_buffer, self.index_buffer = glGenBuffers(2)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vertex_buffer)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices.view(numpy.float32), GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.index_buffer)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        stride = render_model_vertex_dtype.itemsize
+        fields = render_model_vertex_dtype.fields
         # Vertices
         glEnableVertexAttribArray(0)
-        fsize = sizeof(c_float)
-        glVertexAttribPointer(0, 3, GL_FLOAT, False, 8 * fsize, cast(0 * fsize, c_void_p))
+        glVertexAttribPointer(0, 3, GL_FLOAT, False, stride, c_void_p(fields['vPosition'][1]))
         # Normals
         glEnableVertexAttribArray(1)
-        glVertexAttribPointer(1, 3, GL_FLOAT, False, 8 * fsize, cast(3 * fsize, c_void_p))
+        glVertexAttribPointer(1, 3, GL_FLOAT, False, stride, c_void_p(fields['vNormal'][1]))
         # Texture coordinates    
         glEnableVertexAttribArray(2)
-        glVertexAttribPointer(2, 2, GL_FLOAT, False, 8 * fsize, cast(6 * fsize, c_void_p))
+        glVertexAttribPointer(2, 2, GL_FLOAT, False, stride, c_void_p(fields['rfTextureCoord'][1]))
         glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def _upload_texture(self):
         # Surface texture
-        while True:
-            error, texture_map = openvr.VRRenderModels().loadTexture_Async(model.diffuseTextureId)
-            if error != openvr.VRRenderModelError_Loading:
-                break
-            time.sleep(1)
-        self.texture_map = texture_map.contents
+        pixels = self._loaded.pixels
+        if pixels is None:
+            pixels = _NO_TEXTURE_PIXELS
+        height, width = pixels.shape[:2]
         self.diffuse_texture = glGenTextures(1)
         glBindTexture(GL_TEXTURE_2D, self.diffuse_texture)
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, self.texture_map.unWidth, self.texture_map.unHeight, 
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height,
                      0, GL_RGBA,
-                     GL_UNSIGNED_BYTE, self.texture_map.rubTextureMapData)
-        glGenerateMipmap(GL_TEXTURE_2D)
+                     GL_UNSIGNED_BYTE, pixels)
+        mipmaps = self._loaded.mipmaps
+        if mipmaps is None:
+            glGenerateMipmap(GL_TEXTURE_2D)
+        else:
+            # Mipmaps from a RenderModelCache
+            for level, level_pixels in enumerate(mipmaps, 1):
+                glTexImage2D(GL_TEXTURE_2D, level, GL_RGBA, level_pixels.shape[1], level_pixels.shape[0],
+                             0, GL_RGBA, GL_UNSIGNED_BYTE, level_pixels)
         glTexParameteri( GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE )
         glTexParameteri( GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE )
         glTexParameteri( GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR )
@@ -89,55 +141,295 @@ class TrackedDeviceMesh(object):
         glTexParameterf( GL_TEXTURE_2D, GL_TEXTURE_MAX_ANISOTROPY_EXT, fLargest )
         glBindTexture(GL_TEXTURE_2D, 0)
 
-    def display_gl(self, modelview, projection, pose):
-        controller_X_room = pose.mDeviceToAbsoluteTracking
-        controller_X_room = matrixForOpenVrMatrix(controller_X_room)
-        modelview0 = controller_X_room * modelview
-        # Repack before use, just in case
-        modelview0 = numpy.asarray(numpy.matrix(modelview0, dtype=numpy.float32))
-        glUniformMatrix4fv(4, 1, False, modelview0)
-        normal_matrix = numpy.asarray(controller_X_room)
-        glUniformMatrix4fv(8, 1, False, normal_matrix)
-        glActiveTexture(GL_TEXTURE0)
+    def display_gl_instances(self, first_instance, instance_count, eye_count=1):
+        """
+        Draws the mesh once for each of instance_count devices, whose
+        controller_X_room matrices are in TrackedDevicesActor's model matrix
+        buffer from first_instance on, and each of eye_count eyes, in one draw call.
+        Expects the actor's shader program and texture unit 0 to be active.
+        """
+        glUniform1i(0, first_instance)
         glBindTexture(GL_TEXTURE_2D, self.diffuse_texture)
         glBindVertexArray(self.vao)
-        glDrawElements(GL_TRIANGLES, len(self.indexPositions), GL_UNSIGNED_INT, None)
-        glBindVertexArray(0)
+        glDrawElementsInstanced(GL_TRIANGLES, self.index_count, GL_UNSIGNED_SHORT, None,
+                                instance_count * eye_count)
         
     def dispose_gl(self):
-        glDeleteVertexArrays(1, (self.vao,))
-        self.vbo = 0
-        self.vertexPositions.delete()
-        self.indexPositions.delete()     
+        if self.vao is not None:
+            glDeleteVertexArrays(1, (self.vao,))
+            glDeleteBuffers(2, [self.vertex_buffer, self.index_buffer])
+            self.vao = None
+            self.vertex_buffer = None
+            self.index_buffer = None
+        if self.diffuse_texture is not None:
+            glDeleteTextures([self.diffuse_texture])
+            self.diffuse_texture = None
+        self._upload_steps.clear()
+        self._loaded = None
+
+
+class RenderModelRegistry(object):
+    """
+    TrackedDeviceMesh objects of render models, shared by name between the
+    actors of a process that draw into the same OpenGL context, or contexts
+    sharing objects. TrackedDevicesActor uses default_render_model_registry()
+    unless given another.
+
+    Actors acquire() the render models their devices use and release() them
+    when no device uses them anymore. The first acquire() of a model starts
+    loading it with a RenderModelLoader, from cache if given, a
+    render_models.RenderModelCache. update_gl() uploads loaded models, and
+    frees the runtime's memory of each right after its upload; its OpenGL
+    resources are deleted once no actor has used it for eviction_seconds, so
+    memory stays flat while devices come and go. Until a model is uploaded,
+    mesh() returns None, and actors draw placeholder instead. update_gl()
+    spends its upload budget once per frame, however many actors share the
+    registry.
+
+    Each actor calls init_gl() and dispose_gl() along with its own; the last
+    dispose_gl() deletes all meshes and stops the loader.
+    """
+
+    def __init__(self, cache=None, eviction_seconds=60.0):
+        self.cache = cache
+        self.eviction_seconds = eviction_seconds
+        self.loader = None
+        self.placeholder = None
+        # Uploaded meshes, by render model name
+        self.meshes = dict()
+        self._references = collections.Counter()
+        # Time each model without references was last released, by name
+        self._unused_since = dict()
+        # Models loading, uploading, uploaded or failed to load, and those that failed
+        self._requested = set()
+        self._failed = set()
+        # Mesh partly uploaded within the budget of earlier calls, and what it is uploaded from
+        self._uploading = None
+        self._uploading_from = None
+        self._users = 0
+        # Users that called update_gl() since the budget was last spent
+        self._frame_users = set()
+
+    def _create_mesh(self, loaded):
+        return TrackedDeviceMesh(loaded)
+
+    def init_gl(self):
+        self._users += 1
+        if self.placeholder is None:
+            self.placeholder = self._create_mesh(_placeholder_model())
+            self.placeholder.upload_gl()
+        if self.loader is None:
+            self.loader = RenderModelLoader(cache=self.cache)
+
+    def acquire(self, name):
+        "Adds a reference to render model name, and starts loading it if necessary"
+        self._references[name] += 1
+        self._unused_since.pop(name, None)
+        if name not in self._requested:
+            self._requested.add(name)
+            self.loader.request(name)
+
+    def release(self, name):
+        "Removes a reference added by acquire()"
+        self._references[name] -= 1
+        if self._references[name] <= 0:
+            del self._references[name]
+            self._unused_since[name] = _clock()
+
+    def mesh(self, name):
+        "Uploaded TrackedDeviceMesh of render model name, or None"
+        return self.meshes.get(name)
+
+    def update_gl(self, budget_ms=2.0, user=None):
+        """
+        Uploads the meshes of render models that finished loading, for up to
+        budget_ms, and deletes the meshes unused for eviction_seconds.
+
+        Each actor using the registry calls it once per frame, as user. Only
+        the first call of a frame does any work, and a frame starts with the
+        call of a user that already called in the previous frame.
+        """
+        if user is not None:
+            if self._frame_users and user not in self._frame_users:
+                self._frame_users.add(user)
+                return
+            self._frame_users = set([user])
+        deadline = _clock() + 1e-3 * budget_ms
+        self._upload(deadline)
+        if self._unused_since:
+            self._evict(_clock() - self.eviction_seconds)
+
+    def _upload(self, deadline):
+        while True:
+            if self._uploading is None:
+                loaded = self.loader.pop_completed()
+                if loaded is None:
+                    return
+                if loaded.error != openvr.VRRenderModelError_None:
+                    # Stays a placeholder, until evicted
+                    self._failed.add(loaded.name)
+                    continue
+                self._uploading = self._create_mesh(loaded)
+                self._uploading_from = loaded
+            if not self._uploading.upload_gl(deadline):
+                return
+            mesh = self._uploading
+            self.meshes[mesh.model_name] = mesh
+            self.loader.free(self._uploading_from)
+            self._uploading = None
+            self._uploading_from = None
+            if _clock() >= deadline:
+                return
+
+    def _evict(self, released_before):
+        for name, released in list(self._unused_since.items()):
+            if released > released_before:
+                continue
+            mesh = self.meshes.pop(name, None)
+            if mesh is not None:
+                mesh.dispose_gl()
+            elif name in self._failed:
+                # Loaded again when acquired again
+                self._failed.discard(name)
+            else:
+                # Still loading or uploading; evicted once uploaded
+                continue
+            del self._unused_since[name]
+            self._requested.discard(name)
+
+    def dispose_gl(self):
+        "Deletes all meshes and stops the loader, once the last actor using the registry is disposed"
+        self._users -= 1
+        if self._users > 0:
+            return
+        self._users = 0
+        if self.loader is not None:
+            self.loader.close()
+            if self._uploading_from is not None:
+                self.loader.free(self._uploading_from)
+            self.loader = None
+        for mesh in [self.placeholder, self._uploading] + list(self.meshes.values()):
+            if mesh is not None:
+                mesh.dispose_gl()
+        self.placeholder = None
+        self._uploading = None
+        self._uploading_from = None
+        self.meshes.clear()
+        self._references.clear()
+        self._unused_since.clear()
+        self._requested.clear()
+        self._failed.clear()
+        self._frame_users.clear()
+
+
+_default_registry = None
+
+
+def default_render_model_registry():
+    "The RenderModelRegistry of TrackedDevicesActor objects not given one, created on first use"
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = RenderModelRegistry()
+    return _default_registry
 
 
 class TrackedDevicesActor(object):
     """
     Draws Vive controllers and lighthouses.
+
+    Devices that share a render model are drawn together, with one instanced
+    draw call per render model and render pass. The controller_X_room matrices
+    of all devices drawn in a pass are converted from their poses in one
+    vectorized step, and uploaded in one call to a shader storage buffer that
+    the vertex shader indexes by instance.
+
+    Render models come from a RenderModelRegistry, which loads them on a
+    worker thread and shares them with other actors. update_gl(), which
+    OpenVrGlRenderer calls once per frame, uploads the models that finished
+    loading, for at most upload_budget_ms per frame, once for all actors
+    sharing the registry. Until its render model
+    is uploaded, or if it fails to load, a device is drawn as a small gray
+    box.
+
+    Inside OpenVrGlRenderer, the devices are drawn with the eye matrices of
+    the renderer's frame uniform buffer, and the matrices passed to
+    display_gl() and display_gl_stereo() are not uploaded again. Applications
+    that draw the actor without OpenVrGlRenderer call update_gl() themselves,
+    and the actor uploads the matrices passed to it with a
+    FallbackFrameUniforms.
     """
     
-    def __init__(self, pose_array):
+    def __init__(self, pose_array, properties=None, registry=None):
+        """
+        properties is a DevicePropertyCache, which the application may share
+        and feed with the events it polls. By default the actor keeps its own.
+        registry is a RenderModelRegistry, by default default_render_model_registry();
+        give it a render_models.RenderModelCache to keep render models across runs.
+        """
+        if registry is None:
+            registry = default_render_model_registry()
+        self.registry = registry
         self.shader = 0
+        if not isinstance(pose_array, PoseBuffer):
+            pose_array = PoseBuffer(poses=pose_array)
         self.poses = pose_array
-        self.meshes = dict()
+        if properties is None:
+            properties = DevicePropertyCache()
+        self.properties = properties
+        self._connected = numpy.zeros_like(self.poses.connected)
         self.show_controllers_only = True
+        self.upload_budget_ms = 2.0
+        self.model_matrix_buffer = 0
+        self.frame_uniforms = FallbackFrameUniforms()
+        # Index into _mesh_names of the mesh of each device, or -1 if it is not drawn
+        self._mesh_index = numpy.full(len(self.poses), -1, dtype=numpy.int32)
+        self._mesh_names = []
+        # Render model names acquired from the registry, those of the devices drawn
+        self._acquired = set()
+        # Devices whose mesh has been looked up since they last connected
+        self._checked = numpy.zeros(len(self.poses), dtype=numpy.bool_)
+        self._controllers_only = self.show_controllers_only
+
+    @property
+    def meshes(self):
+        "Uploaded meshes of the devices drawn, by render model name"
+        return dict((name, self.registry.meshes[name]) for name in self._acquired if name in self.registry.meshes)
     
     def _check_devices(self):
         "Enumerate OpenVR tracked devices and check whether any need to be initialized"
-        for i in range(1, len(self.poses)):
-            pose = self.poses[i]
-            if not pose.bDeviceIsConnected:
-                continue
-            if not pose.bPoseIsValid:
+        # A device that disconnected or appeared may have been swapped for another
+        changed = numpy.flatnonzero(self.poses.connected != self._connected)
+        for i in changed:
+            self.properties.invalidate(i)
+        self._connected[:] = self.poses.connected
+        self._checked[changed] = False
+        self._mesh_index[changed] = -1
+        if self._controllers_only != self.show_controllers_only:
+            self._controllers_only = self.show_controllers_only
+            self._checked[:] = False
+            self._mesh_index[:] = -1
+        unchecked = numpy.flatnonzero(self.poses.connected & self.poses.valid & ~self._checked)
+        if len(changed) == 0 and len(unchecked) == 0:
+            return
+        for i in unchecked:
+            self._checked[i] = True
+            if i == openvr.k_unTrackedDeviceIndex_Hmd:
                 continue
             if self.show_controllers_only:
-                device_class = openvr.VRSystem().getTrackedDeviceClass(i)
+                device_class = self.properties.device_class(i)
                 if not device_class == openvr.TrackedDeviceClass_Controller:
                     continue
-            model_name = openvr.VRSystem().getStringTrackedDeviceProperty(i, openvr.Prop_RenderModelName_String)
-            # Create a new mesh object, if necessary
-            if not model_name in self.meshes:
-                self.meshes[model_name] = TrackedDeviceMesh(model_name)
+            model_name = self.properties.render_model_name(i)
+            if not model_name in self._mesh_names:
+                self._mesh_names.append(model_name)
+            self._mesh_index[i] = self._mesh_names.index(model_name)
+        # Hold the render models of the devices drawn, and only those
+        used = set(self._mesh_names[k] for k in numpy.unique(self._mesh_index[self._mesh_index >= 0]))
+        for name in used - self._acquired:
+            self.registry.acquire(name)
+        for name in self._acquired - used:
+            self.registry.release(name)
+        self._acquired = used
     
     def init_gl(self):
         vertex_shader = compileShader(
@@ -146,21 +438,33 @@ class TrackedDevicesActor(object):
             layout(location = 1) in vec3 in_Normal;
             layout(location = 2) in vec2 in_TexCoord;
             
-            layout(location = 0) uniform mat4 projection = mat4(1);
-            layout(location = 4) uniform mat4 model_view = mat4(1);
-            layout(location = 8) uniform mat4 normal_matrix = mat4(1);
+            // controller_X_room matrices of the devices drawn, see display_gl_instances()
+            layout(std430, binding = 0) readonly buffer ModelMatrices {
+              mat4 model_matrices[];
+            };
+            layout(location = 0) uniform int first_instance = 0;
             
             out vec3 color;
             out vec2 fragTexCoord;
             
+            mat4 frame_projection(int eye);
+            mat4 frame_view(int eye);
+            int frame_eye_count();
+            vec4 stereo_position(vec4 position, int eye);
+            
             void main() {
-              gl_Position = projection * model_view * vec4(in_Position, 1.0);
-              vec3 normal = normalize((normal_matrix * vec4(in_Normal, 0)).xyz);
+              int eye = gl_InstanceID % frame_eye_count();
+              mat4 model_matrix = model_matrices[first_instance + gl_InstanceID / frame_eye_count()];
+              gl_Position = frame_projection(eye) * frame_view(eye) * model_matrix * vec4(in_Position, 1.0);
+              if (frame_eye_count() == 2) {
+                  gl_Position = stereo_position(gl_Position, eye);
+              }
+              vec3 normal = normalize((model_matrix * vec4(in_Normal, 0)).xyz);
               color = (normal + vec3(1,1,1)) * 0.5; // color by normal
               fragTexCoord = in_TexCoord;
               // color = vec3(in_TexCoord, 0.5); // color by texture coordinate
             }
-            """), 
+            """) + frame_uniforms_glsl + stereo_vertex_glsl, 
             GL_VERTEX_SHADER)
         fragment_shader = compileShader(
             shader_string("""
@@ -176,28 +480,72 @@ class TrackedDevicesActor(object):
             """), 
             GL_FRAGMENT_SHADER)
         self.shader = compileProgram(vertex_shader, fragment_shader)
+        self.registry.init_gl()
+        self.model_matrix_buffer = glGenBuffers(1)
+        glBindBuffer(GL_SHADER_STORAGE_BUFFER, self.model_matrix_buffer)
+        glBufferData(GL_SHADER_STORAGE_BUFFER, len(self.poses) * 16 * sizeof(c_float), None, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_SHADER_STORAGE_BUFFER, 0)
         self._check_devices()
         glEnable(GL_DEPTH_TEST)
         
-    def display_gl(self, modelview, projection):
+    def update_gl(self):
+        "Looks up the render models of new devices, and uploads those that finished loading"
         self._check_devices()
+        self.registry.update_gl(self.upload_budget_ms, self)
+
+    def display_gl(self, modelview, projection):
+        self.frame_uniforms.bind(modelview, projection)
         glEnable(GL_DEPTH_TEST)
         glUseProgram(self.shader)
-        glUniformMatrix4fv(0, 1, False, projection)
-        for i in range(1, len(self.poses)):
-            pose = self.poses[i]
-            if not pose.bPoseIsValid:
-                continue
-            model_name = openvr.VRSystem().getStringTrackedDeviceProperty(i, openvr.Prop_RenderModelName_String)
-            if not model_name in self.meshes:
-                continue # Come on, we already tried to load it a moment ago. Maybe next time.
-            mesh = self.meshes[model_name]
-            mesh.display_gl(modelview, projection, pose)
+        self._display_meshes(1)
+
+    def display_gl_stereo(self, modelviews, projections):
+        "Draws the devices for both eyes of single-pass stereo, as two instances of each mesh"
+        self.frame_uniforms.bind(modelviews, projections)
+        glEnable(GL_DEPTH_TEST)
+        glUseProgram(self.shader)
+        self._display_meshes(2)
+
+    def _display_meshes(self, eye_count):
+        mesh_index = self._mesh_index
+        devices = numpy.flatnonzero(self.poses.valid & (mesh_index >= 0))
+        if len(devices) == 0:
+            return
+        names = self._mesh_names
+        meshes = [self.registry.mesh(name) for name in names]
+        # Devices whose mesh is not uploaded yet are drawn with the placeholder, last
+        placeholder_index = len(names)
+        draw_index = numpy.array([placeholder_index if mesh is None else k for k, mesh in enumerate(meshes)],
+                                 dtype=numpy.int32)[mesh_index[devices]]
+        meshes.append(self.registry.placeholder)
+        # Devices grouped by mesh, each group drawn as consecutive instances
+        order = numpy.argsort(draw_index, kind='stable')
+        devices = devices[order]
+        counts = numpy.bincount(draw_index[order], minlength=len(meshes))
+        # controller_X_room matrices of all drawn devices at once
+        model_matrices = matrices_for_openvr_poses(self.poses.matrices[devices])
+        # Binding 0 matches the ModelMatrices block of the vertex shader
+        glBindBufferBase(GL_SHADER_STORAGE_BUFFER, 0, self.model_matrix_buffer)
+        glBufferSubData(GL_SHADER_STORAGE_BUFFER, 0, model_matrices.nbytes, model_matrices)
+        glActiveTexture(GL_TEXTURE0)
+        first_instance = 0
+        for mesh, count in zip(meshes, counts.tolist()):
+            if count:
+                mesh.display_gl_instances(first_instance, count, eye_count)
+                first_instance += count
+        glBindVertexArray(0)
     
     def dispose_gl(self):
         glDeleteProgram(self.shader)
         self.shader = 0
-        for key in list(self.meshes):
-            mesh = self.meshes[key]
-            mesh.dispose_gl()
-            del self.meshes[key]
+        if self.model_matrix_buffer:
+            glDeleteBuffers(1, [self.model_matrix_buffer])
+            self.model_matrix_buffer = 0
+        self.frame_uniforms.dispose_gl()
+        for name in self._acquired:
+            self.registry.release(name)
+        self.registry.dispose_gl()
+        self._acquired = set()
+        self._checked[:] = False
+        self._mesh_index[:] = -1
+        self._mesh_names = []
@@ -19,6 +19,8 @@ from OpenGL.arrays import vbo
 import glfw
 import openvr
 
+from openvr.device_properties import DevicePropertyCache
+from openvr.event_buffer import EventBuffer
 from openvr.glframework.glfw_app import GlfwApp
 from openvr.gl_renderer import OpenVrGlRenderer
 from openvr.tracked_devices_actor import TrackedDevicesActor
@@ -642,7 +644,11 @@ class SkyActor(object):
 class SpatialInteractor(object):
     "Composite interactor consisting of both controllers plus maybe other inputs"
     
-    def __init__(self):
+    def __init__(self, properties):
+        self.properties = properties
+        self.event_buffer = EventBuffer()
+        # Controller events that start or stop dragging
+        self.drag_event_types = (openvr.VREvent_ButtonTouch, openvr.VREvent_ButtonUntouch)
         self.translation_history = collections.deque() # array of translation increments
         self.max_history_size = 100
         self.left_controller = ControllerState("left controller")
@@ -653,9 +659,10 @@ class SpatialInteractor(object):
         self.min_velocity = 0.01 # meters per second
 
     def update_controller_states(self):
-        new_event = openvr.VREvent_t()
-        while openvr.VRSystem().pollNextEvent(new_event):
-            self._check_controller_drag(new_event)
+        events = self.event_buffer.drain_events()
+        self.properties.handle_events(events)
+        for event in events[numpy.isin(events['eventType'], self.drag_event_types)]:
+            self._check_controller_drag(event)
         now_is_dragging = self.left_controller.is_dragging or self.right_controller.is_dragging
         
         xform = self._compute_controllers_transform()
@@ -711,16 +718,16 @@ class SpatialInteractor(object):
         self.translation_history.clear()
 
     def _check_controller_drag(self, event):
-        dix = event.trackedDeviceIndex
-        device_class = openvr.VRSystem().getTrackedDeviceClass(dix)
+        dix = event['trackedDeviceIndex']
+        device_class = self.properties.device_class(dix)
         # We only want to watch controller events
         if device_class != openvr.TrackedDeviceClass_Controller:
             return
-        bix = event.data.controller.button
+        bix = event['controller_button']
         # Pay attention to trigger presses only
         if bix != openvr.k_EButton_SteamVR_Trigger:
             return
-        role = openvr.VRSystem().getControllerRoleForTrackedDeviceIndex(dix)
+        role = self.properties.controller_role(dix)
         if role == openvr.TrackedControllerRole_RightHand:
             controller = self.right_controller
             # print("  right controller trigger %s" % action)
@@ -728,7 +735,7 @@ class SpatialInteractor(object):
             controller = self.left_controller
             # print("  left controller trigger %s" % action)
         controller.device_index = dix
-        t = event.eventType
+        t = event['eventType']
         # "Touch" event happens earlier than "Press" event,
         # so allow a light touch for grabbing here
         if t == openvr.VREvent_ButtonTouch:
@@ -798,12 +805,13 @@ if __name__ == "__main__":
     renderer = OpenVrGlRenderer(multisample=2)
     renderer.append(SkyActor())
     # renderer.append(ColorCubeActor())
-    controllers = TrackedDevicesActor(renderer.poses)
+    device_properties = DevicePropertyCache()
+    controllers = TrackedDevicesActor(renderer.poses, device_properties)
     controllers.show_controllers_only = True
     renderer.append(controllers)
     renderer.append(obj)
     renderer.append(FloorActor())
-    interactor = SpatialInteractor()
+    interactor = SpatialInteractor(device_properties)
     with GlfwApp(renderer, "mouse brain") as glfwApp:
         while not glfw.window_should_close(glfwApp.window):
             glfwApp.render_scene()
@@ -16,6 +16,7 @@ from PyQt5.QtCore import QTimer
 from PyQt5.QtWebEngineWidgets import QWebEngineView
 from jinja2 import Environment, FileSystemLoader
 import openvr
+from openvr.pose_buffer import PoseBuffer
 
 jinja_env = Environment(
         loader=FileSystemLoader('.'),
@@ -68,8 +69,7 @@ class MainWindow(QWidget):
         
         # XXX check result
         openvr.init(openvr.VRApplication_Scene)        
-        poses_t = openvr.TrackedDevicePose_t * openvr.k_unMaxTrackedDeviceCount
-        self.poses = poses_t()
+        self.poses = PoseBuffer(openvr.k_unMaxTrackedDeviceCount)
         
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_page)
@@ -96,16 +96,16 @@ class MainWindow(QWidget):
                 beacon_indices.append(i)
                 
             model_name = vrsys.getStringTrackedDeviceProperty(i, openvr.Prop_RenderModelName_String)            
-            pose = self.poses[i]            
             
+            # NumPy views into self.poses, no per-field ctypes access
             poses[i] = dict(
                 model_name=model_name,
-                device_is_connected=pose.bDeviceIsConnected,
-                valid=pose.bPoseIsValid,
-                tracking_result=pose.eTrackingResult,
-                d2a=pose.mDeviceToAbsoluteTracking,
-                velocity=pose.vVelocity,                   # m/s
-                angular_velocity=pose.vAngularVelocity     # radians/s?
+                device_is_connected=self.poses.connected[i],
+                valid=self.poses.valid[i],
+                tracking_result=self.poses.tracking_result[i],
+                d2a=self.poses.matrices[i],
+                velocity=self.poses.velocity[i],                   # m/s
+                angular_velocity=self.poses.angular_velocity[i]    # radians/s?
             )
                     
         template = jinja_env.get_template('status.html')
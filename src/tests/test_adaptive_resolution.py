@@ -0,0 +1,79 @@
+#!/bin/env python
+
+import unittest
+
+import openvr
+from openvr.adaptive_resolution import ResolutionController
+from openvr.simulator import SimulatedRuntime
+
+
+class TestResolutionController(unittest.TestCase):
+
+    def controller(self):
+        return ResolutionController(min_scale=0.5, max_scale=1.0, headroom=0.1, hysteresis=0.15,
+                                    step=0.05, sample_frames=10, frame_budget_ms=10.0)
+
+    def test_lowers_scale_over_target(self):
+        controller = self.controller()
+        for _ in range(9):
+            self.assertEqual(1.0, controller.update(9.5))
+        # Pixel count scaled by target / measured
+        self.assertAlmostEqual((9.0 / 9.5) ** 0.5, controller.update(9.5))
+        self.assertEqual(1, controller.decreases)
+
+    def test_reacts_to_a_frame_over_budget(self):
+        controller = self.controller()
+        controller.update(5.0)
+        controller.update(5.0)
+        self.assertEqual(1.0, controller.update(5.0))
+        self.assertEqual(0.5, controller.update(100.0))
+
+    def test_hysteresis(self):
+        controller = self.controller()
+        controller.scale = 0.8
+        # Below the target, but within the hysteresis band
+        for _ in range(30):
+            controller.update(8.0)
+        self.assertEqual(0.8, controller.scale)
+        for _ in range(10):
+            controller.update(4.0)
+        self.assertAlmostEqual(0.85, controller.scale)
+        for _ in range(100):
+            controller.update(1.0)
+        self.assertEqual(1.0, controller.scale)
+        self.assertEqual(0, controller.decreases)
+
+    def test_viewport_size(self):
+        controller = self.controller()
+        controller.scale = 0.5
+        self.assertEqual((756, 840), controller.viewport_size(1512, 1680))
+
+
+class TestResolutionControllerWithCompositor(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = SimulatedRuntime(paced=False, refresh_rate=120.0, gpu_frame_ms=5.0)
+        openvr.setBackend(self.runtime)
+        self.vr_system = openvr.init(openvr.VRApplication_Scene)
+        self.compositor = openvr.VRCompositor()
+
+    def tearDown(self):
+        openvr.shutdown()
+        openvr.setBackend(None)
+
+    def test_update_from_compositor(self):
+        controller = ResolutionController(sample_frames=5)
+        controller.init(self.vr_system)
+        self.assertAlmostEqual(1000.0 / 120.0, controller.frame_budget_ms)
+        self.runtime.gpu_frame_ms = 10.5
+        for _ in range(20):
+            self.compositor.waitGetPoses(None, 0, None, 0)
+            controller.update_from_compositor(self.compositor)
+            # Each completed frame is accounted for once
+            controller.update_from_compositor(self.compositor)
+        self.assertLess(controller.scale, 1.0)
+        self.assertGreaterEqual(controller.scale, controller.min_scale)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/bin/env python
+
+import asyncio
+import unittest
+
+import openvr
+from openvr.aio import stream_events, stream_poses
+from openvr.simulator import SimulatedRuntime
+
+
+class TestAio(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = SimulatedRuntime(paced=False)
+        openvr.setBackend(self.runtime)
+        openvr.init(openvr.VRApplication_Scene)
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+        openvr.shutdown()
+        openvr.setBackend(None)
+
+    def test_stream_poses(self):
+        async def take(count):
+            result = []
+            async with stream_poses(rate_hz=200.0) as poses:
+                async for batch in poses:
+                    result.append(batch)
+                    if len(result) == count:
+                        break
+            return result
+        batches = self.loop.run_until_complete(take(3))
+        self.assertEqual(3, len(batches))
+        self.assertLessEqual(batches[0].time, batches[-1].time)
+        self.assertTrue(batches[-1].poses['bPoseIsValid'][openvr.k_unTrackedDeviceIndex_Hmd])
+        self.assertAlmostEqual(1.7, batches[-1].poses['mDeviceToAbsoluteTracking'][0, 1, 3], places=5)
+
+    def test_stream_events(self):
+        async def take(count):
+            result = []
+            stream = stream_events(types=[openvr.VREvent_ButtonPress], rate_hz=200.0)
+            async for event in stream:
+                result.append(event)
+                if len(result) == count:
+                    break
+            stream.close()
+            return result
+        for _ in range(300):
+            self.runtime.queue_event(openvr.VREvent_TouchPadMove, 1)
+        self.runtime.set_buttons(1, pressed=1 << openvr.k_EButton_SteamVR_Trigger)
+        self.runtime.set_buttons(2, pressed=1 << openvr.k_EButton_Grip)
+        events = self.loop.run_until_complete(take(2))
+        self.assertEqual([1, 2], [int(e['trackedDeviceIndex']) for e in events])
+        self.assertEqual(openvr.k_EButton_Grip, events[1]['controller_button'])
+
+    def test_drop_oldest(self):
+        async def consume(stream):
+            async for event in stream:
+                return event
+        for k in range(10):
+            self.runtime.queue_event(openvr.VREvent_TouchPadMove, k)
+        stream = stream_events(maxsize=4, rate_hz=200.0)
+        first = self.loop.run_until_complete(consume(stream))
+        stream.close()
+        self.assertEqual(6, stream.dropped)
+        self.assertEqual(6, first['trackedDeviceIndex'])
+
+    def test_sampling_error(self):
+        async def take():
+            async with stream_poses(rate_hz=200.0, vr_system=_FailingSystem()) as poses:
+                async for batch in poses:
+                    return batch
+        with self.assertRaises(openvr.OpenVRError):
+            self.loop.run_until_complete(asyncio.wait_for(take(), 5.0))
+
+
+class _FailingSystem(object):
+    "IVRSystem whose poses cannot be read"
+
+    def getDeviceToAbsoluteTrackingPose(self, origin, predicted_seconds, count, poses):
+        raise openvr.OpenVRError("VRInitError_Init_NotInitialized")
+
+
+if __name__ == '__main__':
+    unittest.main()
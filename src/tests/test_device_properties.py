@@ -0,0 +1,59 @@
+#!/bin/env python
+
+import unittest
+
+import openvr
+from openvr.device_properties import DevicePropertyCache
+from openvr.simulator import SimulatedRuntime
+
+
+class TestDevicePropertyCache(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = SimulatedRuntime(paced=False)
+        openvr.setBackend(self.runtime)
+        openvr.init(openvr.VRApplication_Scene)
+        self.cache = DevicePropertyCache()
+
+    def tearDown(self):
+        openvr.shutdown()
+        openvr.setBackend(None)
+
+    def test_properties(self):
+        self.assertEqual(openvr.TrackedDeviceClass_HMD, self.cache.device_class(0))
+        self.assertEqual(openvr.TrackedControllerRole_LeftHand, self.cache.controller_role(1))
+        self.assertEqual(b"SIM-2", self.cache.serial_number(2))
+        self.assertEqual(b"simulated_controller", self.cache.render_model_name(1))
+        self.assertEqual(b"simulated_base_station", self.cache.model_number(3))
+        self.assertEqual(openvr.TrackedDeviceClass_Invalid, self.cache.device_class(10))
+
+    def test_invalidated_by_events(self):
+        prop = openvr.Prop_RenderModelName_String
+        self.assertEqual(b"simulated_controller", self.cache.render_model_name(1))
+        # Without an event, the cached value is still returned
+        self.runtime.devices[1].properties[prop] = b"changed"
+        self.assertEqual(b"simulated_controller", self.cache.render_model_name(1))
+        self.runtime.set_property(2, prop, b"other")
+        self.runtime.set_property(1, prop, b"changed")
+        event = openvr.VREvent_t()
+        invalidated = []
+        while openvr.VRSystem().pollNextEvent(event):
+            invalidated.append(self.cache.handle_event(event))
+        self.assertEqual([True, True], invalidated)
+        self.assertEqual(b"changed", self.cache.render_model_name(1))
+        self.assertEqual(b"other", self.cache.render_model_name(2))
+
+    def test_unrelated_events_keep_cache(self):
+        self.assertEqual(b"SIM-1", self.cache.serial_number(1))
+        self.runtime.devices[1].properties[openvr.Prop_SerialNumber_String] = b"changed"
+        event = openvr.VREvent_t()
+        event.eventType = openvr.VREvent_ButtonPress
+        event.trackedDeviceIndex = 1
+        self.assertFalse(self.cache.handle_event(event))
+        self.assertEqual(b"SIM-1", self.cache.serial_number(1))
+        self.cache.invalidate()
+        self.assertEqual(b"changed", self.cache.serial_number(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/bin/env python
+
+import unittest
+
+import numpy
+
+try:
+    # Selects PyOpenGL's EGL platform, so it comes before the other modules using OpenGL
+    from openvr.glframework.egl_app import EglApp
+    from OpenGL.GL import glBindFramebuffer, glGetError, glReadPixels, \
+        GL_NO_ERROR, GL_READ_FRAMEBUFFER, GL_RGBA, GL_UNSIGNED_BYTE
+    from openvr.color_cube_actor import ColorCubeActor
+    from openvr.gl_renderer import OpenVrGlRenderer
+    from openvr.tracked_devices_actor import TrackedDevicesActor
+except ImportError:  # PyOpenGL is not installed
+    EglApp = None
+
+import openvr
+from openvr.simulator import SimulatedRuntime, _translation, default_devices
+
+
+"""
+Renders with EglApp against the simulated runtime. The tests of other
+modules that need an OpenGL context use the helpers of this module.
+"""
+
+
+def scene_runtime(**kwargs):
+    "Unpaced SimulatedRuntime with small eye textures, whose HMD sees the color cube and the controllers"
+    devices = default_devices()
+    devices[openvr.k_unTrackedDeviceIndex_Hmd].pose = _translation(0, 1.15, 0.6)
+    runtime = SimulatedRuntime(paced=False, devices=devices, **kwargs)
+    runtime.render_target_size = (96, 108)
+    return runtime
+
+
+def egl_app(renderer):
+    "EglApp of renderer; raises unittest.SkipTest where EGL is not available"
+    if EglApp is None:
+        raise unittest.SkipTest("PyOpenGL is not installed")
+    try:
+        return EglApp(renderer)
+    except Exception as exc:
+        raise unittest.SkipTest("No EGL context: %s" % exc)
+
+
+def read_framebuffer(fb):
+    "Color buffer of an OpenVrFramebuffer, resolved if multisampled, as a height x width x RGBA array"
+    glBindFramebuffer(GL_READ_FRAMEBUFFER, fb.resolve_fb if fb.multisample > 0 else fb.fb)
+    pixels = glReadPixels(0, 0, fb.width, fb.height, GL_RGBA, GL_UNSIGNED_BYTE)
+    glBindFramebuffer(GL_READ_FRAMEBUFFER, 0)
+    return numpy.frombuffer(pixels, numpy.uint8).reshape(fb.height, fb.width, 4)
+
+
+def eye_images(renderer):
+    "The left and right eye images of the last frame, side by side"
+    if renderer.single_pass_stereo:
+        return read_framebuffer(renderer.stereo_fb).copy()
+    return numpy.concatenate([read_framebuffer(renderer.left_fb), read_framebuffer(renderer.right_fb)], axis=1)
+
+
+def color_count(image):
+    return len(numpy.unique(image.reshape(-1, 4), axis=0))
+
+
+@unittest.skipIf(EglApp is None, "PyOpenGL is not installed")
+class TestEglApp(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = scene_runtime()
+        openvr.setBackend(self.runtime)
+
+    def tearDown(self):
+        openvr.setBackend(None)
+
+    def test_render(self):
+        renderer = OpenVrGlRenderer(window_size=(64, 48))
+        renderer.do_mirror = True
+        renderer.append(ColorCubeActor())
+        devices = TrackedDevicesActor(renderer.poses)
+        renderer.append(devices)
+        with egl_app(renderer) as app:
+            app.run_loop(frame_count=3)
+            self.assertEqual(3, app.frame_count)
+            # Both controllers share one render model, drawn once it is uploaded
+            while not devices.meshes and app.frame_count < 1000:
+                app.render_scene()
+            self.assertEqual([b"simulated_controller"], list(devices.meshes))
+            mirror = app.read_pixels()
+            eyes = eye_images(renderer)
+            self.assertEqual(GL_NO_ERROR, glGetError())
+        self.assertEqual(2 * app.frame_count, self.runtime.submit_count)
+        self.assertEqual((48, 64, 4), mirror.shape)
+        # The mirror draws the left eye view again, into the window
+        self.assertGreater(color_count(mirror), 1)
+        self.assertEqual((108, 192, 4), eyes.shape)
+        left, right = eyes[:, :96], eyes[:, 96:]
+        # Clear color, color cube and controllers
+        self.assertGreaterEqual(color_count(left), 3)
+        # The eyes see the scene from different positions
+        self.assertFalse(numpy.array_equal(left, right))
+        # The controllers' gray texture
+        self.assertTrue((eyes[..., :3] == 200).all(axis=2).any())
+
+    def test_run_loop_stops_after_close(self):
+        renderer = OpenVrGlRenderer(window_size=(16, 16))
+        with egl_app(renderer) as app:
+            renderer.append(_ClosingActor(app, 2))
+            app.run_loop()
+        self.assertEqual(2, app.frame_count)
+
+    def test_renderer_without_actors(self):
+        # OpenVrGlRenderer is a list of actors, false when empty
+        renderer = OpenVrGlRenderer(window_size=(16, 16))
+        with egl_app(renderer) as app:
+            app.run_loop(frame_count=2)
+        self.assertEqual(4, self.runtime.submit_count)
+
+
+class _ClosingActor(object):
+    "Closes app after frame_count frames"
+
+    def __init__(self, app, frame_count):
+        self.app = app
+        self.frame_count = frame_count
+
+    def init_gl(self):
+        pass
+
+    def display_gl(self, modelview, projection):
+        if self.app.frame_count + 1 >= self.frame_count:
+            self.app.close()
+
+    def dispose_gl(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/bin/env python
+
+import unittest
+
+import numpy
+
+import openvr
+from openvr.device_properties import DevicePropertyCache
+from openvr.event_buffer import EventBuffer
+from openvr.simulator import SimulatedRuntime
+
+
+class TestEventBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = SimulatedRuntime(paced=False)
+        openvr.setBackend(self.runtime)
+        openvr.init(openvr.VRApplication_Scene)
+
+    def tearDown(self):
+        openvr.shutdown()
+        openvr.setBackend(None)
+
+    def test_layout_matches_ctypes(self):
+        buffer = EventBuffer(4)
+        event = buffer[2]
+        event.eventType = openvr.VREvent_ButtonPress
+        event.trackedDeviceIndex = 3
+        event.eventAgeSeconds = 0.5
+        event.data.controller.button = openvr.k_EButton_Grip
+        record = buffer.array[2]
+        self.assertEqual(openvr.VREvent_ButtonPress, record['eventType'])
+        self.assertEqual(3, record['trackedDeviceIndex'])
+        self.assertEqual(0.5, record['eventAgeSeconds'])
+        self.assertEqual(openvr.k_EButton_Grip, record['controller_button'])
+        self.assertEqual(openvr.k_EButton_Grip, record['data'][0])
+
+    def test_drain(self):
+        for _ in range(10):
+            self.runtime.queue_event(openvr.VREvent_TouchPadMove, 1)
+        self.runtime.set_buttons(2, pressed=1 << openvr.k_EButton_SteamVR_Trigger)
+        buffer = EventBuffer(8)
+        events = buffer.drain_events(max_events=4)
+        self.assertEqual(4, len(events))
+        self.assertTrue(numpy.all(events['eventType'] == openvr.VREvent_TouchPadMove))
+        events = buffer.drain_events()
+        self.assertEqual(7, len(events))
+        self.assertEqual(openvr.VREvent_ButtonPress, events['eventType'][-1])
+        self.assertEqual(0, len(buffer.drain_events()))
+
+    def test_filter_types(self):
+        for _ in range(5):
+            self.runtime.queue_event(openvr.VREvent_TouchPadMove, 1)
+        self.runtime.set_buttons(2, pressed=1 << openvr.k_EButton_SteamVR_Trigger)
+        events = EventBuffer().drain_events(types=[openvr.VREvent_ButtonPress])
+        self.assertEqual(1, len(events))
+        self.assertEqual(2, events['trackedDeviceIndex'][0])
+        self.assertEqual(openvr.k_EButton_SteamVR_Trigger, events['controller_button'][0])
+        # Filtered events were removed from the queue all the same
+        self.assertEqual(0, len(EventBuffer().drain_events()))
+
+    def test_property_cache_invalidation(self):
+        cache = DevicePropertyCache()
+        self.assertEqual(b"SIM-1", cache.serial_number(1))
+        self.runtime.queue_event(openvr.VREvent_TouchPadMove, 1)
+        self.runtime.set_property(1, openvr.Prop_SerialNumber_String, b"new")
+        self.assertTrue(cache.handle_events(EventBuffer().drain_events()))
+        self.assertEqual(b"new", cache.serial_number(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+#!/bin/env python
+
+import threading
+import time
+import unittest
+
+import numpy
+
+import openvr
+from openvr.frame_pipeline import FramePipeline, PoseLatch
+from openvr.pose_buffer import PoseBuffer
+from openvr.simulator import SimulatedRuntime, _translation
+
+
+def _moving_hmd(runtime):
+    "Moves the HMD along x at one meter per second of simulation time"
+    runtime.devices[openvr.k_unTrackedDeviceIndex_Hmd].pose = lambda seconds: _translation(seconds, 1.7, 0)
+
+
+class TestPoseLatch(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = SimulatedRuntime(paced=False)
+        _moving_hmd(self.runtime)
+        openvr.setBackend(self.runtime)
+        self.vr_system = openvr.init(openvr.VRApplication_Scene)
+        self.compositor = openvr.VRCompositor()
+        self.poses = PoseBuffer()
+
+    def tearDown(self):
+        openvr.shutdown()
+        openvr.setBackend(None)
+
+    def frame(self, latch):
+        self.compositor.waitGetPoses(self.poses, len(self.poses), None, 0)
+        latch.update_from_compositor(self.compositor)
+        frame_index = self.compositor.getFrameTiming(0)[1].m_nFrameIndex
+        latch.begin_frame(frame_index)
+        return frame_index
+
+    def test_init(self):
+        latch = PoseLatch()
+        latch.init(self.vr_system, self.compositor)
+        self.assertAlmostEqual(1.0 / 90.0, latch.frame_duration)
+        self.assertAlmostEqual(0.011, latch.seconds_from_vsync_to_photons)
+        self.assertEqual(openvr.TrackingUniverseStanding, latch.origin)
+
+    def test_latch_predicts_photons(self):
+        latch = PoseLatch()
+        latch.init(self.vr_system, self.compositor)
+        self.frame(latch)
+        seconds = latch.seconds_to_photons()
+        self.assertGreater(seconds, latch.seconds_from_vsync_to_photons)
+        self.assertLess(seconds, 2 * latch.frame_duration + latch.seconds_from_vsync_to_photons)
+        expected = self.runtime.seconds() + seconds
+        latch.latch(self.poses)
+        x = self.poses.matrices[openvr.k_unTrackedDeviceIndex_Hmd, 0, 3]
+        self.assertAlmostEqual(expected, x, delta=0.002)
+        self.assertAlmostEqual(1e3 * seconds, latch.frames.last()['latency_ms'][0], delta=2.0)
+
+    def test_disabled_keeps_poses(self):
+        latch = PoseLatch(enabled=False)
+        latch.init(self.vr_system, self.compositor)
+        self.frame(latch)
+        before = self.poses.array.copy()
+        time.sleep(0.002)
+        latch.latch(self.poses)
+        numpy.testing.assert_array_equal(before, self.poses.array)
+        frame = latch.frames.last()[0]
+        # Measured from the return of waitGetPoses()
+        self.assertGreaterEqual(frame['latency_ms'], 1e3 * latch.seconds_from_vsync_to_photons)
+        self.assertGreaterEqual(frame['wait_to_latch_ms'], 2.0)
+
+    def test_late_frames(self):
+        latch = PoseLatch()
+        latch.init(self.vr_system, self.compositor)
+        first = self.frame(latch)
+        latch.latch(self.poses)
+        self.assertEqual(-1, latch.frames.last()['late_frames'][0])
+        # Two vsyncs pass before the next frame starts, so the first one was displayed late
+        self.runtime.paced = True
+        time.sleep(2.5 * latch.frame_duration)
+        self.frame(latch)
+        latch.latch(self.poses)
+        frames = latch.frames.last()
+        self.assertEqual(first, frames['frame_index'][0])
+        self.assertGreaterEqual(frames['late_frames'][0], 1)
+        self.assertAlmostEqual(frames['latency_ms'][0] + 1e3 * frames['late_frames'][0] * latch.frame_duration,
+                               frames['measured_ms'][0], places=3)
+        stats = latch.stats(percentiles=(50,))
+        self.assertEqual((2, 1), (stats.frames, stats.late_frames))
+        self.assertEqual(frames['measured_ms'][0], stats.measured_ms[0])
+
+
+class TestFramePipeline(unittest.TestCase):
+
+    def test_state_lags_one_frame(self):
+        threads = []
+
+        def update(poses):
+            threads.append(threading.current_thread())
+            return poses.matrices[0, 0, 3]
+        pipeline = FramePipeline(update)
+        try:
+            for frame in range(5):
+                pipeline.game_poses.matrices[0, 0, 3] = frame
+                state = pipeline.begin_frame()
+                # The game poses of this frame are simulated for the next one
+                self.assertEqual(max(frame - 1, 0), state)
+                self.assertIs(state, pipeline.state)
+        finally:
+            pipeline.stop()
+        self.assertIs(threading.current_thread(), threads[0])
+        self.assertNotIn(threading.current_thread(), threads[1:])
+        # One update per frame, none repeated with the poses of the first frame
+        self.assertEqual(5, len(threads))
+
+    def test_errors_are_raised_on_the_render_thread(self):
+        def update(poses):
+            if poses.matrices[0, 0, 3] == 1:
+                raise ValueError("simulation failed")
+            return 0
+        pipeline = FramePipeline(update)
+        try:
+            pipeline.begin_frame()
+            pipeline.game_poses.matrices[0, 0, 3] = 1
+            pipeline.begin_frame()
+            with self.assertRaises(ValueError):
+                pipeline.begin_frame()
+        finally:
+            pipeline.stop()
+
+    def test_stalls(self):
+        pipeline = FramePipeline(lambda poses: time.sleep(0.01))
+        pipeline.begin_frame()
+        pipeline.begin_frame()
+        pipeline.begin_frame()
+        pipeline.stop()
+        self.assertEqual(1, pipeline.stalls)
+        self.assertGreater(pipeline.stall_seconds, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
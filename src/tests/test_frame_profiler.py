@@ -0,0 +1,82 @@
+#!/bin/env python
+
+import time
+import unittest
+
+import numpy
+
+import openvr
+from openvr.frame_profiler import FrameProfiler, PHASE_MATRICES, PHASE_SIMULATION, PHASE_WAIT_POSES
+from openvr.frame_timing import FrameTimingCollector
+from openvr.simulator import SimulatedRuntime
+
+
+class TestFrameProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = SimulatedRuntime(paced=True, refresh_rate=200.0)
+        openvr.setBackend(self.runtime)
+        openvr.init(openvr.VRApplication_Scene)
+        self.compositor = openvr.VRCompositor()
+
+    def tearDown(self):
+        openvr.shutdown()
+        openvr.setBackend(None)
+
+    def frame(self, profiler, work_seconds=0.0, stall_seconds=0.0):
+        "Profiles a frame like OpenVrGlRenderer.render_scene() does"
+        t = profiler.begin_frame()
+        self.compositor.waitGetPoses(None, 0, None, 0)
+        t = profiler.lap(PHASE_WAIT_POSES, t)
+        profiler.set_frame_index(self.compositor.getFrameTiming(0)[1].m_nFrameIndex)
+        time.sleep(stall_seconds)
+        t = profiler.lap(PHASE_SIMULATION, t)
+        time.sleep(work_seconds)
+        t = profiler.lap(PHASE_MATRICES, t)
+        t = profiler.lap_actor(1, t)
+        profiler.end_frame()
+
+    def test_stats(self):
+        profiler = FrameProfiler(capacity=8, max_actors=2)
+        self.assertEqual(0, profiler.stats().frames)
+        for _ in range(10):
+            self.frame(profiler, 0.001)
+        stats = profiler.stats(percentiles=(50,))
+        self.assertEqual(8, stats.frames)
+        self.assertGreaterEqual(stats.phase_ms['matrices'][0], 1.0)
+        self.assertLessEqual(stats.work_ms[0], stats.total_ms[0])
+        self.assertEqual((2, 1), stats.actor_ms.shape)
+        self.assertEqual(0.0, stats.actor_ms[0, 0])
+        # The last 8 frames, whichever vsyncs they started at
+        indices = profiler.frames.last()['frame_index']
+        self.assertTrue((numpy.diff(indices) > 0).all())
+        self.assertEqual(self.compositor.getFrameTiming(0)[1].m_nFrameIndex, indices[-1])
+
+    def test_missed_frame_causes(self):
+        profiler = FrameProfiler()
+        collector = FrameTimingCollector()
+        for k in range(6):
+            self.frame(profiler, 0.012 if k == 3 else 0.0)
+        self.compositor.waitGetPoses(None, 0, None, 0)
+        collector.collect()
+        profile, timings = profiler.correlate(collector)
+        self.assertEqual(6, len(profile))
+        self.assertTrue(numpy.array_equal(profile['frame_index'], timings['m_nFrameIndex']))
+        slow_frame = int(profile['frame_index'][3])
+        self.assertIn((slow_frame, 'application'), profiler.missed_frame_causes(collector, frame_budget_ms=5.0))
+
+    def test_simulation_stall(self):
+        profiler = FrameProfiler()
+        collector = FrameTimingCollector()
+        for k in range(6):
+            self.frame(profiler, stall_seconds=0.012 if k == 3 else 0.0)
+        self.compositor.waitGetPoses(None, 0, None, 0)
+        collector.collect()
+        profile, _ = profiler.correlate(collector)
+        stalled_frame = int(profile['frame_index'][3])
+        self.assertGreaterEqual(1e-6 * profile['phase_ns'][3, PHASE_SIMULATION], 12.0)
+        self.assertIn((stalled_frame, 'simulation'), profiler.missed_frame_causes(collector, frame_budget_ms=5.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
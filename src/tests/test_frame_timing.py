@@ -0,0 +1,102 @@
+#!/bin/env python
+
+import unittest
+
+import numpy
+
+import openvr
+from openvr.frame_timing import FrameTimingCollector, RingBuffer
+from openvr.simulator import SimulatedRuntime
+
+
+class TestRingBuffer(unittest.TestCase):
+
+    def test_wrap_around(self):
+        ring = RingBuffer(5, numpy.int32)
+        ring.extend(numpy.arange(3))
+        self.assertEqual([0, 1, 2], ring.last().tolist())
+        ring.extend(numpy.arange(3, 7))
+        self.assertEqual(5, len(ring))
+        self.assertEqual([2, 3, 4, 5, 6], ring.last().tolist())
+        self.assertEqual([5, 6], ring.last(2).tolist())
+        ring.extend(numpy.arange(7, 20))
+        self.assertEqual([15, 16, 17, 18, 19], ring.last().tolist())
+
+    def test_batch_larger_than_capacity(self):
+        ring = RingBuffer(5, numpy.int32)
+        ring.extend(numpy.arange(3))
+        ring.extend(numpy.arange(3, 16))
+        self.assertEqual(16, ring.total)
+        self.assertEqual([11, 12, 13, 14, 15], ring.last().tolist())
+        ring.append(16)
+        self.assertEqual(17, ring.total)
+        self.assertEqual([14, 15, 16], ring.last(3).tolist())
+
+
+class TestFrameTimingCollector(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = SimulatedRuntime(paced=False, gpu_frame_ms=5.0, frame_history=16)
+        openvr.setBackend(self.runtime)
+        openvr.init(openvr.VRApplication_Scene)
+        self.compositor = openvr.VRCompositor()
+
+    def tearDown(self):
+        openvr.shutdown()
+        openvr.setBackend(None)
+
+    def frames(self, count):
+        for _ in range(count):
+            self.compositor.waitGetPoses(None, 0, None, 0)
+
+    def test_get_frame_timings(self):
+        self.frames(6)
+        count, timings = self.compositor.getFrameTimings(8)
+        self.assertEqual(6, count)
+        self.assertEqual([1, 2, 3, 4, 5, 6], [t.m_nFrameIndex for t in timings[:count]])
+        result, timing = self.compositor.getFrameTiming()
+        self.assertTrue(result)
+        self.assertEqual(6, timing.m_nFrameIndex)
+
+    def test_get_frame_timings_checks_the_array_size(self):
+        self.frames(2)
+        with self.assertRaises(ValueError):
+            self.compositor.getFrameTimings(16, (openvr.Compositor_FrameTiming * 8)())
+        with self.assertRaises(ValueError):
+            self.compositor.getFrameTimings(0)
+        count, timings = self.compositor.getFrameTimings(4, (openvr.Compositor_FrameTiming * 8)())
+        self.assertEqual(2, count)
+
+    def test_collect(self):
+        collector = FrameTimingCollector(capacity=64, compositor_history=16)
+        self.assertEqual(0, collector.collect())
+        self.frames(11)
+        self.assertEqual(10, collector.collect())
+        self.assertEqual(0, collector.collect())
+        self.frames(5)
+        self.assertEqual(5, collector.collect())
+        self.assertEqual(list(range(1, 16)), collector.frames.last()['m_nFrameIndex'].tolist())
+        self.assertEqual(0, collector.missed_frames)
+        # More frames than the compositor keeps
+        self.frames(20)
+        self.assertEqual(15, collector.collect())
+        self.assertEqual(5, collector.missed_frames)
+        stats = collector.stats(percentiles=(50, 99))
+        self.assertEqual(30, stats.frames)
+        self.assertEqual([5.0, 5.0], stats.gpu_ms.tolist())
+        self.assertEqual(0, stats.dropped_frames)
+        self.assertEqual(5.0, collector.percentiles('m_flTotalRenderGpuMs', (90,), frames=3)[0])
+
+    def test_restart(self):
+        collector = FrameTimingCollector(compositor_history=16)
+        self.frames(10)
+        collector.collect()
+        openvr.shutdown()
+        openvr.init(openvr.VRApplication_Scene)
+        self.frames(4)
+        self.assertEqual(3, collector.collect())
+        self.assertEqual([1, 2, 3], collector.frames.last(3)['m_nFrameIndex'].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/bin/env python
+
+import unittest
+
+try:
+    from openvr.gl_renderer import FramebufferPool, OpenVrFramebuffer
+except ImportError:  # PyOpenGL is not installed
+    FramebufferPool = None
+
+
+class _Framebuffer(object):
+    "Stands in for an OpenVrFramebuffer, without OpenGL"
+
+    def __init__(self, width, height, multisample, internal_format):
+        self.key = (width, height, internal_format, multisample)
+        self.memory_size = width * height
+        self.disposed = False
+
+    def dispose_gl(self):
+        self.disposed = True
+
+
+@unittest.skipIf(FramebufferPool is None, "PyOpenGL is not installed")
+class TestFramebufferPool(unittest.TestCase):
+
+    def pool(self, budget_bytes):
+        pool = FramebufferPool(budget_bytes)
+        pool._create_framebuffer = _Framebuffer
+        return pool
+
+    def test_reuse(self):
+        pool = self.pool(1000)
+        a = pool.acquire(10, 10)
+        b = pool.acquire(10, 10, multisample=4)
+        self.assertEqual(2, pool.in_use)
+        pool.release(a)
+        pool.release(b)
+        self.assertIs(b, pool.acquire(10, 10, multisample=4))
+        self.assertIs(a, pool.acquire(10, 10))
+        self.assertIsNot(a, pool.acquire(10, 10))
+        self.assertEqual((2, 3, 0), (pool.hits, pool.misses, pool.evictions))
+        self.assertEqual(300, pool.allocated_bytes)
+
+    def test_least_recently_released_are_evicted(self):
+        pool = self.pool(320)
+        a, b = pool.acquire(10, 10), pool.acquire(10, 5)
+        c = pool.acquire(20, 5)
+        pool.release(b)
+        pool.release(a)
+        d = pool.acquire(10, 12)
+        self.assertTrue(b.disposed)
+        self.assertFalse(a.disposed)
+        self.assertEqual(320, pool.allocated_bytes)
+        # Framebuffers in use may exceed the budget on their own
+        pool.acquire(10, 14)
+        self.assertTrue(a.disposed)
+        self.assertEqual((2, 360), (pool.evictions, pool.allocated_bytes))
+        pool.release(c)
+        self.assertTrue(c.disposed)
+        pool.release(d)
+        self.assertFalse(d.disposed)
+        self.assertEqual(260, pool.allocated_bytes)
+        pool.dispose_gl()
+        self.assertEqual((0, 0), (len(pool), pool.allocated_bytes))
+
+    def test_preallocate(self):
+        pool = self.pool(1000)
+        pool.preallocate(10, 10, multisample=2, count=2)
+        self.assertEqual((2, 0), (len(pool), pool.in_use))
+        pool.acquire(10, 10, multisample=2)
+        pool.acquire(10, 10, multisample=2)
+        self.assertEqual((2, 2), (pool.hits, pool.misses))
+
+    def test_memory_size(self):
+        fb = OpenVrFramebuffer(100, 10, multisample=4)
+        self.assertEqual(1000 * 4 * 8 + 1000 * 4, fb.memory_size)
+        self.assertEqual((100, 10, fb.internal_format, 4), fb.key)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,198 @@
+#!/bin/env python
+
+import time
+import unittest
+import warnings
+
+import numpy
+
+from test_egl_app import EglApp, egl_app, eye_images, read_framebuffer, scene_runtime
+import openvr
+
+if EglApp is not None:
+    from OpenGL.GL import *  # @UnusedWildImport # this comment squelches an IDE warning
+    from openvr.color_cube_actor import ColorCubeActor
+    from openvr.frame_pipeline import FramePipeline
+    from openvr.frame_profiler import FrameProfiler
+    from openvr.gl_renderer import FRAME_UNIFORMS_BINDING, OpenVrGlRenderer, matrixForOpenVrMatrix
+    from openvr.pose_buffer import rigid_inverse
+    from openvr.tracked_devices_actor import TrackedDevicesActor
+
+    class _MonoColorCubeActor(ColorCubeActor):
+        "ColorCubeActor without display_gl_stereo(), drawn once per eye in single-pass stereo"
+        display_gl_stereo = None
+
+    class _MonoTrackedDevicesActor(TrackedDevicesActor):
+        "TrackedDevicesActor without display_gl_stereo(), drawn once per eye in single-pass stereo"
+        display_gl_stereo = None
+
+
+@unittest.skipIf(EglApp is None, "PyOpenGL is not installed")
+class TestSinglePassStereo(unittest.TestCase):
+
+    def setUp(self):
+        openvr.setBackend(scene_runtime())
+
+    def tearDown(self):
+        openvr.setBackend(None)
+
+    def render(self, single_pass_stereo, cube_class=None, devices_class=None):
+        "Eye images once the controllers are drawn"
+        renderer = OpenVrGlRenderer(single_pass_stereo=single_pass_stereo)
+        renderer.append((cube_class or ColorCubeActor)())
+        devices = (devices_class or TrackedDevicesActor)(renderer.poses)
+        renderer.append(devices)
+        with egl_app(renderer) as app:
+            while not devices.meshes and app.frame_count < 1000:
+                app.render_scene()
+            app.render_scene()
+            return eye_images(renderer)
+
+    def test_instanced_matches_sequential(self):
+        sequential = self.render(False)
+        stereo = self.render(True)
+        self.assertEqual(sequential.shape, stereo.shape)
+        numpy.testing.assert_array_equal(sequential, stereo)
+
+    def test_per_eye_fallback_matches_sequential(self):
+        sequential = self.render(False)
+        stereo = self.render(True, _MonoColorCubeActor, _MonoTrackedDevicesActor)
+        numpy.testing.assert_array_equal(sequential, stereo)
+        # Instanced and per-eye actors together
+        stereo = self.render(True, _MonoColorCubeActor)
+        numpy.testing.assert_array_equal(sequential, stereo)
+
+
+@unittest.skipIf(EglApp is None, "PyOpenGL is not installed")
+class TestFallbackFrameUniforms(unittest.TestCase):
+    "Actors drawn without OpenVrGlRenderer upload the matrices passed to them"
+
+    def setUp(self):
+        openvr.setBackend(scene_runtime())
+
+    def tearDown(self):
+        openvr.setBackend(None)
+
+    def draw(self, renderer, fb, width, display):
+        "Draws all actors of renderer into fb, as display(actor) does, outside of the renderer's frame"
+        glBindFramebuffer(GL_FRAMEBUFFER, fb.fb)
+        glViewport(0, 0, width, renderer.viewport_size[1])
+        glClearColor(0.5, 0.5, 0.5, 0.0)
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT | GL_STENCIL_BUFFER_BIT)
+        for actor in renderer:
+            display(actor)
+        fb.resolve(width, renderer.viewport_size[1])
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        return read_framebuffer(fb).copy()
+
+    def test_matches_renderer(self):
+        renderer = OpenVrGlRenderer(hidden_area_mask=False)
+        renderer.append(ColorCubeActor())
+        devices = TrackedDevicesActor(renderer.poses)
+        renderer.append(devices)
+        with egl_app(renderer) as app:
+            while not devices.meshes and app.frame_count < 1000:
+                app.render_scene()
+            app.render_scene()
+            expected = eye_images(renderer)
+            # The renderer unbinds its frame uniforms at the end of each frame
+            self.assertEqual(0, int(glGetIntegeri_v(GL_UNIFORM_BUFFER_BINDING, FRAME_UNIFORMS_BINDING)))
+            modelviews = numpy.matmul(renderer.poses.inverse_device_matrices()[openvr.k_unTrackedDeviceIndex_Hmd],
+                                      renderer.views)
+            projections = renderer.projections
+            width = renderer.viewport_size[0]
+            eyes = [self.draw(renderer, fb, width, lambda actor: actor.display_gl(modelview, projection))
+                    for fb, modelview, projection in zip((renderer.left_fb, renderer.right_fb),
+                                                         modelviews, projections)]
+            numpy.testing.assert_array_equal(expected, numpy.concatenate(eyes, axis=1))
+            # Both eyes at once, as single-pass stereo draws them
+            renderer.single_pass_stereo = True
+            renderer.reallocate_framebuffers()
+            glEnable(GL_CLIP_DISTANCE0)
+            stereo = self.draw(renderer, renderer.stereo_fb, 2 * width,
+                               lambda actor: actor.display_gl_stereo(modelviews, projections))
+            glDisable(GL_CLIP_DISTANCE0)
+            numpy.testing.assert_array_equal(expected, stereo)
+
+
+@unittest.skipIf(EglApp is None, "PyOpenGL is not installed")
+class TestEyeMatrices(unittest.TestCase):
+
+    def setUp(self):
+        openvr.setBackend(scene_runtime())
+
+    def tearDown(self):
+        openvr.setBackend(None)
+
+    def test_matches_matrix_for_openvr_matrix(self):
+        renderer = OpenVrGlRenderer(window_size=(16, 16))
+        with warnings.catch_warnings():
+            # numpy.matrix is deprecated, and the renderer no longer uses it
+            warnings.simplefilter('error', PendingDeprecationWarning)
+            with egl_app(renderer) as app:
+                app.run_loop(frame_count=2)
+                vr_system = openvr.VRSystem()
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', PendingDeprecationWarning)
+                    projections = [matrixForOpenVrMatrix(vr_system.getProjectionMatrix(eye, 0.2, 500.0))
+                                   for eye in (openvr.Eye_Left, openvr.Eye_Right)]
+                    views = [rigid_inverse(matrixForOpenVrMatrix(vr_system.getEyeToHeadTransform(eye)))
+                             for eye in (openvr.Eye_Left, openvr.Eye_Right)]
+        numpy.testing.assert_allclose(renderer.projections, projections)
+        numpy.testing.assert_allclose(renderer.views, views, atol=1e-6)
+
+
+class _SlowUpdateActor(object):
+    "Actor whose per-frame update_gl() takes seconds"
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def init_gl(self):
+        pass
+
+    def update_gl(self):
+        time.sleep(self.seconds)
+
+    def display_gl(self, modelview, projection):
+        pass
+
+    def dispose_gl(self):
+        pass
+
+
+@unittest.skipIf(EglApp is None, "PyOpenGL is not installed")
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        openvr.setBackend(scene_runtime())
+
+    def tearDown(self):
+        openvr.setBackend(None)
+
+    def test_upload_phase(self):
+        profiler = FrameProfiler()
+        renderer = OpenVrGlRenderer(profiler=profiler)
+        renderer.append(_SlowUpdateActor(0.005))
+        with egl_app(renderer) as app:
+            app.run_loop(frame_count=4)
+        stats = profiler.stats(percentiles=(50,))
+        self.assertEqual(4, stats.frames)
+        self.assertGreaterEqual(stats.phase_ms['upload'][0], 5.0)
+        self.assertLess(stats.phase_ms['matrices'][0], 5.0)
+
+    def test_simulation_phase(self):
+        # The simulation takes longer than the render thread, which waits for it
+        pipeline = FramePipeline(lambda poses: time.sleep(0.01))
+        profiler = FrameProfiler()
+        renderer = OpenVrGlRenderer(profiler=profiler, frame_pipeline=pipeline)
+        with egl_app(renderer) as app:
+            app.run_loop(frame_count=5)
+        stats = profiler.stats(percentiles=(50,))
+        self.assertGreater(pipeline.stalls, 0)
+        self.assertGreaterEqual(stats.phase_ms['simulation'][0], 5.0)
+        self.assertLess(stats.phase_ms['matrices'][0], 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/bin/env python
+
+import unittest
+
+import numpy
+
+from test_egl_app import EglApp, egl_app, scene_runtime
+import openvr
+
+if EglApp is not None:
+    from openvr.color_cube_actor import ColorCubeActor
+    from openvr.gl_renderer import OpenVrGlRenderer
+    from openvr.gpu_timer import GpuTimer, PASS_MIRROR, PASS_STEREO
+    from openvr.tracked_devices_actor import TrackedDevicesActor
+
+
+@unittest.skipIf(EglApp is None, "PyOpenGL is not installed")
+class TestGpuTimer(unittest.TestCase):
+
+    def setUp(self):
+        openvr.setBackend(scene_runtime())
+
+    def tearDown(self):
+        openvr.setBackend(None)
+
+    def render(self, frame_count, **kwargs):
+        timer = GpuTimer(**kwargs)
+        renderer = OpenVrGlRenderer(window_size=(64, 48), gpu_timer=timer)
+        renderer.do_mirror = True
+        renderer.append(ColorCubeActor())
+        renderer.append(TrackedDevicesActor(renderer.poses))
+        with egl_app(renderer) as app:
+            app.finish = True
+            app.run_loop(frame_count=frame_count)
+        return timer
+
+    def test_stats(self):
+        timer = self.render(20)
+        frames = timer.frames.last()
+        # The last latency_frames frames are still in flight
+        self.assertEqual(20 - timer.latency_frames, len(frames) + timer.lost_frames + timer.invalid_frames)
+        self.assertGreaterEqual(len(frames), 10)
+        self.assertTrue((numpy.diff(frames['frame_index']) > 0).all())
+        stats = timer.stats()
+        self.assertEqual(len(frames), stats.frames)
+        # No frame of this small scene takes anywhere near a second of GPU time
+        for name in ('left', 'right', 'mirror'):
+            self.assertTrue((stats.pass_ms[name] > 0).all(), name)
+            self.assertTrue((stats.pass_ms[name] < 1000).all(), name)
+        self.assertTrue((stats.pass_ms['stereo'] == 0).all())
+        self.assertTrue((stats.total_ms < 1000).all())
+        self.assertTrue((stats.actor_ms[:2] > 0).all())
+        self.assertTrue((stats.actor_ms[2:] == 0).all())
+        self.assertTrue((stats.clear_ms > 0).all())
+        # Each frame's total is the sum of its sections
+        self.assertTrue((frames['total_ns'] == frames['pass_ns'].sum(axis=1)).all())
+        self.assertTrue((frames['pass_ns'][:, PASS_MIRROR] > 0).all())
+        self.assertTrue((frames['pass_ns'][:, PASS_STEREO] == 0).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
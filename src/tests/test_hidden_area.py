@@ -0,0 +1,100 @@
+#!/bin/env python
+
+import unittest
+
+import numpy
+
+from test_egl_app import EglApp, egl_app, scene_runtime
+import openvr
+from openvr.hidden_area import clip_space_vertices, get_hidden_area_vertices, hidden_area_vertices
+from openvr.simulator import SimulatedRuntime
+
+if EglApp is not None:
+    from OpenGL.GL import glEnable, glIsEnabled, GL_CULL_FACE
+    from openvr.gl_renderer import OpenVrGlRenderer
+
+
+def _triangle_area(vertices):
+    triangles = vertices.reshape(-1, 3, 2)
+    a = triangles[:, 1] - triangles[:, 0]
+    b = triangles[:, 2] - triangles[:, 0]
+    return 0.5 * numpy.abs(a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]).sum()
+
+
+class TestHiddenArea(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = SimulatedRuntime(paced=False)
+        openvr.setBackend(self.runtime)
+        self.vr_system = openvr.init(openvr.VRApplication_Scene)
+
+    def tearDown(self):
+        openvr.shutdown()
+        openvr.setBackend(None)
+
+    def test_view(self):
+        mesh = self.vr_system.getHiddenAreaMesh(openvr.Eye_Left, openvr.k_eHiddenAreaMesh_Standard)
+        vertices = hidden_area_vertices(mesh)
+        self.assertEqual((3 * mesh.unTriangleCount, 2), vertices.shape)
+        self.assertEqual(numpy.float32, vertices.dtype)
+        self.assertEqual(mesh.pVertexData[1].v[0], vertices[1, 0])
+        self.assertEqual(mesh.pVertexData[1].v[1], vertices[1, 1])
+
+    def test_hidden_and_visible_areas_cover_the_texture(self):
+        hidden = get_hidden_area_vertices(openvr.Eye_Right)
+        visible = get_hidden_area_vertices(openvr.Eye_Right, openvr.k_eHiddenAreaMesh_Inverse)
+        self.assertGreaterEqual(hidden.min(), 0.0)
+        self.assertLessEqual(hidden.max(), 1.0)
+        self.assertAlmostEqual(1.0, _triangle_area(hidden) + _triangle_area(visible), places=5)
+        self.assertTrue(0.15 < _triangle_area(hidden) < 0.25)
+
+    def test_line_loop(self):
+        loop = get_hidden_area_vertices(openvr.Eye_Left, openvr.k_eHiddenAreaMesh_LineLoop)
+        self.assertEqual((self.runtime.hidden_area_segments, 2), loop.shape)
+
+    def test_no_mesh(self):
+        openvr.shutdown()
+        openvr.setBackend(SimulatedRuntime(paced=False, hidden_area_segments=0))
+        openvr.init(openvr.VRApplication_Scene)
+        self.assertEqual((0, 2), get_hidden_area_vertices(openvr.Eye_Left).shape)
+
+    def test_clip_space(self):
+        vertices = numpy.array([[0.0, 0.0], [1.0, 0.25]], dtype=numpy.float32)
+        self.assertEqual([[-1.0, 1.0], [1.0, 0.5]], clip_space_vertices(vertices).tolist())
+
+
+class _CullingActor(object):
+    "Enables face culling once, and records whether it is enabled each time it draws"
+
+    def __init__(self):
+        self.cull_face = []
+
+    def init_gl(self):
+        glEnable(GL_CULL_FACE)
+
+    def display_gl(self, modelview, projection):
+        self.cull_face.append(bool(glIsEnabled(GL_CULL_FACE)))
+
+    def dispose_gl(self):
+        pass
+
+
+@unittest.skipIf(EglApp is None, "PyOpenGL is not installed")
+class TestHiddenAreaMask(unittest.TestCase):
+
+    def setUp(self):
+        openvr.setBackend(scene_runtime())
+
+    def tearDown(self):
+        openvr.setBackend(None)
+
+    def test_face_culling_is_kept(self):
+        actor = _CullingActor()
+        renderer = OpenVrGlRenderer(actor)
+        with egl_app(renderer) as app:
+            app.run_loop(frame_count=2)
+        self.assertEqual([True] * 4, actor.cull_face)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/bin/env python
+
+import math
+import unittest
+import ctypes
+
+import numpy
+
+import openvr
+from openvr.pose_buffer import PoseBuffer, matrices_for_openvr_poses, \
+    inverse_matrices_for_openvr_poses, rigid_inverse
+
+
+class TestPoseBuffer(unittest.TestCase):
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_views_alias_ctypes_memory(self):
+        buffer = PoseBuffer()
+        self.assertEqual(openvr.k_unMaxTrackedDeviceCount, len(buffer))
+        self.assertEqual((openvr.k_unMaxTrackedDeviceCount, 3, 4), buffer.matrices.shape)
+        # Write through ctypes, as the runtime would
+        pose = buffer[3]
+        pose.mDeviceToAbsoluteTracking.m[1][3] = 1.5
+        pose.vVelocity.v[2] = -2.0
+        pose.vAngularVelocity.v[0] = 0.25
+        pose.eTrackingResult = openvr.TrackingResult_Running_OK
+        pose.bPoseIsValid = 1
+        pose.bDeviceIsConnected = 1
+        self.assertEqual(1.5, buffer.matrices[3, 1, 3])
+        self.assertEqual(-2.0, buffer.velocity[3, 2])
+        self.assertEqual(0.25, buffer.angular_velocity[3, 0])
+        self.assertEqual(openvr.TrackingResult_Running_OK, buffer.tracking_result[3])
+        self.assertTrue(buffer.valid[3])
+        self.assertTrue(buffer.connected[3])
+        self.assertEqual([3], list(buffer.valid_indices()))
+        # Write through numpy, read through ctypes
+        buffer.matrices[5, 0, 0] = 2.0
+        self.assertEqual(2.0, buffer[5].mDeviceToAbsoluteTracking.m[0][0])
+
+    def test_pointer_cast(self):
+        buffer = PoseBuffer(4)
+        ptr = ctypes.cast(buffer, ctypes.POINTER(openvr.TrackedDevicePose_t))
+        ptr[2].bPoseIsValid = 1
+        self.assertEqual([2], list(buffer.valid_indices()))
+
+    def test_wrap_existing_array(self):
+        poses = (openvr.TrackedDevicePose_t * 2)()
+        buffer = PoseBuffer(poses=poses)
+        poses[1].bDeviceIsConnected = 1
+        self.assertEqual([False, True], list(buffer.connected))
+
+
+class TestPoseMatrices(unittest.TestCase):
+
+    def _random_poses(self, count):
+        rng = numpy.random.RandomState(42)
+        result = numpy.zeros((count, 3, 4), dtype=numpy.float32)
+        for k in range(count):
+            # Rotation about an arbitrary axis, plus translation
+            axis = rng.normal(size=3)
+            axis /= numpy.linalg.norm(axis)
+            angle = rng.uniform(-math.pi, math.pi)
+            x, y, z = axis
+            c, s, t = math.cos(angle), math.sin(angle), 1.0 - math.cos(angle)
+            result[k, :, :3] = [
+                [t*x*x + c, t*x*y - s*z, t*x*z + s*y],
+                [t*x*y + s*z, t*y*y + c, t*y*z - s*x],
+                [t*x*z - s*y, t*y*z + s*x, t*z*z + c]]
+            result[k, :, 3] = rng.uniform(-2, 2, size=3)
+        return result
+
+    def test_matches_per_element_conversion(self):
+        poses = self._random_poses(5)
+        result = matrices_for_openvr_poses(poses)
+        self.assertEqual((5, 4, 4), result.shape)
+        self.assertEqual(numpy.float32, result.dtype)
+        for k in range(5):
+            m = poses[k]
+            expected = numpy.array(
+                ((m[0][0], m[1][0], m[2][0], 0.0),
+                 (m[0][1], m[1][1], m[2][1], 0.0),
+                 (m[0][2], m[1][2], m[2][2], 0.0),
+                 (m[0][3], m[1][3], m[2][3], 1.0),), numpy.float32)
+            numpy.testing.assert_array_equal(expected, result[k])
+
+    def test_rigid_inverses(self):
+        poses = self._random_poses(16)
+        forward = matrices_for_openvr_poses(poses)
+        inverse = inverse_matrices_for_openvr_poses(poses)
+        for k in range(16):
+            numpy.testing.assert_allclose(numpy.linalg.inv(forward[k]), inverse[k], atol=1e-5)
+            numpy.testing.assert_allclose(inverse[k], rigid_inverse(forward[k]), atol=1e-6)
+
+    def test_pose_buffer_matrices(self):
+        buffer = PoseBuffer()
+        buffer.matrices[:] = self._random_poses(len(buffer))
+        numpy.testing.assert_allclose(
+            numpy.eye(4)[numpy.newaxis].repeat(len(buffer), axis=0),
+            numpy.matmul(buffer.device_matrices(), buffer.inverse_device_matrices()),
+            atol=1e-5)
+
+
+if __name__ == '__main__':
+    unittest.main()
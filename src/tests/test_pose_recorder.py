@@ -0,0 +1,71 @@
+#!/bin/env python
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import openvr
+from openvr.pose_buffer import PoseBuffer
+from openvr.pose_recorder import PoseLog, PoseRecorder
+from openvr.simulator import SimulatedRuntime
+
+
+class TestPoseRecorder(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = SimulatedRuntime(paced=False)
+        openvr.setBackend(self.runtime)
+        self.vr_system = openvr.init(openvr.VRApplication_Scene)
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'session.poselog')
+
+    def tearDown(self):
+        openvr.shutdown()
+        openvr.setBackend(None)
+        shutil.rmtree(self.directory)
+
+    def record(self, count, **kwargs):
+        poses = PoseBuffer()
+        compositor = openvr.VRCompositor()
+        with PoseRecorder(self.path, **kwargs) as recorder:
+            for i in range(count):
+                compositor.waitGetPoses(poses, len(poses), None, 0)
+                recorder.record(poses, seconds=float(i))
+        return recorder
+
+    def test_round_trip(self):
+        self.runtime.set_buttons(1, pressed=1 << openvr.k_EButton_Grip)
+        recorder = self.record(10, device_count=8, chunk_records=4)
+        self.assertEqual(10, recorder.record_count)
+        log = PoseLog(self.path)
+        self.assertEqual(10, len(log))
+        self.assertEqual(8, log.device_count)
+        self.assertEqual(list(range(10)), log.time.tolist())
+        self.assertEqual((10, 8, 3, 4), log.matrices.shape)
+        self.assertTrue(log.poses['bPoseIsValid'][9, openvr.k_unTrackedDeviceIndex_Hmd])
+        self.assertFalse(log.poses['bDeviceIsConnected'][9, 7])
+        self.assertEqual(1 << openvr.k_EButton_Grip, log.controller_states['ulButtonPressed'][3, 1])
+        self.assertEqual(0, log.controller_states['ulButtonPressed'][3, openvr.k_unTrackedDeviceIndex_Hmd])
+        self.assertEqual(4, log.index_at(4.5))
+        self.assertEqual(0, log.index_at(-1.0))
+
+    def test_truncated_log(self):
+        self.record(3)
+        size = os.path.getsize(self.path)
+        with open(self.path, 'r+b') as f:
+            f.truncate(size - 10)
+        self.assertEqual(2, len(PoseLog(self.path)))
+
+    def test_empty_log(self):
+        self.record(0)
+        self.assertEqual(0, len(PoseLog(self.path)))
+
+    def test_not_a_pose_log(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a pose log at all')
+        self.assertRaises(ValueError, PoseLog, self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,228 @@
+#!/bin/env python
+
+from ctypes import addressof
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import numpy
+
+import openvr
+from openvr.render_models import RenderModelCache, RenderModelLoader, mipmap_sizes, render_model_indices, \
+    render_model_vertex_dtype, render_model_vertices, texture_mipmaps
+from openvr.simulator import SimulatedRuntime
+
+
+class TestRenderModelViews(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = SimulatedRuntime(paced=False)
+        openvr.setBackend(self.runtime)
+        openvr.init(openvr.VRApplication_Scene)
+        self.render_models = openvr.VRRenderModels()
+        while True:
+            error, self.model = self.render_models.loadRenderModel_Async(b"simulated_controller")
+            if error != openvr.VRRenderModelError_Loading:
+                break
+
+    def tearDown(self):
+        openvr.shutdown()
+        openvr.setBackend(None)
+
+    def test_vertices(self):
+        model = self.model
+        vertices = render_model_vertices(model)
+        self.assertEqual((model.unVertexCount,), vertices.shape)
+        self.assertEqual(32, render_model_vertex_dtype.itemsize)
+        # A view of the runtime's memory, not a copy
+        self.assertEqual(addressof(model.rVertexData.contents), vertices.__array_interface__['data'][0])
+        vertex = model.rVertexData[5]
+        self.assertEqual(list(vertex.vPosition.v), vertices['vPosition'][5].tolist())
+        self.assertEqual(list(vertex.vNormal.v), vertices['vNormal'][5].tolist())
+        self.assertEqual(list(vertex.rfTextureCoord), vertices['rfTextureCoord'][5].tolist())
+        flat = vertices.view(numpy.float32)
+        self.assertEqual(8 * model.unVertexCount, len(flat))
+        self.assertEqual(list(vertex.rfTextureCoord), flat[5 * 8 + 6:5 * 8 + 8].tolist())
+
+    def test_indices(self):
+        model = self.model
+        indices = render_model_indices(model)
+        self.assertEqual((3 * model.unTriangleCount,), indices.shape)
+        self.assertEqual(numpy.uint16, indices.dtype)
+        self.assertEqual([model.rIndexData[i] for i in range(len(indices))], indices.tolist())
+
+    def test_no_model(self):
+        self.assertEqual(0, len(render_model_vertices(None)))
+        self.assertEqual(0, len(render_model_indices(openvr.RenderModel_t())))
+
+    def test_free(self):
+        while True:
+            error, texture = self.render_models.loadTexture_Async(self.model.diffuseTextureId)
+            if error != openvr.VRRenderModelError_Loading:
+                break
+        self.assertEqual(2, len(self.runtime.render_models.loaded))
+        self.render_models.freeRenderModel(self.model)
+        self.render_models.freeTexture(texture)
+        self.assertEqual(0, len(self.runtime.render_models.loaded))
+        # Safe on a null pointer
+        self.render_models.freeTexture(None)
+
+
+class _BrokenRenderModels(object):
+    "Stands in for IVRRenderModels, failing to load any model"
+
+    def __init__(self, error):
+        self.error = error
+
+    def loadRenderModel_Async(self, name):
+        if self.error is None:
+            raise RuntimeError("runtime went away")
+        return self.error, None
+
+
+def _wait_for_model(loader, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        loaded = loader.pop_completed()
+        if loaded is not None:
+            return loaded
+        time.sleep(0.001)
+    raise AssertionError("render model did not load")
+
+
+class TestRenderModelLoader(unittest.TestCase):
+
+    def setUp(self):
+        # Models and textures report VRRenderModelError_Loading a few times first
+        self.runtime = SimulatedRuntime(paced=False, render_model_load_calls=3)
+        openvr.setBackend(self.runtime)
+        openvr.init(openvr.VRApplication_Scene)
+        self.loader = RenderModelLoader(poll_interval=0.001)
+
+    def tearDown(self):
+        self.loader.close()
+        openvr.shutdown()
+        openvr.setBackend(None)
+
+    def test_load(self):
+        self.loader.request(b"simulated_controller")
+        self.assertIsNone(self.loader.pop_completed())
+        loaded = _wait_for_model(self.loader)
+        self.assertEqual(b"simulated_controller", loaded.name)
+        self.assertEqual(openvr.VRRenderModelError_None, loaded.error)
+        self.assertEqual((loaded.model.unVertexCount,), loaded.vertices.shape)
+        self.assertEqual((3 * loaded.model.unTriangleCount,), loaded.indices.shape)
+        self.assertEqual((2, 2, 4), loaded.pixels.shape)
+        self.assertEqual([200, 200, 200, 255], loaded.pixels[1, 0].tolist())
+        self.assertEqual(3, self.runtime.render_models.pending[b"simulated_controller"])
+        self.assertIsNone(self.loader.pop_completed())
+
+    def test_free(self):
+        self.loader.request(b"simulated_controller")
+        loaded = self.loader.free(_wait_for_model(self.loader))
+        self.assertEqual(b"simulated_controller", loaded.name)
+        self.assertEqual((None, None, None), (loaded.model, loaded.texture, loaded.vertices))
+        self.assertEqual(0, len(self.runtime.render_models.loaded))
+
+    def test_close_frees_models_not_taken(self):
+        self.loader.request(b"simulated_controller")
+        while not self.loader._completed:
+            time.sleep(0.001)
+        self.loader.close()
+        self.assertEqual(0, len(self.runtime.render_models.loaded))
+
+    def test_models_load_side_by_side(self):
+        self.loader.request(b"a")
+        self.loader.request(b"b")
+        names = set([_wait_for_model(self.loader).name, _wait_for_model(self.loader).name])
+        self.assertEqual(set([b"a", b"b"]), names)
+
+    def test_error(self):
+        self.loader.render_models = _BrokenRenderModels(openvr.VRRenderModelError_InvalidModel)
+        self.loader.request(b"broken")
+        loaded = _wait_for_model(self.loader)
+        self.assertEqual((b"broken", openvr.VRRenderModelError_InvalidModel), loaded[:2])
+        self.assertIsNone(loaded.vertices)
+
+    def test_exceptions_are_raised_on_the_render_thread(self):
+        self.loader.render_models = _BrokenRenderModels(None)
+        self.loader.request(b"broken")
+        with self.assertRaises(RuntimeError):
+            _wait_for_model(self.loader)
+
+
+class TestMipmaps(unittest.TestCase):
+
+    def test_sizes(self):
+        self.assertEqual([(2, 1), (1, 1)], mipmap_sizes(4, 2))
+        self.assertEqual([], mipmap_sizes(1, 1))
+
+    def test_box_filter(self):
+        pixels = numpy.zeros((2, 4, 4), dtype=numpy.uint8)
+        pixels[0, 0] = [255, 0, 0, 255]
+        pixels[1, 1] = [0, 101, 0, 255]
+        pixels[:, 2:] = 200
+        level1, level2 = texture_mipmaps(pixels)
+        self.assertEqual([[[64, 25, 0, 128], [200, 200, 200, 200]]], level1.tolist())
+        self.assertEqual([[[132, 113, 100, 164]]], level2.tolist())
+
+
+class TestRenderModelCache(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = SimulatedRuntime(paced=False)
+        openvr.setBackend(self.runtime)
+        openvr.init(openvr.VRApplication_Scene)
+        self.directory = tempfile.mkdtemp()
+        self.loader = None
+
+    def tearDown(self):
+        if self.loader is not None:
+            self.loader.close()
+        shutil.rmtree(self.directory)
+        openvr.shutdown()
+        openvr.setBackend(None)
+
+    def load(self, cache, render_models=None):
+        self.loader = RenderModelLoader(poll_interval=0.001, render_models=render_models, cache=cache)
+        self.loader.request(b"simulated_controller")
+        loaded = _wait_for_model(self.loader)
+        self.loader.close()
+        return loaded
+
+    def test_warm_start_does_not_load_from_the_runtime(self):
+        cold = self.load(RenderModelCache(self.directory))
+        self.assertIsInstance(cold.vertices, numpy.memmap)
+        # Mapped from the cache, in place of the runtime's memory, which is freed
+        self.assertIsNone(cold.model)
+        self.assertEqual(0, len(self.runtime.render_models.loaded))
+        cache = RenderModelCache(self.directory)
+        warm = self.load(cache, render_models=_BrokenRenderModels(None))
+        self.assertEqual((1, 0), (cache.hits, cache.misses))
+        self.assertEqual(b"simulated_controller", warm.name)
+        self.assertIsNone(warm.model)
+        numpy.testing.assert_array_equal(cold.vertices, warm.vertices)
+        numpy.testing.assert_array_equal(cold.indices, warm.indices)
+        numpy.testing.assert_array_equal(cold.pixels, warm.pixels)
+        self.assertEqual([(1, 1, 4)], [level.shape for level in warm.mipmaps])
+        self.assertEqual(render_model_vertex_dtype, warm.vertices.dtype)
+
+    def test_runtime_version_is_part_of_the_key(self):
+        self.load(RenderModelCache(self.directory, runtime_version="1.0"))
+        cache = RenderModelCache(self.directory, runtime_version="1.1")
+        self.assertIsNone(cache.load(b"simulated_controller"))
+        self.assertEqual((0, 1), (cache.hits, cache.misses))
+        self.assertEqual(1, len(os.listdir(self.directory)))
+
+    def test_unwritable_cache(self):
+        path = os.path.join(self.directory, 'file')
+        open(path, 'w').close()
+        loaded = self.load(RenderModelCache(os.path.join(path, 'cache')))
+        self.assertIsNotNone(loaded.model)
+        self.assertIsNone(loaded.mipmaps)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/bin/env python
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+import openvr
+from openvr.event_buffer import EventBuffer
+from openvr.pose_buffer import PoseBuffer
+from openvr.pose_recorder import PoseRecorder
+from openvr.replay import ReplayRuntime
+from openvr.simulator import SimulatedRuntime, default_devices
+
+
+def _moving_hmd(seconds):
+    return ((1, 0, 0, 0),
+            (0, 1, 0, 1.7),
+            (0, 0, 1, seconds),)
+
+
+class TestReplayRuntime(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Record 30 frames of a moving HMD, with the right trigger held for frames 10 to 19
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, 'session.poselog')
+        devices = default_devices()
+        devices[0].pose = _moving_hmd
+
+        def script(runtime, frame_index):
+            if frame_index in (10, 20):
+                runtime.set_buttons(2, pressed=(1 << openvr.k_EButton_SteamVR_Trigger) if frame_index == 10 else 0)
+        runtime = SimulatedRuntime(devices=devices, paced=False, script=script)
+        openvr.setBackend(runtime)
+        openvr.init(openvr.VRApplication_Scene)
+        poses = PoseBuffer()
+        compositor = openvr.VRCompositor()
+        with PoseRecorder(cls.path, device_count=8) as recorder:
+            for frame in range(30):
+                compositor.waitGetPoses(poses, len(poses), None, 0)
+                recorder.record(poses, seconds=100.0 + frame / 90.0)
+        openvr.shutdown()
+        openvr.setBackend(None)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def tearDown(self):
+        openvr.shutdown()
+        openvr.setBackend(None)
+
+    def replay(self, frames, **kwargs):
+        "Replays frames frames, returning the HMD z position and the button events of each"
+        runtime = ReplayRuntime(self.path, paced=False, **kwargs)
+        openvr.setBackend(runtime)
+        vr_system = openvr.init(openvr.VRApplication_Scene)
+        compositor = openvr.VRCompositor()
+        poses = PoseBuffer()
+        events = EventBuffer()
+        positions = []
+        presses = []
+        for frame in range(frames):
+            compositor.waitGetPoses(poses, len(poses), None, 0)
+            positions.append(poses.matrices[0, 2, 3])
+            for event in events.drain_events(types=[openvr.VREvent_ButtonPress, openvr.VREvent_ButtonUnpress]):
+                presses.append((frame, int(event['eventType']), int(event['trackedDeviceIndex'])))
+        result, state = vr_system.getControllerState(2)
+        openvr.shutdown()
+        return runtime, numpy.array(positions), presses, state
+
+    def test_devices(self):
+        runtime = ReplayRuntime(self.path, paced=False)
+        openvr.setBackend(runtime)
+        vr_system = openvr.init(openvr.VRApplication_Scene)
+        self.assertEqual(openvr.TrackedDeviceClass_Controller, vr_system.getTrackedDeviceClass(1))
+        self.assertEqual(b"simulated_controller",
+                         vr_system.getStringTrackedDeviceProperty(1, openvr.Prop_RenderModelName_String))
+        self.assertEqual(2, vr_system.getTrackedDeviceIndexForControllerRole(openvr.TrackedControllerRole_RightHand))
+        self.assertFalse(vr_system.isTrackedDeviceConnected(6))
+
+    def test_repeatable(self):
+        runtime, first, first_presses, state = self.replay(30)
+        _, second, second_presses, _ = self.replay(30)
+        self.assertTrue(runtime.finished)
+        self.assertEqual(first.tobytes(), second.tobytes())
+        self.assertEqual(first_presses, second_presses)
+        self.assertEqual([(9, openvr.VREvent_ButtonPress, 2), (19, openvr.VREvent_ButtonUnpress, 2)], first_presses)
+        self.assertEqual(0, state.ulButtonPressed)
+        self.assertTrue(numpy.all(numpy.diff(first) > 0))
+
+    def test_accelerated(self):
+        runtime, positions, presses, _ = self.replay(15, speed=2.0)
+        _, original, _, _ = self.replay(30)
+        self.assertEqual(original[::2].tobytes(), positions.tobytes())
+        # Presses between two replayed frames are not lost
+        self.assertEqual([openvr.VREvent_ButtonPress, openvr.VREvent_ButtonUnpress], [p[1] for p in presses])
+
+    def test_loop(self):
+        runtime, positions, _, _ = self.replay(40, loop=True)
+        self.assertFalse(runtime.finished)
+        self.assertEqual(positions[:10].tobytes(), positions[30:].tobytes())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/bin/env python
+
+import unittest
+from ctypes import byref, sizeof
+
+import openvr
+from openvr.pose_buffer import PoseBuffer
+from openvr.simulator import SimulatedRuntime, SimulatedDevice
+
+
+class TestSimulatedRuntime(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = SimulatedRuntime(paced=False)
+        openvr.setBackend(self.runtime)
+        self.vr_system = openvr.init(openvr.VRApplication_Scene)
+
+    def tearDown(self):
+        openvr.shutdown()
+        openvr.setBackend(None)
+
+    def test_system(self):
+        self.assertTrue(openvr.isHmdPresent())
+        self.assertEqual((1512, 1680), self.vr_system.getRecommendedRenderTargetSize())
+        self.assertEqual(openvr.TrackedDeviceClass_HMD,
+                         self.vr_system.getTrackedDeviceClass(openvr.k_unTrackedDeviceIndex_Hmd))
+        self.assertEqual(b"simulated_controller",
+                         self.vr_system.getStringTrackedDeviceProperty(1, openvr.Prop_RenderModelName_String))
+        self.assertEqual(2, self.vr_system.getTrackedDeviceIndexForControllerRole(
+            openvr.TrackedControllerRole_RightHand))
+        eye = self.vr_system.getEyeToHeadTransform(openvr.Eye_Left)
+        self.assertAlmostEqual(-0.032, eye.m[0][3])
+
+    def test_interfaces_are_reloaded_after_init(self):
+        compositor = openvr.VRCompositor()
+        self.assertIs(compositor, openvr.VRCompositor())
+        openvr.shutdown()
+        openvr.init(openvr.VRApplication_Scene)
+        self.assertIsNot(compositor, openvr.VRCompositor())
+
+    def test_unsimulated_interface(self):
+        self.assertRaises(openvr.OpenVRError, openvr.VROverlay)
+        self.assertRaises(NotImplementedError, self.vr_system.computeDistortion, openvr.Eye_Left, 0.5, 0.5)
+
+    def test_scripted_poses(self):
+        def pose(seconds):
+            return ((1, 0, 0, 0),
+                    (0, 1, 0, 1.5),
+                    (0, 0, 1, seconds),)
+        self.runtime.devices = [SimulatedDevice(openvr.TrackedDeviceClass_HMD, pose)]
+        poses = PoseBuffer()
+        compositor = openvr.VRCompositor()
+        compositor.waitGetPoses(poses, len(poses), None, 0)
+        self.assertEqual([0], list(poses.valid_indices()))
+        self.assertEqual(1.5, poses.matrices[0, 1, 3])
+        self.assertGreater(poses.matrices[0, 2, 3], 0.0)
+        self.vr_system.getDeviceToAbsoluteTrackingPose(openvr.TrackingUniverseStanding, 0, len(poses), poses)
+        self.assertEqual([0], list(poses.valid_indices()))
+
+    def test_controller_events(self):
+        button = openvr.k_EButton_SteamVR_Trigger
+        self.runtime.set_buttons(1, pressed=1 << button)
+        event = openvr.VREvent_t()
+        self.assertTrue(self.vr_system.pollNextEvent(event))
+        self.assertEqual(openvr.VREvent_ButtonPress, event.eventType)
+        self.assertEqual(1, event.trackedDeviceIndex)
+        self.assertEqual(button, event.data.controller.button)
+        self.assertFalse(self.vr_system.pollNextEvent(event))
+        result, state = self.vr_system.getControllerState(1)
+        self.assertTrue(result)
+        self.assertEqual(1 << button, state.ulButtonPressed)
+        result, state = self.vr_system.getControllerState(openvr.k_unTrackedDeviceIndex_Hmd)
+        self.assertFalse(result)
+
+    def test_script_and_frame_timing(self):
+        frames = []
+        self.runtime.script = lambda runtime, frame_index: frames.append(frame_index)
+        compositor = openvr.VRCompositor()
+        for _ in range(3):
+            compositor.waitGetPoses(None, 0, None, 0)
+        self.assertEqual([1, 2, 3], frames)
+        timing = openvr.Compositor_FrameTiming()
+        timing.m_nSize = sizeof(openvr.Compositor_FrameTiming)
+        self.assertTrue(compositor._fns.getFrameTiming(byref(timing), 0))
+        self.assertEqual(3, timing.m_nFrameIndex)
+        self.assertTrue(compositor._fns.getFrameTiming(byref(timing), 1))
+        self.assertEqual(2, timing.m_nFrameIndex)
+
+    def test_paced_frames(self):
+        self.runtime.paced = True
+        self.runtime.refresh_rate = 200.0
+        compositor = openvr.VRCompositor()
+        compositor.waitGetPoses(None, 0, None, 0)
+        since_vsync, frame = self.vr_system.getTimeSinceLastVsync()[1:]
+        self.assertLess(since_vsync, 1.0 / 200.0)
+        compositor.waitGetPoses(None, 0, None, 0)
+        self.assertGreater(self.vr_system.getTimeSinceLastVsync()[2], frame)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+#!/bin/env python
+
+import unittest
+
+import openvr
+
+
+class TestStarImport(unittest.TestCase):
+
+    def test_interfaces_are_exported(self):
+        namespace = dict()
+        exec('from openvr import *', namespace)
+        for name in ('IVRSystem', 'IVRCompositor_FnTable', 'IVRRenderModels'):
+            self.assertIs(getattr(openvr, name), namespace[name])
+        for name in ('VRSystem', 'init', 'TrackedDevicePose_t', 'k_unTrackedDeviceIndex_Hmd'):
+            self.assertIn(name, namespace)
+        self.assertNotIn('_interface_modules', namespace)
+
+    def test_all(self):
+        self.assertEqual(len(openvr.__all__), len(set(openvr.__all__)))
+        for name in openvr.__all__:
+            self.assertTrue(hasattr(openvr, name), name)
+
+
+if __name__ == '__main__':
+    unittest.main()
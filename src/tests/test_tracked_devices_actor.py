@@ -0,0 +1,259 @@
+#!/bin/env python
+
+import collections
+import unittest
+
+from test_egl_app import EglApp, egl_app, eye_images, scene_runtime
+import openvr
+
+try:
+    from openvr.render_models import LoadedRenderModel
+    from openvr import tracked_devices_actor
+    from openvr.tracked_devices_actor import RenderModelRegistry
+except ImportError:  # PyOpenGL is not installed
+    RenderModelRegistry = None
+
+if EglApp is not None:
+    from openvr.gl_renderer import OpenVrGlRenderer
+    from openvr.tracked_devices_actor import TrackedDeviceMesh, TrackedDevicesActor, _placeholder_model
+
+
+class _Loader(object):
+    "Stands in for a RenderModelLoader, whose requests complete when the test says so"
+
+    def __init__(self):
+        self.requested = []
+        self.completed = collections.deque()
+        self.freed = []
+        self.closed = False
+
+    def request(self, name):
+        self.requested.append(name)
+
+    def complete(self, name, error=openvr.VRRenderModelError_None):
+        self.completed.append(LoadedRenderModel(name, error, None, None, None, None, None, None))
+
+    def pop_completed(self):
+        return self.completed.popleft() if self.completed else None
+
+    def free(self, loaded):
+        self.freed.append(loaded.name)
+
+    def close(self):
+        self.closed = True
+
+
+class _Mesh(object):
+    "Stands in for a TrackedDeviceMesh, without OpenGL, uploaded in two steps"
+
+    def __init__(self, loaded):
+        self.model_name = loaded.name
+        self.steps = 2
+        self.disposed = False
+
+    def upload_gl(self, deadline=None):
+        while self.steps:
+            self.steps -= 1
+            if deadline is not None and tracked_devices_actor._clock() >= deadline:
+                break
+        return self.steps == 0
+
+    def dispose_gl(self):
+        self.disposed = True
+
+
+@unittest.skipIf(RenderModelRegistry is None, "PyOpenGL is not installed")
+class TestRenderModelRegistry(unittest.TestCase):
+
+    def setUp(self):
+        # The registry's clock, in seconds
+        self.now = 0.0
+        self._clock = tracked_devices_actor._clock
+        tracked_devices_actor._clock = lambda: self.now
+
+    def tearDown(self):
+        tracked_devices_actor._clock = self._clock
+
+    def registry(self, **kwargs):
+        registry = RenderModelRegistry(**kwargs)
+        registry._create_mesh = _Mesh
+        registry.loader = self.loader = _Loader()
+        registry.init_gl()
+        return registry
+
+    def test_budget_is_spent_once_per_frame(self):
+        registry = self.registry()
+        actors = (object(), object())
+        registry.acquire(b"a")
+        self.loader.complete(b"a")
+        # Each step uses up the whole budget
+        for actor in actors:
+            registry.update_gl(0, actor)
+        self.assertEqual(1, registry._uploading.steps)
+        for actor in actors:
+            registry.update_gl(0, actor)
+        self.assertEqual([b"a"], list(registry.meshes))
+        self.assertEqual([b"a"], self.loader.freed)
+
+    def test_references_across_actors(self):
+        registry = self.registry()
+        registry.acquire(b"a")
+        registry.acquire(b"a")
+        # Loaded once for both
+        self.assertEqual([b"a"], self.loader.requested)
+        self.assertIsNone(registry.mesh(b"a"))
+        self.loader.complete(b"a")
+        registry.update_gl()
+        mesh = registry.mesh(b"a")
+        self.assertIsNotNone(mesh)
+        registry.release(b"a")
+        self.assertEqual({}, registry._unused_since)
+        registry.release(b"a")
+        self.assertEqual({b"a": 0.0}, registry._unused_since)
+        # Acquired again before its eviction, it stays
+        registry.acquire(b"a")
+        self.assertEqual({}, registry._unused_since)
+        self.now = 100.0
+        registry.update_gl()
+        self.assertIs(mesh, registry.mesh(b"a"))
+        self.assertFalse(mesh.disposed)
+
+    def test_eviction(self):
+        registry = self.registry(eviction_seconds=10.0)
+        registry.acquire(b"a")
+        self.loader.complete(b"a")
+        registry.update_gl()
+        mesh = registry.mesh(b"a")
+        self.now = 1.0
+        registry.release(b"a")
+        self.now = 10.5
+        registry.update_gl()
+        self.assertIs(mesh, registry.mesh(b"a"))
+        self.now = 11.0
+        registry.update_gl()
+        self.assertTrue(mesh.disposed)
+        self.assertIsNone(registry.mesh(b"a"))
+        self.assertEqual({}, registry._unused_since)
+        # Loaded again when acquired again
+        registry.acquire(b"a")
+        self.assertEqual([b"a", b"a"], self.loader.requested)
+        self.assertIsNone(registry.mesh(b"a"))
+        self.loader.complete(b"a")
+        registry.update_gl()
+        self.assertIsNot(mesh, registry.mesh(b"a"))
+        self.assertFalse(registry.mesh(b"a").disposed)
+
+    def test_uploading_is_evicted_once_uploaded(self):
+        registry = self.registry(eviction_seconds=0.0)
+        registry.acquire(b"a")
+        self.loader.complete(b"a")
+        registry.update_gl(0)
+        registry.release(b"a")
+        self.assertIsNotNone(registry._uploading)
+        # The next call finishes the upload, then evicts the mesh
+        registry.update_gl(0)
+        self.assertIsNone(registry._uploading)
+        self.assertIsNone(registry.mesh(b"a"))
+        self.assertEqual([b"a"], self.loader.freed)
+        self.assertEqual({}, registry._unused_since)
+
+    def test_failed(self):
+        registry = self.registry(eviction_seconds=10.0)
+        registry.acquire(b"a")
+        self.loader.complete(b"a", openvr.VRRenderModelError_InvalidModel)
+        registry.update_gl()
+        # Drawn as the placeholder, and not requested again
+        self.assertIsNone(registry.mesh(b"a"))
+        self.assertEqual({b"a"}, registry._failed)
+        registry.release(b"a")
+        registry.acquire(b"a")
+        self.assertEqual([b"a"], self.loader.requested)
+        # Until evicted
+        registry.release(b"a")
+        self.now = 10.0
+        registry.update_gl()
+        self.assertEqual(set(), registry._failed)
+        registry.acquire(b"a")
+        self.assertEqual([b"a", b"a"], self.loader.requested)
+
+    def test_dispose_after_last_user(self):
+        registry = self.registry()
+        # A second actor using the registry
+        registry.init_gl()
+        placeholder = registry.placeholder
+        registry.acquire(b"a")
+        registry.acquire(b"b")
+        self.loader.complete(b"a")
+        registry.update_gl()
+        # b is partly uploaded
+        self.loader.complete(b"b")
+        registry.update_gl(0)
+        mesh = registry.mesh(b"a")
+        self.assertIsNotNone(registry._uploading)
+        registry.dispose_gl()
+        self.assertFalse(self.loader.closed)
+        self.assertFalse(mesh.disposed)
+        self.assertIs(mesh, registry.mesh(b"a"))
+        uploading = registry._uploading
+        registry.dispose_gl()
+        self.assertTrue(self.loader.closed)
+        self.assertIsNone(registry.loader)
+        for disposed in (placeholder, mesh, uploading):
+            self.assertTrue(disposed.disposed)
+        self.assertEqual({}, registry.meshes)
+        self.assertEqual([b"a", b"b"], self.loader.freed)
+        # Usable again after init_gl()
+        registry.loader = self.loader = _Loader()
+        registry.init_gl()
+        registry.acquire(b"a")
+        self.assertEqual([b"a"], self.loader.requested)
+
+
+@unittest.skipIf(EglApp is None, "PyOpenGL is not installed")
+class TestTrackedDeviceMesh(unittest.TestCase):
+
+    def setUp(self):
+        openvr.setBackend(scene_runtime())
+
+    def tearDown(self):
+        openvr.setBackend(None)
+
+    def test_upload_stops_at_deadline(self):
+        with egl_app(OpenVrGlRenderer(window_size=(16, 16))):
+            mesh = TrackedDeviceMesh(_placeholder_model())
+            # At least one step, even past the deadline
+            self.assertFalse(mesh.upload_gl(deadline=0.0))
+            self.assertFalse(mesh.is_ready)
+            self.assertIsNotNone(mesh.vao)
+            self.assertIsNone(mesh.diffuse_texture)
+            self.assertTrue(mesh.upload_gl(deadline=0.0))
+            self.assertTrue(mesh.is_ready)
+            self.assertIsNotNone(mesh.diffuse_texture)
+            mesh.dispose_gl()
+
+    def test_placeholder_until_ready(self):
+        renderer = OpenVrGlRenderer()
+        devices = TrackedDevicesActor(renderer.poses, registry=RenderModelRegistry())
+        # One upload step per frame, so the mesh takes at least two frames to upload
+        devices.upload_budget_ms = 0
+        renderer.append(devices)
+        placeholder_frames = 0
+        with egl_app(renderer) as app:
+            while not devices.meshes and app.frame_count < 1000:
+                app.render_scene()
+                eyes = eye_images(renderer)[..., :3]
+                if not devices.meshes:
+                    placeholder_frames += 1
+                    # The placeholder's gray, not yet the controllers' texture
+                    self.assertTrue((eyes == 160).all(axis=2).any())
+                    self.assertFalse((eyes == 200).all(axis=2).any())
+            self.assertEqual([b"simulated_controller"], list(devices.meshes))
+            app.render_scene()
+            eyes = eye_images(renderer)[..., :3]
+        self.assertGreaterEqual(placeholder_frames, 1)
+        self.assertFalse((eyes == 160).all(axis=2).any())
+        self.assertTrue((eyes == 200).all(axis=2).any())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -29,6 +29,9 @@ close $cppheader_fh;
 
 my %docstrings = ();
 
+# Interface names, in order, each with its function table written to a submodule of its own
+my @interface_names = ();
+
 translate_all();
 
 sub translate_all {
@@ -45,8 +48,22 @@ sub translate_all {
 
     translate_structs($header_string);
 
+    expose_interfaces();
+
     translate_functions($cppheader_string);
 
+    print <<EOF;
+# Public names defined above, which the interface submodules import
+_definitions = sorted(_name for _name in globals() if not _name.startswith('_'))
+
+# Python versions before 3.7 ignore module __getattr__, so define the interfaces right away
+if sys.version_info < (3, 7):
+    for _name in _interface_modules:
+        _interfaceAttribute(_name)
+
+# "from openvr import *" does not consult __getattr__, so the interfaces are listed along with the definitions
+__all__ = _definitions + sorted(_interface_modules)
+EOF
 }
 
 sub parse_docstrings {
@@ -147,6 +164,7 @@ sub print_docstring
 
 sub translate_functions {
     my $cppheader_string = shift;
+    my @prototypes = ();
 
     print <<EOF;
 
@@ -187,6 +205,27 @@ def shutdown():
     shutdownInternal() # OK, this is just like inline definition in openvr.h
 
 
+def _backend():
+    global _openvr
+    if _openvr is None:
+        _openvr = _loadOpenVRLibrary()
+    return _openvr
+
+
+def setBackend(backend=None):
+    """
+    Replaces the provider of the OpenVR C API entry points, such as VR_InitInternal
+    and VR_GetGenericInterface. The backend can be a ctypes library exporting
+    those functions, or a Python object implementing them, like
+    openvr.simulator.SimulatedRuntime. None restores the bundled OpenVR library.
+    Interfaces retrieved from the previous backend must not be used afterwards.
+    """
+    global _openvr, _vr_token
+    _openvr = backend
+    _vr_token = None
+    _internal_module_context.clear()
+
+
 EOF
 
     while ($cppheader_string =~ m!
@@ -222,8 +261,8 @@ EOF
         $fn_args = "" unless defined $fn_args;
 
         $return_type = translate_type($return_type);
-        print "_openvr.$fn_name.restype = $return_type\n";
-        print "_openvr.$fn_name.argtypes = [";
+        my $prototype = "    lib.$fn_name.restype = $return_type\n";
+        $prototype .= "    lib.$fn_name.argtypes = [";
         my @arg_types = ();
         my @py_arg_names = ();
         my @arg_names = ();
@@ -272,8 +311,9 @@ EOF
             push @arg_types, $arg_type;
             push @arg_names, $arg_name;
         }
-        print join ", ", @arg_types;
-        print "]\n";
+        $prototype .= join ", ", @arg_types;
+        $prototype .= "]\n";
+        push @prototypes, $prototype;
 
         my $py_fn_name = $fn_name;
         $py_fn_name =~ s/^VR_//;
@@ -304,7 +344,7 @@ EOF
         if ($return_type ne "None") { # avoid IDE warning when "result" value is unused
         	print "result = ";
         }
-        print "    _openvr.$fn_name(";
+        print "_backend().$fn_name(";
         print join ", ", @arg_names;
         print ")\n";
 
@@ -323,6 +363,11 @@ EOF
         # print $1, $2, $3, "\n\n";
     }
 
+    # Only the real library needs ctypes prototypes; Python backends are called as is
+    print "def _declareEntryPoints(lib):\n";
+    print "    \"Declares the argument and return types of the OpenVR C API entry points\"\n";
+    print @prototypes;
+    print "\n\n";
 }
 
 sub translate_constants
@@ -359,9 +404,10 @@ sub write_preamble
 # Created May 7, 2016 Christopher Bruns
 
 import os
-import platform
+import sys
 import ctypes
 from ctypes import *
+from importlib import import_module
 
 from .version import __version__
 
@@ -371,29 +417,46 @@ from .version import __version__
 
 # Detect 32-bit vs 64-bit python
 # Detect platform
+# sys.platform is used, because the platform module is slow to import
 if sizeof(c_void_p) == 4:
-    if platform.system() == 'Windows':
+    if sys.platform == 'win32':
         _openvr_lib_name = "libopenvr_api_32"
-    elif platform.system() == 'Linux':
+    elif sys.platform.startswith('linux'):
         _openvr_lib_name = "libopenvr_api_32.so"
-    elif platform.system() == 'Darwin':
+    elif sys.platform == 'darwin':
         _openvr_lib_name = "libopenvr_api_32.dylib"    
     else:
-        raise ValueError("Libraries not available for this platform: " + platform.system())
+        _openvr_lib_name = None
 else:
-    if platform.system() == 'Windows':
+    if sys.platform == 'win32':
         _openvr_lib_name = "libopenvr_api_64"
-    elif platform.system() == 'Linux':
+    elif sys.platform.startswith('linux'):
         _openvr_lib_name = "libopenvr_api_64.so"
     else:
-        raise ValueError("Libraries not available for this platform: " + platform.system())
+        _openvr_lib_name = None
+
 
-# Add current directory to PATH, so we can load the DLL from right here.
-os.environ['PATH'] += os.pathsep + os.path.dirname(__file__)
-_openvr = cdll.LoadLibrary(_openvr_lib_name)
+def _loadOpenVRLibrary():
+    "Loads the bundled OpenVR shared library and declares the types of its entry points"
+    if _openvr_lib_name is None:
+        raise ValueError("Libraries not available for this platform: " + sys.platform)
+    # Add current directory to PATH, so we can load the DLL from right here.
+    os.environ['PATH'] += os.pathsep + os.path.dirname(__file__)
+    # dlopen() ignores PATH, so prefer the copy right next to this file
+    lib_path = os.path.join(os.path.dirname(__file__), _openvr_lib_name)
+    if not os.path.exists(lib_path):
+        lib_path = _openvr_lib_name
+    lib = cdll.LoadLibrary(lib_path)
+    _declareEntryPoints(lib)
+    return lib
+
+
+# Provider of the VR_* entry points of the OpenVR C API.
+# The bundled library is only loaded on first use. See setBackend().
+_openvr = None
 
 # Function pointer table calling convention
-if platform.system() == 'Windows':
+if sys.platform == 'win32':
     OPENVR_FNTABLE_CALLTYPE = WINFUNCTYPE # __stdcall in openvr_capi.h
 else:
     OPENVR_FNTABLE_CALLTYPE = CFUNCTYPE # __cdecl
@@ -568,6 +631,25 @@ class _MatrixMixin(_VectorMixin):
         return str(list(list(e) for e in self))
 
 
+# Resolves the function pointers of an OpenVR function table once
+class _FunctionTableCache(object):
+    """
+    Reading a function pointer field from a ctypes Structure constructs a new
+    function object each time. Interface classes look up their functions here
+    instead, so each call costs a plain attribute lookup.
+    """
+
+    def __init__(self, function_table):
+        for name, _ in function_table._fields_:
+            setattr(self, name, getattr(function_table, name))
+        # Backends written in Python, such as openvr.simulator.SimulatedRuntime,
+        # may implement the entries as plain Python callables instead
+        overrides = getattr(_backend(), 'functionTableOverrides', None)
+        if overrides is not None:
+            for name, fn in overrides(function_table).items():
+                setattr(self, name, fn)
+
+
 EOF
     # sanity check total struct count
     my $struct_count = 0;
@@ -623,6 +705,33 @@ EOF
             $base = "_MatrixMixin, $base";
         }
 
+        # Function tables and their interface classes go into submodules, which
+        # are imported on first use
+        my $interface_fh = undef;
+        if ($struct_name =~ m/^(\S+)_FnTable$/) {
+            my $interface_name = $1;
+            my $module_name = "_" . lc($interface_name);
+            push @interface_names, $interface_name;
+            open $interface_fh, ">", "../openvr/$module_name.py" or die;
+            select $interface_fh;
+            print <<EOF;
+#!/bin/env python
+
+# $interface_name interface of the Python bindings for OpenVR API version 0.9.20
+# Imported on first use of openvr.$interface_name, see openvr.__getattr__()
+
+import ctypes
+from ctypes import *
+
+import openvr
+# Not "from openvr import *", which would import all the other interfaces as well
+globals().update((_name, getattr(openvr, _name)) for _name in openvr._definitions)
+from openvr import _FunctionTableCache, _checkInitError
+
+
+EOF
+        }
+
         print "class $struct_name($base):\n";
 
         # Maybe include docstring
@@ -736,6 +845,7 @@ EOF
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for $interface_name")
         self.function_table = fn_table_ptr.contents
+        self._fns = _FunctionTableCache(self.function_table)
 
 EOF
 
@@ -835,7 +945,7 @@ EOF
 
                     print_docstring($fn_name, "        ");
 
-                    print "        fn = self.function_table.$fn_name\n";
+                    print "        fn = self._fns.$fn_name\n";
 					# Assign local variables for return/out arguments
                     foreach my $ret_name0 (@return_arg_names) {
 						my $ret_name = $ret_name0;
@@ -874,10 +984,54 @@ EOF
             print "\n\n";
         }
 
+        if (defined $interface_fh) {
+            select STDOUT;
+            close $interface_fh;
+        }
     }
     # print $struct_count2, "\n";    
 }
 
+sub expose_interfaces {
+    print <<EOF;
+#########################
+### Expose interfaces ###
+#########################
+
+# Each interface class and its function table are defined in a submodule of their own,
+# which is only imported on first use. E.g. openvr.IVRSystem is defined in openvr._ivrsystem
+_interface_modules = {
+EOF
+    foreach my $interface_name (@interface_names) {
+        my $module_name = "_" . lc($interface_name);
+        print "    '${interface_name}_FnTable': '$module_name',\n";
+        print "    '$interface_name': '$module_name',\n";
+    }
+    print <<EOF;
+}
+
+
+def _interfaceAttribute(name):
+    "Imports the submodule defining an interface class or function table, and returns that definition"
+    value = getattr(import_module('.' + _interface_modules[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name):
+    "Module attribute fallback (PEP 562), for the interface classes and function tables"
+    if name in _interface_modules:
+        return _interfaceAttribute(name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_interface_modules))
+
+
+EOF
+}
+
 sub expose_openvr_context {
 	my $struct_contents = shift;
 	my @fields = split('\n', $struct_contents);
@@ -920,7 +1074,7 @@ EOF
     def $cls_name(self):
         self.checkClear()
         if self.m_p$cls_name is None:
-            self.m_p$cls_name = I$cls_name()
+            self.m_p$cls_name = _interfaceAttribute('I$cls_name')()
         return self.m_p$cls_name
 EOF
 	}